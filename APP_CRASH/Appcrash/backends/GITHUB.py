@@ -10,7 +10,8 @@ from .base import BaseBackend
 from ..formatters.markdown import MardownFormatter
 from PyQt5 import QtGui, QtCore, QtWidgets
 from .._dialogs.gh_login import DlgGitHubLogin
-import github
+# github (PyGithub) is imported when a report is sent: it takes longer to
+# import than the rest of Osdag's main window.
 
 GH_MARK_NORMAL = ':/rc/GitHub-Mark.png'
 GH_MARK_LIGHT = ':/rc/GitHub-Mark-Light.png'
@@ -52,6 +53,7 @@ class GithubBackend(BaseBackend):
             print('remember token',remember_token)
             print('token is',token)'''
 
+            import github
             if not is_basic:
                 gh = github.Github(username)
             else:
@@ -185,6 +187,7 @@ class GithubBackend(BaseBackend):
                 r = requests.post(query_url, headers=headers, data=json.dumps(data))
                 ret = r.json()
                 ret = ret['html_url']'''
+            import github
             auth = gh.get_user()
             ret = auth.create_gist(True, {"Osdag_crash_log.log": github.InputFileContent(log_content)},"Osdag crash report.")
             ret = str(ret.id)
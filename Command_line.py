@@ -135,14 +135,6 @@ def create_files():
             # with open(path, "w") as content:
             #     content.write(str(output_dict))
 
-#Block print
-def blockPrint():
-    sys.stdout = open(os.devnull, 'w')
-
-# Restore print
-def enablePrint():
-    sys.stdout = sys.__stdout__
-
 # <<<<<<< HEAD
 #     module = d['Module']
 #     if module == 'Fin Plate':
@@ -173,8 +165,6 @@ def enablePrint():
 # =======
 if __name__ == '__main__':
 
-    blockPrint()
-
     precompute_data()
 
     create_files()
@@ -12,9 +12,18 @@ PATH_TO_DATABASE = os.path.join(os.path.dirname(__file__), 'ResourceFiles', 'Dat
 
 import sqlite3
 
+from utils.common import catalogue
+from utils.common import trace
 from utils.common.component import *
 from utils.common.component import *
 import logging
+try:
+    # for OurLog, which only the GUI uses: the batch tools import Common without Qt
+    from PyQt5 import QtCore as _QtCore
+except ImportError:
+    _QtCore = None
+
+_trace = trace.channel('common')
 # from design_type.connection.fin_plate_connection import FinPlateConnection
 # from design_type.connection.column_cover_plate import ColumnCoverPlate
 
@@ -34,7 +43,9 @@ class OurLog(logging.Handler):
             msg = "<span style='color: red;'>"+ msg +"</span>"
         elif record.levelname == 'INFO':
             msg = "<span style='color: green;'>" + msg + "</span>"
-        self.key.append(msg)
+        # designs log from a worker thread (gui/design_worker.py): the text box is
+        # appended to on its own thread, queued when the record comes from another one
+        _QtCore.QMetaObject.invokeMethod(self.key, 'append', _QtCore.Qt.AutoConnection, _QtCore.Q_ARG(str, msg))
 
 
 def connectdb1():
@@ -75,35 +86,34 @@ def connectdb(table_name, call_type="dropdown"):
          """
 
     # @author: Amir
-    conn = sqlite3.connect(PATH_TO_DATABASE)
     lst = []
     if table_name == "Angles":
-        cursor = conn.execute("SELECT Designation FROM Angles")
+        db_query = "SELECT Designation FROM Angles"
 
     elif table_name == "Channels":
-        cursor = conn.execute("SELECT Designation FROM Channels")
+        db_query = "SELECT Designation FROM Channels"
 
     elif table_name == "Beams":
-        cursor = conn.execute("SELECT Designation FROM Beams")
+        db_query = "SELECT Designation FROM Beams"
 
     elif table_name == "Bolt":
-        cursor = conn.execute("SELECT Bolt_diameter FROM Bolt")
+        db_query = "SELECT Bolt_diameter FROM Bolt"
 
     elif table_name == "Material":
-        cursor = conn.execute("SELECT Grade FROM Material")
+        db_query = "SELECT Grade FROM Material"
 
     elif table_name == "RHS":
-        cursor = conn.execute("SELECT Designation FROM RHS")
+        db_query = "SELECT Designation FROM RHS"
 
     elif table_name == "SHS":
-        cursor = conn.execute("SELECT Designation FROM SHS")
+        db_query = "SELECT Designation FROM SHS"
 
     elif table_name == "CHS":
-        cursor = conn.execute("SELECT Designation FROM CHS")
+        db_query = "SELECT Designation FROM CHS"
 
     else:
-        cursor = conn.execute("SELECT Designation FROM Columns")
-    rows = cursor.fetchall()
+        db_query = "SELECT Designation FROM Columns"
+    rows = catalogue.fetch_all(PATH_TO_DATABASE, db_query)
 
     for row in rows:
         lst.append(row)
@@ -2008,9 +2018,8 @@ def get_leg_lengths(designation):
 
 all_angles = connectdb("Angles","popup")
 VALUES_CLEAT_CUSTOMIZED = get_available_cleat_list(all_angles, 200.0, 50.0)
-print(all_angles)
-print("customised")
-print(VALUES_CLEAT_CUSTOMIZED)
+if _trace.on:
+    _trace('cleat_angles', all_angles=all_angles, customised=VALUES_CLEAT_CUSTOMIZED)
 
 BOLT_DESCRIPTION = str("<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
                 "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
@@ -7,6 +7,8 @@ from pathlib import Path
 import ast
 import logging
 is_travis = 'TRAVIS' in os.environ
+# OSDAG_TEST_REPORTS=0 records the report checks of every file without writing (or rendering views for) the reports
+write_reports = os.environ.get('OSDAG_TEST_REPORTS', '1') != '0'
 ############################ Pre-Build Database Updation/Creation #################
 sqlpath = Path('ResourceFiles/Database/Intg_osdag.sql')
 sqlitepath = Path('ResourceFiles/Database/Intg_osdag.sqlite')
@@ -55,12 +57,12 @@ from design_type.connection.column_cover_plate import ColumnCoverPlate
 from design_type.connection.column_end_plate import ColumnEndPlate
 from design_type.compression_member.compression import Compression
 from Common import *
+from utils.common.logs import DesignLogBuffer
 
 
 if not is_travis:
     from cad.common_logic import CommonDesignLogic
-    from texlive .Design_wrapper import init_display
-    display, start_display, add_menu, add_function_to_menu = init_display(backend_str="qt-pyqt5")
+    from cad.renderer import get_renderer
 
 
 
@@ -96,7 +98,7 @@ available_module = {KEY_DISP_FINPLATE:FinPlateConnection,  KEY_DISP_ENDPLATE:End
 #predefined pop-up summary.
 popup_summary = {'ProfileSummary': {'CompanyName': 'LoremIpsum', 'CompanyLogo': '', 'Group/TeamName':
     'LoremIpsum', 'Designer': 'LoremIpsum'},'ProjectTitle': 'Fossee', 'Subtitle': '', 'JobNumber': '123',
-                 'AdditionalComments': 'No comments', 'Client': 'LoremIpsum'}
+                 'AdditionalComments': 'No comments', 'Client': 'LoremIpsum', 'write_report': write_reports}
 
 
 
@@ -147,99 +149,79 @@ class Modules:
 
         pdf_created = False
         main.set_osdaglogger(None)
-        error = main.func_for_validation(main,file_data)  # validating files and setting inputs (although we know files are valid).
+        with DesignLogBuffer() as log_buffer:    # messages of this design only, for the report.
+            error = main.func_for_validation(main,file_data)  # validating files and setting inputs (although we know files are valid).
 
-        if error is None:  # if ran successfully and all input values are set without any error. Now create pdf
+            if error is None:  # if ran successfully and all input values are set without any error. Now create pdf
 
-            '''
+                '''
 
 
-            In save_design function second argument is popup summary which user gives as an input.
-            For testing purpose we are giving some default values for creating every pdf.
-            We are actually not comparing pdf. This is just for testing purpose whether function
-            is running fine and creating pdf or not.
+                In save_design function second argument is popup summary which user gives as an input.
+                For testing purpose we are giving some default values for creating every pdf.
+                We are actually not comparing pdf. This is just for testing purpose whether function
+                is running fine and creating pdf or not.
 
-            Some changes are made in save_design function. Instead of asking for output file
-            location from save_design function it'll ask from 'save_inputSummary' function inside
-            ui_summary_popup.py file immediately after getting popup inputs and send it to
-            save_design function using the same dictionary in which popup inputs are present
-            with key name as 'filename'.
+                Some changes are made in save_design function. Instead of asking for output file
+                location from save_design function it'll ask from 'save_inputSummary' function inside
+                ui_summary_popup.py file immediately after getting popup inputs and send it to
+                save_design function using the same dictionary in which popup inputs are present
+                with key name as 'filename'.
 
 
-            '''
-            file_name = file_name.split(".")[0]
+                '''
+                file_name = file_name.split(".")[0]
 
-            path =  os.path.join(output_file_path, file_name)
+                path =  os.path.join(output_file_path, file_name)
 
-            popup_summary['filename'] = path    # adding this key in popup_summary dict.
+                popup_summary['filename'] = path    # adding this key in popup_summary dict.
 
-            popup_summary['does_design_exist'] = False
+                popup_summary['does_design_exist'] = False
 
-            try:
+                popup_summary['images_dir'] = None
 
-                commLogicObj = CommonDesignLogic(display, ' ', main.module, main.mainmodule)
+                if write_reports and not is_travis:    # no CAD (CommonDesignLogic) on travis
+                    try:
+                        commLogicObj = CommonDesignLogic(None, ' ', main.module, main.mainmodule)
 
-                status = main.design_status
+                        status = main.design_status
 
-                commLogicObj.call_3DModel(status, main)
+                        commLogicObj.set_design(status, main)
 
-                fName = os.path.join(os.path.dirname(__file__),'ResourceFiles','images','3d.png')
-                fName_front = os.path.join(os.path.dirname(__file__), 'ResourceFiles', 'images', 'front.png')
-                fName_side = os.path.join(os.path.dirname(__file__), 'ResourceFiles', 'images', 'side.png')
-                fName_top = os.path.join(os.path.dirname(__file__), 'ResourceFiles', 'images', 'top.png')
-                file_extension = fName.split(".")[-1]
+                        # each file gets its own view images, next to its report
+                        popup_summary['images_dir'] = path + '_images'
+                        get_renderer("qt-pyqt5").render(commLogicObj, popup_summary['images_dir'])
 
-                if file_extension == 'png':
+                        popup_summary['does_design_exist'] = True
 
-                    display.ExportToImage(fName)
-                    display.View_Front()
-                    display.FitAll()
-                    display.ExportToImage(fName_front)
-                    display.View_Top()
-                    display.FitAll()
-                    display.ExportToImage(fName_side)
-                    display.View_Right()
-                    display.FitAll()
-                    display.ExportToImage(fName_top)
+                    except Exception as e:
+                        # the report is still written, without the 3D views
+                        logging.getLogger('Osdag').warning('3D views of {} not rendered: {}'.format(file_name, e))
 
-                display.EraseAll()
+                popup_summary['logger_messages'] = log_buffer.entries()
 
-                popup_summary['does_design_exist'] = True
+                main.save_design(main,popup_summary)  # calling the function.
 
-            except:
+                pdf_created = True   # if pdf created
 
-                pass
+                is_dict_same = True
+                '''
+                path = os.path.join(os.path.dirname(__file__), 'OUTPUT_FILES', 'Command_line_output', file_name + ".txt")
 
-            with open(os.path.join(os.path.dirname(__file__),'logging_text.log'),'r') as LOG: # we are already creating this log file inside each module.
-                to_write = LOG.read()
+                if os.path.isfile(path):
 
-            popup_summary['logger_messages'] = to_write
+                    with open(path,"r") as file_content:
 
-            main.save_design(main,popup_summary)  # calling the function.
+                        content = file_content.read()
 
-            pdf_created = True   # if pdf created
+                    content = ast.literal_eval(content)   # convert dictionary string to dictionary
 
-            is_dict_same = True
-            '''
-            path = os.path.join(os.path.dirname(__file__), 'OUTPUT_FILES', 'Command_line_output', file_name + ".txt")
+                    output_dict = main.results_to_test(main)
 
-            if os.path.isfile(path):
+                    if output_dict != content:
 
-                with open(path,"r") as file_content:
-
-                    content = file_content.read()
-
-                content = ast.literal_eval(content)   # convert dictionary string to dictionary
-
-                output_dict = main.results_to_test(main)
-
-                if output_dict != content:
-
-                    is_dict_same = False    # if dictionary is not equal.
-            '''
-
-        open(os.path.join(os.path.dirname(__file__),'logging_text.log'), 'w').close() # better to clear the file than removing the handlers. More efficient.
-         # Remove the log handlers also if you don't want to see all the accumulated messages repeating each time.
+                        is_dict_same = False    # if dictionary is not equal.
+                '''
 
         return (pdf_created & is_dict_same)
 
@@ -1,5 +1,6 @@
 from utils.common.is800_2007 import *
-from pylatex import Math
+from design_report.equations import Math
+from design_report.deferred import defer_clauses
 from pylatex.utils import NoEscape
 
 
@@ -7748,4 +7749,8 @@ def prov_moment_load_bp(moment_input, min_mc, app_moment_load, moment_capacity,
     return app_moment_load_eqn
 # def dia_plate_thk_provided(t_wc,)
 #     t_wc
-# t_wc = round((1.9 * self.load_moment_effective * 1e6) / (self.column_D * self.beam_D * self.column_fy), 2)
\ No newline at end of file
+# t_wc = round((1.9 * self.load_moment_effective * 1e6) / (self.column_D * self.beam_D * self.column_fy), 2)
+
+
+# the equations are formatted when the report is written (see design_report.deferred)
+defer_clauses(globals(), exclude=('get_pass_fail', 'min_prov_max'))
@@ -14,8 +14,10 @@ import datetime
 
 
 from pylatex import Document, Section, Subsection, Tabular, Tabularx,MultiColumn
-from pylatex import Math, TikZ, Axis, Plot, Figure, Matrix, Alignat
+from pylatex import TikZ, Axis, Plot, Figure, Matrix, Alignat
 from pylatex.utils import italic, NoEscape
+from design_report.equations import Math
+from design_report.deferred import defer_clauses
 #from pdflatex import PDFLaTeX
 import os
 from pylatex import Document, PageStyle, Head, MiniPage, Foot, LargeText, \
@@ -2551,3 +2553,7 @@ def depth_req(e, g, row, sec =None):
 # geometry_options = {"top": "2in", "bottom": "1in", "left": "0.6in", "right": "0.6in", "headsep": "0.8in"}
 # doc = Document(geometry_options=geometry_options, indent=False)
 # report_bolt_shear_check(doc)
+
+
+# the equations are formatted when the report is written (see design_report.deferred)
+defer_clauses(globals(), exclude=('get_pass_fail', 'get_pass_fail2', 'min_prov_max'))
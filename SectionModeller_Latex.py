@@ -3,8 +3,10 @@ import time
 from pylatex import Document, Section,Figure,Head,Foot,NewPage,Command,NoEscape,Tabularx,PageStyle,Package
 from pylatex.utils import bold
 import sys
+import logging
 import datetime
 import os
+from design_report.latex_compiler import compile_tex, LatexError
 
 class CreateLatex(Document):
     def __init__(self):
@@ -127,7 +129,9 @@ class CreateLatex(Document):
                     view_3D.add_image(filename=view_3dimg_path)
 
                     view_3D.add_caption('3D View')   
-        try:            
-            doc.generate_pdf(filename, compiler='pdflatex', clean_tex=False)
-        except:
-            pass
\ No newline at end of file
+        doc.generate_tex(filename)
+        try:
+            compile_tex(filename + '.tex')
+        except LatexError as e:
+            # the section modeller reads the LaTeX log left next to the report
+            logging.getLogger('Osdag').error('The section report was not compiled: {}'.format(e))
\ No newline at end of file
@@ -0,0 +1 @@
+"""Headless batch tooling: running designs without the GUI, parameter sweeps and bulk exports."""
@@ -0,0 +1,206 @@
+"""Export the 3D models of many designs without the GUI
+
+Each design (an .osi file, or a design dictionary through the API) is
+designed, its assembly is built through CommonDesignLogic with no display and
+written in every requested format (STEP, IGES, BREP, binary STL). Designs are
+spread over a pool of worker processes; every file is timed.
+
+Example (every shipped example as STEP and STL, four workers):
+    python -m batch.cad_export ResourceFiles/design_example -o cad_export --format stp stl -j 4
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from utils.common import catalogue
+from design_type.registry import get_module_class
+from batch.runner import init_worker, load_design_file, run_design
+
+FORMATS = ('stp', 'igs', 'brep', 'stl')
+CAD_MODULES = (KEY_DISP_FINPLATE, KEY_DISP_BEAMCOVERPLATE, KEY_DISP_BEAMCOVERPLATEWELD, KEY_DISP_CLEATANGLE,
+               KEY_DISP_ENDPLATE, KEY_DISP_BASE_PLATE, KEY_DISP_SEATED_ANGLE, KEY_DISP_TENSION_BOLTED,
+               KEY_DISP_TENSION_WELDED, KEY_DISP_COLUMNCOVERPLATE, KEY_DISP_COLUMNCOVERPLATEWELD,
+               KEY_DISP_COLUMNENDPLATE, KEY_DISP_BCENDPLATE, KEY_DISP_BB_EP_SPLICE)
+
+
+def find_design_files(paths):
+    """.osi files given directly or found under the given directories, in order (list)."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '**', '*.osi'), recursive=True)))
+        else:
+            files.append(path)
+    return files
+
+
+def unique_names(paths):
+    """Output file names (without extension) for design files, numbered where they clash (list)."""
+    names, used = [], {}
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        used[name] = used.get(name, 0) + 1
+        names.append(name if used[name] == 1 else '{}_{}'.format(name, used[name]))
+    return names
+
+
+def build_model(module_class, module):
+    """
+    Build the 3D model of the design left on module_class, with no display.
+
+    Returns:
+        CommonDesignLogic holding the model, set to export the whole assembly
+    """
+    from cad.common_logic import CommonDesignLogic
+    if getattr(module_class, 'mainmodule', None) is None:
+        # some modules only set mainmodule while building their input dock
+        module_class.input_values(module_class)
+    logic = CommonDesignLogic(None, '', module, module_class.mainmodule)
+    logic.component = 'Model'
+    logic.set_design(True, module_class)
+    logic.get_3DModel()
+    return logic
+
+
+def export_design(design_dictionary, name, output_dir, formats=FORMATS, deflection=None):
+    """Design one connection/member and write its 3D model in every format.
+
+    Args:
+        design_dictionary: inputs as saved in an .osi file (dict)
+        name: output file name without extension (str)
+        output_dir: directory the files are written to (str)
+        formats: extensions to write, see cad.export (list of str)
+        deflection: (linear, angular) deflection of the STL tessellation, see
+            cad.export.mesh_shape (tuple)
+
+    Returns:
+        dictionary with 'name', 'module', 'design_status', 'errors',
+        'timings' (seconds taken by the design and the model build) and
+        'files' (path, format, seconds and bytes of each file written) (dict)
+    """
+    module = design_dictionary.get(KEY_MODULE)
+    report = {'name': name, 'module': module, 'design_status': False, 'errors': [], 'timings': {}, 'files': []}
+    if module not in CAD_MODULES:
+        report['errors'] = ['{} has no 3D model'.format(module)]
+        return report
+
+    start = time.perf_counter()
+    result = run_design(design_dictionary)
+    report['timings']['design'] = time.perf_counter() - start
+    report['design_status'] = result['design_status']
+    report['errors'] = result['errors']
+    if not result['design_status']:
+        report['errors'] = report['errors'] or ['design failed, no 3D model']
+        return report
+
+    try:
+        from cad.export import write_shape, FUSED_FORMATS, LINEAR_DEFLECTION, ANGULAR_DEFLECTION
+        linear_deflection, angular_deflection = deflection or (LINEAR_DEFLECTION, ANGULAR_DEFLECTION)
+        start = time.perf_counter()
+        logic = build_model(get_module_class(module), module)
+        report['timings']['build'] = time.perf_counter() - start
+
+        shapes = {}
+        for file_type in formats:
+            path = os.path.join(output_dir, '{}.{}'.format(name, file_type))
+            start = time.perf_counter()
+            fuse = file_type in FUSED_FORMATS
+            if fuse not in shapes:
+                shapes[fuse] = logic.create2Dcad(fuse=fuse)
+            write_shape(shapes[fuse], path, linear_deflection, angular_deflection)
+            report['files'].append({'path': path, 'format': file_type, 'seconds': time.perf_counter() - start,
+                                    'bytes': os.path.getsize(path)})
+    except Exception as e:
+        report['errors'].append(repr(e))
+    return report
+
+
+def run_export(designs, output_dir, formats=FORMATS, jobs=None, deflection=None, progress=None):
+    """Export the 3D models of many designs, one design per task of a worker pool.
+
+    Args:
+        designs: (name, design dictionary) pairs (list)
+        output_dir: directory the files are written to, created if needed (str)
+        formats: extensions to write (list of str)
+        jobs: number of worker processes, defaults to the CPU count (int)
+        deflection: (linear, angular) deflection of the STL tessellation (tuple)
+        progress: called with each export_design report as it completes
+
+    Returns:
+        export_design reports, in the order of designs (list of dict)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if jobs == 1:
+        catalogue.enable()
+        reports = []
+        for name, design_dictionary in designs:
+            reports.append(export_design(design_dictionary, name, output_dir, formats, deflection))
+            if progress is not None:
+                progress(reports[-1])
+        return reports
+
+    reports = [None] * len(designs)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker) as pool:
+        futures = {pool.submit(export_design, design_dictionary, name, output_dir, formats, deflection): i
+                   for i, (name, design_dictionary) in enumerate(designs)}
+        for future in as_completed(futures):
+            reports[futures[future]] = future.result()
+            if progress is not None:
+                progress(reports[futures[future]])
+    return reports
+
+
+def print_report(report):
+    if not report['files']:
+        print('{:<32} skipped: {}'.format(report['name'], '; '.join(str(e) for e in report['errors'])))
+        return
+    timings = report['timings']
+    print('{:<32} design {:7.2f} s   build {:7.2f} s'.format(report['name'], timings['design'], timings['build']))
+    for exported in report['files']:
+        print('    {:<44} {:7.2f} s {:>10.1f} kB'.format(os.path.basename(exported['path']), exported['seconds'],
+                                                       exported['bytes'] / 1024))
+    for error in report['errors']:
+        print('    error: {}'.format(error))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch.cad_export', description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='+', help='.osi design files or directories of them')
+    parser.add_argument('-o', '--output', default='cad_export', help='output directory')
+    parser.add_argument('--format', nargs='+', choices=FORMATS, default=['stp'], help='file formats to write')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--linear-deflection', type=float, default=0.5,
+                        help='STL: largest distance between faces and triangles in mm (default 0.5)')
+    parser.add_argument('--angular-deflection', type=float, default=0.5,
+                        help='STL: largest angle between neighbouring triangles in radians (default 0.5)')
+    parser.add_argument('--summary', metavar='PATH', help='also write every report and timing as JSON')
+    args = parser.parse_args(argv)
+
+    paths = find_design_files(args.inputs)
+    if not paths:
+        parser.error('no .osi design file found')
+    designs = list(zip(unique_names(paths), (load_design_file(path) for path in paths)))
+
+    start = time.perf_counter()
+    reports = run_export(designs, args.output, args.format, args.jobs,
+                         deflection=(args.linear_deflection, args.angular_deflection), progress=print_report)
+    elapsed = time.perf_counter() - start
+    written = sum(len(report['files']) for report in reports)
+    exported = sum(1 for report in reports if report['files'])
+    print('{} of {} designs exported, {} files in {:.1f} s, written to {}'.format(
+        exported, len(reports), written, elapsed, args.output))
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump({'seconds': elapsed, 'designs': reports}, f, indent=2)
+    return 0 if exported == len(reports) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Load test for the design service (batch.service)
+
+Sends the designs of one or more .osi files to a running service from a number
+of concurrent clients and reports throughput and latency percentiles.
+
+    python -m batch.service --workers 4 &
+    python -m batch.load_test ResourceFiles/design_example/fin*.osi -n 500 -c 8
+"""
+import sys
+import json
+import math
+import time
+import argparse
+import threading
+import urllib.request
+
+import yaml
+
+DEFAULT_URL = 'http://127.0.0.1:8765'
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list (float)."""
+    if not sorted_values:
+        return float('nan')
+    index = min(len(sorted_values) - 1, max(math.ceil(fraction * len(sorted_values)) - 1, 0))
+    return sorted_values[index]
+
+
+def post_design(url, payload):
+    request = urllib.request.Request(url + '/design', data=payload, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+def run_load_test(url, designs, requests, concurrency, batch_size=1):
+    """Send requests from concurrent clients and measure them.
+
+    Args:
+        url: base URL of the service (str)
+        designs: design dictionaries to cycle through (list)
+        requests: total number of HTTP requests (int)
+        concurrency: number of client threads (int)
+        batch_size: designs sent per request (int)
+
+    Returns:
+        dictionary with requests, designs, errors, elapsed time, requests/s,
+        designs/s and p50/p90/p99/max latency in ms (dict)
+    """
+    payloads = []
+    for i in range(len(designs)):
+        batch = [designs[(i + j) % len(designs)] for j in range(batch_size)]
+        payloads.append(json.dumps(batch if batch_size > 1 else batch[0]).encode('utf-8'))
+
+    latencies = []
+    errors = []
+    counter = iter(range(requests))
+    lock = threading.Lock()
+
+    def client():
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            start = time.perf_counter()
+            try:
+                post_design(url, payloads[i % len(payloads)])
+            except Exception as e:
+                with lock:
+                    errors.append(repr(e))
+                continue
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'designs': len(latencies) * batch_size,
+        'errors': len(errors),
+        'elapsed_s': elapsed,
+        'requests_per_s': len(latencies) / elapsed,
+        'designs_per_s': len(latencies) * batch_size / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p90_ms': percentile(latencies, 0.90) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': (latencies[-1] if latencies else float('nan')) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch.load_test', description=__doc__.split('\n')[0])
+    parser.add_argument('design_files', nargs='+', help='.osi files to send')
+    parser.add_argument('--url', default=DEFAULT_URL)
+    parser.add_argument('-n', '--requests', type=int, default=200)
+    parser.add_argument('-c', '--concurrency', type=int, default=4)
+    parser.add_argument('-b', '--batch-size', type=int, default=1, help='designs per request')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args(argv)
+
+    designs = []
+    for path in args.design_files:
+        with open(path, 'r') as fileObject:
+            designs.append(yaml.load(fileObject, yaml.Loader))
+    result = run_load_test(args.url, designs, args.requests, args.concurrency, args.batch_size)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print('{requests} requests ({designs} designs), {errors} errors in {elapsed_s:.2f} s'.format(**result))
+        print('{requests_per_s:.1f} requests/s, {designs_per_s:.1f} designs/s'.format(**result))
+        print('latency p50 {p50_ms:.1f} ms, p90 {p90_ms:.1f} ms, p99 {p99_ms:.1f} ms, max {max_ms:.1f} ms'.format(**result))
+    return 0 if result['errors'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
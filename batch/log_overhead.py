@@ -0,0 +1,85 @@
+"""Measure the per-design cost of logging
+
+Designs the same input repeatedly with
+    * logging switched off (baseline),
+    * the shared queue-based setup of utils.common.logs,
+    * the old set_osdaglogger behaviour, which added a console, a file and
+      (here) a buffer handler on every call,
+and prints the mean time per design and the logging overhead of each.
+
+    python -m batch.log_overhead ResourceFiles/design_example/fin1.osi -n 50
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import contextlib
+
+from batch.runner import load_design_file, run_design
+from utils.common import catalogue
+from utils.common.logs import LOGGER_NAME, setup_logger
+
+
+def _time_designs(design_dictionary, repeat, before_each=None):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if before_each is not None:
+            before_each()
+        run_design(design_dictionary)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def _legacy_handlers(log_file):
+    # What every set_osdaglogger call used to do, minus the GUI window.
+    logger = logging.getLogger(LOGGER_NAME)
+    formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                                  datefmt='%Y-%m-%d %H:%M:%S')
+    for handler in (logging.StreamHandler(open(os.devnull, 'w')), logging.FileHandler(log_file)):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+
+def measure(design_dictionary, repeat):
+    """
+    Returns:
+        mean milliseconds per design for 'disabled', 'queued' and 'legacy' logging (dict)
+    """
+    catalogue.enable()
+    logger = logging.getLogger(LOGGER_NAME)
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stderr(open(os.devnull, 'w')):
+        setup_logger(console=False, log_file=os.path.join(tmp, 'queued.log'))
+        run_design(design_dictionary)    # warm up imports and the catalogue
+
+        logger.disabled = True
+        disabled = _time_designs(design_dictionary, repeat)
+        logger.disabled = False
+
+        queued = _time_designs(design_dictionary, repeat)
+
+        saved_handlers = list(logger.handlers)
+        legacy = _time_designs(design_dictionary, repeat,
+                               lambda: _legacy_handlers(os.path.join(tmp, 'legacy.log')))
+        for handler in list(logger.handlers):
+            if handler not in saved_handlers:
+                logger.removeHandler(handler)
+                handler.close()
+    return {'disabled': disabled, 'queued': queued, 'legacy': legacy}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch.log_overhead', description=__doc__.split('\n')[0])
+    parser.add_argument('design_file', help='design to repeat (.osi)')
+    parser.add_argument('-n', '--repeat', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    times = measure(load_design_file(args.design_file), args.repeat)
+    for name in ('disabled', 'queued', 'legacy'):
+        print('{:<9} {:8.2f} ms/design  (+{:.2f} ms logging)'.format(
+            name, times[name], times[name] - times['disabled']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
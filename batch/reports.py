@@ -0,0 +1,218 @@
+"""Write the design reports of many designs without the GUI
+
+Each design (an .osi file) is designed and its LaTeX report written by a pool
+of worker processes; as soon as a report's .tex file is written it is
+compiled to PDF (see design_report.latex_compiler), each report in its own
+temporary directory and at most --latex-jobs at once, while the workers go on
+with the next designs. Failed compilations are listed with the lines of the
+LaTeX log around the error. Throughput is reported in reports per minute.
+
+With --views the four 3D views of each design are rendered offscreen into
+<name>_images (see cad.renderer; needs pythonocc) and the report includes
+them along with the 2D drawings, as reports saved from the GUI do.
+
+With --html each report is also written as <name>.html, streamed to the file
+as it is produced, with the images and style sheet shared by all reports
+stored once under <output>/assets (see design_report.html_report), and an
+index.html lists every design with links to its reports.
+
+Example (every shipped example, four design workers and four pdflatex runs):
+    python -m batch.reports ResourceFiles/design_example -o reports -j 4 --latex-jobs 4
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from design_type.registry import get_module_class, module_names
+from design_report.latex_compiler import compile_report
+from design_report import html_report
+from batch.runner import init_worker, load_design_file, run_design
+from batch.cad_export import CAD_MODULES, find_design_files, unique_names, build_model
+
+PROFILE_SUMMARY = {'CompanyName': '', 'CompanyLogo': '', 'Group/TeamName': '', 'Designer': ''}
+
+
+def report_summary(name, output_dir, logger_messages, project=None):
+    """
+    The dictionary the report dialog passes to save_design, for one design.
+
+    Args:
+        project: 'ProfileSummary', 'ProjectTitle', 'Subtitle', 'JobNumber',
+            'Client' and 'AdditionalComments' shared by every report (dict)
+    """
+    summary = {'ProfileSummary': dict(PROFILE_SUMMARY), 'ProjectTitle': '', 'Subtitle': '', 'JobNumber': '',
+               'Client': '', 'AdditionalComments': ''}
+    summary.update(project or {})
+    summary.update({'filename': os.path.join(output_dir, name), 'logger_messages': logger_messages,
+                    'does_design_exist': False, 'images_dir': None, 'compile_pdf': False})
+    return summary
+
+
+def write_report(design_dictionary, name, output_dir, project=None, views=False, html=False):
+    """Design one connection/member and write its LaTeX report (not compiled).
+
+    Returns:
+        dictionary with 'name', 'module', 'design_status', 'errors', 'tex'
+        and 'html' (None if the report could not be written, or no HTML was
+        asked for) and 'timings' (seconds taken by the design, the 3D views
+        and the reports) (dict)
+    """
+    module = design_dictionary.get(KEY_MODULE)
+    report = {'name': name, 'module': module, 'design_status': False, 'errors': [], 'tex': None, 'html': None,
+              'timings': {}}
+    if module not in module_names():
+        report['errors'] = ["No design module registered for '{}'".format(module)]
+        return report
+    start = time.perf_counter()
+    result = run_design(design_dictionary)
+    report['timings']['design'] = time.perf_counter() - start
+    report['design_status'] = result['design_status']
+    report['errors'] = list(result['errors'])
+    if report['errors']:
+        # rejected inputs: there is nothing to report
+        return report
+
+    module_class = get_module_class(module)
+    summary = report_summary(name, output_dir, result['logger_messages'], project)
+    if views and result['design_status'] and module in CAD_MODULES:
+        start = time.perf_counter()
+        try:
+            from cad.renderer import get_renderer
+            summary['images_dir'] = os.path.join(output_dir, name + '_images')
+            get_renderer().render(build_model(module_class, module), summary['images_dir'])
+            summary['does_design_exist'] = True
+        except Exception as e:
+            summary['images_dir'] = None
+            report['errors'].append('3D views: {!r}'.format(e))
+        report['timings']['views'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+        with open(os.devnull, 'w') as out, contextlib.redirect_stdout(out):
+            module_class.save_design(module_class, summary)
+        report['tex'] = summary['filename'] + '.tex'
+    except Exception as e:
+        report['errors'].append('report: {!r}'.format(e))
+    report['timings']['report'] = time.perf_counter() - start
+
+    if html and report['tex'] is not None:
+        start = time.perf_counter()
+        path = summary['filename'] + '.html'
+        try:
+            with open(path, 'w') as f:
+                html_report.write_report(f, module_class.report_input, module_class.report_check, summary,
+                                         html_report.AssetStore(output_dir))
+            report['html'] = path
+        except Exception as e:
+            report['errors'].append('HTML report: {!r}'.format(e))
+        report['timings']['html'] = time.perf_counter() - start
+    return report
+
+
+def run_reports(designs, output_dir, jobs=None, latex_jobs=None, project=None, views=False, progress=None,
+                html=False):
+    """Write and compile the reports of many designs.
+
+    Args:
+        designs: (name, design dictionary) pairs (list)
+        output_dir: directory the reports are written to, created if needed (str)
+        jobs: worker processes designing and writing reports, defaults to the CPU count (int)
+        latex_jobs: reports compiled at once, defaults to the CPU count (int)
+        project: project details printed in every report header, see report_summary() (dict)
+        views: render the 3D views into the reports (bool)
+        progress: called with each report as its PDF is done (or fails)
+        html: also write every report as HTML, and an index.html of the batch (bool)
+
+    Returns:
+        write_report dictionaries, in the order of designs, with 'pdf',
+        'latex_error' and timings['latex'] added (list of dict)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    reports = [None] * len(designs)
+
+    def compiled(i, future):
+        result = future.result()
+        reports[i].update({'pdf': result['pdf'], 'latex_error': result['error']})
+        reports[i]['timings']['latex'] = result['seconds']
+        return reports[i]
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker) as pool, \
+            ThreadPoolExecutor(max_workers=latex_jobs or os.cpu_count() or 1) as latex_pool:
+        futures = {pool.submit(write_report, design_dictionary, name, output_dir, project, views, html): i
+                   for i, (name, design_dictionary) in enumerate(designs)}
+        compiling = {}
+        for future in as_completed(futures):
+            i = futures[future]
+            reports[i] = future.result()
+            reports[i].update({'pdf': None, 'latex_error': None})
+            if reports[i]['tex'] is not None:
+                compiling[latex_pool.submit(compile_report, reports[i]['tex'])] = i
+            elif progress is not None:
+                progress(reports[i])
+        for future in as_completed(compiling):
+            report = compiled(compiling[future], future)
+            if progress is not None:
+                progress(report)
+    if html:
+        html_report.write_index(os.path.join(output_dir, 'index.html'), reports, html_report.AssetStore(output_dir))
+    return reports
+
+
+def print_report(report):
+    if report['pdf'] is not None:
+        print('{:<32} {:<10} design {:6.2f} s   report {:6.2f} s   pdf {:6.2f} s'.format(
+            report['name'], 'designed' if report['design_status'] else 'unsafe', report['timings']['design'],
+            report['timings']['report'], report['timings']['latex']))
+    elif report['latex_error'] is not None:
+        print('{:<32} pdflatex failed: {}'.format(report['name'], report['latex_error'].replace('\n', '\n    ')))
+    else:
+        print('{:<32} no report: {}'.format(report['name'], '; '.join(str(e) for e in report['errors'])))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch.reports', description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='+', help='.osi design files or directories of them')
+    parser.add_argument('-o', '--output', default='reports', help='output directory')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='design worker processes (default: CPU count)')
+    parser.add_argument('--latex-jobs', type=int, default=None, help='reports compiled at once (default: CPU count)')
+    parser.add_argument('--project', metavar='PATH',
+                        help='JSON file with the ProfileSummary, ProjectTitle, Subtitle, JobNumber and Client '
+                             'printed in every report header')
+    parser.add_argument('--views', action='store_true', help='render the 3D views into the reports (needs pythonocc)')
+    parser.add_argument('--html', action='store_true',
+                        help='also write every report as HTML, and an index.html linking them all')
+    parser.add_argument('--summary', metavar='PATH', help='also write every report and timing as JSON')
+    args = parser.parse_args(argv)
+
+    paths = find_design_files(args.inputs)
+    if not paths:
+        parser.error('no .osi design file found')
+    project = None
+    if args.project:
+        with open(args.project) as f:
+            project = json.load(f)
+    designs = list(zip(unique_names(paths), (load_design_file(path) for path in paths)))
+
+    start = time.perf_counter()
+    reports = run_reports(designs, args.output, args.jobs, args.latex_jobs, project, args.views,
+                          progress=print_report, html=args.html)
+    elapsed = time.perf_counter() - start
+    done = sum(1 for report in reports if report['pdf'] is not None)
+    print('{} of {} reports compiled in {:.1f} s ({:.1f} reports/min), written to {}'.format(
+        done, len(reports), elapsed, done / elapsed * 60 if elapsed else 0.0, args.output))
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump({'seconds': elapsed, 'reports_per_minute': done / elapsed * 60 if elapsed else 0.0,
+                       'reports': reports}, f, indent=2)
+    return 0 if done == len(reports) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
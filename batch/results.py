@@ -0,0 +1,317 @@
+"""Design results as typed records, written in bulk to JSON Lines, Parquet or Arrow files
+
+Every module gets a result schema: the name of the design, its module, design
+status and errors, then one field per output of its output dock (the values
+behind the detail buttons included), in dock order, as given by
+output_values. The type of each output field (float64 or string) is fixed
+from the first batch of results of the module: float64 if every value given
+is a number, string otherwise. Every record written after that follows the
+schema: numbers are floats (or null), text is text, whatever the module put
+in its dock.
+
+The writers keep at most one batch of results per module in memory:
+    .jsonl    one JSON object per line, for all modules in one file
+    .parquet  one Parquet file per module (<name>-<module>.parquet), a row
+    .arrow    group (or record batch) per batch of results; needs pyarrow
+
+Example (every shipped example designed by four workers, as Parquet):
+    python -m batch.results ResourceFiles/design_example -o results.parquet -j 4
+"""
+import os
+import re
+import sys
+import json
+import math
+import time
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from design_type.registry import get_module_class, module_names
+from batch.runner import init_worker, load_design_file, run_design
+from batch.cad_export import find_design_files, unique_names
+
+BATCH_SIZE = 4096
+FORMATS = ('.jsonl', '.parquet', '.arrow')
+BASE_FIELDS = (('name', 'Name', 'string'), ('module', 'Module', 'string'), ('design_status', 'Design Status', 'bool'),
+               ('errors', 'Errors', 'string'))
+
+
+def output_fields(module_class):
+    """
+    The outputs of a module's dock, without designing anything: what
+    output_values gives for a design that does not exist. Docks and detail
+    buttons that cannot be listed without a design are left out.
+
+    Returns:
+        (key, label) pairs in dock order (list of tuple)
+    """
+    fields, seen = [], set()
+
+    def add(options):
+        for option in options:
+            if option[2] == TYPE_TEXTBOX and option[0] is not None and option[0] not in seen:
+                seen.add(option[0])
+                fields.append((option[0], option[1]))
+
+    try:
+        options = module_class.output_values(module_class, False)
+    except Exception:
+        # the dock of some modules needs a design; their results give the fields
+        return fields
+    add(options)
+    for option in options:
+        if option[2] == TYPE_OUT_BUTTON:
+            try:
+                add(option[3][1](module_class, False))
+            except Exception:
+                pass
+    return fields
+
+
+def _to_float(value):
+    if value is None or value == '' or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def _is_number(value):
+    if isinstance(value, bool):
+        return False
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+class ResultSchema(object):
+    """The fields of the result records of one module: (name, label, type) triples."""
+
+    def __init__(self, module, fields):
+        self.module = module
+        self.fields = fields
+        self._outputs = [(name, dtype) for name, _, dtype in fields[len(BASE_FIELDS):]]
+
+    @classmethod
+    def infer(cls, module, results):
+        """
+        Schema of a module from its dock and a batch of its results; outputs
+        of the results that the dock does not list are added after its own.
+        """
+        labels = {}
+        if module in module_names():
+            with open(os.devnull, 'w') as out, contextlib.redirect_stdout(out):
+                labels.update(output_fields(get_module_class(module)))
+        for result in results:
+            for key in result['outputs']:
+                labels.setdefault(key, key)
+        fields = list(BASE_FIELDS)
+        for key, label in labels.items():
+            values = [result['outputs'][key] for result in results
+                      if result['outputs'].get(key) not in (None, '')]
+            numeric = all(_is_number(value) for value in values)
+            fields.append((key, str(label), 'float64' if numeric else 'string'))
+        return cls(module, fields)
+
+    def record(self, result):
+        """A result of run_design (with its 'name') as a record of this schema (dict)."""
+        record = {'name': result.get('name', ''), 'module': self.module,
+                  'design_status': bool(result['design_status']),
+                  'errors': '; '.join(str(e) for e in result['errors'])}
+        outputs = result['outputs']
+        for name, dtype in self._outputs:
+            value = outputs.get(name)
+            if dtype == 'float64':
+                record[name] = _to_float(value)
+            else:
+                record[name] = None if value is None else str(value)
+        return record
+
+    def to_dict(self):
+        return {'module': self.module, 'fields': [{'name': name, 'label': label, 'type': dtype}
+                                                  for name, label, dtype in self.fields]}
+
+    def arrow_schema(self):
+        import pyarrow
+        types = {'bool': pyarrow.bool_(), 'float64': pyarrow.float64(), 'string': pyarrow.string()}
+        return pyarrow.schema([pyarrow.field(name, types[dtype]) for name, _, dtype in self.fields])
+
+
+class ResultWriter(object):
+    """
+    Writes results of run_design, with their 'name', in batches. Results of a
+    module are held until its first batch is full (or the writer is closed),
+    which fixes its schema; after that every batch goes straight to the file.
+    """
+
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self.schemas = {}
+        self.count = 0
+        self._pending = {}
+
+    def write(self, result):
+        module = result['module']
+        pending = self._pending.setdefault(module, [])
+        pending.append(result)
+        if len(pending) >= self.batch_size:
+            self._flush(module)
+
+    def _flush(self, module):
+        results = self._pending.pop(module, [])
+        if not results:
+            return
+        if module not in self.schemas:
+            self.schemas[module] = ResultSchema.infer(module, results)
+        schema = self.schemas[module]
+        self._write_records(schema, [schema.record(result) for result in results])
+        self.count += len(results)
+
+    def _write_records(self, schema, records):
+        raise NotImplementedError
+
+    def close(self):
+        for module in list(self._pending):
+            self._flush(module)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JsonlWriter(ResultWriter):
+    """All modules in one JSON Lines file, one record per line."""
+
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        super(JsonlWriter, self).__init__(path, batch_size)
+        self._file = open(path, 'w')
+
+    def _write_records(self, schema, records):
+        self._file.write(''.join(json.dumps(record) + '\n' for record in records))
+
+    def close(self):
+        super(JsonlWriter, self).close()
+        self._file.close()
+
+
+class ArrowWriter(ResultWriter):
+    """One Parquet (.parquet) or Arrow IPC (.arrow) file per module."""
+
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("Writing Parquet and Arrow files needs pyarrow (pip install pyarrow)")
+        super(ArrowWriter, self).__init__(path, batch_size)
+        self.paths = {}
+        self._writers = {}
+
+    def module_path(self, module):
+        """File the results of a module go to (str)."""
+        root, extension = os.path.splitext(self.path)
+        return '{}-{}{}'.format(root, re.sub(r'[^0-9A-Za-z]+', '_', module).strip('_').lower(), extension)
+
+    def _write_records(self, schema, records):
+        import pyarrow
+        arrow_schema = schema.arrow_schema()
+        if schema.module not in self._writers:
+            path = self.paths[schema.module] = self.module_path(schema.module)
+            if self.path.lower().endswith('.parquet'):
+                import pyarrow.parquet
+                self._writers[schema.module] = pyarrow.parquet.ParquetWriter(path, arrow_schema)
+            else:
+                import pyarrow.ipc
+                self._writers[schema.module] = pyarrow.ipc.new_file(path, arrow_schema)
+        columns = {name: [record[name] for record in records] for name, _, _ in schema.fields}
+        self._writers[schema.module].write_table(pyarrow.table(columns, schema=arrow_schema))
+
+    def close(self):
+        super(ArrowWriter, self).close()
+        for writer in self._writers.values():
+            writer.close()
+
+
+def open_writer(path, batch_size=BATCH_SIZE):
+    """A result writer for the format given by the file extension (ResultWriter)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.jsonl':
+        return JsonlWriter(path, batch_size)
+    if extension in ('.parquet', '.arrow'):
+        return ArrowWriter(path, batch_size)
+    raise ValueError("Unknown result format '{}', use {}".format(extension, ', '.join(FORMATS)))
+
+
+def design_result(design_dictionary, name):
+    """run_design() of one design, with its 'name' and without its log (dict)."""
+    module = design_dictionary.get(KEY_MODULE)
+    if module not in module_names():
+        return {'name': name, 'module': str(module), 'design_status': False, 'outputs': {},
+                'errors': ["No design module registered for '{}'".format(module)]}
+    result = run_design(design_dictionary)
+    result.pop('logger_messages')
+    result['name'] = name
+    return result
+
+
+def design_results(designs, jobs=None, worker=design_result):
+    """
+    Design many connections/members in a pool of worker processes.
+
+    Args:
+        designs: (name, design dictionary) pairs (list)
+        jobs: worker processes, defaults to the CPU count (int)
+        worker: designs one design in a worker process, called with its design
+            dictionary and name; a module level function (default: design_result)
+
+    Yields:
+        worker() of each design, in order
+    """
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker) as pool:
+        chunksize = max(1, len(designs) // (4 * (jobs or os.cpu_count() or 1)))
+        for result in pool.map(worker, [d for _, d in designs], [name for name, _ in designs],
+                               chunksize=chunksize):
+            yield result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch.results', description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='+', help='.osi design files or directories of them')
+    parser.add_argument('-o', '--output', default='results.jsonl', help='result file ({})'.format(', '.join(FORMATS)))
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='results of a module written at once')
+    parser.add_argument('--schema', metavar='PATH', help='also write the schema of every module as JSON')
+    args = parser.parse_args(argv)
+
+    paths = find_design_files(args.inputs)
+    if not paths:
+        parser.error('no .osi design file found')
+    designs = list(zip(unique_names(paths), (load_design_file(path) for path in paths)))
+
+    start = time.perf_counter()
+    passed = 0
+    with open_writer(args.output, args.batch_size) as writer:
+        for result in design_results(designs, args.jobs):
+            passed += bool(result['design_status'])
+            writer.write(result)
+    elapsed = time.perf_counter() - start
+    outputs = sorted(writer.paths.values()) if isinstance(writer, ArrowWriter) else [args.output]
+    print('{} designs, {} safe, written in {:.1f} s to {}'.format(writer.count, passed, elapsed, ', '.join(outputs)))
+    if args.schema:
+        with open(args.schema, 'w') as f:
+            json.dump([schema.to_dict() for schema in writer.schemas.values()], f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
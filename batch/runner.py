@@ -0,0 +1,83 @@
+"""Run a single design headlessly, the way the GUI's Design button does, and
+collect the output dock values as plain Python data.
+"""
+import os
+import sys
+import contextlib
+
+import yaml
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from utils.common import catalogue
+from utils.common.logs import setup_logger, DesignLogBuffer
+from design_type.registry import get_module_class
+
+
+def load_design_file(path):
+    """Read an .osi design file and return its design dictionary (dict)."""
+    with open(path, 'r') as fileObject:
+        return yaml.load(fileObject, yaml.Loader)
+
+
+def collect_outputs(module_class, status):
+    """Flatten the output dock, including the values behind its detail buttons.
+
+    Args:
+        module_class: design class after func_for_validation has run
+        status: design status passed to output_values (bool)
+
+    Returns:
+        output key -> displayed value, in output dock order (dict)
+    """
+    outputs = {}
+    for option in module_class.output_values(module_class, status):
+        if option[2] == TYPE_TEXTBOX and option[0] is not None:
+            outputs.setdefault(option[0], option[3])
+        elif option[2] == TYPE_OUT_BUTTON and status:
+            for detail in option[3][1](module_class, status):
+                if detail[2] == TYPE_TEXTBOX and detail[0] is not None:
+                    outputs.setdefault(detail[0], detail[3])
+    return outputs
+
+
+def init_worker():
+    """Initializer of the batch worker pools: no log file or console, catalogue rows memoised."""
+    # the first setup in a process decides the handlers: no shared log file for parallel workers
+    setup_logger(console=False, log_file=None)
+    catalogue.enable()
+
+
+def run_design(design_dictionary, quiet=True):
+    """Validate and design one connection/member.
+
+    Args:
+        design_dictionary: inputs as saved in an .osi file (dict)
+        quiet: discard the modules' print() output and, if this is the first
+            design of the process, keep log messages off the console (bool)
+
+    Returns:
+        dictionary with keys 'module', 'design_status', 'errors', 'outputs'
+        and 'logger_messages', the LogEntry records of the design (dict)
+    """
+    module = design_dictionary[KEY_MODULE]
+    result = {'module': module, 'design_status': False, 'errors': [], 'outputs': {}, 'logger_messages': []}
+    module_class = get_module_class(module)
+
+    setup_logger(console=not quiet)
+    with open(os.devnull, 'w') if quiet else contextlib.nullcontext(sys.stdout) as out, \
+            contextlib.redirect_stdout(out), DesignLogBuffer() as log_buffer:
+        module_class.set_osdaglogger(None)
+        try:
+            error = module_class.func_for_validation(module_class, dict(design_dictionary))
+            if error is not None:
+                result['errors'] = list(error)
+            else:
+                result['design_status'] = bool(module_class.design_status)
+                result['outputs'] = collect_outputs(module_class, module_class.design_status)
+        except Exception as e:
+            result['design_status'] = False
+            result['errors'] = [repr(e)]
+    result['logger_messages'] = log_buffer.entries()
+    return result
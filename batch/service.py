@@ -0,0 +1,149 @@
+"""Local HTTP/JSON design service
+
+Keeps a pool of worker processes with every design module imported and the
+catalogue memoised, so a design request only pays for the design itself.
+The server binds to localhost and needs no network access.
+
+Endpoints:
+    GET  /modules   names of the modules that can be designed
+    GET  /health    'ok' and the number of workers
+    POST /design    body is a design dictionary (as saved in an .osi file) or a
+                    list of them (batch); returns the result of run_design for
+                    each, in the same shape
+
+Start with:
+    python -m batch.service --port 8765 --workers 4
+"""
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from design_type.registry import module_names, get_module_class
+from batch.runner import init_worker, run_design
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+
+def _warm_worker():
+    init_worker()
+    for name in module_names():
+        get_module_class(name)
+
+
+class DesignService(object):
+    """Pool of warm design workers, shared by all request threads of the server."""
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+        # Start every worker now rather than on the first requests.
+        list(self.pool.map(_noop, range(self.workers)))
+
+    def design(self, design_dictionaries):
+        """Design a batch of inputs in parallel, returning results in request order (list)."""
+        futures = [self.pool.submit(run_design, d) for d in design_dictionaries]
+        return [f.result() for f in futures]
+
+    def shutdown(self):
+        self.pool.shutdown()
+
+
+def _noop(_):
+    return None
+
+
+class DesignRequestHandler(BaseHTTPRequestHandler):
+
+    service = None
+
+    def do_GET(self):
+        if self.path == '/modules':
+            self._reply(200, module_names())
+        elif self.path == '/health':
+            self._reply(200, {'status': 'ok', 'workers': self.service.workers})
+        else:
+            self._reply(404, {'error': 'Unknown path {}'.format(self.path)})
+
+    def do_POST(self):
+        if self.path != '/design':
+            self._reply(404, {'error': 'Unknown path {}'.format(self.path)})
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        if length > MAX_BODY_SIZE:
+            self._reply(413, {'error': 'Request body too large'})
+            return
+        try:
+            body = json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError as e:
+            self._reply(400, {'error': 'Invalid JSON: {}'.format(e)})
+            return
+
+        batch = isinstance(body, list)
+        design_dictionaries = body if batch else [body]
+        if not all(isinstance(d, dict) and KEY_MODULE in d for d in design_dictionaries):
+            self._reply(400, {'error': "Each design must be an object with a '{}' key".format(KEY_MODULE)})
+            return
+        unknown = [d[KEY_MODULE] for d in design_dictionaries if d[KEY_MODULE] not in module_names()]
+        if unknown:
+            self._reply(400, {'error': 'Unknown module(s): {}'.format(', '.join(sorted(set(unknown))))})
+            return
+
+        results = self.service.design(design_dictionaries)
+        self._reply(200, results if batch else results[0])
+
+    def _reply(self, code, data):
+        payload = json.dumps(data, default=str).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None):
+    """Create (but do not start) the design server and its worker pool.
+
+    Returns:
+        ThreadingHTTPServer with the DesignService under server.service
+    """
+    service = DesignService(workers)
+    handler = type('BoundDesignRequestHandler', (DesignRequestHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch.service', description=__doc__.split('\n')[0])
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('-w', '--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.workers)
+    print('Osdag design service on http://{}:{} ({} workers)'.format(
+        args.host, server.server_address[1], server.service.workers))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""Parametric sweeps over design inputs
+
+Takes a base design dictionary (usually an .osi file saved from the GUI),
+expands ranges/lists given for any input key into a grid, designs every grid
+point in a pool of worker processes and writes the governing capacities and
+pass/fail of each point as columns (CSV, NumPy .npz or Parquet).
+
+Work shared between grid points is done once:
+    * grid points that normalise to the same inputs are designed only once,
+    * each worker memoises catalogue rows (sections, materials, bolt grades),
+      see utils.common.catalogue.
+
+Example (maximum shear of a fin plate for three beams):
+    python -m batch.sweep ResourceFiles/design_example/fin1.osi \\
+        --set Member.Supported_Section.Designation="MB 300,MB 350,MB 400" \\
+        --capacity Load.Shear --upper 1000 -o fin_capacity.csv
+"""
+import os
+import csv
+import sys
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from utils.common import catalogue
+from utils.common import profiling
+from design_type.registry import get_module_class
+from batch.runner import init_worker, load_design_file, run_design
+
+CAPACITY_TOLERANCE = 1.0
+
+
+def parse_values(text):
+    """Parse a sweep value specification.
+
+    'start:stop:step' gives an inclusive numeric range, 'a,b,c' a list and
+    anything else a single value.
+
+    Args:
+        text: value specification (str)
+
+    Returns:
+        values as strings, the way the input dock stores them (list)
+    """
+    if text.count(':') == 2 and ',' not in text:
+        start, stop, step = (float(v) for v in text.split(':'))
+        if step <= 0:
+            raise ValueError("Sweep step must be positive: '{}'".format(text))
+        values = []
+        i = 0
+        while start + i * step <= stop + 1e-9 * step:
+            values.append(_format_number(start + i * step))
+            i += 1
+        return values
+    return [v.strip() for v in text.split(',') if v.strip() != '']
+
+
+def _format_number(value):
+    value = round(value, 9)
+    return str(int(value)) if value == int(value) else str(value)
+
+
+def expand_grid(base, sweep):
+    """Expand sweep ranges into one design dictionary per grid point.
+
+    Keys whose value in the base design is a list (e.g. Bolt.Diameter) are
+    swept one item at a time, so each point fixes that input.
+
+    Args:
+        base: base design dictionary (dict)
+        sweep: input key -> list of values to try (dict)
+
+    Returns:
+        list of (point, design dictionary) where point holds the swept values (list)
+    """
+    keys = list(sweep.keys())
+    grid = []
+    for combination in itertools.product(*(sweep[k] for k in keys)):
+        design_dictionary = dict(base)
+        point = dict(zip(keys, combination))
+        for key, value in point.items():
+            design_dictionary[key] = [str(value)] if isinstance(base.get(key), list) else str(value)
+        grid.append((point, design_dictionary))
+    return grid
+
+
+def _design_key(design_dictionary):
+    return tuple(sorted((k, tuple(v) if isinstance(v, list) else v)
+                        for k, v in design_dictionary.items()))
+
+
+def _design_point(design_dictionary, capacity_key=None, upper=None, profile=False):
+    if profile:
+        profiling.instrument([get_module_class(design_dictionary[KEY_MODULE])])
+        profiling.reset()
+    if capacity_key is None:
+        result = run_design(design_dictionary)
+    else:
+        result = find_capacity(design_dictionary, capacity_key, upper)
+    if profile:
+        result['profile'] = profiling.snapshot()
+    return result
+
+
+def find_capacity(design_dictionary, load_key, upper, tolerance=CAPACITY_TOLERANCE):
+    """Find the largest value of a load input for which the design passes.
+
+    Design status is assumed to be monotonic in the load, so the capacity is
+    bisected between zero and the upper bound.
+
+    Args:
+        design_dictionary: inputs of the grid point (dict)
+        load_key: load input to increase, e.g. KEY_SHEAR (str)
+        upper: largest load tried (float)
+        tolerance: bisection stops when the bracket is narrower than this (float)
+
+    Returns:
+        run_design result of the governing (largest passing) load, with the
+        capacity under result['capacity'] (None if even the smallest load fails) (dict)
+    """
+    low, high = 0.0, float(upper)
+    best = None
+    trial = dict(design_dictionary)
+    trial[load_key] = _format_number(high)
+    result = run_design(trial)
+    if result['design_status']:
+        result['capacity'] = high
+        return result
+    while high - low > tolerance:
+        mid = (low + high) / 2
+        trial[load_key] = _format_number(mid)
+        result = run_design(trial)
+        if result['design_status']:
+            low, best = mid, result
+        else:
+            high = mid
+    if best is None:
+        best = result
+        best['capacity'] = None
+    else:
+        best['capacity'] = low
+    return best
+
+
+def run_sweep(base, sweep, jobs=None, capacity_key=None, upper=None, profile=None):
+    """Design every point of a sweep grid.
+
+    Args:
+        base: base design dictionary (dict)
+        sweep: input key -> list of values to try (dict)
+        jobs: number of worker processes, defaults to the CPU count (int)
+        capacity_key: if given, bisect this load input for each point (str)
+        upper: upper bound of the load bisection (float)
+        profile: if a dictionary is given, the timings of each module's clauses and
+            stages are collected in it, keyed by module name (see utils.common.profiling)
+
+    Returns:
+        one row per grid point, with the swept inputs, 'design_status',
+        'errors' and every output value as columns (list of dict)
+    """
+    if capacity_key is not None and upper is None:
+        raise ValueError("An upper load bound is needed to find the capacity")
+    grid = expand_grid(base, sweep)
+
+    unique = {}
+    for point, design_dictionary in grid:
+        unique.setdefault(_design_key(design_dictionary), design_dictionary)
+    keys = list(unique.keys())
+
+    if jobs == 1:
+        catalogue.enable()
+        results = [_design_point(unique[k], capacity_key, upper, profile is not None) for k in keys]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker) as pool:
+            results = list(pool.map(_design_point, [unique[k] for k in keys],
+                                    itertools.repeat(capacity_key), itertools.repeat(upper),
+                                    itertools.repeat(profile is not None),
+                                    chunksize=max(1, len(keys) // (4 * (jobs or os.cpu_count() or 1)))))
+    by_key = dict(zip(keys, results))
+    if profile is not None:
+        for result in results:
+            profiling.merge(profile.setdefault(result['module'], {}), result.pop('profile'))
+
+    rows = []
+    for point, design_dictionary in grid:
+        result = by_key[_design_key(design_dictionary)]
+        row = dict(point)
+        row['design_status'] = result['design_status']
+        if capacity_key is not None:
+            row['capacity'] = result.get('capacity')
+        row['errors'] = '; '.join(str(e) for e in result['errors'])
+        row.update(result['outputs'])
+        rows.append(row)
+    return rows
+
+
+def to_columns(rows):
+    """Turn result rows into columns, filling outputs missing from a row with None (dict)."""
+    names = []
+    for row in rows:
+        for name in row:
+            if name not in names:
+                names.append(name)
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def write_results(rows, path):
+    """Write sweep results, the format being chosen by the file extension (.csv, .npz, .parquet)."""
+    columns = to_columns(rows)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(list(columns.keys()))
+            writer.writerows(zip(*columns.values()))
+    elif extension == '.npz':
+        import numpy as np
+        np.savez(path, **{name: np.array(_numeric_or_text(values)) for name, values in columns.items()})
+    elif extension == '.parquet':
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Writing Parquet files needs pyarrow (pip install pyarrow)")
+        table = pyarrow.table({name: _numeric_or_text(values) for name, values in columns.items()})
+        pyarrow.parquet.write_table(table, path)
+    else:
+        raise ValueError("Unknown result format '{}', use .csv, .npz or .parquet".format(extension))
+
+
+def _numeric_or_text(values):
+    """Return values as floats when every value is numeric (None -> nan), else as strings."""
+    numbers = []
+    for value in values:
+        if value is None or value == '':
+            numbers.append(float('nan'))
+            continue
+        if isinstance(value, bool):
+            numbers.append(float(value))
+            continue
+        try:
+            numbers.append(float(value))
+        except (TypeError, ValueError):
+            return ['' if v is None else str(v) for v in values]
+    return numbers
+
+
+def _write_profile(profile, args):
+    for module, data in profile.items():
+        if args.profile:
+            print('\n' + module)
+            print(profiling.format_hotspots(data))
+        if args.profile_stacks:
+            path = args.profile_stacks
+            if len(profile) > 1:
+                root, extension = os.path.splitext(path)
+                path = '{}_{}{}'.format(root, module.replace(' ', '_'), extension)
+            with open(path, 'w') as f:
+                f.write(profiling.collapsed_stacks(data))
+    if args.profile_json:
+        profiling.to_json(profile, args.profile_json)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch.sweep', description=__doc__.split('\n')[0])
+    parser.add_argument('design_file', help='base design (.osi)')
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUES',
+                        help="input to sweep, VALUES being 'start:stop:step' or 'a,b,c' (repeatable)")
+    parser.add_argument('--capacity', metavar='LOAD_KEY',
+                        help='find the largest passing value of this load input at every point')
+    parser.add_argument('--upper', type=float, help='upper bound for --capacity')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('-o', '--output', default='sweep.csv', help='result file (.csv, .npz or .parquet)')
+    parser.add_argument('--profile', action='store_true', help='print the top hotspots of each module')
+    parser.add_argument('--profile-json', metavar='PATH', help='also write the profile as JSON')
+    parser.add_argument('--profile-stacks', metavar='PATH',
+                        help='also write collapsed stacks for flame graphs (one file per module if several)')
+    args = parser.parse_args(argv)
+
+    sweep = {}
+    for item in args.set:
+        if '=' not in item:
+            parser.error("--set expects KEY=VALUES, got '{}'".format(item))
+        key, values = item.split('=', 1)
+        sweep[key.strip()] = parse_values(values)
+
+    base = load_design_file(args.design_file)
+    profile = {} if (args.profile or args.profile_json or args.profile_stacks) else None
+    rows = run_sweep(base, sweep, jobs=args.jobs, capacity_key=args.capacity, upper=args.upper, profile=profile)
+    write_results(rows, args.output)
+    passed = sum(1 for row in rows if row['design_status'])
+    print("{} grid points, {} safe, results written to {}".format(len(rows), passed, args.output))
+    if profile is not None:
+        _write_profile(profile, args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
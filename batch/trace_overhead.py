@@ -0,0 +1,70 @@
+"""Measure the design-time cost of trace points
+
+Designs each input repeatedly with every trace channel off and then on
+(events counted by a sink that drops them), and prints the mean time per
+design and the number of trace events a design emits.
+
+    python -m batch.trace_overhead ResourceFiles/design_example/fin1.osi \\
+        ResourceFiles/design_example/EP-1.osi ResourceFiles/design_example/tension_b_angle.osi
+"""
+import os
+import sys
+import time
+import argparse
+import contextlib
+
+from batch.runner import load_design_file, run_design
+from utils.common import catalogue
+from utils.common import trace
+from utils.common.logs import setup_logger
+
+
+def _time_designs(design_dictionary, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run_design(design_dictionary)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def measure(design_dictionary, repeat):
+    """
+    Returns:
+        mean milliseconds per design with tracing 'off' and 'on', and trace
+        'events' per design (dict)
+    """
+    catalogue.enable()
+    setup_logger(console=False, log_file=None)
+    run_design(design_dictionary)    # warm up imports and the catalogue
+
+    trace.disable()
+    off = _time_designs(design_dictionary, repeat)
+
+    events = []
+    count = lambda record: events.append(None)
+    trace.add_sink(count)
+    trace.enable('*')
+    try:
+        on = _time_designs(design_dictionary, repeat)
+    finally:
+        trace.disable()
+        trace.remove_sink(count)
+    return {'off': off, 'on': on, 'events': len(events) / repeat}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch.trace_overhead', description=__doc__.split('\n')[0])
+    parser.add_argument('design_files', nargs='+', help='designs to repeat (.osi)')
+    parser.add_argument('-n', '--repeat', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print('{:<24} {:>10} {:>10} {:>14}'.format('design', 'off (ms)', 'on (ms)', 'events/design'))
+    for path in args.design_files:
+        with contextlib.redirect_stderr(open(os.devnull, 'w')):
+            times = measure(load_design_file(path), args.repeat)
+        print('{:<24} {:>10.2f} {:>10.2f} {:>14.0f}'.format(
+            os.path.basename(path), times['off'], times['on'], times['events']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Benchmark cases: the shipped examples and synthetic stress inputs
+
+Example cases are the .osi files of ResourceFiles/design_example, one case per
+file. Stress cases start from the first example of each module and widen it:
+    * all_bolts_plates: every bolt diameter, bolt grade and plate thickness,
+    * all_sections: one design per section of the catalogue table the
+      example's section comes from (or every section at once when the module
+      takes a list of sections to optimise over).
+"""
+import os
+import re
+import glob
+from collections import OrderedDict
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from utils.common import catalogue
+from design_type.registry import DESIGN_MODULES
+from batch.runner import load_design_file
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'ResourceFiles', 'design_example')
+SECTION_TABLES = ('Beams', 'Columns', 'Angles', 'Channels')
+SECTION_KEYS = (KEY_SUPTDSEC, KEY_SECSIZE)
+PLATE_THICKNESS_KEYS = (KEY_PLATETHK, KEY_FLANGEPLATE_THICKNESS, KEY_WEBPLATE_THICKNESS)
+
+
+class Case(object):
+    """One benchmark case: a module and the design dictionaries designed in one timed run."""
+
+    def __init__(self, name, module, design_dictionaries):
+        self.name = name
+        self.module = module
+        self.design_dictionaries = design_dictionaries
+
+
+def example_cases(examples_dir=EXAMPLES_DIR):
+    """One case per example file whose module is registered (list of Case)."""
+    cases = []
+    for path in sorted(glob.glob(os.path.join(examples_dir, '*.osi'))):
+        design_dictionary = load_design_file(path)
+        if design_dictionary.get(KEY_MODULE) not in DESIGN_MODULES:
+            continue
+        name = 'example:' + os.path.splitext(os.path.basename(path))[0]
+        cases.append(Case(name, design_dictionary[KEY_MODULE], [design_dictionary]))
+    return cases
+
+
+def _designations(table):
+    return [row[0] for row in catalogue.fetch_all(PATH_TO_DATABASE, "SELECT Designation FROM {}".format(table))]
+
+
+def _section_table(designation):
+    for table in SECTION_TABLES:
+        if designation in _designations(table):
+            return table
+    return None
+
+
+def stress_cases(examples, max_sections=None):
+    """Widen the first example of each module into stress inputs.
+
+    Args:
+        examples: example cases, see example_cases() (list of Case)
+        max_sections: limit on the designs of an all_sections case (int)
+
+    Returns:
+        list of Case
+    """
+    first = OrderedDict()
+    for case in examples:
+        first.setdefault(case.module, case.design_dictionaries[0])
+
+    cases = []
+    for module, base in first.items():
+        short_name = re.sub('[^a-z0-9]+', '_', module.lower()).strip('_')
+
+        design_dictionary = dict(base)
+        if isinstance(base.get(KEY_D), list):
+            design_dictionary[KEY_D] = list(connectdb1())
+        if isinstance(base.get(KEY_GRD), list):
+            design_dictionary[KEY_GRD] = list(VALUES_GRD_CUSTOMIZED)
+        for key in PLATE_THICKNESS_KEYS:
+            if isinstance(base.get(key), list):
+                design_dictionary[key] = list(PLATE_THICKNESS_SAIL)
+        if design_dictionary != base:
+            cases.append(Case('stress:{}:all_bolts_plates'.format(short_name), module, [design_dictionary]))
+
+        for key in SECTION_KEYS:
+            value = base.get(key)
+            if isinstance(value, list) and value:
+                table = _section_table(value[0])
+                if table is not None:
+                    design_dictionary = dict(base)
+                    design_dictionary[key] = _designations(table)
+                    cases.append(Case('stress:{}:all_sections'.format(short_name), module, [design_dictionary]))
+                break
+            if isinstance(value, str):
+                table = _section_table(value)
+                if table is not None:
+                    designations = _designations(table)[:max_sections]
+                    design_dictionaries = []
+                    for designation in designations:
+                        design_dictionary = dict(base)
+                        design_dictionary[key] = designation
+                        design_dictionaries.append(design_dictionary)
+                    cases.append(Case('stress:{}:all_sections'.format(short_name), module, design_dictionaries))
+                break
+    return cases
@@ -0,0 +1,69 @@
+"""Compare two benchmark result files
+
+Prints the median time of every case and phase in both files and the change,
+and flags changes larger than the threshold. Exits with status 1 if anything
+got slower by more than the threshold.
+
+    python -m benchmarks.compare before.json after.json --threshold 0.1
+"""
+import sys
+import json
+import argparse
+
+
+def _medians(document):
+    medians = {}
+    for case, phases in document['results'].items():
+        for phase, timing in phases.items():
+            if not isinstance(timing, dict) or 'skipped' in timing:
+                continue
+            if 'median' in timing:
+                medians[(case, phase)] = timing['median']
+            else:
+                for variant, sub_timing in timing.items():
+                    if isinstance(sub_timing, dict) and 'median' in sub_timing:
+                        medians[(case, '{}.{}'.format(phase, variant))] = sub_timing['median']
+    return medians
+
+
+def compare(before, after):
+    """
+    Returns:
+        (case, phase, median before, median after, relative change) for the
+        timings found in both documents, in case order (list)
+    """
+    old, new = _medians(before), _medians(after)
+    rows = []
+    for key in sorted(set(old) & set(new)):
+        change = (new[key] - old[key]) / old[key] if old[key] else 0.0
+        rows.append(key + (old[key], new[key], change))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.compare', description=__doc__.split('\n')[0])
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative change to flag (default 0.1)')
+    args = parser.parse_args(argv)
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    print('{} -> {}'.format((before.get('commit') or '?')[:10], (after.get('commit') or '?')[:10]))
+    print('{:<48} {:<20} {:>12} {:>12} {:>8}'.format('case', 'phase', 'before (ms)', 'after (ms)', 'change'))
+    slower = 0
+    for case, phase, old, new, change in compare(before, after):
+        flag = ''
+        if change > args.threshold:
+            flag, slower = ' slower', slower + 1
+        elif change < -args.threshold:
+            flag = ' faster'
+        print('{:<48} {:<20} {:>12.2f} {:>12.2f} {:>+7.0%}{}'.format(case, phase, old * 1000, new * 1000, change, flag))
+    return 1 if slower else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Time writing the inputs and outputs of many designs to an Excel workbook
+
+The examples are designed once; their inputs and outputs are then written
+--count times over (10,000 by default, by cycling through them) with
+write_to_excel.ExcelWriter, once with each Excel library installed. For
+comparison, the first --reopen-count designs are also written the way
+write_to_excel.py used to, loading and saving the workbook for every design;
+its time per design grows with the workbook, so the time it would take for
+--count designs is extrapolated from the last tenth of the run.
+
+    python -m benchmarks.excel_export                   # 10,000 designs
+    python -m benchmarks.excel_export -c 1000 --reopen-count 100
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+from benchmarks.cases import EXAMPLES_DIR
+from batch.cad_export import find_design_files, unique_names
+from batch.runner import load_design_file
+from batch.results import design_result
+from utils.common import catalogue
+from utils.common.logs import setup_logger
+from write_to_excel import ExcelWriter, design_rows
+
+ENGINES = ('xlsxwriter', 'openpyxl')
+
+
+def _designs(captured, count):
+    for i in range(count):
+        name, design_dictionary, result = captured[i % len(captured)]
+        yield 'design_{}'.format(i), result['module'], design_dictionary, result['outputs']
+
+
+def write_streamed(captured, count, path, engine):
+    with ExcelWriter(path, engine) as writer:
+        for name, module, inputs, outputs in _designs(captured, count):
+            writer.write_design(name, module, inputs, outputs)
+
+
+def write_reopened(captured, count, path):
+    """
+    Returns:
+        seconds taken by each design (list of float)
+    """
+    from openpyxl import load_workbook, Workbook
+    times = []
+    for name, module, inputs, outputs in _designs(captured, count):
+        start = time.perf_counter()
+        try:
+            wb = load_workbook(path)
+        except Exception:
+            wb = Workbook()
+        for row in design_rows(name, inputs, outputs):
+            wb.active.append(row)
+        wb.save(path)
+        wb.close()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.excel_export', description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='*', default=[EXAMPLES_DIR],
+                        help='.osi design files or directories of them (default: the shipped examples)')
+    parser.add_argument('-c', '--count', type=int, default=10000, help='designs written')
+    parser.add_argument('--reopen-count', type=int, default=200,
+                        help='designs written by reopening the workbook (0 to skip)')
+    args = parser.parse_args(argv)
+
+    setup_logger(console=False, log_file=None)
+    catalogue.enable()
+    paths = find_design_files(args.inputs)
+    captured = []
+    for path, name in zip(paths, unique_names(paths)):
+        design_dictionary = load_design_file(path)
+        captured.append((name, design_dictionary, design_result(design_dictionary, name)))
+    print('{} designs from {} examples'.format(args.count, len(captured)))
+    print('{:<22} {:>10} {:>16} {:>12}'.format('writer', 'time (s)', 'peak memory (MB)', 'output (MB)'))
+    with tempfile.TemporaryDirectory() as tmp:
+        for engine in ENGINES:
+            path = os.path.join(tmp, engine + '.xlsx')
+            try:
+                start = time.perf_counter()
+                write_streamed(captured, args.count, path, engine)
+                seconds = time.perf_counter() - start
+            except ImportError as e:
+                print('{:<22} skipped: {}'.format(engine, e))
+                continue
+            # memory is measured on a second run, tracemalloc slowing the writers down
+            tracemalloc.start()
+            write_streamed(captured, args.count, path, engine)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print('{:<22} {:>10.2f} {:>16.1f} {:>12.1f}'.format(engine, seconds, peak / 1e6,
+                                                               os.path.getsize(path) / 1e6))
+        if args.reopen_count:
+            try:
+                times = write_reopened(captured, args.reopen_count, os.path.join(tmp, 'reopened.xlsx'))
+            except ImportError as e:
+                print('{:<22} skipped: {}'.format('reopen per design', e))
+                return 0
+            # the time per design grows linearly with the rows already written
+            tail = times[-max(1, len(times) // 10):]
+            per_design = sum(tail) / len(tail) / (len(times) - len(tail) / 2)
+            estimate = per_design * args.count * args.count / 2
+            print('{:<22} {:>10.2f}   ({} designs; about {:.0f} s for {})'.format(
+                'reopen per design', sum(times), len(times), estimate, args.count))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Time and measure writing a batch of HTML design reports
+
+Each example is designed and its report data (report_input and report_check,
+left on the design class by save_design) is kept; the reports of a batch of
+--count designs (1,000 by default) are then written by cycling through the
+examples, two ways:
+
+    streamed:  design_report.html_report writes every report to its file as
+               it is produced; images are stored once, under their content
+               hash, in the shared assets directory
+    in memory: every report is built as one string and written at the end
+               (as save_html did), into a folder of its own where the images
+               it uses are copied (as the GUI did with the Osdag header)
+
+For each, the time taken and the peak of memory allocated while writing
+(tracemalloc) are printed, along with the size of the output directory.
+
+    python -m benchmarks.html_reports                   # 1,000 reports
+    python -m benchmarks.html_reports -c 200 ResourceFiles/design_example
+"""
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+
+from benchmarks.cases import EXAMPLES_DIR
+from batch.runner import load_design_file, run_design
+from batch.cad_export import find_design_files
+from batch.reports import report_summary
+from design_type.registry import get_module_class, module_names
+from design_report import html_report
+from utils.common import catalogue
+from utils.common.logs import setup_logger
+
+
+def capture(paths, tmp):
+    """
+    Design each example and write its LaTeX report once, keeping its report data.
+
+    Returns:
+        (report_input, report_check, popup summary) of each example that could
+        be designed and reported (list of tuple)
+    """
+    captured = []
+    for path in paths:
+        design_dictionary = load_design_file(path)
+        module = design_dictionary.get('Module')
+        if module not in module_names():
+            continue
+        result = run_design(design_dictionary)
+        if result['errors']:
+            continue
+        module_class = get_module_class(module)
+        name = os.path.splitext(os.path.basename(path))[0]
+        summary = report_summary(name, tmp, result['logger_messages'])
+        try:
+            with open(os.devnull, 'w') as out, contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+                module_class.save_design(module_class, summary)
+        except Exception:
+            continue
+        captured.append((module_class.report_input, module_class.report_check, summary))
+    return captured
+
+
+def write_streamed(captured, count, output_dir):
+    assets = html_report.AssetStore(output_dir)
+    entries = []
+    for i in range(count):
+        report_input, report_check, summary = captured[i % len(captured)]
+        path = os.path.join(output_dir, 'design_{}.html'.format(i))
+        with open(path, 'w') as f:
+            html_report.write_report(f, report_input, report_check, summary, assets)
+        entries.append({'name': 'design_{}'.format(i), 'module': report_input.get('Module'),
+                        'design_status': summary['does_design_exist'], 'html': path, 'pdf': None})
+    html_report.write_index(os.path.join(output_dir, 'index.html'), entries, assets)
+
+
+def write_in_memory(captured, count, output_dir):
+    for i in range(count):
+        report_input, report_check, summary = captured[i % len(captured)]
+        directory = os.path.join(output_dir, 'design_{}'.format(i))
+        os.makedirs(directory)
+        # the assets of each report copied into its own folder
+        assets = html_report.AssetStore(directory, subdir='images_html')
+        buffer = io.StringIO()
+        html_report.write_report(buffer, report_input, report_check, summary, assets)
+        with open(os.path.join(directory, 'report.html'), 'w') as f:
+            f.write(buffer.getvalue())
+
+
+def _size(directory):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(directory) for name in names)
+
+
+def measure(write, captured, count):
+    """
+    Returns:
+        seconds, peak memory allocated in MB and size of the output in MB (tuple)
+    """
+    with tempfile.TemporaryDirectory() as output_dir:
+        tracemalloc.start()
+        start = time.perf_counter()
+        write(captured, count, output_dir)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return seconds, peak / 1e6, _size(output_dir) / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.html_reports', description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='*', default=[EXAMPLES_DIR],
+                        help='.osi design files or directories of them (default: the shipped examples)')
+    parser.add_argument('-c', '--count', type=int, default=1000, help='reports in the batch')
+    args = parser.parse_args(argv)
+
+    setup_logger(console=False, log_file=None)
+    catalogue.enable()
+    with tempfile.TemporaryDirectory() as tmp:
+        captured = capture(find_design_files(args.inputs), tmp)
+    if not captured:
+        parser.error('no example could be designed and reported')
+    print('{} reports from {} examples'.format(args.count, len(captured)))
+    print('{:<10} {:>9} {:>16} {:>12}'.format('', 'time (s)', 'peak memory (MB)', 'output (MB)'))
+    for name, write in (('streamed', write_streamed), ('in memory', write_in_memory)):
+        print('{:<10} {:>9.2f} {:>16.1f} {:>12.1f}'.format(name, *measure(write, captured, args.count)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
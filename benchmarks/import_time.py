@@ -0,0 +1,107 @@
+"""Check the import time of the main window against a budget
+
+Imports osdagMainPage (or --module) in a fresh interpreter with
+python -X importtime, --repeat times, and takes the fastest run. Everything
+a design needs (Common and the section catalogues, the design modules, the
+CAD builders and OCC, pandas, pynput, the module window and its icons, the
+update check and the GitHub crash reporter) is imported when a module is
+opened or a menu item is used, not before the main window is shown; the
+check fails if any of it is imported with the page.
+
+Prints the total import time and the slowest imports, and exits with
+status 1 if the total is over --budget seconds or a deferred module was
+imported.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget 0.25 --top 20
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET = 0.4    # seconds
+# packages and modules imported only once a design module is opened
+DEFERRED = ('Common', 'utils.common.component', 'design_type', 'cad', 'OCC', 'numpy', 'pylatex', 'pandas',
+            'pynput', 'requests', 'github', 'design_report', 'gui.ui_template', 'gui.ui_template_for_mac',
+            'gui.icons_rc', 'gui.osdagMainPageIcons_rc', 'update_version_check')
+# import time:  self [us] | cumulative | imported package
+LINE_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$')
+
+
+def parse_importtime(text):
+    """
+    Returns:
+        (name, depth, self seconds, cumulative seconds) of every import, in
+        the order python -X importtime lists them (list of tuple)
+    """
+    imports = []
+    for line in text.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append((name, (len(indent) - 1) // 2, int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    return imports
+
+
+def measure(module):
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        what parse_importtime gives for the import of the module and the
+        modules it imports (list of tuple)
+    """
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')     # get_DPI_scale starts a QApplication
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module], cwd=ROOT, env=env,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode != 0:
+        raise RuntimeError('import {} failed:\n{}'.format(module, process.stderr.strip().splitlines()[-1]))
+    imports = parse_importtime(process.stderr)
+    # modules imported by the interpreter at startup (site, .pth files) are listed first
+    last = max(i for i, entry in enumerate(imports) if entry[0] == module and entry[1] == 0)
+    first = last
+    while first > 0 and imports[first - 1][1] > 0:
+        first -= 1
+    return imports[first:last + 1]
+
+
+def deferred_imports(imports):
+    """The packages and modules of DEFERRED that were imported (list)."""
+    names = set(name for name, _, _, _ in imports)
+    return [prefix for prefix in DEFERRED
+            if any(name == prefix or name.startswith(prefix + '.') for name in names)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.import_time', description=__doc__.split('\n')[0])
+    parser.add_argument('--module', default='osdagMainPage', help='module imported (default: osdagMainPage)')
+    parser.add_argument('--budget', type=float, default=BUDGET, help='seconds the import may take')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='imports, the fastest one is kept')
+    parser.add_argument('--top', type=int, default=10, help='slowest imports listed')
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.module) for _ in range(args.repeat)]
+    imports = min(runs, key=lambda run: run[-1][3])
+    total = imports[-1][3]
+    print('import {}: {:.3f} s (budget {:.3f} s, fastest of {})'.format(args.module, total, args.budget, args.repeat))
+    print('{:<48} {:>10} {:>14}'.format('slowest imports', 'self (s)', 'cumulative (s)'))
+    for name, depth, self_time, cumulative in sorted(imports[:-1], key=lambda entry: -entry[2])[:args.top]:
+        print('{:<48} {:>10.4f} {:>14.4f}'.format(name, self_time, cumulative))
+
+    failed = False
+    deferred = deferred_imports(imports)
+    if deferred:
+        print('imported before a module is opened: ' + ', '.join(deferred))
+        failed = True
+    if total > args.budget:
+        print('over budget by {:.3f} s'.format(total - args.budget))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
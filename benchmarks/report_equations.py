@@ -0,0 +1,112 @@
+"""Time writing design reports with pylatex Math equations, Equations and deferred checks
+
+Each example is designed again before every timed run (save_design changes
+the state some modules leave on their class, the base plate for one), then
+its LaTeX report is written without compiling it: with the equations built
+as pylatex Math objects and formatted as the checks are recorded, as
+design_report.equations.Equation formatted the same way, and as Equations
+recorded as Deferred cells, formatted when the report is written (see
+design_report.deferred). The .tex files written every way must be identical;
+the command exits with status 1 if they are not.
+
+The last column is the time save_design takes to record the checks of the
+deferred report without writing it (popup summary 'write_report' False),
+all a run needs when only the outcome of the checks matters.
+
+    python -m benchmarks.report_equations                   # base plate examples
+    python -m benchmarks.report_equations ResourceFiles/design_example -n 5
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import statistics
+import contextlib
+
+from benchmarks.cases import EXAMPLES_DIR
+from benchmarks.suite import POPUP_SUMMARY
+from batch.runner import load_design_file, run_design
+from batch.cad_export import find_design_files
+from design_type.registry import get_module_class, module_names
+from design_report import equations, deferred
+from utils.common import catalogue
+from utils.common.logs import setup_logger
+
+DEFAULT_EXAMPLES = sorted(glob.glob(os.path.join(EXAMPLES_DIR, 'baseplate_*.osi')))
+MODES = (('pylatex', True, False), ('equation', False, False), ('deferred', False, True))
+
+
+def _save_design(module_class, design_dictionary, popup_summary, repeat):
+    times = []
+    for _ in range(repeat):
+        run_design(design_dictionary)
+        with open(os.devnull, 'w') as out, contextlib.redirect_stdout(out):
+            start = time.perf_counter()
+            module_class.save_design(module_class, dict(popup_summary))
+            times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def time_report(design_dictionary, repeat, tmp):
+    """
+    Returns:
+        mode -> (median seconds of save_design, text of the .tex file written),
+        and 'record' -> median seconds of recording the deferred checks only (dict)
+    """
+    module_class = get_module_class(design_dictionary['Module'])
+    results = {}
+    for mode, pylatex, defer in MODES:
+        equations.use_pylatex(pylatex)
+        deferred.use_deferred(defer)
+        popup_summary = dict(POPUP_SUMMARY, filename=os.path.join(tmp, mode), compile_pdf=False)
+        try:
+            seconds = _save_design(module_class, design_dictionary, popup_summary, repeat)
+        finally:
+            equations.use_pylatex(False)
+            deferred.use_deferred(True)
+        with open(popup_summary['filename'] + '.tex') as f:
+            results[mode] = (seconds, f.read())
+    results['record'] = _save_design(module_class, design_dictionary, dict(popup_summary, write_report=False),
+                                     repeat)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.report_equations',
+                                     description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='*', default=DEFAULT_EXAMPLES,
+                        help='.osi design files or directories of them (default: the base plate examples)')
+    parser.add_argument('-n', '--repeat', type=int, default=3, help='timed runs per mode')
+    args = parser.parse_args(argv)
+
+    setup_logger(console=False, log_file=None)
+    catalogue.enable()
+    print('{:<28} {:>12} {:>13} {:>13} {:>8} {:>10} {:>11}'.format(
+        'example', 'pylatex (ms)', 'equation (ms)', 'deferred (ms)', 'speedup', 'identical', 'record (ms)'))
+    differ = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in find_design_files(args.inputs):
+            design_dictionary = load_design_file(path)
+            name = os.path.splitext(os.path.basename(path))[0]
+            if design_dictionary.get('Module') not in module_names() or run_design(design_dictionary)['errors']:
+                print('{:<28} skipped'.format(name))
+                continue
+            with open(os.devnull, 'w') as out, contextlib.redirect_stderr(out):
+                try:
+                    results = time_report(design_dictionary, args.repeat, tmp)
+                except Exception as e:
+                    print('{:<28} report failed ({!r})'.format(name, e))
+                    continue
+            (old, old_tex), (new, new_tex), (late, late_tex) = [results[mode[0]] for mode in MODES]
+            identical = old_tex == new_tex == late_tex
+            differ += not identical
+            print('{:<28} {:>12.1f} {:>13.1f} {:>13.1f} {:>7.1f}x {:>10} {:>11.1f}'.format(
+                name, old * 1000, new * 1000, late * 1000, old / late if late else 0.0,
+                'yes' if identical else 'NO', results['record'] * 1000))
+    return 1 if differ else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
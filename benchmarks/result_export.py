@@ -0,0 +1,80 @@
+"""Time and measure writing a large number of design results
+
+The shipped examples are designed once; their results are then written
+--count times over (100,000 by default, by cycling through them) with each
+result writer of batch.results. For each format the time taken, the peak of
+memory allocated while writing (tracemalloc) and the size of the output are
+printed. Parquet and Arrow are skipped when pyarrow is not installed.
+
+    python -m benchmarks.result_export                  # 100,000 results
+    python -m benchmarks.result_export -c 10000 --batch-size 1024
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+from benchmarks.cases import EXAMPLES_DIR
+from batch.cad_export import find_design_files, unique_names
+from batch.runner import load_design_file
+from batch.results import BATCH_SIZE, FORMATS, design_result, open_writer
+from utils.common import catalogue
+from utils.common.logs import setup_logger
+
+
+def _write(path, results, count, batch_size):
+    with open_writer(path, batch_size) as writer:
+        for i in range(count):
+            writer.write(dict(results[i % len(results)], name='design_{}'.format(i)))
+
+
+def measure(extension, results, count, batch_size):
+    """
+    Returns:
+        seconds, peak memory allocated in MB and size of the output in MB (tuple);
+        the memory is measured on a second run, tracemalloc slowing the writers down
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results' + extension)
+        start = time.perf_counter()
+        _write(path, results, count, batch_size)
+        seconds = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp))
+        tracemalloc.start()
+        _write(path, results, count, batch_size)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return seconds, peak / 1e6, size / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.result_export', description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='*', default=[EXAMPLES_DIR],
+                        help='.osi design files or directories of them (default: the shipped examples)')
+    parser.add_argument('-c', '--count', type=int, default=100000, help='results written')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='results of a module written at once')
+    args = parser.parse_args(argv)
+
+    setup_logger(console=False, log_file=None)
+    catalogue.enable()
+    paths = find_design_files(args.inputs)
+    results = [design_result(load_design_file(path), name) for path, name in zip(paths, unique_names(paths))]
+    print('{} results from {} designs, {} modules'.format(args.count, len(results),
+                                                         len(set(result['module'] for result in results))))
+    print('{:<9} {:>9} {:>16} {:>12} {:>12}'.format('format', 'time (s)', 'peak memory (MB)', 'output (MB)',
+                                                   'results/s'))
+    for extension in FORMATS:
+        try:
+            seconds, peak, size = measure(extension, results, args.count, args.batch_size)
+        except ImportError as e:
+            print('{:<9} skipped: {}'.format(extension, e))
+            continue
+        print('{:<9} {:>9.2f} {:>16.1f} {:>12.1f} {:>12.0f}'.format(extension, seconds, peak, size,
+                                                                   args.count / seconds if seconds else 0.0))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
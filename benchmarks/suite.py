@@ -0,0 +1,304 @@
+"""Benchmark suite for the design, CAD and report pipeline
+
+Every case (see benchmarks.cases) is timed in separate phases:
+    * cold_import: importing the module's design class in a fresh interpreter,
+    * catalogue: reading the input dock, which loads the section/bolt/material
+      catalogues from the database, without and then with the catalogue cache,
+    * design: func_for_validation and the output dock of every design of the case,
+    * cad: building the 3D model of the first design, then fusing its
+      components into one solid and grouping them in a compound (needs pythonocc),
+    * export: meshing the 3D model of the first design for STL, then writing it
+      as ASCII and as binary STL, with the file sizes (needs pythonocc),
+    * report: writing the LaTeX report of the first design (the PDF as well if
+      pdflatex is on the PATH),
+    * latex: compiling that report to PDF in full as before ('full'), with the
+      preamble loaded from a format ('format', after 'format_build' made it)
+      and with the .aux file of the previous compile as well ('format_aux'),
+      see design_report.latex_compiler (needs pdflatex and mylatexformat).
+Results are written as JSON, with the commit and machine they were taken on,
+so that runs from different commits can be compared with benchmarks.compare.
+
+    python -m benchmarks.suite -o benchmarks/results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.suite --only example --modules "Fin Plate Connection" -n 5
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import fnmatch
+import argparse
+import platform
+import tempfile
+import statistics
+import contextlib
+import subprocess
+from datetime import datetime
+
+from benchmarks.cases import example_cases, stress_cases
+from batch.runner import run_design
+from design_type.registry import get_module_class
+from utils.common import catalogue
+from utils.common.logs import setup_logger
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASES = ('cold_import', 'catalogue', 'design', 'cad', 'export', 'report', 'latex')
+POPUP_SUMMARY = {'ProfileSummary': {'CompanyName': 'Benchmark', 'CompanyLogo': '', 'Group/TeamName': 'Benchmark',
+                                    'Designer': 'Benchmark'},
+                 'ProjectTitle': 'Benchmark', 'Subtitle': '', 'JobNumber': '1', 'AdditionalComments': '',
+                 'Client': 'Benchmark', 'does_design_exist': False, 'logger_messages': ''}
+IMPORT_SCRIPT = ("import time; start = time.perf_counter(); "
+                 "from design_type.registry import get_module_class; get_module_class({!r}); "
+                 "print(time.perf_counter() - start)")
+
+
+def summarize(times):
+    """Statistics of repeated timings in seconds (dict)."""
+    return {'runs': len(times), 'min': min(times), 'median': statistics.median(times),
+            'mean': statistics.mean(times)}
+
+
+def _repeat(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def machine_info():
+    return {'python': platform.python_version(), 'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(), 'cpu_count': os.cpu_count(),
+            'pdflatex': shutil.which('pdflatex') is not None}
+
+
+def time_cold_import(module, repeat):
+    """Seconds to import a design class in a new interpreter, interpreter start-up excluded (dict)."""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT.format(module)], cwd=ROOT,
+                                         stderr=subprocess.DEVNULL)
+        times.append(float(output.decode().strip().splitlines()[-1]))
+    return summarize(times)
+
+
+def time_catalogue(module_class, repeat):
+    """Time the input dock with the catalogue cache off ('uncached') and warm ('cached') (dict)."""
+    load = lambda: module_class.input_values(module_class)
+    catalogue.disable()
+    uncached = _repeat(load, repeat)
+    catalogue.enable()
+    load()
+    return {'uncached': uncached, 'cached': _repeat(load, repeat)}
+
+
+def time_design(case, repeat):
+    results = []
+
+    def design_all():
+        del results[:]
+        results.extend(run_design(design_dictionary) for design_dictionary in case.design_dictionaries)
+
+    timing = _repeat(design_all, repeat)
+    timing['designs'] = len(results)
+    timing['passed'] = sum(1 for result in results if result['design_status'])
+    return timing
+
+
+def time_cad(module_class, repeat):
+    try:
+        from cad.common_logic import CommonDesignLogic
+    except ImportError as e:
+        return {'skipped': 'CAD libraries not available ({})'.format(e)}
+    if not module_class.design_status:
+        return {'skipped': 'design failed'}
+    from cad import parallel
+    logic = CommonDesignLogic(None, '', module_class.module, module_class.mainmodule)
+    build = lambda: logic.build_3DModel(True, module_class)
+    result = {'build': _repeat(build, repeat)}
+    # the same build with every sub-assembly made in turn, for comparison with cad.parallel
+    parallel.set_workers(1)
+    try:
+        result['build_serial'] = _repeat(build, repeat)
+    finally:
+        parallel.set_workers()
+    logic.component = 'Model'
+    result['fuse'] = _repeat(lambda: logic.create2Dcad(fuse=True), repeat)
+    result['compound'] = _repeat(lambda: logic.create2Dcad(fuse=False), repeat)
+    return result
+
+
+def time_export(module_class, repeat):
+    try:
+        from cad.common_logic import CommonDesignLogic
+        from cad import export
+    except ImportError as e:
+        return {'skipped': 'CAD libraries not available ({})'.format(e)}
+    if not module_class.design_status:
+        return {'skipped': 'design failed'}
+    logic = CommonDesignLogic(None, '', module_class.module, module_class.mainmodule)
+    logic.component = 'Model'
+    logic.set_design(True, module_class)
+    shape = logic.create2Dcad(fuse=False)
+    times = []
+    for _ in range(repeat):
+        # drop the triangulation, so that every run meshes from scratch
+        export.BRepTools.breptools.Clean(shape)
+        export.clear_mesh_cache()
+        start = time.perf_counter()
+        export.mesh_shape(shape)
+        times.append(time.perf_counter() - start)
+    result = {'mesh': summarize(times)}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, ascii in (('stl_ascii', True), ('stl_binary', False)):
+            path = os.path.join(tmp, name + '.stl')
+            result[name] = _repeat(lambda: export.write_shape(shape, path, ascii=ascii), repeat)
+            result[name]['bytes'] = os.path.getsize(path)
+    return result
+
+
+def time_report(module_class, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        popup_summary = dict(POPUP_SUMMARY, filename=os.path.join(tmp, 'report'))
+
+        def save():
+            with open(os.devnull, 'w') as out, contextlib.redirect_stdout(out):
+                module_class.save_design(module_class, popup_summary)
+
+        try:
+            timing = _repeat(save, repeat)
+        except Exception as e:
+            return {'skipped': 'report failed ({!r})'.format(e)}
+        timing['pdf'] = os.path.isfile(popup_summary['filename'] + '.pdf')
+    return timing
+
+
+def time_latex(module_class, repeat):
+    from design_report import latex_compiler
+    if shutil.which(latex_compiler.COMPILER) is None:
+        return {'skipped': '{} is not on the PATH'.format(latex_compiler.COMPILER)}
+    cache_dir = latex_compiler.CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        popup_summary = dict(POPUP_SUMMARY, filename=os.path.join(tmp, 'report'), compile_pdf=False)
+        try:
+            with open(os.devnull, 'w') as out, contextlib.redirect_stdout(out):
+                module_class.save_design(module_class, popup_summary)
+        except Exception as e:
+            return {'skipped': 'report failed ({!r})'.format(e)}
+        tex = popup_summary['filename'] + '.tex'
+        with open(tex) as f:
+            preamble = latex_compiler.split_preamble(f.read())[0]
+        # an empty cache, so that the format is built here
+        latex_compiler.CACHE_DIR = os.path.join(tmp, 'cache')
+        try:
+            start = time.perf_counter()
+            built = latex_compiler.preamble_format(preamble) is not None
+            result = {'format_build': summarize([time.perf_counter() - start])}
+            compile_tex = latex_compiler.compile_tex
+            result['full'] = _repeat(lambda: compile_tex(tex, use_format=False, reuse_aux=False), repeat)
+            if built:
+                result['format'] = _repeat(lambda: compile_tex(tex, reuse_aux=False), repeat)
+                result['format_aux'] = _repeat(lambda: compile_tex(tex), repeat)
+            else:
+                result['format'] = {'skipped': 'the format could not be built (is mylatexformat installed?)'}
+        except latex_compiler.LatexError as e:
+            return {'skipped': str(e)}
+        finally:
+            latex_compiler.CACHE_DIR = cache_dir
+    return result
+
+
+def run_case(case, phases, repeat):
+    """Time the requested phases of one case.
+
+    Returns:
+        phase name -> timing statistics in seconds, or {'skipped': reason} (dict)
+    """
+    module_class = get_module_class(case.module)
+    result = {}
+    if 'cold_import' in phases:
+        result['cold_import'] = time_cold_import(case.module, repeat)
+    if 'catalogue' in phases:
+        result['catalogue'] = time_catalogue(module_class, repeat)
+    catalogue.enable()
+    if 'design' in phases:
+        result['design'] = time_design(case, repeat)
+    if 'cad' in phases or 'export' in phases or 'report' in phases or 'latex' in phases:
+        # CAD and report read the state the first design leaves on the class
+        run_design(case.design_dictionaries[0])
+    if 'cad' in phases:
+        result['cad'] = time_cad(module_class, repeat)
+    if 'export' in phases:
+        result['export'] = time_export(module_class, repeat)
+    if 'report' in phases:
+        result['report'] = time_report(module_class, repeat)
+    if 'latex' in phases:
+        result['latex'] = time_latex(module_class, repeat)
+    return result
+
+
+def select_cases(only=None, modules=None, cases=None, max_sections=None):
+    examples = example_cases()
+    selected = []
+    if only in (None, 'example'):
+        selected.extend(examples)
+    if only in (None, 'stress'):
+        selected.extend(stress_cases(examples, max_sections))
+    if modules:
+        selected = [case for case in selected if case.module in modules]
+    if cases:
+        selected = [case for case in selected if any(fnmatch.fnmatchcase(case.name, pattern) for pattern in cases)]
+    return selected
+
+
+def run_suite(cases, phases=PHASES, repeat=3, progress=None):
+    """
+    Returns:
+        the benchmark document written by main(): 'commit', 'timestamp',
+        'machine', 'repeat' and 'results' (case name -> module and phase timings) (dict)
+    """
+    setup_logger(console=False, log_file=None)
+    results = {}
+    for case in cases:
+        if progress is not None:
+            progress(case)
+        with open(os.devnull, 'w') as out, contextlib.redirect_stderr(out):
+            timings = run_case(case, phases, repeat)
+        results[case.name] = dict(module=case.module, **timings)
+    return {'commit': _git_commit(), 'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'machine': machine_info(), 'repeat': repeat, 'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.split('\n')[0])
+    parser.add_argument('-o', '--output', default='benchmark.json', help='JSON file to write')
+    parser.add_argument('-n', '--repeat', type=int, default=3, help='timed runs per phase')
+    parser.add_argument('--only', choices=('example', 'stress'), help='run only example or stress cases')
+    parser.add_argument('--modules', nargs='+', metavar='MODULE', help='module names, e.g. "Fin Plate Connection"')
+    parser.add_argument('--cases', nargs='+', metavar='PATTERN', help="case name patterns, e.g. 'example:fin*'")
+    parser.add_argument('--phases', nargs='+', choices=PHASES, default=list(PHASES))
+    parser.add_argument('--max-sections', type=int, help='limit on the designs of all_sections stress cases')
+    args = parser.parse_args(argv)
+
+    cases = select_cases(args.only, args.modules, args.cases, args.max_sections)
+    if not cases:
+        parser.error('no benchmark case matches the selection')
+    document = run_suite(cases, args.phases, args.repeat,
+                         progress=lambda case: print(case.name, file=sys.stderr, flush=True))
+    with open(args.output, 'w') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    print('{} cases written to {}'.format(len(cases), args.output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
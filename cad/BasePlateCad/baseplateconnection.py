@@ -11,6 +11,7 @@ This file is for creating CAD model for cover baseplate bolted moment connection
 import numpy
 import copy
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from cad.parallel import run_tasks
 
 
 class BasePlateCad(object):
@@ -180,12 +181,9 @@ class BasePlateCad(object):
         :return: CAD model of each of the followings.
         """
 
-        self.createColumnGeometry()
-        self.createBasePlateGeometry()
-        self.createWeldGeometry()
-        self.createConcreteGeometry()
-        self.create_nut_bolt_array()
-        self.createGroutGeometry()
+        # each sub-assembly places and builds only its own parts
+        run_tasks(self.createColumnGeometry, self.createBasePlateGeometry, self.createWeldGeometry, self.createConcreteGeometry,
+                  self.create_nut_bolt_array, self.createGroutGeometry)
 
     def createColumnGeometry(self):
         """
@@ -1202,12 +1200,9 @@ class HollowBasePlateCad(object):
         """
 
         """
-        self.createcolumnGeometry()
-        self.createBasePlateGeometry()
-        self.createWeldGeometry()
-        self.createConcreteGeometry()
-        self.create_nut_bolt_array()
-        self.createGroutGeometry()
+        # each sub-assembly places and builds only its own parts
+        run_tasks(self.createcolumnGeometry, self.createBasePlateGeometry, self.createWeldGeometry, self.createConcreteGeometry,
+                  self.create_nut_bolt_array, self.createGroutGeometry)
 
     def createcolumnGeometry(self):
         """
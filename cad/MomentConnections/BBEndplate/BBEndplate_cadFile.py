@@ -10,6 +10,7 @@ import numpy
 import copy
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from cad.parallel import ModelBatch
 
 class CADFillet(object): # not used in the current version as groove weld is preferred best practice.
 
@@ -175,79 +176,81 @@ class CADFillet(object): # not used in the current version as groove weld is pre
 
 
         # call for create_model of filletweld from Components directory
-        self.beamLModel = self.beamLeft.create_model()
-        self.beamRModel = self.beamRight.create_model()
-        self.plateLModel = self.plateLeft.create_model()
-        self.plateRModel = self.plateRight.create_model()
-        self.nutBoltArrayModels = self.nut_bolt_array.create_model()
-        self.beam_stiffener_1Model = self.beam_stiffener_1.create_model()
-        self.beam_stiffener_2Model = self.beam_stiffener_2.create_model()
-        self.beam_stiffener_3Model = self.beam_stiffener_3.create_model()
-        self.beam_stiffener_4Model = self.beam_stiffener_4.create_model()
-
-        self.beam_stiffener_F1Model = self.beam_stiffener_F1.create_model()
-        self.beam_stiffener_F2Model = self.beam_stiffener_F2.create_model()
-        self.beam_stiffener_F3Model = self.beam_stiffener_F3.create_model()
-        self.beam_stiffener_F4Model = self.beam_stiffener_F4.create_model()
-
-        self.bbWeldAbvFlang_11Model = self.bbWeldAbvFlang_11.create_model()
-        self.bbWeldAbvFlang_12Model = self.bbWeldAbvFlang_12.create_model()
-        self.bbWeldAbvFlang_21Model = self.bbWeldAbvFlang_21.create_model()
-        self.bbWeldAbvFlang_22Model = self.bbWeldAbvFlang_22.create_model()
-
-        self.bbWeldBelwFlang_11Model = self.bbWeldBelwFlang_11.create_model()
-        self.bbWeldBelwFlang_12Model = self.bbWeldBelwFlang_12.create_model()
-        self.bbWeldBelwFlang_13Model = self.bbWeldBelwFlang_13.create_model()
-        self.bbWeldBelwFlang_14Model = self.bbWeldBelwFlang_14.create_model()
-        self.bbWeldBelwFlang_21Model = self.bbWeldBelwFlang_21.create_model()
-        self.bbWeldBelwFlang_22Model = self.bbWeldBelwFlang_22.create_model()
-        self.bbWeldBelwFlang_23Model = self.bbWeldBelwFlang_23.create_model()
-        self.bbWeldBelwFlang_24Model = self.bbWeldBelwFlang_24.create_model()
-
-
-        self.bbWeldSideWeb_11Model = self.bbWeldSideWeb_11.create_model()
-        self.bbWeldSideWeb_12Model = self.bbWeldSideWeb_12.create_model()
-        self.bbWeldSideWeb_21Model = self.bbWeldSideWeb_21.create_model()
-        self.bbWeldSideWeb_22Model = self.bbWeldSideWeb_22.create_model()
-
-        self.bbWeldStiffHL_1Model = self.bbWeldStiffHL_1.create_model()
-        self.bbWeldStiffHL_2Model = self.bbWeldStiffHL_2.create_model()
-        self.bbWeldStiffHL_3Model = self.bbWeldStiffHL_3.create_model()
-        self.bbWeldStiffHL_4Model = self.bbWeldStiffHL_4.create_model()
-
-        self.bbWeldStiffLL_1Model = self.bbWeldStiffLL_1.create_model()
-        self.bbWeldStiffLL_2Model = self.bbWeldStiffLL_2.create_model()
-        self.bbWeldStiffLL_3Model = self.bbWeldStiffLL_3.create_model()
-        self.bbWeldStiffLL_4Model = self.bbWeldStiffLL_4.create_model()
-        self.bbWeldStiffHR_1Model = self.bbWeldStiffHR_1.create_model()
-        self.bbWeldStiffHR_2Model = self.bbWeldStiffHR_2.create_model()
-        self.bbWeldStiffHR_3Model = self.bbWeldStiffHR_3.create_model()
-        self.bbWeldStiffHR_4Model = self.bbWeldStiffHR_4.create_model()
-
-        self.bbWeldStiffLR_1Model = self.bbWeldStiffLR_1.create_model()
-        self.bbWeldStiffLR_2Model = self.bbWeldStiffLR_2.create_model()
-        self.bbWeldStiffLR_3Model = self.bbWeldStiffLR_3.create_model()
-        self.bbWeldStiffLR_4Model = self.bbWeldStiffLR_4.create_model()
-
-        self.bbWeldstiff1_u1Model = self.bbWeldstiff1_u1.create_model()
-        self.bbWeldstiff1_u2Model = self.bbWeldstiff1_u2.create_model()
-        self.bbWeldstiff1_l1Model = self.bbWeldstiff1_l1.create_model()
-        self.bbWeldstiff1_l2Model = self.bbWeldstiff1_l2.create_model()
-
-        self.bbWeldstiff2_u1Model = self.bbWeldstiff2_u1.create_model()
-        self.bbWeldstiff2_u2Model = self.bbWeldstiff2_u2.create_model()
-        self.bbWeldstiff2_l1Model = self.bbWeldstiff2_l1.create_model()
-        self.bbWeldstiff2_l2Model = self.bbWeldstiff2_l2.create_model()
-
-        self.bbWeldstiff3_u1Model = self.bbWeldstiff3_u1.create_model()
-        self.bbWeldstiff3_u2Model = self.bbWeldstiff3_u2.create_model()
-        self.bbWeldstiff3_l1Model = self.bbWeldstiff3_l1.create_model()
-        self.bbWeldstiff3_l2Model = self.bbWeldstiff3_l2.create_model()
-
-        self.bbWeldstiff4_u1Model = self.bbWeldstiff4_u1.create_model()
-        self.bbWeldstiff4_u2Model = self.bbWeldstiff4_u2.create_model()
-        self.bbWeldstiff4_l1Model = self.bbWeldstiff4_l1.create_model()
-        self.bbWeldstiff4_l2Model = self.bbWeldstiff4_l2.create_model()
+        models = ModelBatch(self)
+        models.add('beamLModel', self.beamLeft.create_model)
+        models.add('beamRModel', self.beamRight.create_model)
+        models.add('plateLModel', self.plateLeft.create_model)
+        models.add('plateRModel', self.plateRight.create_model)
+        models.add('nutBoltArrayModels', self.nut_bolt_array.create_model)
+        models.add('beam_stiffener_1Model', self.beam_stiffener_1.create_model)
+        models.add('beam_stiffener_2Model', self.beam_stiffener_2.create_model)
+        models.add('beam_stiffener_3Model', self.beam_stiffener_3.create_model)
+        models.add('beam_stiffener_4Model', self.beam_stiffener_4.create_model)
+
+        models.add('beam_stiffener_F1Model', self.beam_stiffener_F1.create_model)
+        models.add('beam_stiffener_F2Model', self.beam_stiffener_F2.create_model)
+        models.add('beam_stiffener_F3Model', self.beam_stiffener_F3.create_model)
+        models.add('beam_stiffener_F4Model', self.beam_stiffener_F4.create_model)
+
+        models.add('bbWeldAbvFlang_11Model', self.bbWeldAbvFlang_11.create_model)
+        models.add('bbWeldAbvFlang_12Model', self.bbWeldAbvFlang_12.create_model)
+        models.add('bbWeldAbvFlang_21Model', self.bbWeldAbvFlang_21.create_model)
+        models.add('bbWeldAbvFlang_22Model', self.bbWeldAbvFlang_22.create_model)
+
+        models.add('bbWeldBelwFlang_11Model', self.bbWeldBelwFlang_11.create_model)
+        models.add('bbWeldBelwFlang_12Model', self.bbWeldBelwFlang_12.create_model)
+        models.add('bbWeldBelwFlang_13Model', self.bbWeldBelwFlang_13.create_model)
+        models.add('bbWeldBelwFlang_14Model', self.bbWeldBelwFlang_14.create_model)
+        models.add('bbWeldBelwFlang_21Model', self.bbWeldBelwFlang_21.create_model)
+        models.add('bbWeldBelwFlang_22Model', self.bbWeldBelwFlang_22.create_model)
+        models.add('bbWeldBelwFlang_23Model', self.bbWeldBelwFlang_23.create_model)
+        models.add('bbWeldBelwFlang_24Model', self.bbWeldBelwFlang_24.create_model)
+
+
+        models.add('bbWeldSideWeb_11Model', self.bbWeldSideWeb_11.create_model)
+        models.add('bbWeldSideWeb_12Model', self.bbWeldSideWeb_12.create_model)
+        models.add('bbWeldSideWeb_21Model', self.bbWeldSideWeb_21.create_model)
+        models.add('bbWeldSideWeb_22Model', self.bbWeldSideWeb_22.create_model)
+
+        models.add('bbWeldStiffHL_1Model', self.bbWeldStiffHL_1.create_model)
+        models.add('bbWeldStiffHL_2Model', self.bbWeldStiffHL_2.create_model)
+        models.add('bbWeldStiffHL_3Model', self.bbWeldStiffHL_3.create_model)
+        models.add('bbWeldStiffHL_4Model', self.bbWeldStiffHL_4.create_model)
+
+        models.add('bbWeldStiffLL_1Model', self.bbWeldStiffLL_1.create_model)
+        models.add('bbWeldStiffLL_2Model', self.bbWeldStiffLL_2.create_model)
+        models.add('bbWeldStiffLL_3Model', self.bbWeldStiffLL_3.create_model)
+        models.add('bbWeldStiffLL_4Model', self.bbWeldStiffLL_4.create_model)
+        models.add('bbWeldStiffHR_1Model', self.bbWeldStiffHR_1.create_model)
+        models.add('bbWeldStiffHR_2Model', self.bbWeldStiffHR_2.create_model)
+        models.add('bbWeldStiffHR_3Model', self.bbWeldStiffHR_3.create_model)
+        models.add('bbWeldStiffHR_4Model', self.bbWeldStiffHR_4.create_model)
+
+        models.add('bbWeldStiffLR_1Model', self.bbWeldStiffLR_1.create_model)
+        models.add('bbWeldStiffLR_2Model', self.bbWeldStiffLR_2.create_model)
+        models.add('bbWeldStiffLR_3Model', self.bbWeldStiffLR_3.create_model)
+        models.add('bbWeldStiffLR_4Model', self.bbWeldStiffLR_4.create_model)
+
+        models.add('bbWeldstiff1_u1Model', self.bbWeldstiff1_u1.create_model)
+        models.add('bbWeldstiff1_u2Model', self.bbWeldstiff1_u2.create_model)
+        models.add('bbWeldstiff1_l1Model', self.bbWeldstiff1_l1.create_model)
+        models.add('bbWeldstiff1_l2Model', self.bbWeldstiff1_l2.create_model)
+
+        models.add('bbWeldstiff2_u1Model', self.bbWeldstiff2_u1.create_model)
+        models.add('bbWeldstiff2_u2Model', self.bbWeldstiff2_u2.create_model)
+        models.add('bbWeldstiff2_l1Model', self.bbWeldstiff2_l1.create_model)
+        models.add('bbWeldstiff2_l2Model', self.bbWeldstiff2_l2.create_model)
+
+        models.add('bbWeldstiff3_u1Model', self.bbWeldstiff3_u1.create_model)
+        models.add('bbWeldstiff3_u2Model', self.bbWeldstiff3_u2.create_model)
+        models.add('bbWeldstiff3_l1Model', self.bbWeldstiff3_l1.create_model)
+        models.add('bbWeldstiff3_l2Model', self.bbWeldstiff3_l2.create_model)
+
+        models.add('bbWeldstiff4_u1Model', self.bbWeldstiff4_u1.create_model)
+        models.add('bbWeldstiff4_u2Model', self.bbWeldstiff4_u2.create_model)
+        models.add('bbWeldstiff4_l1Model', self.bbWeldstiff4_l1.create_model)
+        models.add('bbWeldstiff4_l2Model', self.bbWeldstiff4_l2.create_model)
+        models.build()
 
 
 #############################################################################################################
@@ -1007,16 +1010,17 @@ class CADGroove(object):
 
 
         # call for create_model of filletweld from Components directory
-        self.beamLModel = self.beamLeft.create_model()
-        self.beamRModel = self.beamRight.create_model()
-        self.plateLModel = self.plateLeft.create_model()
-        self.plateRModel = self.plateRight.create_model()
-        self.nutBoltArrayModels = self.nut_bolt_array.create_model()
-
-        self.beam_stiffener_1Model = self.beam_stiffener_1.create_model()
-        self.beam_stiffener_2Model = self.beam_stiffener_2.create_model()
-        self.beam_stiffener_3Model = self.beam_stiffener_3.create_model()
-        self.beam_stiffener_4Model = self.beam_stiffener_4.create_model()
+        models = ModelBatch(self)
+        models.add('beamLModel', self.beamLeft.create_model)
+        models.add('beamRModel', self.beamRight.create_model)
+        models.add('plateLModel', self.plateLeft.create_model)
+        models.add('plateRModel', self.plateRight.create_model)
+        models.add('nutBoltArrayModels', self.nut_bolt_array.create_model)
+
+        models.add('beam_stiffener_1Model', self.beam_stiffener_1.create_model)
+        models.add('beam_stiffener_2Model', self.beam_stiffener_2.create_model)
+        models.add('beam_stiffener_3Model', self.beam_stiffener_3.create_model)
+        models.add('beam_stiffener_4Model', self.beam_stiffener_4.create_model)
 
         # flush stiffener#
         # self.beam_stiffener_F1Model = self.beam_stiffener_F1.create_model()
@@ -1029,32 +1033,33 @@ class CADGroove(object):
         #     self.beam_stiffener_F7Model = self.beam_stiffener_F7.create_model()
         #     self.beam_stiffener_F8Model = self.beam_stiffener_F8.create_model()
         #
-        self.bbWeldFlang_R1Model = self.bbWeldFlang_R1.create_model()
-        self.bbWeldFlang_R2Model = self.bbWeldFlang_R2.create_model()
-        self.bbWeldFlang_L1Model = self.bbWeldFlang_L1.create_model()
-        self.bbWeldFlang_L2Model = self.bbWeldFlang_L2.create_model()
-        self.bbWeldWeb_R3Model = self.bbWeldWeb_R3.create_model()
-        self.bbWeldWeb_L3Model = self.bbWeldWeb_L3.create_model()
+        models.add('bbWeldFlang_R1Model', self.bbWeldFlang_R1.create_model)
+        models.add('bbWeldFlang_R2Model', self.bbWeldFlang_R2.create_model)
+        models.add('bbWeldFlang_L1Model', self.bbWeldFlang_L1.create_model)
+        models.add('bbWeldFlang_L2Model', self.bbWeldFlang_L2.create_model)
+        models.add('bbWeldWeb_R3Model', self.bbWeldWeb_R3.create_model)
+        models.add('bbWeldWeb_L3Model', self.bbWeldWeb_L3.create_model)
         #
         # #Fillet weld
-        self.bbWeldStiffHL_1Model = self.bbWeldStiffHL_1.create_model()
-        self.bbWeldStiffHL_2Model = self.bbWeldStiffHL_2.create_model()
-        self.bbWeldStiffHL_3Model = self.bbWeldStiffHL_3.create_model()
-        self.bbWeldStiffHL_4Model = self.bbWeldStiffHL_4.create_model()
+        models.add('bbWeldStiffHL_1Model', self.bbWeldStiffHL_1.create_model)
+        models.add('bbWeldStiffHL_2Model', self.bbWeldStiffHL_2.create_model)
+        models.add('bbWeldStiffHL_3Model', self.bbWeldStiffHL_3.create_model)
+        models.add('bbWeldStiffHL_4Model', self.bbWeldStiffHL_4.create_model)
         #
-        self.bbWeldStiffLL_1Model = self.bbWeldStiffLL_1.create_model()
-        self.bbWeldStiffLL_2Model = self.bbWeldStiffLL_2.create_model()
-        self.bbWeldStiffLL_3Model = self.bbWeldStiffLL_3.create_model()
-        self.bbWeldStiffLL_4Model = self.bbWeldStiffLL_4.create_model()
-        self.bbWeldStiffHR_1Model = self.bbWeldStiffHR_1.create_model()
-        self.bbWeldStiffHR_2Model = self.bbWeldStiffHR_2.create_model()
-        self.bbWeldStiffHR_3Model = self.bbWeldStiffHR_3.create_model()
-        self.bbWeldStiffHR_4Model = self.bbWeldStiffHR_4.create_model()
+        models.add('bbWeldStiffLL_1Model', self.bbWeldStiffLL_1.create_model)
+        models.add('bbWeldStiffLL_2Model', self.bbWeldStiffLL_2.create_model)
+        models.add('bbWeldStiffLL_3Model', self.bbWeldStiffLL_3.create_model)
+        models.add('bbWeldStiffLL_4Model', self.bbWeldStiffLL_4.create_model)
+        models.add('bbWeldStiffHR_1Model', self.bbWeldStiffHR_1.create_model)
+        models.add('bbWeldStiffHR_2Model', self.bbWeldStiffHR_2.create_model)
+        models.add('bbWeldStiffHR_3Model', self.bbWeldStiffHR_3.create_model)
+        models.add('bbWeldStiffHR_4Model', self.bbWeldStiffHR_4.create_model)
         #
-        self.bbWeldStiffLR_1Model = self.bbWeldStiffLR_1.create_model()
-        self.bbWeldStiffLR_2Model = self.bbWeldStiffLR_2.create_model()
-        self.bbWeldStiffLR_3Model = self.bbWeldStiffLR_3.create_model()
-        self.bbWeldStiffLR_4Model = self.bbWeldStiffLR_4.create_model()
+        models.add('bbWeldStiffLR_1Model', self.bbWeldStiffLR_1.create_model)
+        models.add('bbWeldStiffLR_2Model', self.bbWeldStiffLR_2.create_model)
+        models.add('bbWeldStiffLR_3Model', self.bbWeldStiffLR_3.create_model)
+        models.add('bbWeldStiffLR_4Model', self.bbWeldStiffLR_4.create_model)
+        models.build()
         #
         #
         #
@@ -9,6 +9,7 @@ import numpy
 import copy
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from cad.parallel import ModelBatch
 from OCC.Core.gp import (gp_Vec, gp_Pnt, gp_Trsf, gp_OX, gp_OY,
                          gp_OZ, gp_XYZ, gp_Ax2, gp_Dir, gp_GTrsf, gp_Mat)
 from OCC.Core.BRepBuilderAPI import (BRepBuilderAPI_MakeEdge,
@@ -130,62 +131,64 @@ class CADFillet(object):# not used in the current version as groove weld is pref
         self.create_bcWeldStiff()
 
         # call for create_model of filletweld from Components directory
-        self.columnModel = self.column.create_model()
-        self.beamModel = self.beam.create_model()
-        self.plateModel = self.plate.create_model()
-        self.nutBoltArrayModels = self.nut_bolt_array.create_model()
-        self.contPlate_L1Model = self.contPlate_L1.create_model()
-        self.contPlate_L2Model = self.contPlate_L2.create_model()
-        self.contPlate_R1Model = self.contPlate_R1.create_model()
-        self.contPlate_R2Model = self.contPlate_R2.create_model()
-        self.beam_stiffener_1Model = self.beam_stiffener_1.create_model()
-        self.beam_stiffener_2Model = self.beam_stiffener_2.create_model()
-
-        self.bcWeldAbvFlang_21Model = self.bcWeldAbvFlang_21.create_model()
-        self.bcWeldAbvFlang_22Model = self.bcWeldAbvFlang_22.create_model()
-
-        self.bcWeldBelwFlang_21Model = self.bcWeldBelwFlang_21.create_model()
-        self.bcWeldBelwFlang_22Model = self.bcWeldBelwFlang_22.create_model()
-        self.bcWeldBelwFlang_23Model = self.bcWeldBelwFlang_23.create_model()
-        self.bcWeldBelwFlang_24Model = self.bcWeldBelwFlang_24.create_model()
-
-        self.bcWeldSideWeb_21Model = self.bcWeldSideWeb_21.create_model()
-        self.bcWeldSideWeb_22Model = self.bcWeldSideWeb_22.create_model()
-
-        self.contWeldL1_U2Model = self.contWeldL1_U2.create_model()
-        self.contWeldL2_U2Model = self.contWeldL2_U2.create_model()
-        self.contWeldL1_L2Model = self.contWeldL1_L2.create_model()
-        self.contWeldL2_L2Model = self.contWeldL2_L2.create_model()
-        self.contWeldR1_U2Model = self.contWeldR1_U2.create_model()
-        self.contWeldR2_U2Model = self.contWeldR2_U2.create_model()
-        self.contWeldR1_L2Model = self.contWeldR1_L2.create_model()
-        self.contWeldR2_L2Model = self.contWeldR2_L2.create_model()
-        self.contWeldL1_U3Model = self.contWeldL1_U3.create_model()
-        self.contWeldL1_L3Model = self.contWeldL1_L3.create_model()
-        self.contWeldL2_U3Model = self.contWeldL2_U3.create_model()
-        self.contWeldL2_L3Model = self.contWeldL2_L3.create_model()
-        self.contWeldR1_U3Model = self.contWeldR1_U3.create_model()
-        self.contWeldR1_L3Model = self.contWeldR1_L3.create_model()
-        self.contWeldR2_U3Model = self.contWeldR2_U3.create_model()
-        self.contWeldR2_L3Model = self.contWeldR2_L3.create_model()
-        self.contWeldL1_U1Model = self.contWeldL1_U1.create_model()
-        self.contWeldL1_L1Model = self.contWeldL1_L1.create_model()
-        self.contWeldL2_U1Model = self.contWeldL2_U1.create_model()
-        self.contWeldL2_L1Model = self.contWeldL2_L1.create_model()
-        self.contWeldR1_U1Model = self.contWeldR1_U1.create_model()
-        self.contWeldR1_L1Model = self.contWeldR1_L1.create_model()
-        self.contWeldR2_U1Model = self.contWeldR2_U1.create_model()
-        self.contWeldR2_L1Model = self.contWeldR2_L1.create_model()
-
-        self.bcWeldStiffHL_1Model = self.bcWeldStiffHL_1.create_model()
-        self.bcWeldStiffHL_2Model = self.bcWeldStiffHL_2.create_model()
-        self.bcWeldStiffHR_1Model = self.bcWeldStiffHR_1.create_model()
-        self.bcWeldStiffHR_2Model = self.bcWeldStiffHR_2.create_model()
-
-        self.bcWeldStiffLL_1Model = self.bcWeldStiffLL_1.create_model()
-        self.bcWeldStiffLL_2Model = self.bcWeldStiffLL_2.create_model()
-        self.bcWeldStiffLR_1Model = self.bcWeldStiffLR_1.create_model()
-        self.bcWeldStiffLR_2Model = self.bcWeldStiffLR_2.create_model()
+        models = ModelBatch(self)
+        models.add('columnModel', self.column.create_model)
+        models.add('beamModel', self.beam.create_model)
+        models.add('plateModel', self.plate.create_model)
+        models.add('nutBoltArrayModels', self.nut_bolt_array.create_model)
+        models.add('contPlate_L1Model', self.contPlate_L1.create_model)
+        models.add('contPlate_L2Model', self.contPlate_L2.create_model)
+        models.add('contPlate_R1Model', self.contPlate_R1.create_model)
+        models.add('contPlate_R2Model', self.contPlate_R2.create_model)
+        models.add('beam_stiffener_1Model', self.beam_stiffener_1.create_model)
+        models.add('beam_stiffener_2Model', self.beam_stiffener_2.create_model)
+
+        models.add('bcWeldAbvFlang_21Model', self.bcWeldAbvFlang_21.create_model)
+        models.add('bcWeldAbvFlang_22Model', self.bcWeldAbvFlang_22.create_model)
+
+        models.add('bcWeldBelwFlang_21Model', self.bcWeldBelwFlang_21.create_model)
+        models.add('bcWeldBelwFlang_22Model', self.bcWeldBelwFlang_22.create_model)
+        models.add('bcWeldBelwFlang_23Model', self.bcWeldBelwFlang_23.create_model)
+        models.add('bcWeldBelwFlang_24Model', self.bcWeldBelwFlang_24.create_model)
+
+        models.add('bcWeldSideWeb_21Model', self.bcWeldSideWeb_21.create_model)
+        models.add('bcWeldSideWeb_22Model', self.bcWeldSideWeb_22.create_model)
+
+        models.add('contWeldL1_U2Model', self.contWeldL1_U2.create_model)
+        models.add('contWeldL2_U2Model', self.contWeldL2_U2.create_model)
+        models.add('contWeldL1_L2Model', self.contWeldL1_L2.create_model)
+        models.add('contWeldL2_L2Model', self.contWeldL2_L2.create_model)
+        models.add('contWeldR1_U2Model', self.contWeldR1_U2.create_model)
+        models.add('contWeldR2_U2Model', self.contWeldR2_U2.create_model)
+        models.add('contWeldR1_L2Model', self.contWeldR1_L2.create_model)
+        models.add('contWeldR2_L2Model', self.contWeldR2_L2.create_model)
+        models.add('contWeldL1_U3Model', self.contWeldL1_U3.create_model)
+        models.add('contWeldL1_L3Model', self.contWeldL1_L3.create_model)
+        models.add('contWeldL2_U3Model', self.contWeldL2_U3.create_model)
+        models.add('contWeldL2_L3Model', self.contWeldL2_L3.create_model)
+        models.add('contWeldR1_U3Model', self.contWeldR1_U3.create_model)
+        models.add('contWeldR1_L3Model', self.contWeldR1_L3.create_model)
+        models.add('contWeldR2_U3Model', self.contWeldR2_U3.create_model)
+        models.add('contWeldR2_L3Model', self.contWeldR2_L3.create_model)
+        models.add('contWeldL1_U1Model', self.contWeldL1_U1.create_model)
+        models.add('contWeldL1_L1Model', self.contWeldL1_L1.create_model)
+        models.add('contWeldL2_U1Model', self.contWeldL2_U1.create_model)
+        models.add('contWeldL2_L1Model', self.contWeldL2_L1.create_model)
+        models.add('contWeldR1_U1Model', self.contWeldR1_U1.create_model)
+        models.add('contWeldR1_L1Model', self.contWeldR1_L1.create_model)
+        models.add('contWeldR2_U1Model', self.contWeldR2_U1.create_model)
+        models.add('contWeldR2_L1Model', self.contWeldR2_L1.create_model)
+
+        models.add('bcWeldStiffHL_1Model', self.bcWeldStiffHL_1.create_model)
+        models.add('bcWeldStiffHL_2Model', self.bcWeldStiffHL_2.create_model)
+        models.add('bcWeldStiffHR_1Model', self.bcWeldStiffHR_1.create_model)
+        models.add('bcWeldStiffHR_2Model', self.bcWeldStiffHR_2.create_model)
+
+        models.add('bcWeldStiffLL_1Model', self.bcWeldStiffLL_1.create_model)
+        models.add('bcWeldStiffLL_2Model', self.bcWeldStiffLL_2.create_model)
+        models.add('bcWeldStiffLR_1Model', self.bcWeldStiffLR_1.create_model)
+        models.add('bcWeldStiffLR_2Model', self.bcWeldStiffLR_2.create_model)
+        models.build()
 
     #############################################################################################################
     #   Following functions takes inputs as origin, u direction and w direction of concerned component to place #
@@ -1231,56 +1234,57 @@ class CADGroove(object):
             self.create_webWelds()
 
         # call for create_model of filletweld from Components directory
-        self.columnModel = self.column.create_model()
-        self.beamModel = self.beam.create_model()
-        self.plateModel = self.plate.create_model()
-        self.nutBoltArrayModels = self.nut_bolt_array.create_model()
+        models = ModelBatch(self)
+        models.add('columnModel', self.column.create_model)
+        models.add('beamModel', self.beam.create_model)
+        models.add('plateModel', self.plate.create_model)
+        models.add('nutBoltArrayModels', self.nut_bolt_array.create_model)
         if self.diagplate!= None:
-            self.diagplate_L1Model = self.diagplate_L1.create_model(-45)
-            self.diagplate_R1Model = self.diagplate_R1.create_model(-45)
+            models.add('diagplate_L1Model', self.diagplate_L1.create_model, -45)
+            models.add('diagplate_R1Model', self.diagplate_R1.create_model, -45)
         if self.contPlates != None:
             if self.module.connectivity == "Column Web-Beam Web":
-                self.contPlate_L1Model = self.contPlate_L1.create_model()
-                self.contPlate_L2Model = self.contPlate_L2.create_model()
+                models.add('contPlate_L1Model', self.contPlate_L1.create_model)
+                models.add('contPlate_L2Model', self.contPlate_L2.create_model)
             else:
-                self.contPlate_L1Model = self.contPlate_L1.create_model()
-                self.contPlate_L2Model = self.contPlate_L2.create_model()
-                self.contPlate_R1Model = self.contPlate_R1.create_model()
-                self.contPlate_R2Model = self.contPlate_R2.create_model()
+                models.add('contPlate_L1Model', self.contPlate_L1.create_model)
+                models.add('contPlate_L2Model', self.contPlate_L2.create_model)
+                models.add('contPlate_R1Model', self.contPlate_R1.create_model)
+                models.add('contPlate_R2Model', self.contPlate_R2.create_model)
 
         if self.webplate != None:
-            self.webplate_LModel = self.webplate_L.create_model()
-            self.webplate_RModel = self.webplate_R.create_model()
+            models.add('webplate_LModel', self.webplate_L.create_model)
+            models.add('webplate_RModel', self.webplate_R.create_model)
 
         if self.webplate != None:
-            self.webWeldB_LTModel = self.webWeldB_LT.create_model()
-            self.webWeldB_LBModel = self.webWeldB_LB.create_model()
-            self.webWeldB_RTModel = self.webWeldB_RT.create_model()
-            self.webWeldB_RBModel = self.webWeldB_RB.create_model()
-            self.webWeldD_LLModel = self.webWeldD_LL.create_model()
-            self.webWeldD_LRModel = self.webWeldD_LR.create_model()
-            self.webWeldD_RLModel = self.webWeldD_RL.create_model()
-            self.webWeldD_RRModel = self.webWeldD_RR.create_model()
+            models.add('webWeldB_LTModel', self.webWeldB_LT.create_model)
+            models.add('webWeldB_LBModel', self.webWeldB_LB.create_model)
+            models.add('webWeldB_RTModel', self.webWeldB_RT.create_model)
+            models.add('webWeldB_RBModel', self.webWeldB_RB.create_model)
+            models.add('webWeldD_LLModel', self.webWeldD_LL.create_model)
+            models.add('webWeldD_LRModel', self.webWeldD_LR.create_model)
+            models.add('webWeldD_RLModel', self.webWeldD_RL.create_model)
+            models.add('webWeldD_RRModel', self.webWeldD_RR.create_model)
 
-        self.beam_stiffener_1Model = self.beam_stiffener_1.create_model()
-        self.beam_stiffener_2Model = self.beam_stiffener_2.create_model()
+        models.add('beam_stiffener_1Model', self.beam_stiffener_1.create_model)
+        models.add('beam_stiffener_2Model', self.beam_stiffener_2.create_model)
 
 
-        self.bcWeldFlang_R1Model = self.bcWeldFlang_R1.create_model()
-        self.bcWeldFlang_R2Model = self.bcWeldFlang_R2.create_model()
+        models.add('bcWeldFlang_R1Model', self.bcWeldFlang_R1.create_model)
+        models.add('bcWeldFlang_R2Model', self.bcWeldFlang_R2.create_model)
 
-        self.bcWeldWeb_R3Model = self.bcWeldWeb_R3.create_model()
+        models.add('bcWeldWeb_R3Model', self.bcWeldWeb_R3.create_model)
 
 
-        self.bcWeldStiffHL_1Model = self.bcWeldStiffHL_1.create_model()
-        self.bcWeldStiffHL_2Model = self.bcWeldStiffHL_2.create_model()
-        self.bcWeldStiffHR_1Model = self.bcWeldStiffHR_1.create_model()
-        self.bcWeldStiffHR_2Model = self.bcWeldStiffHR_2.create_model()
+        models.add('bcWeldStiffHL_1Model', self.bcWeldStiffHL_1.create_model)
+        models.add('bcWeldStiffHL_2Model', self.bcWeldStiffHL_2.create_model)
+        models.add('bcWeldStiffHR_1Model', self.bcWeldStiffHR_1.create_model)
+        models.add('bcWeldStiffHR_2Model', self.bcWeldStiffHR_2.create_model)
 
-        self.bcWeldStiffLL_1Model = self.bcWeldStiffLL_1.create_model()
-        self.bcWeldStiffLL_2Model = self.bcWeldStiffLL_2.create_model()
-        self.bcWeldStiffLR_1Model = self.bcWeldStiffLR_1.create_model()
-        self.bcWeldStiffLR_2Model = self.bcWeldStiffLR_2.create_model()
+        models.add('bcWeldStiffLL_1Model', self.bcWeldStiffLL_1.create_model)
+        models.add('bcWeldStiffLL_2Model', self.bcWeldStiffLL_2.create_model)
+        models.add('bcWeldStiffLR_1Model', self.bcWeldStiffLR_1.create_model)
+        models.add('bcWeldStiffLR_2Model', self.bcWeldStiffLR_2.create_model)
 
         # flush stiffener#
         # self.beam_stiffener_F1Model = self.beam_stiffener_F1.create_model()
@@ -1293,55 +1297,56 @@ class CADGroove(object):
         if self.contPlates != None:
 
             if self.module.connectivity == "Column Web-Beam Web":
-                self.contWeldL1_U2Model = self.contWeldL1_U2.create_model()
-                self.contWeldL2_U2Model = self.contWeldL2_U2.create_model()
-                self.contWeldL1_L2Model = self.contWeldL1_L2.create_model()
-                self.contWeldL2_L2Model = self.contWeldL2_L2.create_model()
-                self.contWeldL1_U3Model = self.contWeldL1_U3.create_model()
-                self.contWeldL1_L3Model = self.contWeldL1_L3.create_model()
-                self.contWeldL2_U3Model = self.contWeldL2_U3.create_model()
-                self.contWeldL2_L3Model = self.contWeldL2_L3.create_model()
-                self.contWeldL1_U1Model = self.contWeldL1_U1.create_model()
-                self.contWeldL1_L1Model = self.contWeldL1_L1.create_model()
-                self.contWeldL2_U1Model = self.contWeldL2_U1.create_model()
-                self.contWeldL2_L1Model = self.contWeldL2_L1.create_model()
+                models.add('contWeldL1_U2Model', self.contWeldL1_U2.create_model)
+                models.add('contWeldL2_U2Model', self.contWeldL2_U2.create_model)
+                models.add('contWeldL1_L2Model', self.contWeldL1_L2.create_model)
+                models.add('contWeldL2_L2Model', self.contWeldL2_L2.create_model)
+                models.add('contWeldL1_U3Model', self.contWeldL1_U3.create_model)
+                models.add('contWeldL1_L3Model', self.contWeldL1_L3.create_model)
+                models.add('contWeldL2_U3Model', self.contWeldL2_U3.create_model)
+                models.add('contWeldL2_L3Model', self.contWeldL2_L3.create_model)
+                models.add('contWeldL1_U1Model', self.contWeldL1_U1.create_model)
+                models.add('contWeldL1_L1Model', self.contWeldL1_L1.create_model)
+                models.add('contWeldL2_U1Model', self.contWeldL2_U1.create_model)
+                models.add('contWeldL2_L1Model', self.contWeldL2_L1.create_model)
             else:
-                self.contWeldL1_U2Model = self.contWeldL1_U2.create_model()
-                self.contWeldL2_U2Model = self.contWeldL2_U2.create_model()
-                self.contWeldL1_L2Model = self.contWeldL1_L2.create_model()
-                self.contWeldL2_L2Model = self.contWeldL2_L2.create_model()
-                self.contWeldR1_U2Model = self.contWeldR1_U2.create_model()
-                self.contWeldR2_U2Model = self.contWeldR2_U2.create_model()
-                self.contWeldR1_L2Model = self.contWeldR1_L2.create_model()
-                self.contWeldR2_L2Model = self.contWeldR2_L2.create_model()
-                self.contWeldL1_U3Model = self.contWeldL1_U3.create_model()
-                self.contWeldL1_L3Model = self.contWeldL1_L3.create_model()
-                self.contWeldL2_U3Model = self.contWeldL2_U3.create_model()
-                self.contWeldL2_L3Model = self.contWeldL2_L3.create_model()
-                self.contWeldR1_U3Model = self.contWeldR1_U3.create_model()
-                self.contWeldR1_L3Model = self.contWeldR1_L3.create_model()
-                self.contWeldR2_U3Model = self.contWeldR2_U3.create_model()
-                self.contWeldR2_L3Model = self.contWeldR2_L3.create_model()
-                self.contWeldL1_U1Model = self.contWeldL1_U1.create_model()
-                self.contWeldL1_L1Model = self.contWeldL1_L1.create_model()
-                self.contWeldL2_U1Model = self.contWeldL2_U1.create_model()
-                self.contWeldL2_L1Model = self.contWeldL2_L1.create_model()
-                self.contWeldR1_U1Model = self.contWeldR1_U1.create_model()
-                self.contWeldR1_L1Model = self.contWeldR1_L1.create_model()
-                self.contWeldR2_U1Model = self.contWeldR2_U1.create_model()
-                self.contWeldR2_L1Model = self.contWeldR2_L1.create_model()
+                models.add('contWeldL1_U2Model', self.contWeldL1_U2.create_model)
+                models.add('contWeldL2_U2Model', self.contWeldL2_U2.create_model)
+                models.add('contWeldL1_L2Model', self.contWeldL1_L2.create_model)
+                models.add('contWeldL2_L2Model', self.contWeldL2_L2.create_model)
+                models.add('contWeldR1_U2Model', self.contWeldR1_U2.create_model)
+                models.add('contWeldR2_U2Model', self.contWeldR2_U2.create_model)
+                models.add('contWeldR1_L2Model', self.contWeldR1_L2.create_model)
+                models.add('contWeldR2_L2Model', self.contWeldR2_L2.create_model)
+                models.add('contWeldL1_U3Model', self.contWeldL1_U3.create_model)
+                models.add('contWeldL1_L3Model', self.contWeldL1_L3.create_model)
+                models.add('contWeldL2_U3Model', self.contWeldL2_U3.create_model)
+                models.add('contWeldL2_L3Model', self.contWeldL2_L3.create_model)
+                models.add('contWeldR1_U3Model', self.contWeldR1_U3.create_model)
+                models.add('contWeldR1_L3Model', self.contWeldR1_L3.create_model)
+                models.add('contWeldR2_U3Model', self.contWeldR2_U3.create_model)
+                models.add('contWeldR2_L3Model', self.contWeldR2_L3.create_model)
+                models.add('contWeldL1_U1Model', self.contWeldL1_U1.create_model)
+                models.add('contWeldL1_L1Model', self.contWeldL1_L1.create_model)
+                models.add('contWeldL2_U1Model', self.contWeldL2_U1.create_model)
+                models.add('contWeldL2_L1Model', self.contWeldL2_L1.create_model)
+                models.add('contWeldR1_U1Model', self.contWeldR1_U1.create_model)
+                models.add('contWeldR1_L1Model', self.contWeldR1_L1.create_model)
+                models.add('contWeldR2_U1Model', self.contWeldR2_U1.create_model)
+                models.add('contWeldR2_L1Model', self.contWeldR2_L1.create_model)
 
         if self.diagplate != None: # omitted due to detailing issues
 
-            self.diagWeldL1_LModel = self.diagWeldL1_L.create_model(-45)
-            self.diagWeldL1_UModel = self.diagWeldL1_U.create_model(-45)
-            self.diagWeldR1_LModel = self.diagWeldR1_L.create_model(-45)
-            self.diagWeldR1_UModel = self.diagWeldR1_U.create_model(-45)
+            models.add('diagWeldL1_LModel', self.diagWeldL1_L.create_model, -45)
+            models.add('diagWeldL1_UModel', self.diagWeldL1_U.create_model, -45)
+            models.add('diagWeldR1_LModel', self.diagWeldR1_L.create_model, -45)
+            models.add('diagWeldR1_UModel', self.diagWeldR1_U.create_model, -45)
 
-            self.diagWeldS1_UModel = self.diagWeldS1_U.create_model(45)
-            self.diagWeldS1_LModel = self.diagWeldS1_L.create_model(-135)
-            self.diagWeldS2_UModel = self.diagWeldS2_U.create_model(45)
-            self.diagWeldS2_LModel = self.diagWeldS2_L.create_model(-135)
+            models.add('diagWeldS1_UModel', self.diagWeldS1_U.create_model, 45)
+            models.add('diagWeldS1_LModel', self.diagWeldS1_L.create_model, -135)
+            models.add('diagWeldS2_UModel', self.diagWeldS2_U.create_model, 45)
+            models.add('diagWeldS2_LModel', self.diagWeldS2_L.create_model, -135)
+        models.build()
 
         # flush stiffener#
         # self.bcWeldstiff1_u1Model = self.bcWeldstiff1_u1.create_model()
@@ -79,6 +79,7 @@ from design_type.connection.beam_cover_plate import BeamCoverPlate
 # from design_type.connection.base_plate_connection import BasePlateConnection
 from utilities import osdag_display_shape, DisplayMsg
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from cad.items.ModelUtils import fuse_shapes, make_compound, get_solids, make_bounding_cylinder
 import copy
 
 from cad.BBCad.nutBoltPlacement_AF import NutBoltArray_AF
@@ -137,6 +138,10 @@ from OCC.Core.Quantity import Quantity_NOC_GRAY25 as GRAY
 # from OCC.Display.OCCViewer import V3d_XposYnegZneg
 from OCC.Core.TNaming import tnaming
 import multiprocessing
+import os
+
+# views with more nut and bolt solids than this draw them as plain cylinders
+BOLT_LOD_THRESHOLD = int(os.environ.get('OSDAG_BOLT_LOD_THRESHOLD', 200))
 
 # from Connections.Shear.Finplate.drawing_2D import FinCommonData
 # from Connections.Shear.Endplate.drawing_2D import EndCommonData
@@ -177,6 +182,11 @@ class CommonDesignLogic(object):
         self.connectivityObj = None
         self.folder = folder
 
+        self.design_flag = None
+        self.module_class = None
+        self.cad_model = None
+        self.display_groups = []
+
 
     def get_notch_ht(self, PB_T, PB_R1, SB_T, SB_R1):
         """
@@ -1703,6 +1713,8 @@ class CommonDesignLogic(object):
     def display_3DModel(self, component, bgcolor):
 
         self.component = component
+        self.get_3DModel()
+        self.display_groups = []
 
         self.display.EraseAll()
 
@@ -1735,59 +1747,46 @@ class CommonDesignLogic(object):
                 self.display.View.SetProj(OCC.Core.V3d.V3d_XposYnegZpos)
 
             if self.component == "Column":
-                osdag_display_shape(self.display, self.connectivityObj.get_columnModel(), update=True)
+                self.queue_shape(self.connectivityObj.get_columnModel())
             elif self.component == "Beam":
-                osdag_display_shape(self.display, self.connectivityObj.get_beamModel(), material=Graphic3d_NOT_2D_ALUMINUM,
-                                    update=True)
+                self.queue_shape(self.connectivityObj.get_beamModel(), material=Graphic3d_NOT_2D_ALUMINUM)
             elif component == "cleatAngle":
 
-                osdag_display_shape(self.display, self.connectivityObj.angleModel, color=Quantity_NOC_BLUE1, update=True)
-                osdag_display_shape(self.display, self.connectivityObj.angleLeftModel, color=Quantity_NOC_BLUE1,
-                                    update=True)
-                nutboltlist = self.connectivityObj.nut_bolt_array.get_models()
-                for nutbolt in nutboltlist:
-                    osdag_display_shape(self.display, nutbolt, color=Quantity_NOC_SADDLEBROWN, update=True)
+                self.queue_shape(self.connectivityObj.angleModel, color=Quantity_NOC_BLUE1)
+                self.queue_shape(self.connectivityObj.angleLeftModel, color=Quantity_NOC_BLUE1)
+                self.queue_shape(self.connectivityObj.nut_bolt_array.get_models(), color=Quantity_NOC_SADDLEBROWN,
+                                 bolts=True)
 
             elif component == "SeatAngle":
-                osdag_display_shape(self.display, self.connectivityObj.topclipangleModel, color=Quantity_NOC_BLUE1,
-                                    update=True)
-                osdag_display_shape(self.display, self.connectivityObj.angleModel, color=Quantity_NOC_BLUE1, update=True)
-                nutboltlist = self.connectivityObj.nut_bolt_array.get_models()
-                for nutbolt in nutboltlist:
-                    osdag_display_shape(self.display, nutbolt, color=Quantity_NOC_SADDLEBROWN, update=True)
+                self.queue_shape(self.connectivityObj.topclipangleModel, color=Quantity_NOC_BLUE1)
+                self.queue_shape(self.connectivityObj.angleModel, color=Quantity_NOC_BLUE1)
+                self.queue_shape(self.connectivityObj.nut_bolt_array.get_models(), color=Quantity_NOC_SADDLEBROWN,
+                                 bolts=True)
 
             elif self.component == "Plate":
-                osdag_display_shape(self.display, self.connectivityObj.weldModelLeft, color=Quantity_NOC_RED, update=True)
-                osdag_display_shape(self.display, self.connectivityObj.weldModelRight, color=Quantity_NOC_RED, update=True)
-                osdag_display_shape(self.display, self.connectivityObj.plateModel, color=Quantity_NOC_BLUE4, update=True)
-                nutboltlist = self.connectivityObj.nut_bolt_array.get_models()
-                for nutbolt in nutboltlist:
-                    osdag_display_shape(self.display, nutbolt, color=Quantity_NOC_SADDLEBROWN, update=True)
+                self.queue_shape(self.connectivityObj.weldModelLeft, color=Quantity_NOC_RED)
+                self.queue_shape(self.connectivityObj.weldModelRight, color=Quantity_NOC_RED)
+                self.queue_shape(self.connectivityObj.plateModel, color=Quantity_NOC_BLUE4)
+                self.queue_shape(self.connectivityObj.nut_bolt_array.get_models(), color=Quantity_NOC_SADDLEBROWN,
+                                 bolts=True)
 
             elif self.component == "Model":
 
-                osdag_display_shape(self.display, self.connectivityObj.columnModel, update=True)
-                osdag_display_shape(self.display, self.connectivityObj.beamModel, material=Graphic3d_NOT_2D_ALUMINUM,
-                                    update=True)
+                self.queue_shape(self.connectivityObj.columnModel)
+                self.queue_shape(self.connectivityObj.beamModel, material=Graphic3d_NOT_2D_ALUMINUM)
                 if self.connection == KEY_DISP_FINPLATE or self.connection == KEY_DISP_ENDPLATE:
-                    osdag_display_shape(self.display, self.connectivityObj.weldModelLeft, color=Quantity_NOC_RED, update=True)
-                    osdag_display_shape(self.display, self.connectivityObj.weldModelRight, color=Quantity_NOC_RED, update=True)
-                    osdag_display_shape(self.display, self.connectivityObj.plateModel, color=Quantity_NOC_BLUE1,
-                                        update=True)
+                    self.queue_shape(self.connectivityObj.weldModelLeft, color=Quantity_NOC_RED)
+                    self.queue_shape(self.connectivityObj.weldModelRight, color=Quantity_NOC_RED)
+                    self.queue_shape(self.connectivityObj.plateModel, color=Quantity_NOC_BLUE1)
 
                 elif self.connection == KEY_DISP_CLEATANGLE:
-                    osdag_display_shape(self.display, self.connectivityObj.angleModel, color=Quantity_NOC_BLUE1,
-                                        update=True)
-                    osdag_display_shape(self.display, self.connectivityObj.angleLeftModel, color=Quantity_NOC_BLUE1,
-                                        update=True)
+                    self.queue_shape(self.connectivityObj.angleModel, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(self.connectivityObj.angleLeftModel, color=Quantity_NOC_BLUE1)
                 else:
-                    osdag_display_shape(self.display, self.connectivityObj.topclipangleModel, color=Quantity_NOC_BLUE1,
-                                        update=True)
-                    osdag_display_shape(self.display, self.connectivityObj.angleModel, color=Quantity_NOC_BLUE1,
-                                        update=True)
-                nutboltlist = self.connectivityObj.nut_bolt_array.get_models()
-                for nutbolt in nutboltlist:
-                    osdag_display_shape(self.display, nutbolt, color=Quantity_NOC_SADDLEBROWN, update=True)
+                    self.queue_shape(self.connectivityObj.topclipangleModel, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(self.connectivityObj.angleModel, color=Quantity_NOC_BLUE1)
+                self.queue_shape(self.connectivityObj.nut_bolt_array.get_models(), color=Quantity_NOC_SADDLEBROWN,
+                                 bolts=True)
 
         if self.mainmodule == "Moment Connection":
             if self.connection == KEY_DISP_BEAMCOVERPLATE:
@@ -1797,82 +1796,71 @@ class CommonDesignLogic(object):
                 #     pass
                 #
                 # self.loc = A.connectivity
-                self.CPObj = self.createBBCoverPlateCAD()  # CPBoltedObj is an object which gets all the calculated values of CAD models
                 if self.component == "Beam":
                     # Displays both beams
-                    osdag_display_shape(self.display, self.CPObj.get_only_beams_Models(), update=True)
+                    self.queue_shape(self.CPObj.get_only_beams_Models())
 
                 elif self.component == "Connector":
-                    osdag_display_shape(self.display, self.CPObj.get_flangewebplatesModel(), update=True,
-                                        color=Quantity_NOC_BLUE1)
+                    self.queue_shape(self.CPObj.get_flangewebplatesModel(), color=Quantity_NOC_BLUE1)
                     if self.B.preference != 'Outside':
-                        osdag_display_shape(self.display, self.CPObj.get_innetplatesModels(), update=True,
-                                            color=Quantity_NOC_BLUE1)
+                        self.queue_shape(self.CPObj.get_innetplatesModels(), color=Quantity_NOC_BLUE1)
 
-                    osdag_display_shape(self.display, self.CPObj.get_nut_bolt_arrayModels(), update=True,
-                                        color=Quantity_NOC_YELLOW)
+                    self.queue_shape(self.CPObj.get_nut_bolt_arrayModels(), color=Quantity_NOC_YELLOW, bolts=True)
 
                 elif self.component == "Model":
-                    osdag_display_shape(self.display, self.CPObj.get_beamsModel(), update=True)
-                    osdag_display_shape(self.display, self.CPObj.get_flangewebplatesModel(), update=True,
-                                        color=Quantity_NOC_BLUE1)
+                    self.queue_shape(self.CPObj.get_beamsModel())
+                    self.queue_shape(self.CPObj.get_flangewebplatesModel(), color=Quantity_NOC_BLUE1)
 
                     # Todo: remove velove commented lines
 
                     if self.B.preference != 'Outside':
-                        osdag_display_shape(self.display, self.CPObj.get_innetplatesModels(), update=True,
-                                            color=Quantity_NOC_BLUE1)
+                        self.queue_shape(self.CPObj.get_innetplatesModels(), color=Quantity_NOC_BLUE1)
 
-                    osdag_display_shape(self.display, self.CPObj.get_nut_bolt_arrayModels(), update=True,
-                                        color=Quantity_NOC_YELLOW)
+                    self.queue_shape(self.CPObj.get_nut_bolt_arrayModels(), color=Quantity_NOC_YELLOW, bolts=True)
             elif self.connection == KEY_DISP_BB_EP_SPLICE:
                 self.B = self.module_class()
 
-                self.ExtObj = self.createBBEndPlateCAD()
+                self.ExtObj = self.CPObj
 
                 if component == "Beam":
-                    osdag_display_shape(self.display, self.ExtObj.get_beam_models(), update=True)
+                    self.queue_shape(self.ExtObj.get_beam_models())
 
                 elif component == "Connector":
-                    osdag_display_shape(self.display, self.ExtObj.get_plate_connector_models(), update=True,
-                                        color='Blue')
-                    osdag_display_shape(self.display, self.ExtObj.get_welded_models(), update=True, color='Red')
-                    osdag_display_shape(self.display, self.ExtObj.get_nut_bolt_array_models(), update=True,
-                                        color=Quantity_NOC_SADDLEBROWN)
+                    self.queue_shape(self.ExtObj.get_plate_connector_models(), color='Blue')
+                    self.queue_shape(self.ExtObj.get_welded_models(), color='Red')
+                    self.queue_shape(self.ExtObj.get_nut_bolt_array_models(), color=Quantity_NOC_SADDLEBROWN,
+                                     bolts=True)
 
                 elif component == "Model":
 
                     # osdag_display_shape(self.display, self.ExtObj.get_models(), update=True)
-                    osdag_display_shape(self.display, self.ExtObj.get_beam_models(), update=True)
-                    osdag_display_shape(self.display, self.ExtObj.get_plate_connector_models(), update=True,
-                                        color='Blue')
-                    osdag_display_shape(self.display, self.ExtObj.get_welded_models(), update=True, color='Red')
-                    osdag_display_shape(self.display, self.ExtObj.get_nut_bolt_array_models(), update=True,
-                                        color=Quantity_NOC_SADDLEBROWN)
+                    self.queue_shape(self.ExtObj.get_beam_models())
+                    self.queue_shape(self.ExtObj.get_plate_connector_models(), color='Blue')
+                    self.queue_shape(self.ExtObj.get_welded_models(), color='Red')
+                    self.queue_shape(self.ExtObj.get_nut_bolt_array_models(), color=Quantity_NOC_SADDLEBROWN,
+                                     bolts=True)
 
 
 
             elif self.connection == KEY_DISP_BEAMCOVERPLATEWELD:
                 self.B = self.module_class()
-                self.CPObj = self.createBBCoverPlateCAD()
                 beams = self.CPObj.get_beam_models()
                 plates = self.CPObj.get_plate_models()
                 welds = self.CPObj.get_welded_modules()
 
                 if self.component == "Beam":
                     # Displays both beams
-                    osdag_display_shape(self.display, beams, update=True)
+                    self.queue_shape(beams)
                 elif self.component == "Connector":
-                    osdag_display_shape(self.display, plates, update=True, color=Quantity_NOC_BLUE1)
-                    osdag_display_shape(self.display, welds, update=True, color=Quantity_NOC_RED)
+                    self.queue_shape(plates, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(welds, color=Quantity_NOC_RED)
                 elif self.component == "Model":
-                    osdag_display_shape(self.display, beams, update=True)
-                    osdag_display_shape(self.display, plates, update=True, color=Quantity_NOC_BLUE1)
-                    osdag_display_shape(self.display, welds, update=True, color=Quantity_NOC_RED)
+                    self.queue_shape(beams)
+                    self.queue_shape(plates, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(welds, color=Quantity_NOC_RED)
 
             elif self.connection == KEY_DISP_COLUMNCOVERPLATE:
                 self.C = self.module_class()
-                self.CPObj = self.createCCCoverPlateCAD()
                 columns = self.CPObj.get_column_models()
                 plates = self.CPObj.get_plate_models()
                 nutbolt = self.CPObj.get_nut_bolt_models()
@@ -1880,19 +1868,19 @@ class CommonDesignLogic(object):
 
                 if self.component == "Column":
                     # Displays both beams
-                    osdag_display_shape(self.display, onlycolumn, update=True)
+                    self.queue_shape(onlycolumn)
                 elif self.component == "Cover Plate":
-                    osdag_display_shape(self.display, plates, update=True, color=Quantity_NOC_BLUE1)
-                    osdag_display_shape(self.display, nutbolt, update=True, color=Quantity_NOC_YELLOW)
+                    self.queue_shape(plates, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(nutbolt, color=Quantity_NOC_YELLOW, bolts=True)
                 elif self.component == "Model":
-                    osdag_display_shape(self.display, columns, update=True)
-                    osdag_display_shape(self.display, plates, update=True, color=Quantity_NOC_BLUE1)
-                    osdag_display_shape(self.display, nutbolt, update=True, color=Quantity_NOC_YELLOW)
+                    self.queue_shape(columns)
+                    self.queue_shape(plates, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(nutbolt, color=Quantity_NOC_YELLOW, bolts=True)
 
 
             elif self.connection == KEY_DISP_BCENDPLATE:
                 self.Bc = self.module_class()
-                self.ExtObj = self.createBCEndPlateCAD()
+                self.ExtObj = self.CPObj
 
                 self.display.View.SetProj(OCC.Core.V3d.V3d_XnegYnegZpos)
                 c_length = self.column_length
@@ -1904,7 +1892,7 @@ class CommonDesignLogic(object):
                 # Displays the beams #TODO ANAND
                 if component == "Column":
                     self.display.View_Iso()
-                    osdag_display_shape(self.display, self.ExtObj.columnModel, update=True)
+                    self.queue_shape(self.ExtObj.columnModel)
                     # Point1 = gp_Pnt(-self.Bc.supporting_section.flange_width/2, 0, c_length)
                     # DisplayMsg(self.display, Point1, self.Bc.supporting_section.designation)
                     # Point = gp_Pnt(0.0, 0.0, 10)
@@ -1912,30 +1900,26 @@ class CommonDesignLogic(object):
 
                 elif component == "Beam":
                     self.display.View_Iso()
-                    osdag_display_shape(self.display, self.ExtObj.beamModel, update=True,
-                                        material=Graphic3d_NOT_2D_ALUMINUM)
+                    self.queue_shape(self.ExtObj.beamModel, material=Graphic3d_NOT_2D_ALUMINUM)
                     # Point2 = gp_Pnt(0.0, -b_length, c_length / 2)
                     # DisplayMsg(self.display, Point2, self.Bc.supported_section.designation)
                     # , color = 'Dark Gray'
 
                 elif component == "Connector":
-                    osdag_display_shape(self.display, self.ExtObj.get_plate_connector_models(), update=True,
-                                        color='Blue')
-                    osdag_display_shape(self.display, self.ExtObj.get_welded_models(), update=True, color='Red')
-                    osdag_display_shape(self.display, self.ExtObj.get_nut_bolt_array_models(), update=True,
-                                        color=Quantity_NOC_SADDLEBROWN)
+                    self.queue_shape(self.ExtObj.get_plate_connector_models(), color='Blue')
+                    self.queue_shape(self.ExtObj.get_welded_models(), color='Red')
+                    self.queue_shape(self.ExtObj.get_nut_bolt_array_models(), color=Quantity_NOC_SADDLEBROWN,
+                                     bolts=True)
 
 
                 elif component == "Model":
 
-                    osdag_display_shape(self.display, self.ExtObj.get_column_models(), update=True)
-                    osdag_display_shape(self.display, self.ExtObj.get_beam_models(), update=True,
-                                        material=Graphic3d_NOT_2D_ALUMINUM)
-                    osdag_display_shape(self.display, self.ExtObj.get_plate_connector_models(), update=True,
-                                        color='Blue')
-                    osdag_display_shape(self.display, self.ExtObj.get_welded_models(), update=True, color='Red')
-                    osdag_display_shape(self.display, self.ExtObj.get_nut_bolt_array_models(), update=True,
-                                        color=Quantity_NOC_SADDLEBROWN)
+                    self.queue_shape(self.ExtObj.get_column_models())
+                    self.queue_shape(self.ExtObj.get_beam_models(), material=Graphic3d_NOT_2D_ALUMINUM)
+                    self.queue_shape(self.ExtObj.get_plate_connector_models(), color='Blue')
+                    self.queue_shape(self.ExtObj.get_welded_models(), color='Red')
+                    self.queue_shape(self.ExtObj.get_nut_bolt_array_models(), color=Quantity_NOC_SADDLEBROWN,
+                                     bolts=True)
                     # Point1 = gp_Pnt(self.Bc.supporting_section.flange_width/2, -self.Bc.supporting_section.depth/2, c_length*0.75)
                     # DisplayMsg(self.display, Point1, self.Bc.supporting_section.designation)
                     # Point2 = gp_Pnt(self.Bc.supporting_section.flange_width/2, -b_length, c_length / 2)
@@ -1945,49 +1929,45 @@ class CommonDesignLogic(object):
 
             elif self.connection == KEY_DISP_COLUMNCOVERPLATEWELD:
                 self.C = self.module_class()
-                self.CPObj = self.createCCCoverPlateCAD()
                 columns = self.CPObj.get_column_models()
                 plates = self.CPObj.get_plate_models()
                 welds = self.CPObj.get_welded_modules()
 
                 if self.component == "Column":
                     # Displays both beams
-                    osdag_display_shape(self.display, columns, update=True)
+                    self.queue_shape(columns)
                 elif self.component == "Cover Plate":
-                    osdag_display_shape(self.display, plates, update=True, color=Quantity_NOC_BLUE1)
-                    osdag_display_shape(self.display, welds, update=True, color=Quantity_NOC_RED)
+                    self.queue_shape(plates, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(welds, color=Quantity_NOC_RED)
                 elif self.component == "Model":
-                    osdag_display_shape(self.display, columns, update=True)
-                    osdag_display_shape(self.display, plates, update=True, color=Quantity_NOC_BLUE1)
-                    osdag_display_shape(self.display, welds, update=True, color=Quantity_NOC_RED)
+                    self.queue_shape(columns)
+                    self.queue_shape(plates, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(welds, color=Quantity_NOC_RED)
 
             elif self.connection == KEY_DISP_COLUMNENDPLATE:
                 self.CEP = self.module_class()
-                self.CEPObj = self.createCCEndPlateCAD()
                 columns = self.CEPObj.get_column_models()
                 plates = self.CEPObj.get_plate_models()
                 welds = self.CEPObj.get_weld_models()
                 nutBolts = self.CEPObj.get_nut_bolt_models()
 
                 if self.component == "Column":
-                    osdag_display_shape(self.display, columns, update=True)
+                    self.queue_shape(columns)
 
                 elif self.component == "Connector":
-                    osdag_display_shape(self.display, plates, update=True, color=Quantity_NOC_BLUE1)
-                    osdag_display_shape(self.display, welds, update=True, color=Quantity_NOC_RED)
-                    osdag_display_shape(self.display, nutBolts, update=True, color=Quantity_NOC_YELLOW)
+                    self.queue_shape(plates, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(welds, color=Quantity_NOC_RED)
+                    self.queue_shape(nutBolts, color=Quantity_NOC_YELLOW, bolts=True)
 
                 elif self.component == "Model":
-                    osdag_display_shape(self.display, columns, update=True)
-                    osdag_display_shape(self.display, plates, update=True, color=Quantity_NOC_BLUE1)
-                    osdag_display_shape(self.display, welds, update=True, color=Quantity_NOC_RED)
-                    osdag_display_shape(self.display, nutBolts, update=True, color=Quantity_NOC_YELLOW)
+                    self.queue_shape(columns)
+                    self.queue_shape(plates, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(welds, color=Quantity_NOC_RED)
+                    self.queue_shape(nutBolts, color=Quantity_NOC_YELLOW, bolts=True)
 
             elif self.connection == KEY_DISP_BASE_PLATE:
                 self.Bp = self.module_class
 
-                self.BPObj = self.createBasePlateCAD()
-
                 column = self.BPObj.get_column_model()
                 plate = self.BPObj.get_plate_connector_models()
                 weld = self.BPObj.get_welded_models()
@@ -1996,25 +1976,24 @@ class CommonDesignLogic(object):
                 grout = self.BPObj.get_grout_models()
 
                 if self.component == "Model":  # Todo: change this into key
-                    osdag_display_shape(self.display, column, update=True)
-                    osdag_display_shape(self.display, plate, color=Quantity_NOC_BLUE1, update=True)
-                    osdag_display_shape(self.display, weld, color=Quantity_NOC_RED, update=True)
-                    osdag_display_shape(self.display, nut_bolt, color=Quantity_NOC_YELLOW, update=True)
-                    osdag_display_shape(self.display, conc, color=GRAY, transparency=0.5, update=True)
-                    osdag_display_shape(self.display, grout, color=GRAY, transparency=0.5, update=True)
+                    self.queue_shape(column)
+                    self.queue_shape(plate, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(weld, color=Quantity_NOC_RED)
+                    self.queue_shape(nut_bolt, color=Quantity_NOC_YELLOW, bolts=True)
+                    self.queue_shape(conc, color=GRAY, transparency=0.5)
+                    self.queue_shape(grout, color=GRAY, transparency=0.5)
 
                 elif self.component == "Column":
-                    osdag_display_shape(self.display, column, update=True)
+                    self.queue_shape(column)
 
                 elif self.component == "Connector":
-                    osdag_display_shape(self.display, plate, color=Quantity_NOC_BLUE1, update=True)
-                    osdag_display_shape(self.display, weld, color=Quantity_NOC_RED, update=True)
-                    osdag_display_shape(self.display, nut_bolt, color=Quantity_NOC_YELLOW, update=True)
+                    self.queue_shape(plate, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(weld, color=Quantity_NOC_RED)
+                    self.queue_shape(nut_bolt, color=Quantity_NOC_YELLOW, bolts=True)
 
         else:
             if self.connection == KEY_DISP_TENSION_BOLTED:
                 self.T = self.module_class()
-                self.TObj = self.createTensionCAD()
 
                 member = self.TObj.get_members_models()
                 plate = self.TObj.get_plates_models()
@@ -2028,46 +2007,80 @@ class CommonDesignLogic(object):
 
 
                 if self.component == "Member":  # Todo: change this into key
-                    osdag_display_shape(self.display, onlymember, update=True)
+                    self.queue_shape(onlymember)
                 elif self.component == "Plate":
-                    osdag_display_shape(self.display, plate, color=Quantity_NOC_BLUE1, update=True)
-                    osdag_display_shape(self.display, nutbolt, color=Quantity_NOC_YELLOW, update=True)
+                    self.queue_shape(plate, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(nutbolt, color=Quantity_NOC_YELLOW, bolts=True)
                 elif self.component == "Endplate":
                     endplate = self.TObj.get_end_plates_models()
                     end_nutbolt = self.TObj.get_end_nut_bolt_array_models()
-                    osdag_display_shape(self.display, endplate, color=Quantity_NOC_BLUE1, update=True)
-                    osdag_display_shape(self.display, end_nutbolt, color=Quantity_NOC_YELLOW, update=True)
+                    self.queue_shape(endplate, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(end_nutbolt, color=Quantity_NOC_YELLOW, bolts=True)
                 else:
                     connector = BRepAlgoAPI_Fuse(nutbolt, plate).Shape()
                     shape = BRepAlgoAPI_Fuse(connector, member).Shape()
                     self.TObj.shape = shape
-                    osdag_display_shape(self.display, member, update=True)
-                    osdag_display_shape(self.display, plate, color=Quantity_NOC_BLUE1, update=True)
-                    osdag_display_shape(self.display, nutbolt, color=Quantity_NOC_YELLOW, update=True)
+                    self.queue_shape(member)
+                    self.queue_shape(plate, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(nutbolt, color=Quantity_NOC_YELLOW, bolts=True)
 
 
             elif self.connection == KEY_DISP_TENSION_WELDED:
                 self.T = self.module_class()
-                self.TObj = self.createTensionCAD()
 
                 member = self.TObj.get_members_models()
                 plate = self.TObj.get_plates_models()
                 welds = self.TObj.get_welded_models()
                 if self.component == "Member":  # Todo: change this into key
-                    osdag_display_shape(self.display, member, update=True)
+                    self.queue_shape(member)
                 elif self.component == "Plate":
-                    osdag_display_shape(self.display, plate, color=Quantity_NOC_BLUE1, update=True)
-                    osdag_display_shape(self.display, welds, color=Quantity_NOC_RED, update=True)
+                    self.queue_shape(plate, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(welds, color=Quantity_NOC_RED)
                 elif self.component == "Endplate":
                     endplate = self.TObj.get_end_plates_models()
-                    osdag_display_shape(self.display, endplate, color=Quantity_NOC_BLUE1, update=True)
+                    self.queue_shape(endplate, color=Quantity_NOC_BLUE1)
                 else:
                     connector = BRepAlgoAPI_Fuse(welds, plate).Shape()
                     shape = BRepAlgoAPI_Fuse(connector, member).Shape()
                     self.TObj.shape = shape
-                    osdag_display_shape(self.display, member, update=True)
-                    osdag_display_shape(self.display, plate, color=Quantity_NOC_BLUE1, update=True)
-                    osdag_display_shape(self.display, welds, color=Quantity_NOC_RED, update=True)
+                    self.queue_shape(member)
+                    self.queue_shape(plate, color=Quantity_NOC_BLUE1)
+                    self.queue_shape(welds, color=Quantity_NOC_RED)
+
+        self.show_queued_shapes()
+
+    def queue_shape(self, shapes, material=None, color=None, transparency=None, bolts=False):
+        """
+        Add shapes (a shape or a list of shapes) to the view being built by
+        display_3DModel. Nothing is drawn until show_queued_shapes().
+
+        Args:
+            bolts: the shapes are nuts and bolts, which are drawn as plain cylinders
+                when the view has more than BOLT_LOD_THRESHOLD of them
+        """
+        if not isinstance(shapes, list):
+            shapes = [shapes]
+        for group in self.display_groups:
+            if group[:4] == [material, color, transparency, bolts]:
+                group[4].extend(shapes)
+                return
+        self.display_groups.append([material, color, transparency, bolts, list(shapes)])
+
+    def show_queued_shapes(self):
+        """
+        Display the queued shapes as one compound per material and color, then
+        fit and redraw the view once. Redrawing after every shape made the views
+        of large splices slow to switch.
+        """
+        bolt_count = sum(len(get_solids(shape)) for group in self.display_groups if group[3] for shape in group[4])
+        for material, color, transparency, bolts, shapes in self.display_groups:
+            if bolts and bolt_count > BOLT_LOD_THRESHOLD:
+                shapes = [make_bounding_cylinder(solid) for shape in shapes for solid in get_solids(shape)]
+            osdag_display_shape(self.display, make_compound(shapes), material=material, color=color,
+                                transparency=transparency, update=False)
+        self.display_groups = []
+        self.display.FitAll()
+        self.display.Repaint()
     #
     # def display_msg(self):
     #     if self.connection == KEY_DISP_TENSION_BOLTED:
@@ -2080,100 +2093,91 @@ class CommonDesignLogic(object):
 
 
 
-    def call_3DModel(self, flag, module_class):  # Done
+    def build_3DModel(self, flag, module_class):
+        """
+        Create the CAD objects of the designed connection/member without displaying them.
 
+        Returns the created CAD object (also kept in connectivityObj, CPObj, CEPObj, BPObj or TObj
+        as before), or None if the design has failed or the module has no 3D model.
+        """
         self.module_class = module_class
 
+        if flag is not True:
+            return None
+
         if self.mainmodule == "Shear Connection":
 
             A = self.module_class()
 
             self.loc = A.connectivity
 
-            if flag is True:
-
-                if self.loc == CONN_CWBW:
-                    self.connectivityObj = self.create3DColWebBeamWeb()
-
-                elif self.loc == CONN_CFBW:
-                    self.connectivityObj = self.create3DColFlangeBeamWeb()
+            if self.loc == CONN_CWBW:
+                self.connectivityObj = self.create3DColWebBeamWeb()
 
-                else:
-                    self.connectivityObj = self.create3DBeamWebBeamWeb()
+            elif self.loc == CONN_CFBW:
+                self.connectivityObj = self.create3DColFlangeBeamWeb()
 
-                self.display_3DModel("Model","gradient_bg")
             else:
-                self.display.EraseAll()
+                self.connectivityObj = self.create3DBeamWebBeamWeb()
+
+            return self.connectivityObj
 
         elif self.mainmodule == "Moment Connection":
 
             if self.connection == KEY_DISP_BEAMCOVERPLATE or self.connection == KEY_DISP_BEAMCOVERPLATEWELD:
-                if flag is True:
-
-                    self.CPObj = self.createBBCoverPlateCAD()
-
-                    self.display_3DModel("Model", "gradient_bg")
-                else:
-                    self.display.EraseAll()
+                self.CPObj = self.createBBCoverPlateCAD()
+                return self.CPObj
 
             elif self.connection == KEY_DISP_BB_EP_SPLICE:
-                if flag is True:
-
-                    self.CPObj = self.createBBEndPlateCAD()
-
-                    self.display_3DModel("Model", "gradient_bg")
-
-                else:
-                    self.display.EraseAll()
+                self.CPObj = self.createBBEndPlateCAD()
+                return self.CPObj
 
             elif self.connection == KEY_DISP_BCENDPLATE:
-                if flag is True:
-
-                    self.CPObj = self.createBCEndPlateCAD()
-
-                    self.display_3DModel("Model", "gradient_bg")
-
-                else:
-                    self.display.EraseAll()
+                self.CPObj = self.createBCEndPlateCAD()
+                return self.CPObj
 
             elif self.connection == KEY_DISP_COLUMNCOVERPLATE or self.connection == KEY_DISP_COLUMNCOVERPLATEWELD:
-                if flag is True:
-
-                    self.CPObj = self.createCCCoverPlateCAD()
-
-                    self.display_3DModel("Model", "gradient_bg")
-
-                else:
-                    self.display.EraseAll()
+                self.CPObj = self.createCCCoverPlateCAD()
+                return self.CPObj
 
             elif self.connection == KEY_DISP_COLUMNENDPLATE:
-                if flag is True:
-                    self.CEPObj = self.createCCEndPlateCAD()
-
-                    self.display_3DModel("Model", "gradient_bg")
-                else:
-                    self.display.EraseAll()
+                self.CEPObj = self.createCCEndPlateCAD()
+                return self.CEPObj
 
             elif self.connection == KEY_DISP_BASE_PLATE:
-
-                if flag is True:
-                    self.BPObj = self.createBasePlateCAD()
-
-                    self.display_3DModel("Model", "gradient_bg")
-
-                else:
-                    self.display.EraseAll()
+                self.BPObj = self.createBasePlateCAD()
+                return self.BPObj
 
         else:
             if self.connection == KEY_DISP_TENSION_BOLTED or self.connection == KEY_DISP_TENSION_WELDED:
+                self.TObj = self.createTensionCAD()
+                return self.TObj
 
-                if flag is True:
-                    self.TObj = self.createTensionCAD()
+        return None
 
-                    self.display_3DModel("Model", "gradient_bg")
+    def set_design(self, flag, module_class):
+        """
+        Record a new design result. Its CAD model is not built here but on the first
+        get_3DModel() call (first display, export or report image), and then reused
+        for every component view of this design.
+        """
+        self.design_flag = flag
+        self.module_class = module_class
+        self.cad_model = None
 
-                else:
-                    self.display.EraseAll()
+    def get_3DModel(self):
+        """CAD object of the recorded design, built on first use (None if the design has failed)."""
+        if self.cad_model is None:
+            self.cad_model = self.build_3DModel(self.design_flag, self.module_class)
+        return self.cad_model
+
+    def call_3DModel(self, flag, module_class):  # Done
+
+        self.set_design(flag, module_class)
+        if self.get_3DModel() is not None:
+            self.display_3DModel("Model", "gradient_bg")
+        elif flag is not True:
+            self.display.EraseAll()
 
     # def call_saveOutputs(self):  # Done
     #     return self.call_calculation(self.uiObj)
@@ -2270,9 +2274,13 @@ class CommonDesignLogic(object):
     #     # TODO save_CADimages - deepa
     #     pass
 
-    def create2Dcad(self):
+    def create2Dcad(self, fuse=True):
         ''' Returns the 3D model of finplate depending upon component
+
+        With fuse=False the components are only grouped in a compound, which is
+        enough for formats that do not need a single solid (BREP, STL).
         '''
+        self.get_3DModel()
 
         final_model = None
         cadlist = []
@@ -2384,15 +2392,21 @@ class CommonDesignLogic(object):
                         cadlist = [self.TObj.get_plates_models(), self.TObj.get_nut_bolt_array_models()]
                     else:
                         cadlist = [self.TObj.get_plates_models(), self.TObj.get_welded_models()]
-                else:
+                elif getattr(self.TObj, 'shape', None) is not None:
                     # print(type(self.TObj.shape))
                     final_model = self.TObj.shape
+                else:
+                    # the fused model is only kept once the model has been displayed
+                    if self.connection == KEY_DISP_TENSION_BOLTED:
+                        cadlist = [self.TObj.get_members_models(), self.TObj.get_plates_models(),
+                                   self.TObj.get_nut_bolt_array_models()]
+                    else:
+                        cadlist = [self.TObj.get_members_models(), self.TObj.get_plates_models(),
+                                   self.TObj.get_welded_models()]
                     # cadlist = self.TObj.get_models() #TODO: get_models() in BoltedCAD.py and WeldedCAD.py is not returning anything right now.
 
         if cadlist and len(cadlist) > 1:
-            final_model = cadlist[0]
-            for model in cadlist[1:]:
-                final_model = BRepAlgoAPI_Fuse(model, final_model).Shape()
+            final_model = fuse_shapes(cadlist) if fuse else make_compound(cadlist)
 
         return final_model
 
@@ -0,0 +1,103 @@
+"""Writing 3D models to CAD exchange files
+
+The file format is chosen by the extension of the path:
+    * .stp/.step: STEP (AP203),
+    * .igs/.iges: IGES,
+    * .brep: OpenCASCADE BREP,
+    * .stl: binary STL (ASCII on request).
+IGES and STEP are meant for one fused solid, BREP and STL can take the
+components grouped in a compound (see CommonDesignLogic.create2Dcad).
+
+STL files are written from a triangulation made beforehand by mesh_shape(),
+with the given linear and angular deflection, faces being meshed in parallel.
+The triangulation is kept on the shape, so meshing the same shape again with
+the same or a coarser deflection is skipped; nuts, bolts and other solids
+shared through cad.items.shape_cache are meshed only once for all their copies.
+"""
+import os
+from collections import OrderedDict
+
+from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.Interface import Interface_Static_SetCVal
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.StlAPI import StlAPI_Writer
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core import BRepTools
+from OCC.Core import IGESControl
+
+FORMATS = {'stp': 'stp', 'step': 'stp', 'igs': 'igs', 'iges': 'igs', 'brep': 'brep', 'stl': 'stl'}
+FUSED_FORMATS = ('stp', 'igs')
+LINEAR_DEFLECTION = 0.5     # mm
+ANGULAR_DEFLECTION = 0.5    # radians
+MESH_CACHE_SIZE = 64
+
+_meshed = OrderedDict()     # shape -> (linear deflection, angular deflection) it was meshed with
+
+
+def file_format(path):
+    """Format of a file from its extension: 'stp', 'igs', 'brep' or 'stl' (str)."""
+    extension = os.path.splitext(path)[1].lstrip('.').lower()
+    if extension not in FORMATS:
+        raise ValueError("Unknown CAD file format '{}', use .stp, .igs, .brep or .stl".format(extension))
+    return FORMATS[extension]
+
+
+def mesh_shape(shape, linear_deflection=LINEAR_DEFLECTION, angular_deflection=ANGULAR_DEFLECTION, parallel=True):
+    """
+    Triangulate shape for STL output, unless it has already been meshed at
+    least as finely.
+
+    Args:
+        linear_deflection: largest distance between the faces and their triangles, in mm (float)
+        angular_deflection: largest angle between neighbouring triangles, in radians (float)
+        parallel: mesh the faces in parallel (bool)
+
+    Returns:
+        True if the shape was meshed, False if the earlier triangulation was kept (bool)
+    """
+    done = _meshed.get(shape)
+    if done is not None and done[0] <= linear_deflection and done[1] <= angular_deflection:
+        _meshed.move_to_end(shape)
+        return False
+    BRepMesh_IncrementalMesh(shape, linear_deflection, False, angular_deflection, parallel)
+    _meshed[shape] = (linear_deflection, angular_deflection)
+    _meshed.move_to_end(shape)
+    while len(_meshed) > MESH_CACHE_SIZE:
+        _meshed.popitem(last=False)
+    return True
+
+
+def clear_mesh_cache():
+    """Forget which shapes have been meshed (their triangulation stays on the shapes)."""
+    _meshed.clear()
+
+
+def write_shape(shape, path, linear_deflection=LINEAR_DEFLECTION, angular_deflection=ANGULAR_DEFLECTION,
+                ascii=False):
+    """
+    Write shape to path, the format being chosen by the file extension.
+
+    Args:
+        linear_deflection, angular_deflection: STL tessellation, see mesh_shape()
+        ascii: write ASCII STL instead of binary (bool)
+    """
+    file_type = file_format(path)
+    if file_type == 'igs':
+        IGESControl.IGESControl_Controller().Init()
+        iges_writer = IGESControl.IGESControl_Writer()
+        iges_writer.AddShape(shape)
+        status = iges_writer.Write(path)
+    elif file_type == 'brep':
+        status = BRepTools.breptools.Write(shape, path)
+    elif file_type == 'stp':
+        step_writer = STEPControl_Writer()
+        Interface_Static_SetCVal("write.step.schema", "AP203")
+        step_writer.Transfer(shape, STEPControl_AsIs)
+        status = step_writer.Write(path) == IFSelect_RetDone
+    else:
+        mesh_shape(shape, linear_deflection, angular_deflection)
+        stl_writer = StlAPI_Writer()
+        stl_writer.SetASCIIMode(ascii)
+        status = stl_writer.Write(shape, path)
+    if status is False:
+        raise IOError("Could not write the 3D model to '{}'".format(path))
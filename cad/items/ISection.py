@@ -5,6 +5,7 @@ Created on 29-Nov-2014
 '''
 import numpy
 from cad.items.ModelUtils import *
+from cad.items import shape_cache
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
 #from notch import Notch
 from cad.items.notch import Notch
@@ -91,6 +92,14 @@ class ISection(object):
         # self.points = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
 
     def create_model(self):
+        notch = None
+        if self.notchObj is not None:
+            notch = (self.notchObj.R1, self.notchObj.height, self.notchObj.width, self.notchObj.length)
+        key = shape_cache.geometry_key(type(self), self.sec_origin, self.points, self.length * self.wDir,
+                                       self.uDir, self.wDir, notch)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self):
 
         edges = makeEdgesFromPoints(self.points)
         wire = makeWireFromEdges(edges)
@@ -3,8 +3,10 @@ Created on 29-Nov-2014
 
 @author: deepa
 '''
-from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakePrism
-from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Vec
+import numpy
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakePrism, BRepPrimAPI_MakeCylinder
+from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Vec, gp_Ax3, gp_Trsf
+from OCC.Core.TopLoc import TopLoc_Location
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeFace
 from OCC.Core.BRepBuilderAPI import (BRepBuilderAPI_MakeEdge,
                                 BRepBuilderAPI_MakeVertex,
@@ -13,6 +15,15 @@ from OCC.Core.BRepFill import BRepFill_Filling
 from OCC.Core.GeomAbs import GeomAbs_C0
 from OCC.Core.GeomAPI import GeomAPI_PointsToBSpline
 from OCC.Core.TColgp import TColgp_Array1OfPnt
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.TopTools import TopTools_ListOfShape
+from OCC.Core.TopoDS import TopoDS_Compound
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.BRepBndLib import brepbndlib_Add
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_SOLID
+from cad.items import shape_cache
 
 
 def make_edge(*args):
@@ -78,6 +89,16 @@ def getGpDir(direction):
     return gp_Dir(direction[0], direction[1], direction[2])
 
 
+def getLocation(origin, uDir, wDir):
+    """
+    Location that moves a shape modelled about the global axes to origin, with
+    the global x axis along uDir and the global z axis along wDir.
+    """
+    trsf = gp_Trsf()
+    trsf.SetDisplacement(gp_Ax3(), gp_Ax3(getGpPt(origin), getGpDir(wDir), getGpDir(uDir)))
+    return TopLoc_Location(trsf)
+
+
 def makeEdgesFromPoints(points):
     edges = []
     num = len(points)
@@ -98,3 +119,65 @@ def makePrismFromFace(aFace, eDir):
 
     return BRepPrimAPI_MakePrism(aFace, gp_Vec(gp_Pnt(0., 0., 0.), gp_Pnt(eDir[0], eDir[1], eDir[2]))).Shape()
 
+
+def make_compound(shapes):
+    """Group shapes into one TopoDS_Compound without any boolean operation."""
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for shape in shapes:
+        builder.Add(compound, shape)
+    return compound
+
+
+def fuse_shapes(shapes, parallel=True):
+    """
+    Fuse all shapes in one multi-argument boolean, instead of fusing them into
+    the result one at a time (which re-intersects the growing result with every
+    new shape).
+    """
+    if len(shapes) == 1:
+        return shapes[0]
+    arguments = TopTools_ListOfShape()
+    arguments.Append(shapes[0])
+    tools = TopTools_ListOfShape()
+    for shape in shapes[1:]:
+        tools.Append(shape)
+    fuse = BRepAlgoAPI_Fuse()
+    fuse.SetArguments(arguments)
+    fuse.SetTools(tools)
+    fuse.SetRunParallel(parallel)
+    fuse.Build()
+    return fuse.Shape()
+
+
+def get_solids(shape):
+    """Solids of a shape, e.g. the nuts and bolts of a compound (list of TopoDS_Shape)."""
+    solids = []
+    explorer = TopExp_Explorer(shape, TopAbs_SOLID)
+    while explorer.More():
+        solids.append(explorer.Current())
+        explorer.Next()
+    return solids
+
+
+def make_bounding_cylinder(shape):
+    """
+    Cylinder along the longest side of the bounding box of shape and as wide as
+    the box: a cheap stand-in for a nut or a bolt. Cylinders of the same size
+    share one solid.
+    """
+    box = Bnd_Box()
+    brepbndlib_Add(shape, box)
+    xmin, ymin, zmin, xmax, ymax, zmax = box.Get()
+    lower = numpy.array([xmin, ymin, zmin])
+    sides = numpy.array([xmax, ymax, zmax]) - lower
+    axis = int(numpy.argmax(sides))
+    height = float(sides[axis])
+    radius = float(max(side for i, side in enumerate(sides) if i != axis)) / 2
+    wDir = numpy.eye(3)[axis]
+    uDir = numpy.eye(3)[(axis + 1) % 3]
+    base = lower + sides / 2 - wDir * height / 2
+    key = ('BoundingCylinder', round(radius, 3), round(height, 3))
+    cylinder = shape_cache.get(key, lambda: BRepPrimAPI_MakeCylinder(radius, height).Shape())
+    return cylinder.Located(getLocation(base, uDir, wDir))
@@ -6,6 +6,7 @@ Created on 20-Jan-2020
 import numpy
 from numpy import sqrt, square
 from cad.items.ModelUtils import *  # getGpPt, getGpDir, makeEdgesFromPoints, makeWireFromEdges, makePrismFromFace, makeFaceFromWire
+from cad.items import shape_cache
 import math
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeWire, BRepBuilderAPI_MakeFace
 
@@ -57,6 +58,12 @@ class AnchorBolt_A(object):
         self.hightcyl2 = sqrt(square(self.cyl2_length) + square(self.cyl3_arc_dia))
 
     def create_model(self):
+        points = [self.p1, self.p2, self.p3, self.p4, self.p5, self.p6]
+        key = shape_cache.geometry_key(type(self), self.origin, points, self.l, self.c, self.a, self.r, self.ex,
+                                       self.uDir, self.shaftDir)
+        return shape_cache.located(key, self.create_solid, self.origin)
+
+    def create_solid(self):
         boltCylinderex = BRepPrimAPI_MakeCylinder(gp_Ax2(getGpPt(self.p1), getGpDir(self.shaftDir)), self.r,
                                                  self.cylex_length).Shape()
         boltCylinder1 = BRepPrimAPI_MakeCylinder(gp_Ax2(getGpPt(self.p1), getGpDir(-self.shaftDir)), self.r,
@@ -130,6 +137,11 @@ class AnchorBolt_B(object):
         self.cyl2_ht = sqrt(square(self.cyl2_length) + square(2 * self.r))
 
     def create_model(self):
+        points = [self.p1, self.p2, self.p3, self.p4, self.p5, self.p6]
+        key = shape_cache.geometry_key(type(self), self.origin, points, self.l, self.r, self.ex, self.uDir, self.shaftDir)
+        return shape_cache.located(key, self.create_solid, self.origin)
+
+    def create_solid(self):
         boltCylinderex = BRepPrimAPI_MakeCylinder(gp_Ax2(getGpPt(self.p1), getGpDir(-self.shaftDir)), self.r,
                                                   self.cylex_length).Shape()
         boltCylinder1 = BRepPrimAPI_MakeCylinder(gp_Ax2(getGpPt(self.p1), getGpDir(self.shaftDir)), self.r,
@@ -200,6 +212,11 @@ class AnchorBolt_Endplate(object):
         self.p3 = self.p2 - self.endplate_width / 2 * self.uDir - self.endplate_width / 2 * self.vDir - self.endplate_thickness / 2 * self.shaftDir
 
     def create_model(self):
+        key = shape_cache.geometry_key(type(self), self.origin, [self.p1, self.p2, self.p3], self.l, self.r, self.ex, self.a,
+                                       self.shaftDir)
+        return shape_cache.located(key, self.create_solid, self.origin)
+
+    def create_solid(self):
         boltCylinderex = BRepPrimAPI_MakeCylinder(gp_Ax2(getGpPt(self.p1), getGpDir(self.shaftDir)), self.r,
                                                   self.cylex_length).Shape()
         boltCylinder1 = BRepPrimAPI_MakeCylinder(gp_Ax2(getGpPt(self.p1), getGpDir(-self.shaftDir)), self.r,
@@ -57,6 +57,7 @@ from OCC.Core.TopoDS import topods
 from OCC.Core.TopAbs import TopAbs_EDGE
 from cad.items.ModelUtils import getGpPt, make_edge, makeWireFromEdges, \
     makeFaceFromWire, makePrismFromFace
+from cad.items import shape_cache
 
 
 class Angle(object):
@@ -105,6 +106,10 @@ class Angle(object):
                       self.a11, self.a12]
 
     def create_model(self):
+        key = shape_cache.geometry_key(type(self), self.sec_origin, self.points, self.L * self.wDir, self.T, self.R1, self.R2)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self):
 
         ######################################################
         edges = []
@@ -4,11 +4,12 @@ Created on 29-Nov-2014
 @author: deepa
 '''
 import numpy
-from cad.items.ModelUtils import getGpPt, getGpDir, makeEdgesFromPoints, makeWireFromEdges, makePrismFromFace, makeFaceFromWire
+from cad.items.ModelUtils import getGpPt, getGpDir, getLocation, makeEdgesFromPoints, makeWireFromEdges, makePrismFromFace, makeFaceFromWire
 import math
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder
 from OCC.Core.gp import gp_Ax2
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from cad.items import shape_cache
 
 
 class Bolt(object):
@@ -76,6 +77,20 @@ a4  X                   XXXXXXXXXXXXXXXXX  a1
         self.points = [self.a1, self.a2, self.a3, self.a4, self.a5, self.a6]
 
     def create_model(self):
+        """
+        All bolts of the same size share one solid: the prototype is built once
+        and every bolt returns it moved to its own position.
+        """
+        return self.create_prototype().Located(getLocation(self.origin, self.uDir, self.shaftDir))
+
+    def create_prototype(self):
+        """Solid of this size with the head centred on the global origin and the shaft along +z."""
+        prototype = Bolt(self.R, self.T, self.H, self.r)
+        prototype.place(numpy.array([0., 0., 0.]), numpy.array([1., 0., 0.]), numpy.array([0., 0., 1.]))
+        key = shape_cache.geometry_key(Bolt, prototype.origin, [], self.R, self.T, self.H, self.r)
+        return shape_cache.get(key, prototype.create_solid)
+
+    def create_solid(self):
 
         edges = makeEdgesFromPoints(self.points)
         wire = makeWireFromEdges(edges)
@@ -5,6 +5,7 @@ Created on 29-Nov-2014
 '''
 import numpy
 from cad.items.ModelUtils import *
+from cad.items import shape_cache
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
 #from notch import Notch
 from cad.items.notch import Notch
@@ -101,6 +102,10 @@ class Channel(object):
         # self.points = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
 
     def create_model(self):
+        key = shape_cache.geometry_key(type(self), self.sec_origin, self.points, self.L * self.wDir)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self):
         edges = makeEdgesFromPoints(self.points)
         wire = makeWireFromEdges(edges)
         aFace = makeFaceFromWire(wire)
@@ -1,6 +1,7 @@
 
 import numpy
 from cad.items.ModelUtils import *
+from cad.items import shape_cache
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder
 from OCC.Core.gp import gp_Dir, gp_Circ, gp_Ax2
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
@@ -27,6 +28,10 @@ class CircularHollow(object):
         self.p1 = self.sec_origin - (self.H)/2 * self.shaftDir
 
     def create_model(self):
+        key = shape_cache.geometry_key(type(self), self.sec_origin, [self.p1], self.r, self.T, self.H, self.shaftDir)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self):
         cylinder1 = BRepPrimAPI_MakeCylinder(gp_Ax2(getGpPt(self.p1), getGpDir(self.shaftDir)), self.r,
                                                  self.H).Shape()
         cylinder2 = BRepPrimAPI_MakeCylinder(gp_Ax2(getGpPt(self.p1), getGpDir(self.shaftDir)), self.r-self.T,
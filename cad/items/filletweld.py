@@ -6,6 +6,7 @@ modified : Darshan Vishwakarma (12-10-2020)
 '''
 import numpy
 from cad.items.ModelUtils import getGpPt, makeEdgesFromPoints, makeWireFromEdges, makeFaceFromWire, makePrismFromFace
+from cad.items import shape_cache
 from OCC.Core.gp import (gp_Vec, gp_Pnt, gp_Trsf, gp_OX, gp_OY,
                          gp_OZ, gp_XYZ, gp_Ax2, gp_Dir, gp_GTrsf, gp_Mat)
 from OCC.Core.BRepBuilderAPI import (BRepBuilderAPI_MakeEdge,
@@ -58,7 +59,13 @@ class FilletWeld(object):
         self.a3 = self.sec_origin + self.h * self.vDir
         self.points = [self.a1, self.a2, self.a3]
 
-    def create_model(self,rotate_angle=None):
+    def create_model(self, rotate_angle=None):
+        if rotate_angle is not None:
+            return self.create_solid(rotate_angle)
+        key = shape_cache.geometry_key(type(self), self.sec_origin, self.points, self.L * self.wDir)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self, rotate_angle=None):
         Pnt = getGpPt(self.sec_origin)
         edges = makeEdgesFromPoints(self.points)
         wire = makeWireFromEdges(edges)
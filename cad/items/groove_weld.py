@@ -7,6 +7,7 @@ Created on 15-May-2019
 '''
 import numpy
 from cad.items.ModelUtils import *
+from cad.items import shape_cache
 
 '''
                                                 X---------------X
@@ -65,6 +66,10 @@ class GrooveWeld(object):
         self.points = [self.a1, self.a2, self.a3, self.a4]
 
     def create_model(self):
+        key = shape_cache.geometry_key(type(self), self.sec_origin, self.points, self.L * self.wDir)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self):
         edges = makeEdgesFromPoints(self.points)
         wire = makeWireFromEdges(edges)
         aFace = makeFaceFromWire(wire)
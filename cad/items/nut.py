@@ -7,9 +7,10 @@ NUT COMMENT
 import math
 import numpy
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
-from cad.items.ModelUtils import getGpPt, getGpDir, makeEdgesFromPoints, makeWireFromEdges, makePrismFromFace, makeFaceFromWire
+from cad.items.ModelUtils import getGpPt, getGpDir, getLocation, makeEdgesFromPoints, makeWireFromEdges, makePrismFromFace, makeFaceFromWire
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder
 from OCC.Core.gp import gp_Ax2
+from cad.items import shape_cache
 
 
 class Nut(object):
@@ -71,6 +72,19 @@ a4  X                   XXXXXXXXXXXXXXXXX  a1
         self.points = [self.a1, self.a2, self.a3, self.a4, self.a5, self.a6]
 
     def create_model(self):
+        """
+        All nuts of the same size share one solid: the prototype is built once
+        and every nut returns it moved to its own position.
+        """
+        return self.create_prototype().Located(getLocation(self.sec_origin, self.uDir, self.wDir))
+
+    def create_prototype(self):
+        """Solid of this size centred on the global origin, extruded along +z."""
+        prototype = Nut(self.R, self.T, self.H, self.r1)
+        key = shape_cache.geometry_key(Nut, prototype.sec_origin, [], self.R, self.T, self.H, self.r1)
+        return shape_cache.get(key, prototype.create_solid)
+
+    def create_solid(self):
 
         edges = makeEdgesFromPoints(self.points)
         wire = makeWireFromEdges(edges)
@@ -7,6 +7,7 @@ Created on 29-Nov-2014
 
 import numpy
 from cad.items.ModelUtils import *
+from cad.items import shape_cache
 from OCC.Core.gp import (gp_Vec, gp_Pnt, gp_Trsf, gp_OX, gp_OY,
                          gp_OZ, gp_XYZ, gp_Ax2, gp_Dir, gp_GTrsf, gp_Mat)
 from OCC.Core.BRepBuilderAPI import (BRepBuilderAPI_MakeEdge,
@@ -75,7 +76,13 @@ v dir                                    |   |                          |
         self.a4 = self.sec_origin + (self.T / 2.0) * self.uDir + (-self.L / 2.0) * self.vDir
         self.points = [self.a1, self.a2, self.a3, self.a4]
 
-    def create_model(self,rotate_angle=None):
+    def create_model(self, rotate_angle=None):
+        if rotate_angle is not None:
+            return self.create_solid(rotate_angle)
+        key = shape_cache.geometry_key(type(self), self.sec_origin, self.points, self.W * self.wDir)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self, rotate_angle=None):
         edges = makeEdgesFromPoints(self.points)
         wire = makeWireFromEdges(edges)
         aFace = makeFaceFromWire(wire)
@@ -1,6 +1,7 @@
 
 import numpy
 from cad.items.ModelUtils import *
+from cad.items import shape_cache
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
 
@@ -29,6 +30,10 @@ class RectHollow(object):
         self.a2 = self.a1 + (self.T) / 2 * self.uDir + (self.T) / 2 * self.vDir
 
     def create_model(self):
+        key = shape_cache.geometry_key(type(self), self.sec_origin, [self.a1, self.a2], self.L, self.W, self.H, self.T)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self):
         box1 = BRepPrimAPI_MakeBox(getGpPt(self.a1),self.L, self.W, self.H).Shape()
         box2 = BRepPrimAPI_MakeBox(getGpPt(self.a2),self.L-self.T, self.W-self.T, self.H).Shape()
         prism = BRepAlgoAPI_Cut(box1, box2).Shape()
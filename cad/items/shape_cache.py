@@ -0,0 +1,169 @@
+"""Process-wide LRU cache of the solids built by cad.items
+
+Plates, sections, welds, nuts and bolts of the same size turn up over and over:
+in both members of a splice, on every bolt of an array, and again in every
+design of a batch CAD export. Each item's create_model() now asks this cache
+first, with a key made of the item's class and its geometry relative to its
+own origin. On a hit the cached solid is moved to the new origin, which shares
+the BRep instead of building it again. Nuts and bolts go one step further and
+keep one solid per size about the global axes (see Bolt.create_prototype),
+which is placed in any orientation.
+
+Memory is bounded by an estimate of the size of the cached solids (the number
+of faces and edges times BYTES_PER_ENTITY); least recently used solids are
+dropped first. The cache is shared by the threads of cad.parallel; solids are
+built outside its lock, so two threads missing on the same key both build it.
+
+    from cad.items import shape_cache
+    shape_cache.set_limit(max_mb=64)
+    ...
+    print(shape_cache.stats())
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import numpy
+
+from OCC.Core.gp import gp_Trsf, gp_Vec
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_EDGE
+
+BYTES_PER_ENTITY = 2048
+DEFAULT_MAX_MB = float(os.environ.get('OSDAG_CAD_CACHE_MB', 256))
+
+_shapes = OrderedDict()     # key -> (shape, origin it was built at, estimated bytes)
+_max_bytes = int(DEFAULT_MAX_MB * 1024 * 1024)
+_bytes = 0
+_hits = 0
+_misses = 0
+_evictions = 0
+_lock = threading.Lock()
+
+
+def estimated_size(shape):
+    """Rough memory taken by a solid, from its number of faces and edges (bytes)."""
+    count = 0
+    for entity in (TopAbs_FACE, TopAbs_EDGE):
+        explorer = TopExp_Explorer(shape, entity)
+        while explorer.More():
+            count += 1
+            explorer.Next()
+    return count * BYTES_PER_ENTITY
+
+
+def geometry_key(item_class, origin, points, *params):
+    """
+    Key of an item: its class, its points relative to its origin (rounded to
+    1e-6 mm) and the other values its solid is built from (tuple).
+    """
+    origin = numpy.asarray(origin, dtype=float)
+    relative = tuple(tuple(round(float(value), 6) for value in numpy.asarray(point, dtype=float) - origin)
+                     for point in points)
+    return (item_class.__name__, relative) + tuple(_plain(value) for value in params)
+
+
+def _plain(value):
+    if hasattr(value, 'tolist'):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_plain(v) for v in value)
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+def _translation(vector):
+    trsf = gp_Trsf()
+    trsf.SetTranslation(gp_Vec(float(vector[0]), float(vector[1]), float(vector[2])))
+    return TopLoc_Location(trsf)
+
+
+def _store(key, shape, origin):
+    global _bytes, _evictions
+    size = estimated_size(shape)
+    with _lock:
+        if size > _max_bytes or key in _shapes:
+            return
+        _shapes[key] = (shape, origin, size)
+        _bytes += size
+        while _bytes > _max_bytes:
+            _, (_, _, dropped) = _shapes.popitem(last=False)
+            _bytes -= dropped
+            _evictions += 1
+
+
+def _lookup(key):
+    global _hits, _misses
+    with _lock:
+        entry = _shapes.get(key)
+        if entry is None:
+            _misses += 1
+            return None
+        _hits += 1
+        _shapes.move_to_end(key)
+        return entry
+
+
+def get(key, build):
+    """Cached solid for key, built with build() on a miss (TopoDS_Shape)."""
+    entry = _lookup(key)
+    if entry is not None:
+        return entry[0]
+    shape = build()
+    _store(key, shape, None)
+    return shape
+
+
+def located(key, build, origin):
+    """
+    Solid for key at origin. On a miss build() makes the solid in place and it
+    is cached; on a hit the cached solid is moved from where it was built.
+
+    Args:
+        key: see geometry_key() (tuple)
+        build: creates the solid at origin (callable)
+        origin: origin of the item (numpy array)
+    """
+    origin = numpy.asarray(origin, dtype=float)
+    entry = _lookup(key)
+    if entry is not None:
+        shape, built_origin, _ = entry
+        return shape.Moved(_translation(origin - built_origin))
+    shape = build()
+    _store(key, shape, origin)
+    return shape
+
+
+def set_limit(max_mb=DEFAULT_MAX_MB):
+    """Change the memory cap, dropping least recently used solids if needed (0 turns caching off)."""
+    global _max_bytes, _bytes, _evictions
+    with _lock:
+        _max_bytes = int(max_mb * 1024 * 1024)
+        while _shapes and _bytes > _max_bytes:
+            _, (_, _, dropped) = _shapes.popitem(last=False)
+            _bytes -= dropped
+            _evictions += 1
+
+
+def clear():
+    """Drop every cached solid and reset the statistics."""
+    global _bytes, _hits, _misses, _evictions
+    with _lock:
+        _shapes.clear()
+        _bytes = 0
+        _hits = 0
+        _misses = 0
+        _evictions = 0
+
+
+def stats():
+    """
+    Returns:
+        dictionary with the hit/miss/eviction counts, number of cached solids
+        and their estimated size against the cap (dict)
+    """
+    with _lock:
+        return {'hits': _hits, 'misses': _misses, 'evictions': _evictions, 'entries': len(_shapes),
+                'estimated_bytes': _bytes, 'max_bytes': _max_bytes}
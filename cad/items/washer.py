@@ -6,6 +6,7 @@ Created on 29-Nov-2014
 '''
 import numpy
 from cad.items.ModelUtils import *
+from cad.items import shape_cache
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder
 from OCC.Core.gp import gp_Ax2
@@ -68,6 +69,10 @@ v dir                                    |   |                          |
         self.points = [self.a1, self.a2, self.a3, self.a4]
 
     def create_model(self):
+        key = shape_cache.geometry_key(type(self), self.sec_origin, self.points, self.T, self.d, self.wDir)
+        return shape_cache.located(key, self.create_solid, self.sec_origin)
+
+    def create_solid(self):
         edges = makeEdgesFromPoints(self.points)
         wire = makeWireFromEdges(edges)
         aFace = makeFaceFromWire(wire)
@@ -0,0 +1,88 @@
+"""Building the independent parts of a CAD assembly at the same time
+
+Once every part of an assembly has been placed, the solids of the column,
+plates, stiffeners, welds, grout and nut/bolt arrays do not depend on each
+other. They are built on a shared pool of threads: OCC's modelling
+algorithms (prisms, booleans) release the GIL, so parts are built on several
+cores while the Python placement code stays serial.
+
+The pool size is OSDAG_CAD_THREADS (default: up to 4); set_workers(1) builds
+everything in the calling thread, as before.
+
+    models = ModelBatch(self)
+    models.add('columnModel', self.column.create_model)
+    models.add('diagplate_L1Model', self.diagplate_L1.create_model, -45)
+    models.build()      # sets self.columnModel and self.diagplate_L1Model
+"""
+import os
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = int(os.environ.get('OSDAG_CAD_THREADS', min(4, os.cpu_count() or 1)))
+
+_workers = DEFAULT_WORKERS
+_pool = None
+_pool_lock = threading.Lock()
+_in_worker = threading.local()
+
+
+def set_workers(workers=DEFAULT_WORKERS):
+    """Change the number of threads parts are built on (1 builds them serially)."""
+    global _workers, _pool
+    with _pool_lock:
+        _workers = max(1, int(workers))
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix='osdag-cad')
+        return _pool
+
+
+def _run_in_worker(task):
+    _in_worker.active = True
+    try:
+        return task()
+    finally:
+        _in_worker.active = False
+
+
+def run_tasks(*tasks):
+    """
+    Call every task (a function without arguments) on the CAD thread pool and
+    wait for all of them. Tasks started from inside a task run serially, so
+    nested assemblies cannot exhaust the pool.
+
+    Returns:
+        the tasks' results, in order; the first exception raised by a task is re-raised (list)
+    """
+    if _workers <= 1 or len(tasks) < 2 or getattr(_in_worker, 'active', False):
+        return [task() for task in tasks]
+    pool = _get_pool()
+    futures = [pool.submit(_run_in_worker, task) for task in tasks]
+    return [future.result() for future in futures]
+
+
+class ModelBatch(object):
+    """create_model() calls of an assembly's parts, run together on the CAD thread pool."""
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.tasks = []
+
+    def add(self, name, create_model, *args):
+        """Build owner.<name> with create_model(*args) when build() is called."""
+        self.tasks.append((name, partial(create_model, *args)))
+
+    def build(self):
+        """Build every part added so far and set the solids on the owner."""
+        results = run_tasks(*[task for _, task in self.tasks])
+        for (name, _), model in zip(self.tasks, results):
+            setattr(self.owner, name, model)
+        self.tasks = []
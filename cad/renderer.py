@@ -0,0 +1,79 @@
+"""Offscreen rendering of the report views of a 3D model
+
+Design reports show the model in four views (3D, front, top and side). Each
+worker process keeps one offscreen viewer, created on the first render and
+reused for every model after it, and renders all views of a model in one
+pass. The images go to a directory of the caller's choosing, one per design,
+so reports built at the same time do not overwrite each other's images; the
+report finds them through popup_summary['images_dir'].
+
+    from cad.renderer import get_renderer
+    images = get_renderer().render(logic, os.path.join(output_dir, 'fin1_images'))
+"""
+import os
+from collections import OrderedDict
+
+# view name -> viewer method setting it up (None keeps the isometric view of display_3DModel)
+VIEWS = OrderedDict([('3d', None), ('front', 'View_Front'), ('top', 'View_Top'), ('side', 'View_Right')])
+
+_renderer = None
+
+
+class OffscreenRenderer(object):
+
+    def __init__(self, backend_str=None, size=(1024, 768)):
+        self.backend_str = backend_str
+        self.size = size
+        self.display = None
+
+    def get_display(self):
+        """The offscreen viewer, created on first use."""
+        if self.display is None:
+            from texlive.Design_wrapper import init_display
+            self.display, _, _, _ = init_display(backend_str=self.backend_str, size=self.size)
+        return self.display
+
+    def render(self, logic, output_dir, views=None):
+        """
+        Render the whole model of a design in every view.
+
+        Args:
+            logic: CommonDesignLogic of the design (its own display is left as it was)
+            output_dir: directory the images are written to, created if needed (str)
+            views: names of the views to render, see VIEWS (default all); the 3D
+                view is always rendered first, as display_3DModel leaves it (list)
+
+        Returns:
+            view name -> image path (OrderedDict)
+        """
+        display = self.get_display()
+        os.makedirs(output_dir, exist_ok=True)
+        images = OrderedDict()
+        own_display, component = logic.display, logic.component
+        logic.display = display
+        try:
+            logic.display_3DModel("Model", "gradient_bg")
+            display.set_bg_gradient_color([255, 255, 255], [255, 255, 255])
+            for view in VIEWS:
+                if views is not None and view not in views:
+                    continue
+                if VIEWS[view] is not None:
+                    getattr(display, VIEWS[view])()
+                    display.FitAll()
+                images[view] = os.path.join(output_dir, view + '.png')
+                display.ExportToImage(images[view])
+        finally:
+            display.EraseAll()
+            logic.display, logic.component = own_display, component
+        return images
+
+
+def get_renderer(backend_str=None):
+    """The renderer of this process (OffscreenRenderer)."""
+    global _renderer
+    if _renderer is None:
+        if backend_str is None:
+            from osdagMainSettings import backend_name
+            backend_str = backend_name()
+        _renderer = OffscreenRenderer(backend_str)
+    return _renderer
@@ -0,0 +1,130 @@
+"""Report checks recorded as raw numbers, rendered when the report is written
+
+The clause functions of Report_functions format an equation (LaTeX text of
+the clause with the design's numbers in it) for every row of the design
+check tables. With defer_clauses() they return a Deferred cell instead: the
+clause function and the numbers it was called with, formatted on the first
+dumps() (when a LaTeX or HTML report writes the row) and kept for the next.
+save_design then only records report_check, a list of rows of raw values and
+Deferred cells; a report that is never written costs no formatting, and the
+LaTeX and HTML reports of a design share one rendering of each equation.
+
+A save_design given a popup summary with 'write_report' set to False stops
+there: the arguments it would have written the LaTeX report with are left in
+the summary as a ReportRecord, to write the report later (or never, when
+only the outcome of the checks is needed).
+
+    summary = dict(popup_summary, write_report=False)
+    module_class.save_design(module_class, summary)
+    record = summary['report_record']
+    record.failed_checks()              # no equation formatted
+    record.write_latex(popup_summary)   # formats and writes the .tex file
+
+For comparison, use_deferred(False) makes the clause functions format their
+equations at once again (see benchmarks.report_equations).
+"""
+import copy
+import functools
+
+from pylatex import Package
+from pylatex.base_classes import LatexObject
+from pylatex.utils import escape_latex
+
+_deferred = True
+
+
+class Deferred(LatexObject):
+    """A report cell recorded as a clause function and its arguments."""
+
+    packages = [Package('amsmath')]
+
+    def __init__(self, function, args, kwargs):
+        # LatexObject.__init__ is skipped, as for design_report.equations.Equation
+        self.function = function
+        # lists of plate thicknesses and the like may change after the check
+        # is recorded; numbers and strings are kept as they are
+        self.args = tuple(copy.copy(arg) if isinstance(arg, (list, dict)) else arg for arg in args)
+        self.kwargs = {key: copy.copy(value) if isinstance(value, (list, dict)) else value
+                       for key, value in kwargs.items()}
+        self._text = None
+
+    def render(self):
+        """What the clause function returns for the recorded arguments."""
+        return self.function(*self.args, **self.kwargs)
+
+    def dumps(self):
+        if self._text is None:
+            value = self.render()
+            # as a pylatex table writes a cell that is not a LaTeX object
+            self._text = value.dumps() if isinstance(value, LatexObject) else escape_latex(str(value))
+        return self._text
+
+    def __repr__(self):
+        return 'Deferred({}{!r})'.format(self.function.__name__, self.args)
+
+
+def deferred(function):
+    """Make a clause function return a Deferred cell while use_deferred() is on."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if _deferred:
+            return Deferred(function, args, kwargs)
+        return function(*args, **kwargs)
+    wrapper.formatted = function
+    return wrapper
+
+
+def defer_clauses(namespace, exclude=()):
+    """
+    Wrap every function defined in a module (given by its globals()) with
+    deferred(), except those in exclude: the ones giving values rather than
+    equations, such as get_pass_fail.
+    """
+    for name, value in list(namespace.items()):
+        if callable(value) and getattr(value, '__module__', None) == namespace['__name__'] \
+                and isinstance(value, type(defer_clauses)) and name not in exclude:
+            namespace[name] = deferred(value)
+
+
+def use_deferred(enable=True):
+    """Record clause equations as Deferred cells (True) or format them at once (False)."""
+    global _deferred
+    _deferred = bool(enable)
+
+
+def uses_deferred():
+    """True unless use_deferred(False) was called (bool)."""
+    return _deferred
+
+
+class ReportRecord(object):
+    """What save_design records for the report of a design, before any of it is written."""
+
+    def __init__(self, report_input, report_check, rel_path, images_2d, image_3d, module):
+        self.report_input = report_input
+        self.report_check = report_check
+        self.rel_path = rel_path
+        self.images_2d = images_2d
+        self.image_3d = image_3d
+        self.module = module
+
+    def checks(self):
+        """(check, required, provided, remark) rows of the design check tables (list of tuple)."""
+        return [row for row in self.report_check if row[0] not in ('SubSection', 'Selected')]
+
+    def failed_checks(self):
+        """Names of the checks that failed, without formatting any equation (list of str)."""
+        return [row[0] for row in self.checks() if row[3] == 'Fail']
+
+    def write_latex(self, reportsummary, filename=None):
+        """Write (and compile, unless reportsummary['compile_pdf'] is False) the LaTeX report."""
+        from design_report.reportGenerator_latex import CreateLatex
+        summary = dict(reportsummary, write_report=True)
+        filename = filename or summary['filename']
+        CreateLatex.save_latex(CreateLatex(), self.report_input, self.report_check, summary, filename,
+                               self.rel_path, self.images_2d, self.image_3d, module=self.module)
+
+    def write_html(self, f, reportsummary, assets, output_dir=None):
+        """Write the HTML report to an open file (see design_report.html_report.write_report)."""
+        from design_report import html_report
+        html_report.write_report(f, self.report_input, self.report_check, reportsummary, assets, output_dir)
@@ -0,0 +1,125 @@
+"""Equations and check table rows of the design report as plain LaTeX text
+
+The clause functions of Report_functions and Report_functions_a build every
+equation as a list of LaTeX fragments appended to an inline math object. With
+pylatex's Math each of them is a full LaTeX object (its own package set,
+escaping rules and container machinery) that is only ever turned into a
+string when its table row is written. Equation keeps the fragments as
+text and joins them once, when the row is written, into exactly the text
+pylatex would have produced; it is still a LatexObject, so tables, cells and
+other pylatex containers take it as before.
+
+The rows of the design check tables (dozens per report, each with its
+equations and a coloured remark) are written the same way by table_row():
+the text pylatex's add_row would have produced, without building a pylatex
+command for every cell and rule.
+
+For migration, use_pylatex(True) makes Math() build pylatex Math objects and
+the report build its check tables with pylatex again, so that reports
+written both ways can be compared (see benchmarks.report_equations).
+
+    from design_report.equations import Math
+    eqn = Math(inline=True)
+    eqn.append(NoEscape(r'\\begin{aligned}\\gamma_{m0}&=1.1\\end{aligned}'))
+    eqn.dumps()     # '$\\begin{aligned}\\gamma_{m0}&=1.1\\end{aligned}$'
+"""
+from pylatex import Math as PylatexMath, Package, TextColor
+from pylatex.base_classes import LatexObject
+from pylatex.utils import escape_latex, bold, NoEscape
+
+HLINE = NoEscape(r'\hline')
+REMARK_PACKAGES = TextColor.packages
+
+_use_pylatex = False
+_remarks = {}
+
+
+class Equation(LatexObject):
+    """Math environment holding its content as LaTeX text (see pylatex.Math)."""
+
+    packages = [Package('amsmath')]
+    content_separator = ' '
+
+    def __init__(self, *, inline=False, data=None, escape=None):
+        # LatexObject.__init__ is skipped on purpose: it copies the package
+        # set of every object, which is most of the cost of a pylatex Math
+        self.inline = inline
+        self.escape = escape
+        self.data = [] if data is None else data if isinstance(data, list) else [data]
+
+    def append(self, item):
+        self.data.append(item)
+
+    def extend(self, items):
+        self.data.extend(items)
+
+    def dumps_content(self):
+        parts = []
+        for item in self.data:
+            if isinstance(item, LatexObject):
+                parts.append(item.dumps_as_content())
+            else:
+                # as in pylatex, escape_latex leaves NoEscape fragments (what the
+                # clause functions append) as they are
+                if not isinstance(item, str):
+                    item = str(item)
+                parts.append(escape_latex(item) if self.escape else item)
+        return self.content_separator.join(parts)
+
+    def dumps(self):
+        if self.inline:
+            return '$' + self.dumps_content() + '$'
+        return '\\[%\n' + self.dumps_content() + '%\n\\]'
+
+    def __repr__(self):
+        return 'Equation({!r})'.format(self.dumps())
+
+
+def Math(*, inline=False, data=None, escape=None):
+    """An Equation, or a pylatex Math object after use_pylatex(True)."""
+    if _use_pylatex:
+        return PylatexMath(inline=inline, data=data, escape=escape)
+    return Equation(inline=inline, data=data, escape=escape)
+
+
+def use_pylatex(enable=True):
+    """Build equations and check tables with pylatex objects (True) or as text (False)."""
+    global _use_pylatex
+    _use_pylatex = bool(enable)
+
+
+def uses_pylatex():
+    """True after use_pylatex(True) (bool)."""
+    return _use_pylatex
+
+
+def _cell(item, escape):
+    if isinstance(item, LatexObject):
+        return item.dumps_as_content()
+    if not isinstance(item, str):
+        item = str(item)
+    return escape_latex(item) if escape else item
+
+
+def table_row(cells, escape=True):
+    """
+    A table row as Tabular.add_row(cells) writes it, without a row colour. The
+    packages the cells need are not added to the table: the report declares
+    them all in its preamble.
+
+    Returns:
+        LaTeX text of the row, to be appended to the table (NoEscape)
+    """
+    return NoEscape('&'.join(_cell(item, escape) for item in cells) + r'\\')
+
+
+def remark(text, color):
+    """
+    Bold coloured remark of a check, e.g. remark('Pass', 'OsdagGreen'); its
+    table needs REMARK_PACKAGES (NoEscape).
+    """
+    key = (text, color)
+    if key not in _remarks:
+        _remarks[key] = NoEscape(TextColor(color, bold(text)).dumps())
+    return _remarks[key]
+
@@ -0,0 +1,332 @@
+"""Design reports as HTML, written to the file as they are produced
+
+HtmlWriter writes a report element by element to an open file, so a report is
+never held in memory as one string. write_report() writes the report of a
+design from the same data as the LaTeX report (report_input, report_check and
+the popup summary), and write_index() writes the index page of a batch.
+
+Images and the style sheet are shared assets: AssetStore copies each file
+once into <output directory>/assets, under a name made from a hash of its
+content, and every report links to that copy. A batch of a thousand reports
+holds one copy of the Osdag logo and of each section sketch, and writing a
+report never copies a file that is already there.
+
+    assets = AssetStore('reports')
+    with open('reports/fin1.html', 'w') as f:
+        write_report(f, module_class.report_input, module_class.report_check, summary, assets)
+    write_index('reports/index.html', entries, assets)
+"""
+import os
+import html
+import time
+import shutil
+import hashlib
+import tempfile
+from collections import namedtuple
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from pylatex.base_classes import LatexObject
+from utils.common.logs import log_entries
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_DIR = os.path.join(ROOT, 'ResourceFiles', 'images')
+HEADER_IMAGE = os.path.join(IMAGES_DIR, 'Osdag_header_report.png')
+VIEWS = (('3d', '3D View'), ('top', 'Top View'), ('side', 'Side View'), ('front', 'Front View'))
+LOG_LEVELS = ('WARNING', 'INFO', 'ERROR')     # design log messages shown in the report
+SECTION_LISTS = ('Section Size*', KEY_DISP_ANGLE_LIST, KEY_DISP_TOPANGLE_LIST, KEY_DISP_CLEAT_ANGLE_LIST)
+
+STYLE = """\
+body { font-family: Helvetica, Arial, sans-serif; font-size: 10pt; margin: 2em; }
+table { width: 100%; border-collapse: collapse; margin-bottom: 1.5em; page-break-inside: auto; }
+tr { page-break-inside: avoid; page-break-after: auto; }
+th, td { border: 1px solid black; padding: 3px; vertical-align: top; }
+th, td.title, tr.header td { background-color: #99a924; font-weight: bold; }
+td.pass { color: #99a924; font-weight: bold; text-align: center; }
+td.fail { color: #ff0000; font-weight: bold; text-align: center; }
+td.image { text-align: center; }
+h2 { page-break-before: always; }
+h2.first { page-break-before: avoid; }
+p.log-WARNING { color: blue; }
+p.log-INFO { color: #99a924; }
+p.log-ERROR { color: red; }
+"""
+
+
+# a table cell spanning columns, or with a class of its own
+Span = namedtuple('Span', ('value', 'colspan', 'css'))
+Span.__new__.__defaults__ = (1, None)
+
+
+class AssetStore(object):
+    """Shared files of a set of reports, stored once each under a content hash."""
+
+    def __init__(self, output_dir, subdir='assets'):
+        self.output_dir = output_dir
+        self.subdir = subdir
+        self.directory = os.path.join(output_dir, subdir)
+        self._urls = {}     # (path, size, modification time) or text hash -> url
+
+    def _store(self, digest, extension, write):
+        name = digest[:16] + extension.lower()
+        target = os.path.join(self.directory, name)
+        if not os.path.isfile(target):
+            os.makedirs(self.directory, exist_ok=True)
+            # written under a temporary name, so that reports written by other
+            # processes at the same time never link to a half written file
+            handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(handle, 'wb') as f:
+                write(f)
+            os.replace(temporary, target)
+        return self.subdir + '/' + name
+
+    def add(self, path):
+        """Link to a file, relative to the output directory, copying it if needed (str)."""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        if key not in self._urls:
+            digest = hashlib.sha1()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 16), b''):
+                    digest.update(block)
+
+            def copy(target):
+                with open(path, 'rb') as source:
+                    shutil.copyfileobj(source, target)
+            self._urls[key] = self._store(digest.hexdigest(), os.path.splitext(path)[1], copy)
+        return self._urls[key]
+
+    def add_text(self, text, extension):
+        """Link to a file holding text (a style sheet, say), written if needed (str)."""
+        data = text.encode('utf-8')
+        key = hashlib.sha1(data).hexdigest()
+        if key not in self._urls:
+            self._urls[key] = self._store(key, extension, lambda target: target.write(data))
+        return self._urls[key]
+
+
+def cell_html(value):
+    """
+    HTML of a table cell. Equations (pylatex objects, see
+    design_report.equations) keep their LaTeX inside a span of class "math",
+    for MathJax or KaTeX to typeset.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, LatexObject):
+        return '<span class="math">' + html.escape(value.dumps()) + '</span>'
+    return html.escape(str(value))
+
+
+class HtmlWriter(object):
+    """Writes the elements of an HTML page to an open file, one at a time."""
+
+    def __init__(self, f, assets):
+        self.f = f
+        self.write = f.write
+        self.assets = assets
+        self._headings = 0
+
+    def begin(self, title):
+        self.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>{}</title>\n'
+                   '<link rel="stylesheet" href="{}">\n</head>\n<body>\n'.format(
+                    html.escape(title), self.assets.add_text(STYLE, '.css')))
+
+    def end(self):
+        self.write('</body>\n</html>\n')
+
+    def heading(self, text, level=2):
+        css = ' class="first"' if level == 2 and not self._headings else ''
+        if level == 2:
+            self._headings += 1
+        self.write('<h{0}{1}>{2}</h{0}>\n'.format(level, css, html.escape(text)))
+
+    def start_table(self):
+        self.write('<table>\n')
+
+    def end_table(self):
+        self.write('</table>\n')
+
+    def row(self, cells, css=None):
+        """
+        Args:
+            cells: cell values, written with cell_html(), or Spans of them (list)
+            css: class of the row (str)
+        """
+        parts = ['<tr class="{}">'.format(css) if css else '<tr>']
+        for cell in cells:
+            if isinstance(cell, Span):
+                value, colspan, cell_css = cell
+            else:
+                value, colspan, cell_css = cell, 1, None
+            parts.append('<td{}{}>'.format(' colspan="{}"'.format(colspan) if colspan > 1 else '',
+                                           ' class="{}"'.format(cell_css) if cell_css else ''))
+            parts.append(cell_html(value))
+            parts.append('</td>')
+        parts.append('</tr>\n')
+        self.write(''.join(parts))
+
+    def image(self, url, width=None, alt=''):
+        self.write(self.image_html(url, width, alt))
+
+    @staticmethod
+    def image_html(url, width=None, alt=''):
+        return '<img src="{}"{} alt="{}">'.format(html.escape(url), ' width="{}"'.format(width) if width else '',
+                                                  html.escape(alt))
+
+
+def _header(writer, reportsummary):
+    profile = reportsummary['ProfileSummary']
+    logo = str(profile['CompanyLogo'])
+    writer.start_table()
+    writer.write('<tr><td colspan="2" class="image">{}</td><td colspan="2" class="image">Created with {}</td></tr>\n'
+                 .format(writer.image_html(writer.assets.add(logo), alt='Company logo') if os.path.isfile(logo) else '',
+                         writer.image_html(writer.assets.add(HEADER_IMAGE), width=160, alt='Osdag')))
+    for row in (('Company Name', profile['CompanyName'], 'Project Title', reportsummary['ProjectTitle']),
+                ('Group/Team Name', profile['Group/TeamName'], 'Subtitle', reportsummary['Subtitle']),
+                ('Designer', profile['Designer'], 'Job Number', reportsummary['JobNumber']),
+                ('Date', time.strftime("%d /%m /%Y"), 'Client', reportsummary['Client'])):
+        writer.row(row, css='header')
+    writer.end_table()
+
+
+def _inputs(writer, report_input):
+    writer.heading('Input Parameters')
+    writer.start_table()
+    for key, value in report_input.items():
+        if key == "Selected Section Details" or key in SECTION_LISTS[1:]:
+            continue
+        if isinstance(value, dict):
+            image = os.path.join(IMAGES_DIR, str(value.get(KEY_DISP_SEC_PROFILE, '')) + '.png')
+            details = [item for item in value.items() if item[0]]
+            image_cell = writer.image_html(writer.assets.add(image), width=200) if os.path.isfile(image) else ''
+            writer.write('<tr><td rowspan="{}" class="image">{}</td>'.format(len(details) + 1, image_cell))
+            writer.write('<td colspan="4" class="title">{}</td></tr>\n'.format(html.escape(str(key))))
+            for name, detail in details:
+                writer.row([Span(name, 2), Span(detail, 2)])
+        elif value == "TITLE":
+            writer.row([Span(key, 5, 'title')])
+        elif key == 'Section Size*':
+            writer.row([Span(key, 3), Span("Ref List of Input Section", 2)])
+        else:
+            writer.row([Span(key, 3), Span(value, 2)])
+    writer.end_table()
+    for key in SECTION_LISTS:
+        if key in report_input:
+            writer.heading('List of Input Section', level=3)
+            writer.start_table()
+            writer.row([key, str(report_input[key]).strip("[]")])
+            writer.end_table()
+
+
+def _checks(writer, report_input, report_check, design_exists):
+    writer.heading('Design Checks')
+    writer.start_table()
+    status = Span('Pass', 1, 'pass') if design_exists else Span('Fail', 1, 'fail')
+    writer.row([Span('Design Status', 1, 'title'), status])
+    writer.end_table()
+    in_table = False
+    for check in report_check:
+        if check[0] in ('SubSection', 'Selected'):
+            if in_table:
+                writer.end_table()
+            writer.heading(check[1], level=3)
+            writer.start_table()
+            in_table = True
+            if check[0] == 'SubSection':
+                writer.row(('Check', 'Required', 'Provided', 'Remarks'), css='header')
+            else:
+                for name, detail in report_input.get('Selected Section Details', {}).items():
+                    if name and name != KEY_DISP_SEC_PROFILE:
+                        writer.row([name, detail])
+        else:
+            if not in_table:
+                writer.start_table()
+                in_table = True
+            remark = check[3]
+            writer.row([check[0], check[1], check[2],
+                        Span(remark, 1, 'fail' if remark == 'Fail' else 'pass' if remark == 'Pass' else None)])
+    if in_table:
+        writer.end_table()
+
+
+def _views(writer, images_dir, output_dir):
+    writer.heading('3D Views')
+    writer.start_table()
+    cells = []
+    for view, caption in VIEWS:
+        path = os.path.join(images_dir, view + '.png')
+        if os.path.isfile(path):
+            # rendered for this design only: linked where they are, not shared
+            cells.append(writer.image_html(os.path.relpath(path, output_dir).replace(os.sep, '/'), width=400,
+                                           alt=caption) + '<br>' + caption)
+    for i in range(0, len(cells), 2):
+        writer.write('<tr>' + ''.join('<td class="image">{}</td>'.format(cell) for cell in cells[i:i + 2]) + '</tr>\n')
+    writer.end_table()
+
+
+def _log(writer, logger_messages):
+    writer.heading('Design Log')
+    for entry in log_entries(logger_messages):
+        if entry.level in LOG_LEVELS:
+            clause = ' data-clause="{}"'.format(html.escape(entry.clause)) if entry.clause else ''
+            writer.write('<p class="log-{}"{}>{}</p>\n'.format(entry.level, clause, html.escape(entry.line())))
+
+
+def write_report(f, report_input, report_check, reportsummary, assets, output_dir=None):
+    """
+    Write the HTML report of a design to an open file.
+
+    Args:
+        report_input, report_check: report data left on the design class by
+            save_design (see CreateLatex.save_latex)
+        reportsummary: the popup summary given to save_design (dict)
+        assets: shared files of the reports (AssetStore)
+        output_dir: directory of the HTML file, to link the 3D views of
+            reportsummary['images_dir'] from; defaults to the assets' (str)
+    """
+    writer = HtmlWriter(f, assets)
+    writer.begin('{} - {}'.format(report_input.get(KEY_MODULE, 'Design Report'), reportsummary['ProjectTitle']))
+    _header(writer, reportsummary)
+    _inputs(writer, report_input)
+    _checks(writer, report_input, report_check, reportsummary['does_design_exist'])
+    if reportsummary['does_design_exist'] and reportsummary.get('images_dir'):
+        _views(writer, reportsummary['images_dir'], output_dir or assets.output_dir)
+    _log(writer, reportsummary.get('logger_messages', ''))
+    writer.end()
+
+
+def write_index(path, entries, assets, title='Design Reports'):
+    """
+    Write the index page of a batch of reports.
+
+    Args:
+        path: HTML file to write (str)
+        entries: one dictionary per design with 'name', 'module',
+            'design_status', and the report files it has under 'html' and
+            'pdf' (paths, or None) (list of dict)
+        assets: shared files of the reports (AssetStore)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    passed = sum(1 for entry in entries if entry['design_status'])
+    with open(path, 'w') as f:
+        writer = HtmlWriter(f, assets)
+        writer.begin(title)
+        writer.heading(title)
+        writer.write('<p>{} designs, {} safe, {} unsafe or not designed.</p>\n'.format(
+            len(entries), passed, len(entries) - passed))
+        writer.start_table()
+        writer.row(('Design', 'Module', 'Status', 'Report'), css='header')
+        for entry in entries:
+            links = []
+            for kind in ('html', 'pdf'):
+                if entry.get(kind):
+                    links.append('<a href="{}">{}</a>'.format(
+                        html.escape(os.path.relpath(entry[kind], directory).replace(os.sep, '/')), kind.upper()))
+            status = ('Pass', 'pass') if entry['design_status'] else ('Fail', 'fail')
+            writer.write('<tr><td>{}</td><td>{}</td><td class="{}">{}</td><td>{}</td></tr>\n'.format(
+                html.escape(entry['name']), html.escape(str(entry['module'])), status[1], status[0],
+                ' '.join(links)))
+        writer.end_table()
+        writer.end()
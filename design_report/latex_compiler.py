@@ -0,0 +1,279 @@
+"""Compiling LaTeX design reports to PDF
+
+Every report is compiled in a temporary directory of its own, from a copy of
+its .tex file; only the PDF is moved next to the .tex file. Reports written to
+the same folder, or compiled at the same time, never share .aux/.log files, and
+pdflatex never runs in (or changes) the working directory of Osdag.
+
+When compilation fails, the .log file is left next to the .tex file (the
+report dialog reads it to explain the failure) and LatexError carries the
+lines of the log around the first LaTeX error.
+
+Two things keep each compile short:
+    * The fixed part of the preamble (document class, packages, page geometry
+      and colours, which every report shares) is dumped once into a format
+      with mylatexformat and cached under OSDAG_LATEX_CACHE, named by a hash of
+      the preamble and the compiler version. Reports then load the format
+      instead of reading the packages again. The rest of the preamble (the
+      page header with the project details) is still read from the report.
+      If the format cannot be built (mylatexformat missing, say), reports are
+      compiled in full.
+    * The .aux file of the last compile of each report is kept in the cache
+      and given to the next compile of it. Another pass is only run while a
+      pass changes the .aux file (long table column widths, labels), so a
+      report saved again is usually done in one pass.
+
+compile_many() compiles many reports on a bounded pool: each worker thread
+waits on its own pdflatex process, so at most `jobs` processes run at once.
+
+    from design_report.latex_compiler import compile_tex, compile_many
+    compile_tex('reports/fin1.tex')                     # -> reports/fin1.pdf
+    results = compile_many(['reports/fin1.tex', 'reports/fin2.tex'], jobs=4)
+"""
+import os
+import re
+import time
+import shutil
+import hashlib
+import threading
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+COMPILER = 'pdflatex'
+MAX_PASSES = 3          # long tables need a second pass to settle their column widths
+TIMEOUT = 300           # seconds per pass
+EXCERPT_LINES = 12
+CACHE_DIR = os.environ.get('OSDAG_LATEX_CACHE', os.path.join(tempfile.gettempdir(), 'osdag_latex_cache'))
+
+# lines of the preamble that are the same in every report and go into the format
+FIXED_PREAMBLE = re.compile(r'\\(documentclass|usepackage|RequirePackage|geometry|definecolor)\b|%?$')
+END_OF_DUMP = '%endofdump\n'
+
+_versions = {}
+_format_locks = {}
+_lock = threading.Lock()
+
+
+class LatexError(Exception):
+    """A report could not be compiled; excerpt holds the relevant lines of the LaTeX log."""
+
+    def __init__(self, message, log_path=None, excerpt=''):
+        super(LatexError, self).__init__(message)
+        self.log_path = log_path
+        self.excerpt = excerpt
+
+    def __str__(self):
+        message = super(LatexError, self).__str__()
+        if self.excerpt:
+            message += '\n' + self.excerpt
+        return message
+
+
+def log_excerpt(log, lines=EXCERPT_LINES):
+    """
+    Lines of a LaTeX log explaining why compilation failed: from the first
+    error (a line starting with '!') on, or the end of the log if there is none.
+    """
+    log_lines = log.splitlines()
+    for i, line in enumerate(log_lines):
+        if line.startswith('!'):
+            return '\n'.join(log_lines[i:i + lines])
+    return '\n'.join(log_lines[-lines:])
+
+
+def _read(path):
+    if not os.path.isfile(path):
+        return ''
+    with open(path, 'r', errors='replace') as f:
+        return f.read()
+
+
+def _write(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def _run(command, cwd, env, timeout):
+    """Run the compiler; returns its exit status, or None if it timed out."""
+    try:
+        return subprocess.run(command, cwd=cwd, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL, timeout=timeout).returncode
+    except FileNotFoundError:
+        raise LatexError('{} is not installed or not on the PATH'.format(command[0]))
+    except subprocess.TimeoutExpired:
+        return None
+
+
+def split_preamble(tex):
+    """
+    Split a LaTeX document after the lines of its preamble that go into the
+    format (see FIXED_PREAMBLE).
+
+    Returns:
+        (fixed preamble, rest of the document); the fixed preamble is empty
+        if the document has none (tuple of str)
+    """
+    lines = tex.splitlines(True)
+    end = 0
+    while end < len(lines) and FIXED_PREAMBLE.match(lines[end]):
+        end += 1
+    fixed = ''.join(lines[:end])
+    if '\\documentclass' not in fixed or '\\begin{document}' not in tex:
+        return '', tex
+    return fixed, ''.join(lines[end:])
+
+
+def _compiler_version(compiler):
+    if compiler not in _versions:
+        try:
+            output = subprocess.run([compiler, '--version'], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, timeout=TIMEOUT).stdout
+            _versions[compiler] = output.decode(errors='replace').split('\n')[0]
+        except (OSError, subprocess.TimeoutExpired):
+            _versions[compiler] = ''
+    return _versions[compiler]
+
+
+def preamble_format(preamble, compiler=COMPILER, timeout=TIMEOUT):
+    """
+    Format with the given fixed preamble dumped into it, built on first use.
+
+    Returns:
+        name of the format in CACHE_DIR, or None if it could not be built (str)
+    """
+    key = hashlib.sha1('{}\n{}'.format(_compiler_version(compiler), preamble).encode()).hexdigest()[:16]
+    name = 'osdag_' + key
+    fmt_path = os.path.join(CACHE_DIR, name + '.fmt')
+    failed_path = os.path.join(CACHE_DIR, name + '.failed')
+    with _lock:
+        lock = _format_locks.setdefault(key, threading.Lock())
+    with lock:
+        if os.path.isfile(fmt_path):
+            return name
+        if os.path.isfile(failed_path):
+            return None
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        workspace = tempfile.mkdtemp(prefix='osdag_latex_')
+        try:
+            _write(os.path.join(workspace, 'preamble.tex'),
+                   preamble + END_OF_DUMP + '\\begin{document}\n\\end{document}\n')
+            status = _run([compiler, '-ini', '-interaction=nonstopmode', '-jobname=' + name, '&' + compiler,
+                           'mylatexformat.ltx', 'preamble.tex'], workspace, None, timeout)
+            built = os.path.join(workspace, name + '.fmt')
+            if status == 0 and os.path.isfile(built):
+                # a format written by another process at the same time is as good as ours
+                os.replace(built, fmt_path)
+                return name
+            # reports are compiled in full from now on; delete the file to try again
+            _write(failed_path, log_excerpt(_read(os.path.join(workspace, name + '.log'))))
+            return None
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+
+def compile_tex(tex_path, pdf_path=None, compiler=COMPILER, timeout=TIMEOUT, use_format=True, reuse_aux=True):
+    """
+    Compile a .tex file to PDF in a temporary directory of its own.
+
+    Args:
+        tex_path: LaTeX file of the report (str)
+        pdf_path: where the PDF goes, next to the .tex file by default (str)
+        compiler: LaTeX program, run until a pass leaves the .aux file as it was (str)
+        timeout: seconds allowed for each run of the compiler (float)
+        use_format: load the fixed preamble from a cached format (bool)
+        reuse_aux: start from the .aux file of the last compile of this PDF (bool)
+
+    Returns:
+        path of the PDF (str)
+
+    Raises:
+        LatexError: the compiler is missing, failed or timed out; its log is
+            copied next to the PDF, with a '.log' extension
+    """
+    tex_path = os.path.abspath(tex_path)
+    base = os.path.splitext(tex_path)[0]
+    pdf_path = os.path.abspath(pdf_path) if pdf_path else base + '.pdf'
+    log_path = os.path.splitext(pdf_path)[0] + '.log'
+    if os.path.isfile(log_path):
+        os.remove(log_path)
+
+    with open(tex_path, 'r', errors='replace') as f:
+        tex = f.read()
+    command = [compiler, '-interaction=nonstopmode', '-halt-on-error', 'report.tex']
+    preamble, rest = split_preamble(tex) if use_format else ('', tex)
+    fmt = preamble_format(preamble, compiler, timeout) if preamble else None
+    if fmt is not None:
+        # mylatexformat skips the preamble up to %endofdump, which the format holds
+        tex = preamble + END_OF_DUMP + rest
+        command.insert(1, '-fmt=' + fmt)
+    # files given by relative paths (a company logo, say) are still found; the
+    # empty entries keep the compiler's own search paths
+    env = dict(os.environ, TEXINPUTS=os.pathsep.join([os.path.dirname(tex_path), os.getcwd(), '']),
+               TEXFORMATS=os.pathsep.join([CACHE_DIR, '']))
+    aux_cache = os.path.join(CACHE_DIR, 'aux', hashlib.sha1(pdf_path.encode()).hexdigest() + '.aux')
+    aux = _read(aux_cache) if reuse_aux else ''
+
+    workspace = tempfile.mkdtemp(prefix='osdag_latex_')
+    try:
+        _write(os.path.join(workspace, 'report.tex'), tex)
+        if aux:
+            _write(os.path.join(workspace, 'report.aux'), aux)
+        for _ in range(MAX_PASSES):
+            status = _run(command, workspace, env, timeout)
+            if status != 0 or not os.path.isfile(os.path.join(workspace, 'report.pdf')):
+                log = _read(os.path.join(workspace, 'report.log'))
+                _write(log_path, log)
+                reason = 'timed out after {} s'.format(timeout) if status is None else 'failed'
+                raise LatexError('{} {} on {}'.format(compiler, reason, tex_path), log_path, log_excerpt(log))
+            previous, aux = aux, _read(os.path.join(workspace, 'report.aux'))
+            if aux == previous:
+                break
+        shutil.move(os.path.join(workspace, 'report.pdf'), pdf_path)
+        if reuse_aux:
+            os.makedirs(os.path.dirname(aux_cache), exist_ok=True)
+            _write(aux_cache, aux)
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+    return pdf_path
+
+
+def compile_report(tex_path, compiler=COMPILER, timeout=TIMEOUT, use_format=True, reuse_aux=True):
+    """
+    compile_tex() for a pool: the outcome is returned instead of raised.
+
+    Returns:
+        dictionary with 'tex', 'pdf' (None on failure), 'seconds' and 'error'
+        (the LatexError text or None) (dict)
+    """
+    result = {'tex': tex_path, 'pdf': None, 'seconds': 0.0, 'error': None}
+    start = time.perf_counter()
+    try:
+        result['pdf'] = compile_tex(tex_path, compiler=compiler, timeout=timeout, use_format=use_format,
+                                    reuse_aux=reuse_aux)
+    except LatexError as e:
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def compile_many(tex_paths, jobs=None, compiler=COMPILER, timeout=TIMEOUT, progress=None):
+    """
+    Compile many reports, at most `jobs` at a time.
+
+    Args:
+        tex_paths: LaTeX files (list of str)
+        jobs: reports compiled at once, defaults to the CPU count (int)
+        progress: called with each result as it completes
+
+    Returns:
+        compile_report() results, in the order of tex_paths (list of dict)
+    """
+    results = [None] * len(tex_paths)
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        futures = {pool.submit(compile_report, tex_path, compiler, timeout): i for i, tex_path in enumerate(tex_paths)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if progress is not None:
+                progress(results[futures[future]])
+    return results
@@ -11,11 +11,20 @@ import math
 from Common import *
 import os
 from utils.common import component
+from design_report.html_report import AssetStore, IMAGES_DIR
 # from Connections.connection_calculations import ConnectionCalculations
 
-def save_html(outObj, uiObj, Design_Check, columndetails, beamdetails,reportsummary, filename, folder):
+def save_html(outObj, uiObj, Design_Check, columndetails, beamdetails,reportsummary, filename, folder, assets=None):
+    """
+    The report is written to the file as it is produced. Images are linked
+    from the shared assets of the output folder (see design_report.html_report),
+    created next to the report unless given.
+    """
     fileName = (filename)
+    if assets is None:
+        assets = AssetStore(os.path.dirname(os.path.abspath(fileName)))
     myfile = open(fileName, "w")
+    write = myfile.write
     myfile.write(t('! DOCTYPE html'))
     myfile.write(t('html'))
     myfile.write(t('head'))
@@ -50,51 +59,49 @@ def save_html(outObj, uiObj, Design_Check, columndetails, beamdetails,reportsumm
 
 # &&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&
 # Design Conclusion
-    rstr = ""
-    h = header(reportsummary)
-    rstr += h
-    rstr += t('table width = 100% border-collapse= "collapse" border="1px solid black"')
-    rstr += t('table border-collapse= "collapse" border="1px solid black" width= 100% ')
+    header(write, reportsummary, assets)
+    write(t('table width = 100% border-collapse= "collapse" border="1px solid black"'))
+    write(t('table border-collapse= "collapse" border="1px solid black" width= 100% '))
 
     row = [0, 'Design Conclusion', "IS800:2007/Limit state design"]
-    rstr += t('tr')
-    rstr += t('td colspan="2" class="header0"') + space(row[0]) + row[1] + t('/td')
-    rstr += t('td colspan="2" class="header0"') + row[2] + t('/td')
+    write(t('tr'))
+    write(t('td colspan="2" class="header0"') + space(row[0]) + row[1] + t('/td'))
+    write(t('td colspan="2" class="header0"') + row[2] + t('/td'))
     # rstr += t('td colspan="2" class="header0"') + t('/td')
-    rstr += t('/tr')
-    mainfolder = "/home/darshan/Desktop/Osdag3_new/Osdag3/ResourceFiles/images"
-    mainfolder = r'C:\Users\Win10\Desktop\Osdag3-master\ResourceFiles\images'
+    write(t('/tr'))
+    columns_beams = os.path.join(IMAGES_DIR, "ColumnsBeams.png")
+    columns_beams = assets.add(columns_beams) if os.path.isfile(columns_beams) else ""
     for i in uiObj:
         row1 = [0,i, uiObj[i]]
-        rstr += t('tr')
-        rstr += t('td colspan="3" class="detail1"') + space(row1[0]) + row1[1] + t('/td')
-        rstr += t('td colspan="2" class="detail2 "') + str(row1[2]) + t('/td')
-        rstr += t('/tr')
-        png = mainfolder + "/Columns_Beams.png"
+        write(t('tr'))
+        write(t('td colspan="3" class="detail1"') + space(row1[0]) + row1[1] + t('/td'))
+        write(t('td colspan="2" class="detail2 "') + str(row1[2]) + t('/td'))
+        write(t('/tr'))
+        png = columns_beams
         datapng = '<object type="image/PNG" data= %s width ="450"></object>' % png
         if i == "Column Details":
             row = [0, datapng, ""]
-            rstr += t('tr')
-            rstr += t('td rowspan = "17" align="center" class=" header2"') + space(row[0]) + row[1] + t('/td')
+            write(t('tr'))
+            write(t('td rowspan = "17" align="center" class=" header2"') + space(row[0]) + row[1] + t('/td'))
             # rstr += t('td  align="center" class=" header2"') + row[2] + t('/td')
             spec = extract_details(columndetails)
             for k in spec:
                 # rstr += t('tr')
-                rstr += t('td colspan = "2" width = "300" class="detail2"') + space(k[0]) + k[1] + t('/td')
-                rstr += t('td colspan = "2" width = "300" class="detail2 "') + k[2] + t('/td')
-                rstr += t('/tr')
+                write(t('td colspan = "2" width = "300" class="detail2"') + space(k[0]) + k[1] + t('/td'))
+                write(t('td colspan = "2" width = "300" class="detail2 "') + k[2] + t('/td'))
+                write(t('/tr'))
         if i == "Beam Details":
-            png = mainfolder + "/Columns_Beams.png"
+            png = columns_beams
             datapng = '<object type="image/PNG" data= %s width ="450"></object>' % png
             row = [0, datapng, ""]
-            rstr += t('tr')
-            rstr += t('td rowspan = "17" align="center" class=" header2"') + space(row[0]) + row[1] + t('/td')
+            write(t('tr'))
+            write(t('td rowspan = "17" align="center" class=" header2"') + space(row[0]) + row[1] + t('/td'))
             spec = extract_details(beamdetails)
             for l in spec:
                 # rstr += t('tr')
-                rstr += t('td colspan = "2" width = "300" class="detail2"') + space(l[0]) + l[1] + t('/td')
-                rstr += t('td colspan = "2" width = "300" class="detail2 "') + l[2] + t('/td')
-                rstr += t('/tr')
+                write(t('td colspan = "2" width = "300" class="detail2"') + space(l[0]) + l[1] + t('/td'))
+                write(t('td colspan = "2" width = "300" class="detail2 "') + l[2] + t('/td'))
+                write(t('/tr'))
         # for k,v in subtitle:
         #     print(k,v)
         # for j in uiObj[i]:
@@ -140,18 +147,18 @@ def save_html(outObj, uiObj, Design_Check, columndetails, beamdetails,reportsumm
         #         rstr += t('td colspan="2" class="detail2 "') + row2[2] + t('/td')
         #         rstr += t('/tr')
 #     #
-    rstr += t('/table')
-    rstr += t('h1 style="page-break-before:always"')  # page break
-    rstr += t('/h1')
+    write(t('/table'))
+    write(t('h1 style="page-break-before:always"'))  # page break
+    write(t('/h1'))
 
     # Diagram
-    rstr += h
-    rstr += t('table width = 100% border-collapse= "collapse" border="1px solid black"')
+    header(write, reportsummary, assets)
+    write(t('table width = 100% border-collapse= "collapse" border="1px solid black"'))
 
     row = [0, "Views", " "]
-    rstr += t('tr')
-    rstr += t('td colspan="2" class=" detail"') + space(row[0]) + row[1] + t('/td')
-    rstr += t('/tr')
+    write(t('tr'))
+    write(t('td colspan="2" class=" detail"') + space(row[0]) + row[1] + t('/td'))
+    write(t('/tr'))
     png = folder + "/images_html/3D_Model.png"
     datapng = '<object type="image/PNG" data= %s width ="450"></object>' % png
 
@@ -166,41 +173,41 @@ def save_html(outObj, uiObj, Design_Check, columndetails, beamdetails,reportsumm
 
     if str(outObj[KEY_MODULE_STATUS]) == 'True':
         row = [0, datapng, datatop]
-        rstr += t('tr')
-        rstr += t('td  align="center" class=" header2"') + space(row[0]) + row[1] + t('/td')
-        rstr += t('td  align="center" class=" header2"') + row[2] + t('/td')
-        rstr += t('/tr')
+        write(t('tr'))
+        write(t('td  align="center" class=" header2"') + space(row[0]) + row[1] + t('/td'))
+        write(t('td  align="center" class=" header2"') + row[2] + t('/td'))
+        write(t('/tr'))
 
         row = [0, dataside, datafront]
-        rstr += t('tr')
-        rstr += t('td align="center" class=" header2"') + space(row[0]) + row[1] + t('/td')
-        rstr += t('td align="center" class=" header2 "') + row[2] + t('/td')
-        rstr += t('/tr')
+        write(t('tr'))
+        write(t('td align="center" class=" header2"') + space(row[0]) + row[1] + t('/td'))
+        write(t('td align="center" class=" header2 "') + row[2] + t('/td'))
+        write(t('/tr'))
 
     else:
         pass
 
-    rstr += t('/table')
-    rstr += t('h1 style="page-break-before:always"')  # page break
-    rstr += t('/h1')
+    write(t('/table'))
+    write(t('h1 style="page-break-before:always"'))  # page break
+    write(t('/h1'))
 
     # # *************************************************************************************************************************
 # # &&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&
 # # Design Check
-    rstr +=h
-    rstr += t('table width = 100% border-collapse= "collapse" border="1px solid black"')
+    header(write, reportsummary, assets)
+    write(t('table width = 100% border-collapse= "collapse" border="1px solid black"'))
     row = [0, "Design Check", " "]
-    rstr += t('tr')
-    rstr += t('td colspan="4" class="detail"') + space(row[0]) + row[1] + t('/td')
-    rstr += t('/tr')
+    write(t('tr'))
+    write(t('td colspan="4" class="detail"') + space(row[0]) + row[1] + t('/td'))
+    write(t('/tr'))
 
-    rstr += t('tr')
+    write(t('tr'))
     row = [0, "Check", "Required", "Provided", "Remark"]
-    rstr += t('td class="header1"') + space(row[0]) + row[1] + t('/td')
-    rstr += t('td class="header1"') + space(row[0]) + row[2] + t('/td')
-    rstr += t('td class="header1"') + space(row[0]) + row[3] + t('/td')
-    rstr += t('td class="header1"') + space(row[0]) + row[4] + t('/td')
-    rstr += t('/tr')
+    write(t('td class="header1"') + space(row[0]) + row[1] + t('/td'))
+    write(t('td class="header1"') + space(row[0]) + row[2] + t('/td'))
+    write(t('td class="header1"') + space(row[0]) + row[3] + t('/td'))
+    write(t('td class="header1"') + space(row[0]) + row[4] + t('/td'))
+    write(t('/tr'))
 
 
     def checks(i):
@@ -337,29 +344,28 @@ def save_html(outObj, uiObj, Design_Check, columndetails, beamdetails,reportsumm
         return i
 
     for i in Design_Check:
-        rstr += t('tr')
+        write(t('tr'))
         a = checks(i)
         for j in range(1,len(a)):
-            rstr += t('td class="detail2"') + space(a[0]) + str(a[j]) + t('/td')
-        rstr += t('/tr')
+            write(t('td class="detail2"') + space(a[0]) + str(a[j]) + t('/td'))
+        write(t('/tr'))
 
 
     # &&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&
 # Additional comments
     addtionalcomments = str(reportsummary['AdditionalComments'])
-    rstr += t('table width = 100% border-collapse= "collapse" border="1px solid black"')
-    rstr += t('''col width=30%''')
-    rstr += t('''col width=70%''')
+    write(t('table width = 100% border-collapse= "collapse" border="1px solid black"'))
+    write(t('''col width=30%'''))
+    write(t('''col width=70%'''))
 
-    rstr += t('tr')
+    write(t('tr'))
     row = [0, "Additional Comments", addtionalcomments]
-    rstr += t('td colspan = "3" class= "detail1"') + space(row[0]) + row[1] + t('/td')
-    rstr += t('td colspan = "3" class= "detail2" align="justified"') + row[2] + t('/td')
-    rstr += t('/tr')
+    write(t('td colspan = "3" class= "detail1"') + space(row[0]) + row[1] + t('/td'))
+    write(t('td colspan = "3" class= "detail2" align="justified"') + row[2] + t('/td'))
+    write(t('/tr'))
 
-    rstr += t('/table')
+    write(t('/table'))
 
-    myfile.write(rstr)
     myfile.write(t('/body'))
     myfile.write(t('/html'))
     myfile.close()
@@ -378,7 +384,7 @@ def quote(m):
     return '"' + m + '"'
 
 #header
-def header(reportsummary):
+def header(write, reportsummary, assets):
     companyname = str(reportsummary["ProfileSummary"]['CompanyName'])
     companylogo = str(reportsummary["ProfileSummary"]['CompanyLogo'])
     groupteamname = str(reportsummary["ProfileSummary"]['Group/TeamName'])
@@ -391,64 +397,65 @@ def header(reportsummary):
 
     # &&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&
 # Header of the pdf fetched from dialogbox
-    rstr = t('table border-collapse= "collapse" border="1px solid black" width=100%')
-    rstr += t('tr')
-    row = [0, '<object type= "image/PNG" data= "cmpylogoFin.png" height=60 ></object>', '<font face="Helvetica, Arial, Sans Serif" size="3">Created with</font>' "&nbsp" "&nbsp" "&nbsp" "&nbsp" "&nbsp" '<object type= "image/PNG" data= "Osdag_header.png" height=60 ''&nbsp" "&nbsp" "&nbsp" "&nbsp"></object>']
-    rstr += t('td colspan="2" align= "center"') + space(row[0]) + row[1] + t('/td')
-    rstr += t('td colspan="2" align= "center"') + row[2] + t('/td')
-    rstr += t('/tr')
-
-    rstr += t('tr')
+    write(t('table border-collapse= "collapse" border="1px solid black" width=100%'))
+    write(t('tr'))
+    logo = assets.add(companylogo) if os.path.isfile(companylogo) else ""
+    osdag_logo = assets.add(os.path.join(IMAGES_DIR, "OsdagHeader.png"))
+    row = [0, '<object type= "image/PNG" data= "%s" height=60 ></object>' % logo, '<font face="Helvetica, Arial, Sans Serif" size="3">Created with</font>' "&nbsp" "&nbsp" "&nbsp" "&nbsp" "&nbsp" '<object type= "image/PNG" data= "%s" height=60 ''&nbsp" "&nbsp" "&nbsp" "&nbsp"></object>' % osdag_logo]
+    write(t('td colspan="2" align= "center"') + space(row[0]) + row[1] + t('/td'))
+    write(t('td colspan="2" align= "center"') + row[2] + t('/td'))
+    write(t('/tr'))
+
+    write(t('tr'))
     row = [0, 'Company Name']
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
 #     rstr += t('td style= "font:bold 20px Helvetica, Arial, Sans Serif;background-color:#D5DF93"') + space(row[0]) + row[1] + t('/td')
     row = [0, companyname]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
 
     row = [0, 'Project Title']
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, projecttitle]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
-    rstr += t('/tr')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
+    write(t('/tr'))
 
-    rstr += t('tr')
+    write(t('tr'))
     row = [0, 'Group/Team Name']
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, groupteamname]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, 'Subtitle']
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, subtitle]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
-    rstr += t('/tr')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
+    write(t('/tr'))
 
-    rstr += t('tr')
+    write(t('tr'))
     row = [0, 'Designer']
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, designer]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, 'Job Number']
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, jobnumber]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
-    rstr += t('/tr')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
+    write(t('/tr'))
 
-    rstr += t('tr')
+    write(t('tr'))
     row = [0, 'Date']
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, time.strftime("%d /%m /%Y")]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, "Client"]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
     row = [0, client]
-    rstr += t('td class="detail" ') + space(row[0]) + row[1] + t('/td')
-    rstr += t('/tr')
-    rstr += t('/table')
+    write(t('td class="detail" ') + space(row[0]) + row[1] + t('/td'))
+    write(t('/tr'))
+    write(t('/table'))
 
-    rstr += t('hr')
+    write(t('hr'))
 #     rstr += t('p> &nbsp</p')
-    rstr += t('/hr')
-    return rstr
+    write(t('/hr'))
 
 
 def extract_details(membertype):
@@ -10,6 +10,7 @@ from pylatex import Document, Section, Subsection
 from pylatex.utils import italic, bold
 #import pdflatex
 import sys
+import logging
 import datetime
 import pylatex as pyl
 from pylatex.basic import TextColor
@@ -25,11 +26,18 @@ from pylatex.utils import italic
 import os
 from pylatex.base_classes import Environment, CommandBase, Arguments
 from pylatex.package import Package
+from design_report.latex_compiler import compile_tex, LatexError
+from design_report import equations
+from design_report.deferred import ReportRecord
+from utils.common.logs import log_entries
 from pylatex import Document, PageStyle, Head, MiniPage, Foot, LargeText, \
     MediumText, LineBreak, simple_page_number, NewPage
 
 from pylatex.utils import bold
 
+# colours of the design log messages; other levels are left out of the report
+LOG_COLOURS = {'WARNING': 'blue', 'INFO': 'OsdagGreen', 'ERROR': 'red'}
+
 class CreateLatex(Document):
 
     def __init__(self):
@@ -37,6 +45,11 @@ class CreateLatex(Document):
 
 
     def save_latex(self, uiObj, Design_Check, reportsummary, filename, rel_path, Disp_2d_image, Disp_3d_image, module=''):
+        if not reportsummary.get('write_report', True):
+            # only the checks are recorded; the report is written later, if at all
+            reportsummary['report_record'] = ReportRecord(uiObj, Design_Check, rel_path, Disp_2d_image,
+                                                          Disp_3d_image, module)
+            return
         companyname = str(reportsummary["ProfileSummary"]['CompanyName'])
         companylogo = str(reportsummary["ProfileSummary"]['CompanyLogo'])
         groupteamname = str(reportsummary["ProfileSummary"]['Group/TeamName'])
@@ -270,6 +283,14 @@ class CreateLatex(Document):
                                         table.add_hline(2, 5)
                             table.add_hline()
                         count = count + 1
+                elif not equations.uses_pylatex():
+                    # the same rows as below, written as text (see design_report.equations)
+                    colour = "Red" if check[3] == 'Fail' else "OsdagGreen"
+                    table.append(equations.table_row((NoEscape(check[0]), check[1], check[2],
+                                                      equations.remark(check[3], colour)), table.escape))
+                    table.append(equations.HLINE)
+                    for package in equations.REMARK_PACKAGES:
+                        table.packages.add(package)
                 else:
 
                     if check[3] == 'Fail':
@@ -350,12 +371,15 @@ class CreateLatex(Document):
             view_topimg_path = rel_path + Disp_top_image
             view_sideimg_path = rel_path + Disp_side_image
             view_frontimg_path = rel_path + Disp_front_image
+            if reportsummary.get('images_dir'):
+                # views rendered for this design only, see cad.renderer
+                images_dir = reportsummary['images_dir'].replace("\\", "/")
+                view_3dimg_path = images_dir + "/3d.png"
+                view_topimg_path = images_dir + "/top.png"
+                view_sideimg_path = images_dir + "/side.png"
+                view_frontimg_path = images_dir + "/front.png"
             with doc.create(Section('3D Views')):
                 with doc.create(Tabularx(r'|>{\centering}X|>{\centering\arraybackslash}X|', row_height=1.2)) as table:
-                    view_3dimg_path = rel_path + Disp_3d_image
-                    view_topimg_path = rel_path + Disp_top_image
-                    view_sideimg_path = rel_path + Disp_side_image
-                    view_frontimg_path = rel_path + Disp_front_image
                     table.add_hline()
                     table.add_row([StandAloneGraphic(image_options="height=4cm",filename=view_3dimg_path),
                                   StandAloneGraphic(image_options="height=4cm",filename=view_topimg_path)])
@@ -375,21 +399,18 @@ class CreateLatex(Document):
 
         with doc.create(Section('Design Log')):
             doc.append(pyl.Command('Needspace', arguments=NoEscape(r'10\baselineskip')))
-            logger_msgs=reportsummary['logger_messages'].split('\n')
-            for msg in logger_msgs:
-                if('WARNING' in msg):
-                    colour='blue'
-                elif('INFO' in msg):
-                    colour='OsdagGreen'
-                elif('ERROR' in msg):
-                    colour='red'
-                else:
+            for entry in log_entries(reportsummary['logger_messages']):
+                colour = LOG_COLOURS.get(entry.level)
+                if colour is None:
                     continue
-                doc.append(TextColor(colour,'\n'+msg))
-        try:
-            doc.generate_pdf(filename, compiler='pdflatex', clean_tex=False)
-        except:
-            pass
+                doc.append(TextColor(colour, '\n' + entry.line()))
+        doc.generate_tex(filename)
+        if reportsummary.get('compile_pdf', True):
+            # on failure the LaTeX log is left next to the report for the report dialog to read
+            try:
+                compile_tex(filename + '.tex')
+            except LatexError as e:
+                logging.getLogger('Osdag').error('The design report was not compiled: {}'.format(e))
 
 def color_cell(cellcolor,celltext):
     string = NoEscape(r'\cellcolor{'+cellcolor+r'}{'+celltext+r'}')
@@ -1,8 +1,12 @@
 from design_type.member import Member
 from Common import *
+from utils.common.logs import setup_logger
 from utils.common.component import ISection, Material
 from utils.common.load import Load
 from utils.common.Section_Properties_Calculator import I_sectional_Properties
+from utils.common import trace
+
+_trace = trace.channel('compression')
 
 
 class Compression(Member):
@@ -166,31 +170,7 @@ class Compression(Member):
 
         # @author Arsil Zunzunia
         global logger
-        logger = logging.getLogger('osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        # handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        # handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        # handler.setLevel(logging.INFO)
-        # formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-        # handler.setFormatter(formatter)
-        # logger.addHandler(handler)
-        if key is not None:
-            handler = OurLog(key)
-            # handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def customized_input(self):
 
@@ -386,12 +366,9 @@ class Compression(Member):
         self.load = Load(shear_force="", axial_force=design_dictionary[KEY_AXIAL],moment=design_dictionary[KEY_MOMENT_MAJOR],
                          moment_minor = design_dictionary[KEY_MOMENT_MINOR],unit_kNm=True)
 
-        print(self.module)
-        print(self.sec_profile)
-        print(self.material)
-        print(self.length_yy)
-        print(self.length_zz)
-        print(self.load)
+        if _trace.on:
+            _trace('set_input_values', module=self.module, sec_profile=self.sec_profile, material=self.material,
+                   length_yy=self.length_yy, length_zz=self.length_zz, load=self.load)
         # Assuming first member as selected size
         selectedsize = design_dictionary[KEY_SECSIZE][0]
         self.select_section(self,selectedsize)
@@ -411,7 +388,8 @@ class Compression(Member):
         else:
             pass
 
-        print(self.section_size)
+        if _trace.on:
+            _trace('select_section', section_size=self.section_size)
 
     def get_3d_components(self):
 
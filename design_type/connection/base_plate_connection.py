@@ -38,6 +38,10 @@ from Report_functions import *
 from design_report.reportGenerator_latex import CreateLatex
 
 import logging
+from utils.common.logs import setup_logger
+from utils.common import trace
+
+_trace = trace.channel('base_plate')
 
 
 class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Part3_2002, Column):
@@ -487,25 +491,7 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
         Set logger for Base Plate Module.
         """
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def module_name(self):
         """
@@ -1685,7 +1671,8 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
             flag = True
 
         if flag:
-            print(design_dictionary)
+            if _trace.on:
+                _trace('inputs', design_dictionary)
             self.bp_parameters(self, design_dictionary)
         else:
             return all_errors
@@ -2302,7 +2289,6 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
         self.base_plate.connect_to_database_to_get_fy_fu(self.dp_bp_material, 0)
 
         # stiffener plate/ shear key
-        print(design_dictionary[KEY_ST_KEY_MATERIAL])
         self.dp_stif_key_material = str(design_dictionary[KEY_ST_KEY_MATERIAL])
         self.stiff_key = Material(material_grade=self.dp_stif_key_material, thickness=0)  # thk is initialised to 0
         self.stiff_key.connect_to_database_to_get_fy_fu(self.dp_stif_key_material, 0)
@@ -2468,17 +2454,23 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
         self.load_status = True
 
         self.bp_analyses_parameters(self)
-        print('bp_analyses_parameters done')
+        if _trace.on:
+            _trace('stage_done', 'bp_analyses_parameters')
         self.bp_analyses(self)
-        print('bp_analyses done')
+        if _trace.on:
+            _trace('stage_done', 'bp_analyses')
         self.anchor_bolt_design(self)
-        print('anchor_bolt_design done')
+        if _trace.on:
+            _trace('stage_done', 'anchor_bolt_design')
         self.design_weld(self)
-        print('design_weld done')
+        if _trace.on:
+            _trace('stage_done', 'design_weld')
         self.design_stiffeners(self)
-        print('design_stiffeners done')
+        if _trace.on:
+            _trace('stage_done', 'design_stiffeners')
         self.additional_calculations(self)
-        print('additional_calculations done')
+        if _trace.on:
+            _trace('stage_done', 'additional_calculations')
 
     def bp_analyses_parameters(self):
         """ initialize detailing parameters like the end/edge/pitch/gauge distances, anchor bolt diameter and grade,
@@ -6903,222 +6895,110 @@ class BasePlateConnection(MomentConnection, IS800_2007, IS_5624_1993, IS1367_Par
             logger.info(":     Overall base plate connection design is UNSAFE")
             logger.info(": ============ End Of Design ============")
 
-        # printing values for output dock
-
-        # Anchor Bolt - Outside Column Flange
-        print(self.anchor_dia_outside_flange)  # Diameter (mm)
-        print(self.anchor_grade_out)  # Property Class
-        print(2 * self.anchors_outside_flange)  # No. of Anchor Bolts
-
-        print(self.shear_capacity_anchor)  # Shear Capacity (kN)
-        print(self.bearing_capacity_anchor)  # Bearing Capacity (kN)
-        print(self.anchor_capacity)  # Bolt capacity (kN)
-
-        if self.connectivity == 'Moment Base Plate':
-            print(self.tension_demand_anchor)  # Tension Demand (kN)
-            print(self.tension_capacity_anchor)  # Tension capacity (kN)
-        else:
-            print(self.tension_demand_anchor)  # Tension Demand (kN)
-
-        print(self.combined_capacity_anchor)  # Combined capacity (kN)
-
-        print(self.anchor_len_above_footing_out)
-        print(self.anchor_len_below_footing_out)
-        print(self.anchor_length_provided_out)  # Anchor Length (total) (mm)
-
-        # Anchor Bolt - Inside Column Flange
-        if self.connectivity == 'Moment Base Plate':
-            if (self.load_axial_tension > 0) or (self.load_moment_minor > 0):
-
-                print(self.anchor_dia_inside_flange)  # Diameter (mm)
-                print(self.anchor_grade_in)  # Property Class
-
-                if self.load_axial_tension > 0:
-                    print(self.tension_demand_anchor_uplift)  # Tension Demand (kN)
-                else:
-                    print(self.tension_demand_anchor_uplift)
-                if self.connectivity == 'Moment Base Plate':
-                    print(self.tension_capacity_anchor_uplift)  # Tension capacity (kN)
-
-                print(self.anchors_inside_flange)  # No. of Anchor Bolts
-
-                print(self.anchor_len_above_footing_in)
-                print(self.anchor_len_below_footing_in)
-                print(self.anchor_length_provided_in)  # Anchor Length (total) (mm)
-
-        # Detailing for anchor bolts inside flange
-        if self.connectivity == 'Moment Base Plate':
-            if (self.load_axial_tension > 0) or (self.load_moment_minor > 0):
-
-                if (self.stiffener_across_web == 'Yes') or (self.shear_key_along_ColWidth == 'Yes'):
-
-                    if self.anchors_inside_flange == 4:
-                        print(self.end_distance_in)
-                        print(self.edge_distance_in)
-
-                    if self.anchors_inside_flange == 8:
-                        print(self.end_distance_in)
-                        print(self.edge_distance_in)
-                        print(self.gauge_distance_in)
-                else:
-                    if self.anchors_inside_flange == 4:
-                        print(self.end_distance_in)
-                        print(self.pitch_distance_in)
-
-                    if self.anchors_inside_flange == 8:
-                        print(self.end_distance_in)
-                        print(self.edge_distance_in)
-                        print(self.pitch_distance_in)
-                        print(self.gauge_distance_in)
-
-        # Base Plate
-        print(self.plate_thk_provided)  # Thickness (mm)
-        print(self.bp_length_provided)  # Length (mm)
-        print(self.bp_width_provided)  # Width (mm)
-
-        # Detailing
-        print(self.anchor_nos_provided)  # Total No. of Anchor Bolts
-
-        print(self.end_distance_out)  # End Distance (mm)
-        print(self.edge_distance_out)  # Edge Distance (mm)
-
-        print(self.pitch_distance_out)  # Pitch Distance (mm)
-        print(self.gauge_distance_out)  # Gauge Distance (mm)
-
-        if (self.connectivity == 'Welded Column Base') or (self.connectivity == 'Hollow/Tubular Column Base'):
-            print(self.projection)  # Effective Projection (mm)
-        else:
-            pass
-
-        # Gusset/Stiffener Plate
-        if self.connectivity == 'Hollow/Tubular Column Base':
-
-            if (self.stiffener_along_D == 'Yes') or (self.stiffener_along_B == 'Yes'):
-
-                print(self.stiffener_nos)
-                print(self.stiffener_plt_thk)
-                print(self.stiffener_plt_height)
-
-                if (self.dp_column_designation[1:4] == 'SHS') or (self.dp_column_designation[1:4] == 'RHS'):
-                    print(self.stiffener_plt_len_along_D)
-                    print(self.stiffener_plt_len_along_B)
-                else:
-                    print(self.stiffener_plt_len_across_D)
+        # values for the output dock
+        if _trace.on:
+            # Anchor Bolt - Outside Column Flange
+            _trace('anchor_bolt_outside_flange', diameter=self.anchor_dia_outside_flange, grade=self.anchor_grade_out,
+                   number=2 * self.anchors_outside_flange, shear_capacity=self.shear_capacity_anchor,
+                   bearing_capacity=self.bearing_capacity_anchor, capacity=self.anchor_capacity,
+                   tension_demand=self.tension_demand_anchor, combined_capacity=self.combined_capacity_anchor,
+                   length_above_footing=self.anchor_len_above_footing_out,
+                   length_below_footing=self.anchor_len_below_footing_out, length=self.anchor_length_provided_out)
+            if self.connectivity == 'Moment Base Plate':
+                _trace('anchor_bolt_outside_flange', tension_capacity=self.tension_capacity_anchor)
 
-                print(self.shear_on_stiffener)
-                print(self.shear_capa_stiffener)
-                print(self.moment_on_stiffener)
-                print(self.moment_capa_stiffener)
+                # Anchor Bolt - Inside Column Flange
+                if (self.load_axial_tension > 0) or (self.load_moment_minor > 0):
+                    _trace('anchor_bolt_inside_flange', diameter=self.anchor_dia_inside_flange, grade=self.anchor_grade_in,
+                           tension_demand=self.tension_demand_anchor_uplift,
+                           tension_capacity=self.tension_capacity_anchor_uplift, number=self.anchors_inside_flange,
+                           length_above_footing=self.anchor_len_above_footing_in,
+                           length_below_footing=self.anchor_len_below_footing_in, length=self.anchor_length_provided_in)
+                    # Detailing for anchor bolts inside flange
+                    _trace('anchor_bolt_inside_flange_detailing', end=self.end_distance_in, edge=self.edge_distance_in,
+                           pitch=self.pitch_distance_in, gauge=self.gauge_distance_in)
+
+            # Base Plate
+            _trace('base_plate', thickness=self.plate_thk_provided, length=self.bp_length_provided,
+                   width=self.bp_width_provided)
+
+            # Detailing
+            _trace('detailing', anchor_bolts=self.anchor_nos_provided, end=self.end_distance_out,
+                   edge=self.edge_distance_out, pitch=self.pitch_distance_out, gauge=self.gauge_distance_out)
+            if (self.connectivity == 'Welded Column Base') or (self.connectivity == 'Hollow/Tubular Column Base'):
+                _trace('detailing', projection=self.projection)
 
+            # Gusset/Stiffener Plate
+            if self.connectivity == 'Hollow/Tubular Column Base':
+                if (self.stiffener_along_D == 'Yes') or (self.stiffener_along_B == 'Yes'):
+                    if (self.dp_column_designation[1:4] == 'SHS') or (self.dp_column_designation[1:4] == 'RHS'):
+                        lengths = {'length_along_D': self.stiffener_plt_len_along_D,
+                                   'length_along_B': self.stiffener_plt_len_along_B}
+                    else:
+                        lengths = {'length_across_D': self.stiffener_plt_len_across_D}
+                    _trace('stiffener', number=self.stiffener_nos, thickness=self.stiffener_plt_thk,
+                           height=self.stiffener_plt_height, shear=self.shear_on_stiffener,
+                           shear_capacity=self.shear_capa_stiffener, moment=self.moment_on_stiffener,
+                           moment_capacity=self.moment_capa_stiffener, **lengths)
             else:
-                pass
+                # Stiffener Plate Along Column Flange
+                if self.stiffener_along_flange == 'Yes':
+                    _trace('stiffener_along_flange', length=self.stiffener_plt_len_along_flange,
+                           height=self.stiffener_plt_height_along_flange, thickness=self.stiffener_plt_thick_along_flange,
+                           shear=self.shear_on_stiffener_along_flange,
+                           shear_capacity=self.shear_capa_stiffener_along_flange,
+                           moment=self.moment_on_stiffener_along_flange,
+                           moment_capacity=self.moment_capa_stiffener_along_flange)
+
+                # Stiffener Plate Along Column Web
+                if self.stiffener_along_web == 'Yes':
+                    _trace('stiffener_along_web', length=self.stiffener_plt_len_along_web,
+                           height=self.stiffener_plt_height_along_web, thickness=self.stiffener_plt_thick_along_web,
+                           shear=self.shear_on_stiffener_along_web, shear_capacity=self.shear_capa_stiffener_along_web,
+                           moment=self.moment_on_stiffener_along_web,
+                           moment_capacity=self.moment_capa_stiffener_along_web)
 
-        else:
-            # Stiffener Plate Along Column Flange
-            if self.stiffener_along_flange == 'Yes':
-                print(self.stiffener_plt_len_along_flange)
-                print(self.stiffener_plt_height_along_flange)
-                print(self.stiffener_plt_thick_along_flange)
-                print(self.shear_on_stiffener_along_flange)
-                print(self.shear_capa_stiffener_along_flange)
-                print(self.moment_on_stiffener_along_flange)
-                print(self.moment_capa_stiffener_along_flange)
-            else:
-                print(self.stiffener_plt_len_along_flange == 'N/A')
-                print(self.stiffener_plt_height_along_flange == 'N/A')
-                print(self.stiffener_plt_thick_along_flange == 'N/A')
-                print(self.shear_on_stiffener_along_flange == 'N/A')
-                print(self.shear_capa_stiffener_along_flange == 'N/A')
-                print(self.moment_on_stiffener_along_flange == 'N/A')
-                print(self.moment_capa_stiffener_along_flange == 'N/A')
-
-            # Stiffener Plate Along Column Web
-            if self.stiffener_along_web == 'Yes':
-                print(self.stiffener_plt_len_along_web)
-                print(self.stiffener_plt_height_along_web)
-                print(self.stiffener_plt_thick_along_web)
-                print(self.shear_on_stiffener_along_web)
-                print(self.shear_capa_stiffener_along_web)
-                print(self.moment_on_stiffener_along_web)
-                print(self.moment_capa_stiffener_along_web)
-            else:
-                print(self.stiffener_plt_len_along_web == 'N/A')
-                print(self.stiffener_plt_height_along_web == 'N/A')
-                print(self.stiffener_plt_thick_along_web == 'N/A')
-                print(self.shear_on_stiffener_along_web == 'N/A')
-                print(self.shear_capa_stiffener_along_web == 'N/A')
-                print(self.moment_on_stiffener_along_web == 'N/A')
-                print(self.moment_capa_stiffener_along_web == 'N/A')
-
-            # Stiffener Plate Across Column Web
-            if self.stiffener_across_web == 'Yes':
-                print(self.stiffener_plt_len_across_web)
-                print(self.stiffener_plt_height_across_web)
-                print(self.stiffener_plt_thick_across_web)
-                print(self.shear_on_stiffener_across_web)
-                print(self.shear_capa_stiffener_across_web)
-                print(self.moment_on_stiffener_across_web)
-                print(self.moment_capa_stiffener_across_web)
-            else:
-                print(self.stiffener_plt_len_across_web == 'N/A')
-                print(self.stiffener_plt_height_across_web == 'N/A')
-                print(self.stiffener_plt_thick_across_web == 'N/A')
-                print(self.shear_on_stiffener_across_web == 'N/A')
-                print(self.shear_capa_stiffener_across_web == 'N/A')
-                print(self.moment_on_stiffener_across_web == 'N/A')
-                print(self.moment_capa_stiffener_across_web == 'N/A')
-
-        # Stiffener plate inside flange
-        if self.connectivity == 'Moment Base Plate':
-            if (self.anchors_outside_flange == 3) or (self.anchors_outside_flange == 6):
-                if self.stiffener_inside_flange == 'Yes':
-                    print(self.stiffener_plt_len_btwn_D_out)
-                    print(self.stiffener_plt_width_btwn_D)
-                    print(self.stiffener_plt_thick_btwn_D)
+                # Stiffener Plate Across Column Web
+                if self.stiffener_across_web == 'Yes':
+                    _trace('stiffener_across_web', length=self.stiffener_plt_len_across_web,
+                           height=self.stiffener_plt_height_across_web, thickness=self.stiffener_plt_thick_across_web,
+                           shear=self.shear_on_stiffener_across_web, shear_capacity=self.shear_capa_stiffener_across_web,
+                           moment=self.moment_on_stiffener_across_web,
+                           moment_capacity=self.moment_capa_stiffener_across_web)
 
-        # Shear Key Details
-        print("Shear key details start")
+            # Stiffener plate inside flange
+            if self.connectivity == 'Moment Base Plate':
+                if (self.anchors_outside_flange == 3) or (self.anchors_outside_flange == 6):
+                    if self.stiffener_inside_flange == 'Yes':
+                        _trace('stiffener_inside_flange', length=self.stiffener_plt_len_btwn_D_out,
+                               width=self.stiffener_plt_width_btwn_D, thickness=self.stiffener_plt_thick_btwn_D)
 
-        if self.shear_key_along_ColDepth == 'Yes':
-            print(self.shear_key_len_ColDepth)
-            print(self.shear_key_depth_ColDepth)
-            print(self.shear_key_stress_ColDepth)
-        else:
+        # Shear Key Details
+        if self.shear_key_along_ColDepth != 'Yes':
             self.shear_key_len_ColDepth = 0
             self.shear_key_depth_ColDepth = 0
             self.shear_key_stress_ColDepth = 0
 
-        if self.shear_key_along_ColWidth == 'Yes':
-            print(self.shear_key_len_ColWidth)
-            print(self.shear_key_depth_ColWidth)
-            print(self.shear_key_stress_ColWidth)
-        else:
+        if self.shear_key_along_ColWidth != 'Yes':
             self.shear_key_len_ColWidth = 0
             self.shear_key_depth_ColWidth = 0
             self.shear_key_stress_ColWidth = 0
 
-        print(self.shear_key_thk)
-        print("Shear key details end")
+        if _trace.on:
+            _trace('shear_key', thickness=self.shear_key_thk,
+                   along_depth=(self.shear_key_len_ColDepth, self.shear_key_depth_ColDepth, self.shear_key_stress_ColDepth),
+                   along_width=(self.shear_key_len_ColWidth, self.shear_key_depth_ColWidth, self.shear_key_stress_ColWidth))
 
-        # Weld
-        if self.connectivity == 'Hollow/Tubular Column Base':
-            print(self.weld_size_hollow)
-        else:
-            print(self.weld_size_flange if self.weld_type != 'Butt Weld' else '')  # Size at Flange (mm)
-            print(self.weld_size_web if self.weld_type != 'Butt Weld' else '')  # Size at Web (mm)
-
-            if self.stiffener_along_flange == 'Yes':
-                print(self.weld_size_stiffener if self.weld_type != 'Butt Weld' else '')  # weld size at stiffener along flange (mm)
-
-            if self.stiffener_along_web == 'Yes':
-                print(self.weld_size_stiffener if self.weld_type != 'Butt Weld' else '')  # weld size at stiffener along web (mm)
-
-            if self.stiffener_across_web == 'Yes':
-                print(self.weld_size_stiffener if self.weld_type != 'Butt Weld' else '')  # weld size at stiffener along web (mm)
-
-        # col properties
-        print(self.column_D, self.column_bf, self.column_tf, self.column_tw, self.column_r1, self.column_r2)
-        # print(self.w)
+            # Weld
+            if self.connectivity == 'Hollow/Tubular Column Base':
+                _trace('weld', size=self.weld_size_hollow)
+            elif self.weld_type != 'Butt Weld':
+                _trace('weld', size_flange=self.weld_size_flange, size_web=self.weld_size_web,
+                       size_stiffener=self.weld_size_stiffener)
+
+            # col properties
+            _trace('column', D=self.column_D, bf=self.column_bf, tf=self.column_tf, tw=self.column_tw,
+                   r1=self.column_r1, r2=self.column_r2)
 
     # design report
 
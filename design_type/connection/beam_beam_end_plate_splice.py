@@ -39,8 +39,12 @@ from Report_functions import *
 from design_report.reportGenerator_latex import CreateLatex
 
 import logging
+from utils.common.logs import setup_logger
 import math
 import numpy as np
+from utils.common import trace
+
+_trace = trace.channel('end_plate_splice')
 
 
 class BeamBeamEndPlateSplice(MomentConnection):
@@ -180,25 +184,7 @@ class BeamBeamEndPlateSplice(MomentConnection):
     def set_osdaglogger(key):
         """ Function to set Logger for the module """
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     # set module name
     def module_name(self):
@@ -1226,7 +1212,8 @@ class BeamBeamEndPlateSplice(MomentConnection):
 
                                         # step 1: max pitch distance
                                         self.pitch_distance_max = self.cl_10_2_3_1_max_spacing([self.plate_thickness])
-                                        print("PITCH MAX {}".format(self.pitch_distance_max))
+                                        if _trace.on:
+                                            _trace('design_connection', pitch_distance_max=self.pitch_distance_max)
 
                                         # step 2: checking space availability to accommodate extra rows based on maximum pitch criteria
                                         if self.endplate_type == VALUES_ENDPLATE_TYPE[1]:  # one-way
@@ -2070,7 +2057,6 @@ class BeamBeamEndPlateSplice(MomentConnection):
 
         Disp_2d_image = [path_weld, path_detailing, path_stiffener]
         Disp_3d_image = "/ResourceFiles/images/3d.png"
-        print(sys.path[0])
         rel_path = str(sys.path[0])
         rel_path = rel_path.replace("\\", "/")
 
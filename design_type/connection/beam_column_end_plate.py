@@ -43,6 +43,7 @@ from Report_functions import *
 from design_report.reportGenerator_latex import CreateLatex
 
 import logging
+from utils.common.logs import setup_logger
 import math
 import numpy as np
 
@@ -242,25 +243,7 @@ class BeamColumnEndPlate(MomentConnection):
     def set_osdaglogger(key):
         """ Function to set Logger for the module """
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     # set module name
     def module_name(self):
@@ -3249,7 +3232,6 @@ class BeamColumnEndPlate(MomentConnection):
 
         Disp_2d_image = [path_weld, path_detailing, path_stiffener]
         Disp_3d_image = "/ResourceFiles/images/3d.png"
-        print(sys.path[0])
         rel_path = str(sys.path[0])
         rel_path = rel_path.replace("\\", "/")
 
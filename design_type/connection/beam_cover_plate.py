@@ -20,6 +20,10 @@ from utils.common.load import Load
 from design_report.reportGenerator_latex import CreateLatex
 from Report_functions import *
 import logging
+from utils.common.logs import setup_logger
+from utils.common import trace
+
+_trace = trace.channel('beam_cover_plate')
 
 
 class BeamCoverPlate(MomentConnection):
@@ -212,26 +216,7 @@ class BeamCoverPlate(MomentConnection):
 
         # @author Arsil Zunzunia
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                                          datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def out_bolt_bearing(self):
 
@@ -783,7 +768,8 @@ class BeamCoverPlate(MomentConnection):
 
         self.section = Beam(designation=design_dictionary[KEY_SECSIZE],
                               material_grade=design_dictionary[KEY_SEC_MATERIAL])
-        print("anjali",design_dictionary[KEY_DP_DETAILING_EDGE_TYPE])
+        if _trace.on:
+            _trace('inputs', edge_type=design_dictionary[KEY_DP_DETAILING_EDGE_TYPE])
         self.web_bolt = Bolt(grade=design_dictionary[KEY_GRD], diameter=design_dictionary[KEY_D],
                              bolt_type=design_dictionary[KEY_TYP],
                              bolt_hole_type=design_dictionary[KEY_DP_BOLT_HOLE_TYPE],
@@ -1141,10 +1127,9 @@ class BeamCoverPlate(MomentConnection):
         #             self.web_plate.thickness.remove(i)
         #         else:
         #             pass
-        print("thickness_previous_list_flange", previous_thk_flange)
-        print("thickness_previous_list_web",previous_thk_web)
-        print("thicknesslist",self.web_plate.thickness)
-        print("thicknesslist", self.flange_plate.thickness)
+        if _trace.on:
+            _trace('initial_pt_thk', previous_thk_flange=previous_thk_flange, previous_thk_web=previous_thk_web,
+                   web_plate_thickness=self.web_plate.thickness, flange_plate_thickness=self.flange_plate.thickness)
         self.initial_pt_thk_status = False
         self.initial_pt_thk_status_web =False
         A_v_web = (self.section.depth - 2 * self.section.flange_thickness) * self.section.web_thickness
@@ -1391,8 +1376,8 @@ class BeamCoverPlate(MomentConnection):
             else:
                 pass
 
-        print("bolt dia ", d, " mm  available bolt list ",
-              self.bolt.bolt_diameter_possible, " mm")
+        if _trace.on:
+            _trace('select_bolt_dia', bolt_dia=d, available=self.bolt.bolt_diameter_possible)
 
         if len(self.bolt.bolt_diameter_possible) ==0:
             self.large_grip_status = False
@@ -1409,7 +1394,9 @@ class BeamCoverPlate(MomentConnection):
 
                 self.flange_bolt.calculate_bolt_spacing_limits(bolt_diameter_provided=self.bolt.bolt_diameter_provided,
                                                             conn_plates_t_fu_fy=self.bolt_conn_plates_t_fu_fy)
-                print(self.flange_bolt.min_edge_dist, self.flange_bolt.edge_type)
+                if _trace.on:
+                    _trace('select_bolt_dia', min_edge_dist=self.flange_bolt.min_edge_dist,
+                           edge_type=self.flange_bolt.edge_type)
 
                 if self.preference == "Outside":
                     self.flange_bolt.calculate_bolt_capacity(bolt_diameter_provided=self.bolt.bolt_diameter_provided,
@@ -1541,7 +1528,8 @@ class BeamCoverPlate(MomentConnection):
             #     logger.error(" : Design is not safe. \n ")
             #     logger.info(" :=========End Of design===========")
     def get_bolt_grade(self):
-        print(self.design_status, "Getting bolt grade")
+        if _trace.on:
+            _trace('get_bolt_grade', design_status=self.design_status)
         bolt_grade_previous = self.bolt.bolt_grade[-1]
         self.select_bolt_dia_status = False
         grade_status = False
@@ -1569,7 +1557,9 @@ class BeamCoverPlate(MomentConnection):
                                                   conn_plates_t_fu_fy=self.bolt_conn_plates_web_t_fu_fy,
                                                   n_planes=2)
 
-            print(self.bolt.bolt_grade_provided, self.bolt.bolt_capacity, self.flange_plate.bolt_force)
+            if _trace.on:
+                _trace('get_bolt_grade', bolt_grade_provided=self.bolt.bolt_grade_provided,
+                       bolt_capacity=self.bolt.bolt_capacity, bolt_force=self.flange_plate.bolt_force)
 
             bolt_capacity_reduced_flange = self.flange_plate.get_bolt_red(self.flange_plate.bolts_one_line,
                                                                           self.flange_plate.gauge_provided,self.web_plate.bolt_line,self.web_plate.pitch_provided,
@@ -2029,8 +2019,9 @@ class BeamCoverPlate(MomentConnection):
                 self.flange_plate.tension_capacity_flange_plate = min(self.flange_plate.tension_yielding_capacity,
                                                     self.flange_plate.tension_rupture_capacity,
                                                     self.flange_plate.block_shear_capacity)
-                print ("flange_force",self.flange_force)
-                print(self.flange_plate.tension_capacity_flange_plate, "tension_capacity_flange_plate")
+                if _trace.on:
+                    _trace('flange_plate_check', flange_force=self.flange_force,
+                           tension_capacity_flange_plate=self.flange_plate.tension_capacity_flange_plate)
                 if  self.flange_plate.tension_capacity_flange_plate < self.flange_force:
                     # self.flange_plate_check_status = False
                     if len(self.flange_plate.thickness) >= 2:
@@ -2176,7 +2167,8 @@ class BeamCoverPlate(MomentConnection):
                                                                                     A_tn=Atn,
                                                                                     f_u=self.web_plate.fu,
                                                                                     f_y=self.web_plate.fy)
-            print("block_shear_strength_section",self.web_plate.block_shear_capacity )
+            if _trace.on:
+                _trace('web_plate_axial_check', block_shear_strength_section=self.web_plate.block_shear_capacity)
             self.web_plate.block_shear_capacity = 2 * self.web_plate.block_shear_capacity
             if self.web_plate.block_shear_capacity < self.axial_force_w:
                 if self.web_bolt.max_spacing_round >= pitch + 5 and self.web_bolt.max_end_dist_round >= end_dist + 5:  # increase thickness todo
@@ -2343,7 +2335,8 @@ class BeamCoverPlate(MomentConnection):
 
         self.min_plate_length = (((self.flange_plate.bolt_line / 2 - 1) * self.flange_bolt.min_pitch) +
                                  (2*self.flange_bolt.min_end_dist) + (self.flange_plate.gap/2))
-        print("self.min_plate_length",self.min_plate_length)
+        if _trace.on:
+            _trace('web_shear_plate_check', min_plate_length=self.min_plate_length)
         if self.preference =="Outside":
             self.flange_out_plate_tk = self.flange_plate.thickness_provided
             self.flange_in_plate_tk =0.0
@@ -2360,29 +2353,20 @@ class BeamCoverPlate(MomentConnection):
             self.plate_in_len = self.flange_plate.Innerlength
 
         # print("anjali", self.anjali)
-        print(self.section)
-        print(self.load)
-        print(self.flange_bolt)
-        print(self.flange_plate)
-        print(self.web_bolt)
-        print(self.web_plate)
-        print(self.web_plate.thickness_provided)
-        print(self.flange_plate.thickness_provided)
+        if _trace.on:
+            _trace('web_shear_plate_check', section=self.section, load=self.load, flange_bolt=self.flange_bolt,
+                   flange_plate=self.flange_plate, web_bolt=self.web_bolt, web_plate=self.web_plate,
+                   web_plate_thickness=self.web_plate.thickness_provided,
+                   flange_plate_thickness=self.flange_plate.thickness_provided)
         #print(design_status)
-        print(self.flange_plate.length )
-        print(self.web_plate.length )
-        print(self.flange_plate.bolts_required )
-        print(self.web_plate.bolts_required )
-        print("bolt dia",self.flange_bolt.bolt_diameter_provided)
-        print("flange_plate.Innerlength", self.flange_plate.Innerlength)
-        print("flange_plate.Innerheight", self.flange_plate.Innerheight)
-        print("flange_plate.gap", self.flange_plate.gap)
-        print(self.web_plate.length)
-        print("webplategap", self.web_plate.gap)
-
-        print( "self.flange_plate.midgauge" , self.flange_plate.midgauge)
-        print( "self.web_plate.midpitch" ,self.web_plate.midpitch)
-        print( "self.flange_plate.midpitch" ,  self.flange_plate.midpitch)
+        if _trace.on:
+            _trace('web_shear_plate_check', flange_plate_length=self.flange_plate.length,
+                   web_plate_length=self.web_plate.length, flange_bolts_required=self.flange_plate.bolts_required,
+                   web_bolts_required=self.web_plate.bolts_required, bolt_dia=self.flange_bolt.bolt_diameter_provided,
+                   flange_plate_innerlength=self.flange_plate.Innerlength,
+                   flange_plate_innerheight=self.flange_plate.Innerheight, flange_plate_gap=self.flange_plate.gap,
+                   web_plate_gap=self.web_plate.gap, flange_plate_midgauge=self.flange_plate.midgauge,
+                   web_plate_midpitch=self.web_plate.midpitch, flange_plate_midpitch=self.flange_plate.midpitch)
 
         # if self.design_status == True:
         #
@@ -2615,7 +2599,8 @@ class BeamCoverPlate(MomentConnection):
                 else:
                     class_of_section1 = "N/A"
 
-        print("class_of_section", class_of_section1)
+        if _trace.on:
+            _trace('limiting_width_thk_ratio', class_of_section=class_of_section1)
         if class_of_section1 == "plastic":
             class_of_section1 = 1
         elif class_of_section1 == "compact":
@@ -2624,8 +2609,8 @@ class BeamCoverPlate(MomentConnection):
             class_of_section1 = 3
         # else:
         #     print('fail')
-        print("class_of_section2", class_of_section1)
-        print("class_of_section1", class_of_section1)
+        if _trace.on:
+            _trace('limiting_width_thk_ratio', class_number=class_of_section1)
         return class_of_section1
 
     def min_thick_based_on_area(self, tk, width, list_of_pt_tk, t_w, r_1, D,
@@ -3471,7 +3456,8 @@ class BeamCoverPlate(MomentConnection):
             web_bolt_force_kn = round(self.web_plate.bolt_force / 1000, 2)
             web_bolt_capacity_red_kn = round(self.web_plate.bolt_capacity_red / 1000, 2)
             res_force = self.web_plate.bolt_force * self.web_plate.bolt_line * self.web_plate.bolts_one_line
-            print("res_focce", res_force)
+            if _trace.on:
+                _trace('save_design', res_force=res_force)
 
             t1 = ('SubSection', 'Web Bolt Check', '|p{2.5cm}|p{5.6cm}|p{6.4cm}|p{1.5cm}|')
 
@@ -4036,7 +4022,6 @@ class BeamCoverPlate(MomentConnection):
         #config.read_file(open(r'Osdag.config'))
         #desktop_path = config.get("desktop_path", "path1")
         #print("desk:", desktop_path)
-        print(sys.path[0])
         rel_path = str(sys.path[0])
         rel_path = rel_path.replace("\\", "/")
 
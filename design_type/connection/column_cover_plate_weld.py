@@ -20,6 +20,10 @@ from design_report.reportGenerator_latex import CreateLatex
 from Report_functions import *
 
 import logging
+from utils.common.logs import setup_logger
+from utils.common import trace
+
+_trace = trace.channel('column_cover_plate_weld')
 
 
 class ColumnCoverPlateWeld(MomentConnection):
@@ -220,26 +224,7 @@ class ColumnCoverPlateWeld(MomentConnection):
 
         # @author Arsil Zunzunia
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                                          datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def preference_type(self):
 
@@ -1257,7 +1242,8 @@ class ColumnCoverPlateWeld(MomentConnection):
         else:
             pass
         self.flangespace = max(15, (self.flange_weld.size + 5))
-        print("space", self.flangespace)
+        if _trace.on:
+            _trace('flange_plate_weld', space=self.flangespace)
         self.axial_force_f = self.factored_axial_load * self.section.flange_width * self.section.flange_thickness / (
             self.section.area)
         self.flange_force = (((self.moment_flange) / (self.section.depth - self.section.flange_thickness)) + (
@@ -1311,7 +1297,8 @@ class ColumnCoverPlateWeld(MomentConnection):
             if self.flange_weld.strength_red > self.flange_weld.stress:
                 self.flange_plate_weld_status = True
                 self.flange_weld.length = round_up(self.available_long_flange_length, 5)
-                print("self.flange_weld.length", self.flange_weld.length)
+                if _trace.on:
+                    _trace('flange_plate_weld', flange_weld_length=self.flange_weld.length)
                 self.flange_plate.length = (2 * (self.available_long_flange_length + (2 * self.flange_weld.size))
                                             + self.flange_plate.gap)
                 self.flange_plate.height = round_down((self.section.flange_width - (2 * self.flangespace)), 5)
@@ -1645,23 +1632,14 @@ class ColumnCoverPlateWeld(MomentConnection):
         else:
             self.plate_out_len = self.flange_plate.length
             self.plate_in_len = self.flange_plate.Innerlength
-        print(self.section)
-        print(self.load)
-        print("Outside Flange PLate")
-        print(self.flange_weld)
-        print(self.flange_plate)
-        print("Web  PLate")
-        print(self.web_weld)
-        print(self.web_plate)
-        print("flangegap", self.flange_plate.gap)
-        print("webgap", self.web_plate.gap)
-        print("A", self.load.axial_force)
-        print("min_ac", self.min_axial_load / 1000)
-        print("axial_capacity", self.axial_capacity / 1000)
-        print("app_axial_load", self.factored_axial_load / 1000)
+        if _trace.on:
+            _trace('cap_blockcheck_web_axial', section=self.section, load=self.load, flange_weld=self.flange_weld,
+                   flange_plate=self.flange_plate, web_weld=self.web_weld, web_plate=self.web_plate,
+                   flange_plate_gap=self.flange_plate.gap, web_plate_gap=self.web_plate.gap,
+                   axial_force=self.load.axial_force, min_axial_load=self.min_axial_load / 1000,
+                   axial_capacity=self.axial_capacity / 1000, factored_axial_load=self.factored_axial_load / 1000)
         # print(self.web_plate.thickness_provided)
         # print(self.flange_plate.thickness_provided)
-        print("Inside PLate")
 
         ################################ Extra Functions  #####################################################################################
 
@@ -1865,7 +1843,8 @@ class ColumnCoverPlateWeld(MomentConnection):
                 else:
                     class_of_section1 = "N/A"
 
-        print("class_of_section", class_of_section1)
+        if _trace.on:
+            _trace('limiting_width_thk_ratio', class_of_section=class_of_section1)
         if class_of_section1 == "plastic":
             class_of_section1 = 1
         elif class_of_section1 == "compact":
@@ -1874,12 +1853,11 @@ class ColumnCoverPlateWeld(MomentConnection):
             class_of_section1 = 3
         # else:
         #     print('fail')
-        print("class_of_section2", class_of_section1)
+        if _trace.on:
+            _trace('limiting_width_thk_ratio', class_number=class_of_section1)
 
         return class_of_section1
 
-        print("class_of_section1", class_of_section1)
-
     def min_thick_based_on_area(self, tk, width, list_of_pt_tk, t_w, r_1, D,
                                 preference=None,
                                 fp_thk=None):  # area of flange plate should be greater than 1.05 times area of flange
@@ -17,7 +17,11 @@ from Common import *
 from Report_functions import *
 
 import logging
+from utils.common.logs import setup_logger
 from utils.common.load import Load
+from utils.common import trace
+
+_trace = trace.channel('column_end_plate')
 
 
 class ColumnEndPlate(MomentConnection):
@@ -229,31 +233,7 @@ class ColumnEndPlate(MomentConnection):
         Function to set Logger for FinPlate Module
         """
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        # handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        # handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        # handler.setLevel(logging.INFO)
-        # formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-        # handler.setFormatter(formatter)
-        # logger.addHandler(handler)
-        if key is not None:
-            handler = OurLog(key)
-            # handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def module_name(self):
         return KEY_DISP_COLUMNENDPLATE
@@ -627,7 +607,8 @@ class ColumnEndPlate(MomentConnection):
 
     def set_input_values(self, design_dictionary):
 
-        print(design_dictionary)
+        if _trace.on:
+            _trace('inputs', design_dictionary)
 
         super(ColumnEndPlate, self).set_input_values(self, design_dictionary)
 
@@ -650,7 +631,8 @@ class ColumnEndPlate(MomentConnection):
         #     self.commLogicObj = CommonDesignLogic(window.display, window.folder, self.module, self.mainmodule)
         #     status = self.design_status
         #     self.commLogicObj.call_3DModel(status, ColumnEndPlate)
-        print("Input values are set. Doing preliminary member checks")
+        if _trace.on:
+            _trace('inputs_set')
         self.member_capacity(self)
 
     def member_capacity(self):
@@ -694,7 +676,8 @@ class ColumnEndPlate(MomentConnection):
                                                                            column_area=self.section.area,
                                                                            compression_element="External",
                                                                            section="Rolled")
-            print("limitwidththkratio_flange", self.limitwidththkratio_flange)
+            if _trace.on:
+                _trace('member_capacity', limitwidththkratio_flange=self.limitwidththkratio_flange)
         else:
             pass
 
@@ -708,7 +691,8 @@ class ColumnEndPlate(MomentConnection):
                                                                         column_area=self.section.area,
                                                                         compression_element="Web of an I-H",
                                                                         section="generally")
-            print("limitwidththkratio_web", self.limitwidththkratio_web)
+            if _trace.on:
+                _trace('member_capacity', limitwidththkratio_web=self.limitwidththkratio_web)
 
         else:
             pass
@@ -717,7 +701,8 @@ class ColumnEndPlate(MomentConnection):
         self.Z_p = self.section.plast_sec_mod_z
         self.Z_e = self.section.elast_sec_mod_z
         self.class_of_section = int(max(self.limitwidththkratio_flange, self.limitwidththkratio_web))
-        print("class of section",self.class_of_section)
+        if _trace.on:
+            _trace('member_capacity', class_of_section=self.class_of_section)
         # if self.class_of_section == 1 or self.class_of_section == 2:
         #     Z_w = self.Z_p
         # elif self.class_of_section == 3:
@@ -816,9 +801,9 @@ class ColumnEndPlate(MomentConnection):
                     logger.info(" : =========End of Design===========")
                 else:
                     self.member_capacity_status = True
-                    print("axial load", self.factored_axial_load)
-                    print("shear load", self.fact_shear_load)
-                    print("moment", self.load_moment)
+                    if _trace.on:
+                        _trace('member_capacity', axial_load=self.factored_axial_load, shear_load=self.fact_shear_load,
+                               moment=self.load_moment)
 
                     self.get_bolt_diam(self)
 
@@ -858,7 +843,8 @@ class ColumnEndPlate(MomentConnection):
 
             self.pitch = IS800_2007.cl_10_2_2_min_spacing(x)
             self.end_dist = round_up(IS800_2007.cl_10_2_4_2_min_edge_end_dist(x,self.bolt.bolt_hole_type,self.bolt.edge_type),5)
-            print("Bolt diam: ", x,"Pitch: ",self.pitch,"End-dist: ",self.end_dist)
+            if _trace.on:
+                _trace('get_bolt_diam', bolt_diam=x, pitch=self.pitch, end_dist=self.end_dist)
 
         ########## no of bolts along each side of web and flange  ##################
             """
@@ -896,7 +882,8 @@ class ColumnEndPlate(MomentConnection):
             if self.n_bw == 1:
                 continue
 
-            print("no bolts web: ",self.n_bw, "no bolts flange: ",self.n_bf)
+            if _trace.on:
+                _trace('get_bolt_diam', no_bolts_web=self.n_bw, no_bolts_flange=self.n_bf)
 
             if self.connection == 'Flush End Plate':
                 # if self.n_bf == 1:
@@ -911,7 +898,8 @@ class ColumnEndPlate(MomentConnection):
                     self.no_bolts = self.n_bw * 2 + (self.n_bf-1) * 4 + self.n_bf*4
                 # elif self.n_bf > 1:
                 #     self.no_bolts = self.n_bw * 2 + (self.n_bf-1) * 4 + self.n_bf*4
-            print("no of bolts: ", self.no_bolts)
+            if _trace.on:
+                _trace('get_bolt_diam', no_of_bolts=self.no_bolts)
 
         ######### pitch 2 along web  ##################
             if self.n_bw % 2 == 0:
@@ -927,7 +915,8 @@ class ColumnEndPlate(MomentConnection):
                 else:
                     self.p_2_web = (self.section.depth - (2 * self.section.flange_thickness) - (
                             2 * self.end_dist) - ((self.n_bw - 3) * self.pitch)) / 2
-            print("p_2_web: ", self.p_2_web,"p_2_flange: ",self.p_2_flange)
+            if _trace.on:
+                _trace('get_bolt_diam', p_2_web=self.p_2_web, p_2_flange=self.p_2_flange)
 
         ############# y_max and y square ################
             """
@@ -937,7 +926,8 @@ class ColumnEndPlate(MomentConnection):
                 self.y_max = self.section.depth - 3/2 * self.section.flange_thickness - self.end_dist
             else:
                 self.y_max = self.section.depth - self.section.flange_thickness/2 + self.end_dist
-            print("y_max",self.y_max)
+            if _trace.on:
+                _trace('get_bolt_diam', y_max=self.y_max)
 
             if self.connection == 'Flush End Plate':
                 if self.n_bw % 2 == 0:
@@ -949,7 +939,8 @@ class ColumnEndPlate(MomentConnection):
                     else:
 
                         self.y_sqr1 = self.n_bf * (self.section.flange_thickness/2 + self.end_dist)**2
-                        print("y_sqr1",self.y_sqr1)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr1=self.y_sqr1)
 
                         self.y_sqr2 = 0
                         for i in range(1,int(self.n_bw/2)):
@@ -957,10 +948,12 @@ class ColumnEndPlate(MomentConnection):
                             self.y_sqr2 = self.y_sqr2 + self.y_sq2
                         # return self.y_sqr2
 
-                        print("y_sqr2", self.y_sqr2)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr2=self.y_sqr2)
 
                         self.y_sqr3 = (self.section.flange_thickness/2 + self.end_dist + ((self.n_bw/2)-1) * self.pitch + self.p_2_web)**2
-                        print("y_sqr3", self.y_sqr3)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr3=self.y_sqr3)
 
                         self.y_sqr4 = 0
                         for i in range(1, int(self.n_bw/2)):
@@ -968,10 +961,12 @@ class ColumnEndPlate(MomentConnection):
                             self.y_sqr4 = self.y_sqr4 + self.y_sq4
 
                         self.y_sqr4 = self.y_sqr4 + (self.n_bf -1) * self.y_sq4
-                        print("y_sqr4", self.y_sqr4)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr4=self.y_sqr4)
 
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4)
-                    print("y_sqr", self.y_sqr)
+                    if _trace.on:
+                        _trace('get_bolt_diam', y_sqr=self.y_sqr)
                 else:
                     # TODO: This part can be removed
                     if self.n_bw == 3:
@@ -982,7 +977,8 @@ class ColumnEndPlate(MomentConnection):
                     else:
 
                         self.y_sqr1 = self.n_bf * (self.section.flange_thickness / 2 + self.end_dist) ** 2
-                        print("y_sqr1",self.y_sqr1)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr1=self.y_sqr1)
 
                         self.y_sqr2 = 0
                         for i in range(1,int(self.n_bw/2 - 0.5)):
@@ -1002,10 +998,12 @@ class ColumnEndPlate(MomentConnection):
                             self.y_sqr5 = self.y_sqr5 + self.y_sq5
 
                         self.y_sqr5 = self.y_sqr5 + (self.n_bf - 1) * self.y_sq5
-                        print("y_sqr5",self.y_sqr5)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr5=self.y_sqr5)
 
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4 + self.y_sqr5)
-                    print("y_sqr",self.y_sqr)
+                    if _trace.on:
+                        _trace('get_bolt_diam', y_sqr=self.y_sqr)
             else:
                 if self.n_bw % 2 == 0:
                     # TODO: minimum no of bolts rows for extended end plate is 4
@@ -1018,7 +1016,8 @@ class ColumnEndPlate(MomentConnection):
                     else:
 
                         self.y_sqr1 = self.n_bf * (self.section.flange_thickness / 2 + self.end_dist) ** 2
-                        print("y_sqr1", self.y_sqr1)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr1=self.y_sqr1)
 
                         self.y_sqr2 = 0
                         for i in range(1, int(self.n_bw / 2)):
@@ -1037,12 +1036,14 @@ class ColumnEndPlate(MomentConnection):
                             self.y_sqr4 = self.y_sqr4 + self.y_sq4
 
                         self.y_sqr4 = self.y_sqr4 + (self.n_bf - 1) * self.y_sq4
-                        print("y_sqr4", self.y_sqr4)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr4=self.y_sqr4)
 
                         self.y_sqr5 = self.n_bf * (1.5 * self.section.flange_thickness + 3 * self.end_dist + (self.n_bw - 2)*self.pitch + self.p_2_web) ** 2
 
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4 + self.y_sqr5)
-                    print("y_sqr", self.y_sqr)
+                    if _trace.on:
+                        _trace('get_bolt_diam', y_sqr=self.y_sqr)
                 else:
                     # TODO: This part can be removed
                     if self.n_bw == 3:
@@ -1054,21 +1055,25 @@ class ColumnEndPlate(MomentConnection):
                     else:
 
                         self.y_sqr1 = self.n_bf * (self.section.flange_thickness / 2 + self.end_dist) ** 2
-                        print("y_sqr1", self.y_sqr1)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr1=self.y_sqr1)
 
                         self.y_sqr2 = 0
                         for i in range(1, int(self.n_bw / 2 - 0.5)):
                             self.y_sq2 = (self.section.flange_thickness / 2 + self.end_dist + i * self.pitch) ** 2
                             self.y_sqr2 = self.y_sqr2 + self.y_sq2
-                        print("y_sqr2", self.y_sqr2)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr2=self.y_sqr2)
 
                         self.y_sqr3 = (self.section.flange_thickness / 2 + self.end_dist + (
                                     (self.n_bw / 2) - 1.5) * self.pitch + self.p_2_web) ** 2
-                        print("y_sqr3", self.y_sqr3)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr3=self.y_sqr3)
 
                         self.y_sqr4 = (self.section.flange_thickness / 2 + self.end_dist + (
                                     (self.n_bw / 2) - 1.5) * self.pitch + 2 * self.p_2_web) ** 2
-                        print("y_sqr4", self.y_sqr4)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr4=self.y_sqr4)
 
                         self.y_sqr5 = 0
                         for i in range(1, int(self.n_bw / 2 - 0.5)):
@@ -1077,12 +1082,14 @@ class ColumnEndPlate(MomentConnection):
                             self.y_sqr5 = self.y_sqr5 + self.y_sq5
 
                         self.y_sqr5 = self.y_sqr5 + (self.n_bf - 1) * self.y_sq5
-                        print("y_sqr5", self.y_sqr5)
+                        if _trace.on:
+                            _trace('get_bolt_diam', y_sqr5=self.y_sqr5)
 
                         self.y_sqr6 = self.n_bf * (1.5 * self.section.flange_thickness + 3 * self.end_dist + (self.n_bw - 3)*self.pitch + 2 * self.p_2_web) ** 2
 
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4 + self.y_sqr5 + self.y_sqr6)
-                    print("y_sqr", self.y_sqr)
+                    if _trace.on:
+                        _trace('get_bolt_diam', y_sqr=self.y_sqr)
 
 
             self.t_b = round((self.factored_axial_load / self.no_bolts) + (self.load_moment * self.y_max) / self.y_sqr,2)
@@ -1090,22 +1097,23 @@ class ColumnEndPlate(MomentConnection):
             self.bolt.calculate_bolt_tension_capacity(bolt_diameter_provided=x,bolt_grade_provided=(self.bolt.bolt_grade[-1]))
 
 
-            print("T_b: ",self.t_b,"Bolt tension capacity: ",self.bolt.bolt_tension_capacity)
+            if _trace.on:
+                _trace('get_bolt_diam', t_b=self.t_b, bolt_tension_capacity=self.bolt.bolt_tension_capacity)
             if self.t_b < self.bolt.bolt_tension_capacity:
                 # self.lst1.append(x)
                 # self.lst2.append(self.no_bolts)
                 if previous_size is None:
                     self.lst1.append(x)
                     self.lst2.append(self.no_bolts)
-                    print("List1, List2",self.lst1,self.lst2)
+                    if _trace.on:
+                        _trace('get_bolt_diam', lst1=self.lst1, lst2=self.lst2)
                 else:
                     # self.prev_dia = (previous_size)
                     if previous_size != x and previous_size > x:
                         self.lst1.append(x)
                         self.lst2.append(self.no_bolts)
-                        print("after prev size, lst1, lst2",self.lst1,self.lst2)
-                        print("excluded diam",previous_size)
-                        print(self.lst1)
+                        if _trace.on:
+                            _trace('get_bolt_diam', lst1=self.lst1, lst2=self.lst2, excluded_diam=previous_size)
                         # self.lst1.pop(self.prev_dia)
                     else:
                         pass
@@ -1117,11 +1125,10 @@ class ColumnEndPlate(MomentConnection):
             self.key_min = min(self.res, key=self.res.get)
             self.bolt_diam_provided = self.key_min
             # return self.bolt_diam_provided
-            print("diam list", self.lst1)
-            print("no of bolts list", self.lst2)
-            print("dict", self.res)
-            print("Bolt diam prov", self.bolt_diam_provided)
-            print("Selecting bolt grade")
+            if _trace.on:
+                _trace('get_bolt_diam', diam_list=self.lst1, no_of_bolts_list=self.lst2, res=self.res,
+                       bolt_diam_prov=self.bolt_diam_provided)
+                _trace('selecting_bolt_grade')
             # self.get_bolt_grade(self)
             self.design_status = True
             self.bolt_dia_status = True
@@ -1166,7 +1173,8 @@ class ColumnEndPlate(MomentConnection):
         for x in reversed(self.bolt.bolt_grade):
             self.pitch = IS800_2007.cl_10_2_2_min_spacing(self.bolt_diam_provided)
             self.end_dist = round_up(IS800_2007.cl_10_2_4_2_min_edge_end_dist(self.bolt_diam_provided,self.bolt.bolt_hole_type,self.bolt.edge_type),5)
-            print("Bolt diam: ", self.bolt_diam_provided,"Pitch: ",self.pitch,"End-dist: ",self.end_dist)
+            if _trace.on:
+                _trace('get_bolt_grade', bolt_diam=self.bolt_diam_provided, pitch=self.pitch, end_dist=self.end_dist)
 
             ########## no of bolts along each side of web and flange  ##################
 
@@ -1199,9 +1207,8 @@ class ColumnEndPlate(MomentConnection):
                 self.n_bf_output = self.n_bf * 8
 
             # print("n_bf",self.n_bf)
-            print("In bolt grade loop, grade = ", x)
-
-            print("no bolts web", self.n_bw, "no bolts flange", self.n_bf)
+            if _trace.on:
+                _trace('get_bolt_grade', grade=x, no_bolts_web=self.n_bw, no_bolts_flange=self.n_bf)
 
             #############################################################
             ##  added images to reflect in output dock
@@ -1255,7 +1262,8 @@ class ColumnEndPlate(MomentConnection):
                 else:
                     # if self.n_bf == 1:
                     self.no_bolts = self.n_bw * 2 + (self.n_bf - 1) * 4 + self.n_bf * 4
-            print("no of bolts", self.no_bolts)
+            if _trace.on:
+                _trace('get_bolt_grade', no_of_bolts=self.no_bolts)
 
             ######### pitch 2 along web  ##################
             if self.n_bw % 2 == 0:
@@ -1268,7 +1276,8 @@ class ColumnEndPlate(MomentConnection):
                     self.p_2_web = ((self.section.depth) - (2 * self.section.flange_thickness) - (2 * self.end_dist)) / 2
                 else:
                     self.p_2_web = (self.section.depth - (2 * self.section.flange_thickness) - (2 * self.end_dist) - ((self.n_bw - 3) * self.pitch)) / 2
-            print("p_2_web_prov", self.p_2_web, "p_2_flange_prov", self.p_2_flange)
+            if _trace.on:
+                _trace('get_bolt_grade', p_2_web_prov=self.p_2_web, p_2_flange_prov=self.p_2_flange)
 
 
             ############# y_max and y square ################
@@ -1280,7 +1289,8 @@ class ColumnEndPlate(MomentConnection):
                 self.y_max = self.section.depth - 3 / 2 * self.section.flange_thickness - self.end_dist
             else:
                 self.y_max = self.section.depth - self.section.flange_thickness / 2 + self.end_dist
-            print("y_max", self.y_max)
+            if _trace.on:
+                _trace('get_bolt_grade', y_max=self.y_max)
 
             if self.connection == 'Flush End Plate':
                 if self.n_bw % 2 == 0:
@@ -1293,18 +1303,21 @@ class ColumnEndPlate(MomentConnection):
                     else:
 
                         self.y_sqr1 = self.n_bf * (self.section.flange_thickness / 2 + self.end_dist) ** 2
-                        print("y_sqr1", self.y_sqr1)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr1=self.y_sqr1)
 
                         self.y_sqr2 = 0
                         for i in range(1, int(self.n_bw / 2)):
                             self.y_sq2 = (self.section.flange_thickness / 2 + self.end_dist + i * self.pitch) ** 2
                             self.y_sqr2 = self.y_sqr2 + self.y_sq2
                         # return self.y_sqr2
-                        print("y_sqr2", self.y_sqr2)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr2=self.y_sqr2)
 
                         self.y_sqr3 = (self.section.flange_thickness / 2 + self.end_dist + (
                                     (self.n_bw / 2) - 1) * self.pitch + self.p_2_web) ** 2
-                        print("y_sqr3", self.y_sqr3)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr3=self.y_sqr3)
 
                         self.y_sqr4 = 0
                         for i in range(1, int(self.n_bw / 2)):
@@ -1312,10 +1325,12 @@ class ColumnEndPlate(MomentConnection):
                                         (self.n_bw / 2) - 1) * self.pitch + self.p_2_web + i * self.pitch) ** 2
                             self.y_sqr4 = self.y_sqr4 + self.y_sq4
                         self.y_sqr4 = self.y_sqr4 + (self.n_bf - 1) * self.y_sq4
-                        print("y_sqr4", self.y_sqr4)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr4=self.y_sqr4)
 
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4)
-                    print("y_sqr", self.y_sqr)
+                    if _trace.on:
+                        _trace('get_bolt_grade', y_sqr=self.y_sqr)
                 else:
                     # TODO: This part can be removed
                     if self.n_bw == 3:
@@ -1327,21 +1342,25 @@ class ColumnEndPlate(MomentConnection):
                     else:
 
                         self.y_sqr1 = self.n_bf * (self.section.flange_thickness / 2 + self.end_dist) ** 2
-                        print("y_sqr1", self.y_sqr1)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr1=self.y_sqr1)
 
                         self.y_sqr2 = 0
                         for i in range(1, int(self.n_bw / 2 - 0.5)):
                             self.y_sq2 = (self.section.flange_thickness / 2 + self.end_dist + i * self.pitch) ** 2
                             self.y_sqr2 = self.y_sqr2 + self.y_sq2
-                        print("y_sqr2", self.y_sqr2)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr2=self.y_sqr2)
 
                         self.y_sqr3 = (self.section.flange_thickness / 2 + self.end_dist + (
                                     (self.n_bw / 2) - 1.5) * self.pitch + self.p_2_web) ** 2
-                        print("y_sqr3", self.y_sqr3)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr3=self.y_sqr3)
 
                         self.y_sqr4 = (self.section.flange_thickness / 2 + self.end_dist + (
                                     (self.n_bw / 2) - 1.5) * self.pitch + 2 * self.p_2_web) ** 2
-                        print("y_sqr4", self.y_sqr4)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr4=self.y_sqr4)
 
                         self.y_sqr5 = 0
                         for i in range(1, int(self.n_bw / 2 - 0.5)):
@@ -1349,10 +1368,12 @@ class ColumnEndPlate(MomentConnection):
                                         (self.n_bw / 2) - 1.5) * self.pitch + 2 * self.p_2_web + i * self.pitch) ** 2
                             self.y_sqr5 = self.y_sqr5 + self.y_sq5
                         self.y_sqr5 = self.y_sqr5 + (self.n_bf - 1) * self.y_sq5
-                        print("y_sqr5", self.y_sqr5)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr5=self.y_sqr5)
 
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4 + self.y_sqr5)
-                    print("y_sqr", self.y_sqr)
+                    if _trace.on:
+                        _trace('get_bolt_grade', y_sqr=self.y_sqr)
             else:
                 if self.n_bw % 2 == 0:
                     # TODO: minimum no of bolts rows for extended end plate is 4
@@ -1366,18 +1387,21 @@ class ColumnEndPlate(MomentConnection):
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3)
                     else:
                         self.y_sqr1 = self.n_bf * (self.section.flange_thickness / 2 + self.end_dist) ** 2
-                        print("y_sqr1", self.y_sqr1)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr1=self.y_sqr1)
 
                         self.y_sqr2 = 0
 
                         for i in range(1, int(self.n_bw / 2)):
                             self.y_sq2 = (self.section.flange_thickness / 2 + self.end_dist + i * self.pitch) ** 2
                             self.y_sqr2 = self.y_sqr2 + self.y_sq2
-                        print("y_sqr2", self.y_sqr2)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr2=self.y_sqr2)
 
                         self.y_sqr3 = (self.section.flange_thickness / 2 + self.end_dist + (
                                 (self.n_bw / 2) - 1) * self.pitch + self.p_2_web) ** 2
-                        print("y_sqr3", self.y_sqr3)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr3=self.y_sqr3)
 
                         self.y_sqr4 = 0
                         for i in range(1, int(self.n_bw / 2)):
@@ -1385,13 +1409,15 @@ class ColumnEndPlate(MomentConnection):
                                     (self.n_bw / 2) - 1) * self.pitch + self.p_2_web + i * self.pitch) ** 2
                             self.y_sqr4 = self.y_sqr4 + self.y_sq4
                         self.y_sqr4 = self.y_sqr4 + (self.n_bf - 1) * self.y_sq4
-                        print("y_sqr4", self.y_sqr4)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr4=self.y_sqr4)
 
                         self.y_sqr5 = self.n_bf * (1.5 * self.section.flange_thickness + 3 * self.end_dist + (
                                     self.n_bw - 2) * self.pitch + self.p_2_web) ** 2
 
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4 + self.y_sqr5)
-                    print("y_sqr", self.y_sqr)
+                    if _trace.on:
+                        _trace('get_bolt_grade', y_sqr=self.y_sqr)
                 else:
                     # TODO: This part can be removed
                     if self.n_bw == 3:
@@ -1404,22 +1430,26 @@ class ColumnEndPlate(MomentConnection):
                         self.y_sqr = 2 * (self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4)
                     else:
                         self.y_sqr1 = self.n_bf * (self.section.flange_thickness / 2 + self.end_dist) ** 2
-                        print("y_sqr1", self.y_sqr1)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr1=self.y_sqr1)
 
                         self.y_sqr2 = 0
 
                         for i in range(1, int(self.n_bw / 2 - 0.5)):
                             self.y_sq2 = (self.section.flange_thickness / 2 + self.end_dist + i * self.pitch) ** 2
                             self.y_sqr2 = self.y_sqr2 + self.y_sq2
-                        print("y_sqr2", self.y_sqr2)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr2=self.y_sqr2)
 
                         self.y_sqr3 = (self.section.flange_thickness / 2 + self.end_dist + (
                                 (self.n_bw / 2) - 1.5) * self.pitch + self.p_2_web) ** 2
-                        print("y_sqr3", self.y_sqr3)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr3=self.y_sqr3)
 
                         self.y_sqr4 = (self.section.flange_thickness / 2 + self.end_dist + (
                                 (self.n_bw / 2) - 1.5) * self.pitch + 2 * self.p_2_web) ** 2
-                        print("y_sqr4", self.y_sqr4)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr4=self.y_sqr4)
 
                         self.y_sqr5 = 0
                         for i in range(1, int(self.n_bw / 2 - 0.5)):
@@ -1427,14 +1457,16 @@ class ColumnEndPlate(MomentConnection):
                                     (self.n_bw / 2) - 1.5) * self.pitch + 2 * self.p_2_web + i * self.pitch) ** 2
                             self.y_sqr5 = self.y_sqr5 + self.y_sq5
                         self.y_sqr5 = self.y_sqr5 + (self.n_bf - 1) * self.y_sq5
-                        print("y_sqr5", self.y_sqr5)
+                        if _trace.on:
+                            _trace('get_bolt_grade', y_sqr5=self.y_sqr5)
 
                         self.y_sqr6 = self.n_bf * (1.5 * self.section.flange_thickness + 3 * self.end_dist + (
                                     self.n_bw - 3) * self.pitch + 2 * self.p_2_web) ** 2
 
                         self.y_sqr = 2 * (
                                     self.y_sqr1 + self.y_sqr2 + self.y_sqr3 + self.y_sqr4 + self.y_sqr5 + self.y_sqr6)
-                    print("y_sqr", self.y_sqr)
+                    if _trace.on:
+                        _trace('get_bolt_grade', y_sqr=self.y_sqr)
 
             self.t_b = round((self.factored_axial_load / self.no_bolts) + (self.load_moment * self.y_max) / self.y_sqr,2)
 
@@ -1444,7 +1476,8 @@ class ColumnEndPlate(MomentConnection):
         #         self.lst3.append(x)
         #         # self.lst2.append(y)
         # self.bolt_grade_provided = min(self.lst3)
-            print("T_b: ", self.t_b, "Bolt tension capacity: ", self.bolt.bolt_tension_capacity)
+            if _trace.on:
+                _trace('get_bolt_grade', t_b=self.t_b, bolt_tension_capacity=self.bolt.bolt_tension_capacity)
             if self.t_b < self.bolt.bolt_tension_capacity:
                 self.lst3.append(x)
             else:
@@ -1455,11 +1488,13 @@ class ColumnEndPlate(MomentConnection):
             # return self.bolt_diam_provided
             self.bolt.calculate_bolt_tension_capacity(bolt_diameter_provided=self.bolt_diam_provided,
                                                       bolt_grade_provided=self.bolt_grade_provided)
-            print("bolt grade", self.bolt_grade_provided)
+            if _trace.on:
+                _trace('get_bolt_grade', bolt_grade=self.bolt_grade_provided)
             # self.get_bolt_grade(self)
             self.design_status = True
             self.bolt_grade_status = True
-            print("1",self.bolt.bolt_tension_capacity)
+            if _trace.on:
+                _trace('get_bolt_grade', bolt_tension_capacity=self.bolt.bolt_tension_capacity)
             self.plate_details(self)
 
         else:
@@ -1504,7 +1539,8 @@ class ColumnEndPlate(MomentConnection):
                 self.m_ep = self.t_b * self.end_dist
         else:
             self.m_ep = self.t_b * self.end_dist
-        print("m_ep: ",self.m_ep)
+        if _trace.on:
+            _trace('plate_details', m_ep=self.m_ep)
 
         if self.pitch >= self.end_dist*2:
             self.b_eff = self.end_dist*2
@@ -1516,10 +1552,12 @@ class ColumnEndPlate(MomentConnection):
 
         for x in self.plate.thickness:
             self.m_dp = self.b_eff * x**2 * self.plate.fy / (4 * gamma_m0)
-            print("m_dp: ",self.m_dp)
+            if _trace.on:
+                _trace('plate_details', m_dp=self.m_dp)
             if self.m_dp > self.m_ep and x >= self.t_prying:
                 self.lst_pl.append(x)
-                print("plate list",self.lst_pl)
+                if _trace.on:
+                    _trace('plate_details', plate_list=self.lst_pl)
             else:
                 pass
                 # self.design_status = False
@@ -1547,7 +1585,8 @@ class ColumnEndPlate(MomentConnection):
             else:
                 self.v_sb = self.fact_shear_load/ ((2 * self.n_bw) + 4)
 
-            print("V_sb: ", self.v_sb, "Bolt capacity: ", self.bolt.bolt_capacity)
+            if _trace.on:
+                _trace('plate_details', v_sb=self.v_sb, bolt_capacity=self.bolt.bolt_capacity)
 
             if self.v_sb < self.bolt.bolt_capacity:
                 self.lst_4.append(x)
@@ -1563,7 +1602,8 @@ class ColumnEndPlate(MomentConnection):
             self.prying_f = (round(self.t_b/1000 ,2) - (1 * 1.5 * (round(self.f_o/1000,2)) * self.b_e * (self.plate_thickness_provided) ** 4)/(27 *self.le * (self.lv) ** 2))
 
             # return self.bolt_diam_provided
-            print("Plate thickness prov", self.plate_thickness_provided)
+            if _trace.on:
+                _trace('plate_details', plate_thickness_prov=self.plate_thickness_provided)
             # self.get_bolt_grade(self)
             if self.connection == 'Flush End Plate':
                 self.stiff_ht = 0.0
@@ -1608,7 +1648,6 @@ class ColumnEndPlate(MomentConnection):
 
         else:
             previous_diam = (self.bolt_diam_provided)
-            print(type(self.bolt_diam_provided))
             self.get_bolt_diam(self,previous_diam)
             # self.design_status = False
             # logger.error("Plate thickness provided is not satisfied")
@@ -1663,7 +1702,8 @@ class ColumnEndPlate(MomentConnection):
             self.stiff_wt = 0.0
             self.t_s = 0.0
             self.weld_type = "None"
-            print("< 50 loop")
+            if _trace.on:
+                _trace('stiffener', h_s=self.h_s, weld_type=self.weld_type)
         else:
             if self.h_s < 100:
                 self.h_s = 100
@@ -1676,14 +1716,16 @@ class ColumnEndPlate(MomentConnection):
                 self.t_s = self.t_s
                 self.stiff_wt = 2 * self.end_dist
                 self.stiff_ht = self.h_s
-                print(">50, fillet loop")
+                if _trace.on:
+                    _trace('stiffener', h_s=self.h_s, weld_type=self.weld_type)
             else:
                 self.weld_size_prov = 'N/A'
                 self.t_s = self.t_s
                 self.stiff_wt = 2 * self.end_dist
                 self.stiff_ht = self.h_s
                 self.weld_type = "Groove Weld"
-                print(">50, groove loop")
+                if _trace.on:
+                    _trace('stiffener', h_s=self.h_s, weld_type=self.weld_type)
 
         if self.design_status:
             self.bolt_conn_plates_t_fu_fy = []
@@ -1888,7 +1930,8 @@ class ColumnEndPlate(MomentConnection):
                 else:
                     class_of_section1 = "N/A"
 
-        print("class_of_section", class_of_section1)
+        if _trace.on:
+            _trace('limiting_width_thk_ratio', class_of_section=class_of_section1)
         if class_of_section1 == "plastic":
             class_of_section1 = 1
         elif class_of_section1 == "compact":
@@ -1897,12 +1940,11 @@ class ColumnEndPlate(MomentConnection):
             class_of_section1 = 3
         # else:
         #     print('fail')
-        print("class_of_section2", class_of_section1)
+        if _trace.on:
+            _trace('limiting_width_thk_ratio', class_number=class_of_section1)
 
         return class_of_section1
 
-        print("class_of_section1", class_of_section1)
-
     def customized_input(self):
 
         list1 = []
@@ -2346,7 +2388,6 @@ class ColumnEndPlate(MomentConnection):
         # config.read_file(open(r'Osdag.config'))
         # desktop_path = config.get("desktop_path", "path1")
         # print("desk:", desktop_path)
-        print(sys.path[0])
         rel_path = str(sys.path[0])
         rel_path = rel_path.replace("\\", "/")
 
@@ -3,6 +3,9 @@ from utils.common.Section_Properties_Calculator import I_sectional_Properties
 from design_type.main import Main
 from Common import *
 import numpy as np
+from utils.common import trace
+
+_trace = trace.channel('connection')
 
 
 class Connection(Main):
@@ -532,8 +535,8 @@ class Connection(Main):
     ########################################
 
     def func_for_validation(self, design_dictionary):
-        print('input dictionary')
-        print(design_dictionary)
+        if _trace.on:
+            _trace('design_dictionary', design_dictionary=design_dictionary)
         all_errors = []
         self.design_status = False
         flag1 = False
@@ -47,6 +47,10 @@ from Common import *
 from design_report.reportGenerator_latex import CreateLatex
 from Report_functions import *
 import logging
+from utils.common.logs import setup_logger
+from utils.common import trace
+
+_trace = trace.channel('end_plate')
 
 
 class EndPlateConnection(ShearConnection):
@@ -200,28 +204,7 @@ class EndPlateConnection(ShearConnection):
         """
         # @author Arsil Zunzunia
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        # handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        # handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            # handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def module_name(self):
         return KEY_DISP_ENDPLATE
@@ -306,7 +289,8 @@ class EndPlateConnection(ShearConnection):
                            material_grade=design_dictionary[KEY_CONNECTOR_MATERIAL], gap=design_dictionary[KEY_DP_DETAILING_GAP])
         self.weld = Weld(material_g_o=design_dictionary[KEY_DP_WELD_MATERIAL_G_O], fabrication=design_dictionary[KEY_DP_WELD_FAB])
         # self.weld = Weld(size=10, length= 100, material_grade=design_dictionary[KEY_MATERIAL])
-        print("Input values set to perform preliminary member check(s).")
+        if _trace.on:
+            _trace('inputs_set')
         self.member_capacity(self)
 
     def member_capacity(self):
@@ -323,7 +307,8 @@ class EndPlateConnection(ShearConnection):
                     self.load.shear_force = min(round(0.15 * self.supported_section.shear_yielding_capacity / 1000, 0),
                                                 40.0)
 
-                print("Preliminary member check(s) have passed. Checking available bolt diameter(s).")
+                if _trace.on:
+                    _trace('member_checks_passed')
                 self.select_bolt_plate_arrangement(self)
 
             else:
@@ -336,7 +321,8 @@ class EndPlateConnection(ShearConnection):
                     logger.error(" : The tension yielding capacity of the supported section, ({} kN) is less "
                                  "than the factored axial force. Please select a larger section or decrease load."
                                  .format(round(self.supported_section.tension_yielding_capacity/1000, 2)))
-                print("The preliminary member check(s) have failed. Select a large/larger section(s) or decrease load and re-design.")
+                if _trace.on:
+                    _trace('member_checks_failed')
         else:
             if self.supported_section.shear_yielding_capacity / 1000 > self.load.shear_force and \
                     self.supported_section.tension_yielding_capacity / 1000 > self.load.axial_force and \
@@ -349,7 +335,8 @@ class EndPlateConnection(ShearConnection):
                                    "[Ref. IS 800:2007, Cl.10.7].")
                     self.load.shear_force = min(round(0.15 * self.supported_section.shear_yielding_capacity / 1000, 0),
                                                 40.0)
-                print("Preliminary member check(s) have passed. Checking available bolt diameter(s).")
+                if _trace.on:
+                    _trace('member_checks_passed')
                 self.select_bolt_plate_arrangement(self)
 
             else:
@@ -366,7 +353,8 @@ class EndPlateConnection(ShearConnection):
                     logger.error(" : The axial yielding capacity of the supporting section, ({} kN) is less "
                                  "than the factored shear force. Please select a larger section or decrease load."
                                  .format(round(self.supporting_section.tension_yielding_capacity / 1000, 2)))
-                print("The preliminary member check(s) have failed. Select a large/larger section(s) or decrease load and re-design.")
+                if _trace.on:
+                    _trace('member_checks_failed')
 
     def select_bolt_plate_arrangement(self):
         self.output = []
@@ -395,7 +383,8 @@ class EndPlateConnection(ShearConnection):
                                                            + self.supported_section.root_radius, 5) + 10))
             # print("Notch Height:", self.supported_section.notch_ht)
             self.max_plate_height = round(self.supported_section.max_plate_height(self.connectivity, self.supported_section.notch_ht),2)
-            print("Max plate height: ", self.max_plate_height)
+            if _trace.on:
+                _trace('max_plate_height', height=self.max_plate_height)
             # self.res_force = math.sqrt(self.load.shear_force ** 2 + self.load.axial_force ** 2) * 1000
             # if self.connectivity == VALUES_CONN_1[1]:
             self.plate.thickness_check = max(min(self.plate.thickness), math.ceil(self.supported_section.web_thickness))
@@ -427,7 +416,8 @@ class EndPlateConnection(ShearConnection):
             t_sum = self.plate.gap
             for i in self.bolt_conn_plates_t_fu_fy:
                 t_sum = t_sum + i[0]
-            print(t_sum)
+            if _trace.on:
+                _trace('connected_plates_thickness', t_sum=t_sum)
             self.bolt.bolt_diameter_possible = []
             self.bolt.bolt_diameter_not_possible = []
             for d in self.bolt.bolt_diameter:
@@ -435,7 +425,8 @@ class EndPlateConnection(ShearConnection):
                     self.bolt.bolt_diameter_possible.append(d)
                 else:
                     self.bolt.bolt_diameter_not_possible.append(d)
-                    print("Removed bolt dia ", d, " mm from available bolt list for plate thickness ", self.plate.thickness_provided, " mm")
+                    if _trace.on:
+                        _trace('bolt_dia_removed', diameter=d, plate_thickness=self.plate.thickness_provided)
             # if self.connectivity == VALUES_CONN_1[1]:
             #     self.connecting_plates_tk = [self.plate.thickness_provided, self.supported_section.flange_thickness]
             # else:
@@ -485,7 +476,8 @@ class EndPlateConnection(ShearConnection):
                                 self.bolt.bolt_tension_capacity, bolts_required_initial, b_e, l_v,
                                 self.bolt.min_pitch_round, 1.0, 1.0, 1.0)
 
-                        print("Bolts required:", self.bolts_required_IR_LT1)
+                        if _trace.on:
+                            _trace('bolts_required', bolts=self.bolts_required_IR_LT1)
 
                     # return self.bolts_required
                         bolt_rows = self.bolts_required_IR_LT1/2
@@ -551,7 +543,8 @@ class EndPlateConnection(ShearConnection):
                         if self.design_status_bolt is True and self.design_status_plate is True:
                             [available_welds, weld_size_min, weld_size_max] = self.get_available_welds(self,
                                                                                         self.connecting_plates_tk)
-                            print(available_welds)
+                            if _trace.on:
+                                _trace('available_welds', sizes=available_welds)
                             if available_welds:
                                 self.design_weld(self, available_welds)
                                 # if self.weld.design_status is True:
@@ -562,7 +555,8 @@ class EndPlateConnection(ShearConnection):
                             # #         ": For given members and %2.2f mm thick plate, weld sizes should be of range %2.2f mm and  %2.2f mm "
                             # #         % self.plate.thickness_provided % weld_size_min % weld_size_max)
                             # #     logger.info(": Cannot design weld with available welds ")
-                            print("Weld Status: ", self.weld.design_status)
+                            if _trace.on:
+                                _trace('weld_status', status=self.weld.design_status)
                             # if self.weld.design_status is True:
                             plate_width = round_up(self.weld.size * 2 + self.bolt_dist_to_weld * 2 +
                                 self.bolt.min_edge_dist_round * 2 + self.supported_section.web_thickness, 2)
@@ -644,7 +638,8 @@ class EndPlateConnection(ShearConnection):
                                        # total_cost,
                                        count]
                                 self.output.append(row)
-                                print("********* Trial {} ends here *************".format(count))
+                                if _trace.on:
+                                    _trace('trial_end', trial=count)
                             else:
                                 row = [int(bolt_rows),  # 0-Rows of Bolts
                                        int(self.bolt.bolt_diameter_provided),  # 1-Bolt Diameter
@@ -762,8 +757,8 @@ class EndPlateConnection(ShearConnection):
             self.weld.design_status = True
             self.output.sort(key=lambda x: (x[3], x[0], x[1], x[2]))
             self.set_values_to_class(self)
-            print("No of effective trials: ", count)
-            print(self.output[0])
+            if _trace.on:
+                _trace('trials', effective=count, governing=self.output[0])
             if self.output[0][26] == self.output[0][27]:
                 logger.info("The minimum weld size is greater than or equal to the thickness of the thinner connecting plate [Ref. Table 21, "
                             "IS800:2007].")
@@ -904,9 +899,7 @@ class EndPlateConnection(ShearConnection):
         no_bolt = self.plate.bolt_line * self.plate.bolts_one_line
         self.plate.connect_to_database_to_get_fy_fu(self.plate.material, self.plate.thickness_provided)
         self.bolt.bolt_shear = self.load.shear_force * 1000 / no_bolt  # N
-        print("bolt_shear", self.bolt.bolt_shear)
         self.bolt.bolt_tension = self.load.axial_force * 1000 / no_bolt  # N
-        print("bolt_tension", self.bolt.bolt_tension)
         if self.bolt.bolt_type == TYP_FRICTION_GRIP:
             self.bolt.bolt_tensioning = 'Pretensioned'
         # TODO: check available effective width per pair of bolts (b_e)
@@ -916,10 +909,11 @@ class EndPlateConnection(ShearConnection):
                                                                                self.plate.fy,
                                                                                self.bolt.min_end_dist_round,
                                                                                self.bolt.bolt_tensioning)
-        print("bolt_tension_prying", self.bolt.bolt_tension_prying)
         self.comb_bolt_ir = (self.bolt.bolt_shear / (self.bolt.bolt_capacity)) ** 2 + \
                             ((self.bolt.bolt_tension + self.bolt.bolt_tension_prying) / self.bolt.bolt_tension_capacity) ** 2
-        print(self.comb_bolt_ir)
+        if _trace.on:
+            _trace('bolt_forces', shear=self.bolt.bolt_shear, tension=self.bolt.bolt_tension,
+                   prying=self.bolt.bolt_tension_prying, interaction_ratio=self.comb_bolt_ir)
         self.plate.Z_p = self.plate.height * self.plate.thickness_provided ** 2 / 4
         self.plate.Z_e = self.plate.height * self.plate.thickness_provided ** 2 / 6
         # [self.bolt.bolt_shear, self.bolt.bolt_tension, self.bolt.bolt_tension_prying,
@@ -958,7 +952,8 @@ class EndPlateConnection(ShearConnection):
             self.beta_lj = 1.0
             self.beta_lg = 1.0
             self.beta_pk = 1.0
-        print("beta_lj", self.beta_lj)
+        if _trace.on:
+            _trace('long_joint', beta_lj=self.beta_lj)
         col_g = (self.supporting_section.web_thickness / 2 + self.supporting_section.root_radius + self.bolt.min_end_dist_round)
         beam_g = (self.supported_section.web_thickness / 2 + weld_size + self.bolt.min_end_dist_round)
         if col_g > beam_g:
@@ -979,8 +974,8 @@ class EndPlateConnection(ShearConnection):
             self.max_bolts_one_line = int(
                 ((self.plate.height - (2 * self.bolt.min_end_dist_round)) /
                  self.bolt.min_gauge_round) + 1)
-            print("max_bolts_one_line: ", self.max_bolts_one_line)
-            print(bolt_rows, "bolt_rows init")
+            if _trace.on:
+                _trace('plate_check_start', max_bolts_one_line=self.max_bolts_one_line, bolt_rows=bolt_rows)
             while bolt_rows <= self.max_bolts_one_line:
 
                 [pitch, end_dist, self.plate.height, bolt_rows] = \
@@ -989,7 +984,8 @@ class EndPlateConnection(ShearConnection):
                                             self.bolt.max_spacing_round,
                                             self.bolt.max_edge_dist_round,
                                             weld_size_min)
-                print(bolt_rows, "bolt_rows")
+                if _trace.on:
+                    _trace('plate_check_rows', bolt_rows=bolt_rows)
                 [self.plate.plate_moment_capacity, self.plate.shear_capacity,
                  self.plate.plate_block_shear_capacity] = \
                     self.get_plate_capacity(self, self.plate.thickness_provided, self.plate.height, pitch,
@@ -1007,7 +1003,8 @@ class EndPlateConnection(ShearConnection):
                 else:
                     design_status_plate = True
                     break
-            print("design_status_plate: ", design_status_plate)
+            if _trace.on:
+                _trace('plate_check_status', status=design_status_plate)
             if design_status_plate is False:
                 self.plate.height += self.bolt.min_pitch_round
             else:
@@ -1029,7 +1026,8 @@ class EndPlateConnection(ShearConnection):
                 pitch = round_up((plate_h - (2 * edge_dist)) / (bolts_one_line - 1), multiplier=5)
 
             plate_h = pitch * (bolts_one_line - 1) + edge_dist * 2
-            print(plate_h, "plate_h web")
+            if _trace.on:
+                _trace('web_plate_height', height=plate_h)
             if self.bolt.bolt_type == TYP_BEARING:
                 l_j = pitch * (bolts_one_line - 1)
                 t_sum = self.plate.gap
@@ -1071,26 +1069,26 @@ class EndPlateConnection(ShearConnection):
             else:
                 break
 
-        print("web", pitch, edge_dist, plate_h)
+        if _trace.on:
+            _trace('web_bolt_spacing', pitch=pitch, edge_dist=edge_dist, height=plate_h)
         return pitch, edge_dist, plate_h, bolts_one_line
 
     def get_bolt_IR(self, bolt_shear_capacity, bolt_tension_capacity, no_bolt, b_e, l_v, pitch, beta_lj=1.0,
                     beta_lg=1.0, beta_pk=1.0):
         while True:
             self.bolt.bolt_shear = self.load.shear_force * 1000 / no_bolt  # N
-            print("bolt_shear", self.bolt.bolt_shear)
             self.bolt.bolt_tension = self.load.axial_force * 1000 / no_bolt  # N
-            print("bolt_tension", self.bolt.bolt_tension)
             if self.bolt.bolt_type == TYP_FRICTION_GRIP:
                 self.bolt.bolt_tensioning = 'Pretensioned'
             # TODO: check available effective width per pair of bolts (b_e)
             self.bolt.bolt_tension_prying = IS800_2007.cl_10_4_7_bolt_prying_force(self.bolt.bolt_tension, l_v,
                                         0.7*self.bolt.bolt_fu, b_e, self.plate.thickness_provided,
                                         self.plate.fy, self.bolt.min_end_dist_round, self.bolt.bolt_tensioning)
-            print("bolt_tension_prying", self.bolt.bolt_tension_prying)
             self.comb_bolt_ir = (self.bolt.bolt_shear / (bolt_shear_capacity*beta_lj*beta_lg*beta_pk)) ** 2 + \
                            ((self.bolt.bolt_tension + self.bolt.bolt_tension_prying)/bolt_tension_capacity) ** 2
-            print(self.comb_bolt_ir)
+            if _trace.on:
+                _trace('bolt_forces', shear=self.bolt.bolt_shear, tension=self.bolt.bolt_tension,
+                       prying=self.bolt.bolt_tension_prying, interaction_ratio=self.comb_bolt_ir)
             if self.comb_bolt_ir > 1:
                 no_bolt += 2
                 if self.bolt.bolt_type == TYP_BEARING:
@@ -1163,16 +1161,17 @@ class EndPlateConnection(ShearConnection):
                 break
             else:
                 t_weld_req = self.weld.size * self.weld.stress / self.weld.strength
-                print(t_weld_req)
                 available_welds_updated = list([x for x in available_welds if (t_weld_req <= x)])
-                print(available_welds_updated)
+                if _trace.on:
+                    _trace('weld_sizes', thickness_required=t_weld_req, sizes=available_welds_updated)
                 if not available_welds_updated:
                     self.plate.height += 10
                     self.weld.size = available_welds[0]
                     logger.warning('Weld stress is guiding plate height, trying with a length of %2.2f mm' % self.plate.height)
                 else:
                     self.weld.size = available_welds_updated[0]
-        print(self.weld.size, self.weld.length)
+        if _trace.on:
+            _trace('weld', size=self.weld.size, length=self.weld.length)
         if self.weld.strength < self.weld.stress:
             self.weld.t_weld_req = self.weld.size * self.weld.stress / self.weld.strength
             self.weld.design_status = False
@@ -1239,7 +1238,6 @@ class EndPlateConnection(ShearConnection):
         '''
 
         # @author: Umair
-        print(flag)
 
         out_list = []
 
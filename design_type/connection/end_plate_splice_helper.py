@@ -23,6 +23,9 @@ from utils.common.common_calculation import *
 
 import logging
 import math
+from utils.common import trace
+
+_trace = trace.channel('end_plate_splice')
 
 
 class EndPlateSpliceHelper(object):
@@ -362,7 +365,6 @@ class EndPlateSpliceHelper(object):
 
                     summation = r_1
                     for p in range(1, len(row_list), 1):
-                        print(p)
                         summation += self.lever_arm[p] ** 2 / r_1
 
                     self.t_1 = self.load_moment_effective / (self.bolt_column * summation)  # kN, tension in row 1
@@ -626,9 +628,9 @@ class EndPlateSpliceHelper(object):
         self.tension = [round(value_tension, 2) for value_tension in self.tension]
 
         # adding the lists of bolt row and tension
-        print("ROWS BEFORE ADDING {}".format(self.bolt_row))
-        print("ROWS AFTER ADDING {}".format(self.bolt_row + self.bolt_row_web))
-        print("ROWS AT WEB {}".format(self.bolt_row_web))
+        if _trace.on:
+            _trace('bolt_rows', before_adding=self.bolt_row, after_adding=self.bolt_row + self.bolt_row_web,
+                   at_web=self.bolt_row_web)
 
         # Check 4: Total tension
         # r_c = reaction due to tension in all the bolts
@@ -4,6 +4,10 @@ from utils.common.component import *
 from utils.common.material import *
 from Report_functions import *
 import logging
+from utils.common.logs import setup_logger
+from utils.common import trace
+
+_trace = trace.channel('fin_plate')
 
 
 class FinPlateConnection(ShearConnection):
@@ -138,25 +142,7 @@ class FinPlateConnection(ShearConnection):
         # @author Arsil Zunzunia
         # super(FinPlateConnection, FinPlateConnection).set_osdaglogger(key)
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def module_name(self):
         return KEY_DISP_FINPLATE
@@ -451,7 +437,8 @@ class FinPlateConnection(ShearConnection):
                            material_grade=design_dictionary[KEY_CONNECTOR_MATERIAL], gap=design_dictionary[KEY_DP_DETAILING_GAP])
         self.plate.design_status_capacity = False
         self.weld = Weld(material_g_o=design_dictionary[KEY_DP_WELD_MATERIAL_G_O],fabrication = design_dictionary[KEY_DP_WELD_FAB])
-        print("input values are set. Doing preliminary member checks")
+        if _trace.on:
+            _trace('inputs_set')
         self.warn_text(self)
         self.member_capacity(self)
 
@@ -471,14 +458,14 @@ class FinPlateConnection(ShearConnection):
                 self.load.shear_force = min(round(0.15 * self.supported_section.shear_yielding_capacity / 1000, 0),
                                             40.0)
 
-            print("Preliminary member check(s) have passed. Checking available bolt diameter(s).")
+            if _trace.on:
+                _trace('member_checks_passed')
             self.thickness_possible = [i for i in self.plate.thickness if i >= self.supported_section.web_thickness]
 
             if not self.thickness_possible:
                 self.plate.thickness_available = min(self.plate.thickness)
                 logger.error(": The plate thickness should be greater than the web thickness of the suppported section.")
             else:
-                print("Selecting bolt diameter")
                 self.select_bolt_dia(self)
 
         else:
@@ -487,7 +474,8 @@ class FinPlateConnection(ShearConnection):
                            "than the applied load. Define a large/larger section(s) or decrease the load."
                            .format(round(self.supported_section.low_shear_capacity/1000,2),
                                    round(self.supported_section.tension_yielding_capacity/1000,2)))
-            print("The preliminary member check(s) have failed. Select a large/larger section(s) or decrease load and re-design.")
+            if _trace.on:
+                _trace('member_checks_failed')
 
     def select_bolt_dia(self):
         self.min_plate_height = self.supported_section.min_plate_height()
@@ -519,7 +507,9 @@ class FinPlateConnection(ShearConnection):
                                               bolt_grade_provided=self.bolt.bolt_grade_provided,
                                               conn_plates_t_fu_fy=self.bolt_conn_plates_t_fu_fy,
                                               n_planes=1)
-            print("getting web plate details for dia:", self.bolt.bolt_diameter_provided, self.bolt.bolt_grade_provided, self.bolt.bolt_capacity)
+            if _trace.on:
+                _trace('bolt_dia_trial', diameter=self.bolt.bolt_diameter_provided,
+                       grade=self.bolt.bolt_grade_provided, capacity=self.bolt.bolt_capacity)
             self.plate.get_web_plate_details(bolt_dia=self.bolt.bolt_diameter_provided,
                                              web_plate_h_min=self.min_plate_height,
                                              web_plate_h_max=self.max_plate_height,
@@ -568,7 +558,9 @@ class FinPlateConnection(ShearConnection):
                                               conn_plates_t_fu_fy=self.bolt_conn_plates_t_fu_fy,
                                               n_planes=1)
 
-            print("for grade :", self.bolt.bolt_grade_provided, "capacity is:",self.bolt.bolt_capacity,"force is:", self.plate.bolt_force)
+            if _trace.on:
+                _trace('bolt_grade_trial', grade=self.bolt.bolt_grade_provided, capacity=self.bolt.bolt_capacity,
+                       force=self.plate.bolt_force)
 
             bolt_capacity_reduced = self.long_joint_factor*self.bolt.bolt_shear_capacity
             if bolt_capacity_reduced < self.plate.bolt_force and count >= 1:
@@ -588,7 +580,6 @@ class FinPlateConnection(ShearConnection):
                                           bolt_grade_provided=self.bolt.bolt_grade_provided,
                                           conn_plates_t_fu_fy=self.bolt_conn_plates_t_fu_fy,
                                           n_planes=1)
-        print("recalculating web plate details")
         self.plate.get_web_plate_details(bolt_dia=self.bolt.bolt_diameter_provided,
                                          web_plate_h_min=self.plate.height,
                                          web_plate_h_max=self.max_plate_height,
@@ -607,7 +598,8 @@ class FinPlateConnection(ShearConnection):
         self.initial_bearing_capacity = self.bolt.bolt_bearing_capacity
         self.initial_kb = self.bolt.kb
         self.initial_bolt_capacity = self.bolt.bolt_capacity
-        print("1. plate deisign status is ", self.plate.design_status)
+        if _trace.on:
+            _trace('plate_status', plate=self.plate.design_status)
         for self.plate.thickness_provided in self.thickness_possible:
             self.plate.connect_to_database_to_get_fy_fu(grade=self.plate.material,
                                                         thickness=self.plate.thickness_provided)
@@ -955,7 +947,8 @@ class FinPlateConnection(ShearConnection):
                            ' weld size is {} mm.'.format(self.plate.height,self.plate.thickness_provided,self.weld.size))
 
     def get_design_status(self):
-        print("plate design status is ",self.plate.design_status,"weld status is",self.weld.design_status)
+        if _trace.on:
+            _trace('design_status', plate=self.plate.design_status, weld=self.weld.design_status)
         if self.plate.design_status is True and self.weld.design_status is True:
             self.design_status = True
             logger.info("=== End Of Design ===")
@@ -39,6 +39,10 @@ from Report_functions import *
 from Common import *
 from utils.common.load import Load
 import logging
+from utils.common.logs import setup_logger
+from utils.common import trace
+
+_trace = trace.channel('seated_angle')
 
 
 class SeatedAngleConnection(ShearConnection):
@@ -229,31 +233,7 @@ class SeatedAngleConnection(ShearConnection):
 
         # @author Arsil Zunzunia
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        # handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        # handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        # handler.setLevel(logging.INFO)
-        # formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-        # handler.setFormatter(formatter)
-        # logger.addHandler(handler)
-        if key is not None:
-            handler = OurLog(key)
-            # handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def module_name(self):
         return KEY_DISP_SEATED_ANGLE
@@ -694,7 +674,8 @@ class SeatedAngleConnection(ShearConnection):
                 self.load.shear_force = min(round(0.15 * self.supported_section.shear_yielding_capacity / 1000, 0),
                                             40.0)
 
-            print("Preliminary member check(s) have passed. Checking available bolt diameter(s).")
+            if _trace.on:
+                _trace('member_checks_passed')
             self.select_angle_thickness(self)
 
         else:
@@ -707,7 +688,8 @@ class SeatedAngleConnection(ShearConnection):
                 logger.error(" : The tension yielding capacity of the supported section, ({} kN) is less "
                              "than the factored axial force. Please select a larger section or decrease load."
                              .format(round(self.supported_section.tension_yielding_capacity / 1000, 2)))
-            print("The preliminary member check(s) have failed. Select a large/larger section(s) or decrease load and re-design.")
+            if _trace.on:
+                _trace('member_checks_failed')
 
     def select_angle_thickness(self):
         self.plate.thickness = []
@@ -747,7 +729,8 @@ class SeatedAngleConnection(ShearConnection):
             self.design_status = False
 
             self.failed_output.sort(key=lambda x: (-x[1],x[2]))
-            print(self.failed_output)
+            if _trace.on:
+                _trace('select_angle_thickness', failed_output=self.failed_output)
             # self.failed_output.reverse()
             # print(self.failed_output)
             # self.failed_output.sort(key=lambda x: (x[2]))
@@ -874,7 +857,8 @@ class SeatedAngleConnection(ShearConnection):
                 # print("bolt diameter: ", self.bolt_dia_possible)
                 # print("provided bolt diameter: ", self.bolt.bolt_diameter_provided)
                 self.check_leg_size(self, bolt_line)
-                print(self.plate.design_status)
+                if _trace.on:
+                    _trace('get_bolt_details', design_status=self.plate.design_status)
 
                 if self.plate.design_status is True:
                     trial += 1
@@ -898,7 +882,8 @@ class SeatedAngleConnection(ShearConnection):
                            'INSERT_HERE',  # XX- EMPTY
                            trial]
                     output.append(row)
-                    print("********* Trial {} ends here *************".format(trial))
+                    if _trace.on:
+                        _trace('trial_end', trial=trial)
                 else:
                     # if self.bolt.plate_thk_status == True and self.leg_size_checked == True:
                     #     self.check_leg_size(self, bolt_line)
@@ -943,8 +928,8 @@ class SeatedAngleConnection(ShearConnection):
                 continue
 
         if self.bolt_dia_possible and self.plate.design_status is True:
-            print("No of effective trials: ", trial)
-            print(output)
+            if _trace.on:
+                _trace('get_bolt_details', effective_trials=trial, output=output)
             self.select_optimum(self,output)
             self.top_angle_section(self)
             logger.info("=== End Of Design ===")
@@ -1149,9 +1134,9 @@ class SeatedAngleConnection(ShearConnection):
         min_leg_length = (2 * self.bolt.min_end_dist_round + (bolt_line - 1) * self.bolt.min_pitch_round)
         min_leg_b_length = (self.bolt.min_end_dist_round + self.plate.gap + self.bolt.min_edge_dist_round)
         # min_leg_length = max(2*self.bolt.min_end_dist_round + (bolts_one_line - 1) * self.bolt.min_pitch_round, self.seated_angle.leg_a_length_min)
-        print("min_leg_length", min_leg_length)
-        print(self.plate.gap)
-        print("min_leg_b_length", min_leg_b_length)
+        if _trace.on:
+            _trace('check_leg_size', min_leg_length=min_leg_length, gap=self.plate.gap,
+                   min_leg_b_length=min_leg_b_length)
         self.seated_list_same_thickness = self.seated_angle.get_available_seated_list(self.seated_list,
             max_leg_length = math.inf, min_leg_length = min_leg_length, position = "inner", t_min = self.plate.thickness_provided)
 
@@ -1160,11 +1145,13 @@ class SeatedAngleConnection(ShearConnection):
         else:
             for self.seated_angle.designation in self.seated_list_same_thickness:
                 [leg_a_length, leg_b_length, t, r_r] = get_leg_lengths(self.seated_angle.designation)
-                print(leg_a_length, leg_b_length)
+                if _trace.on:
+                    _trace('check_leg_size', leg_a_length=leg_a_length, leg_b_length=leg_b_length)
                 if (leg_a_length - t - r_r) >= min_leg_length and leg_b_length >= min_leg_b_length:
                     self.seated_angle.leg_a_length = leg_a_length
                     self.plate.design_status = True
-                    print(leg_a_length, leg_b_length)
+                    if _trace.on:
+                        _trace('check_leg_size', leg_a_length=leg_a_length, leg_b_length=leg_b_length)
                     break
                 else:
                     self.plate.design_status = False
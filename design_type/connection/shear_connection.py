@@ -6,6 +6,9 @@ from utils.common.load import Load
 from utils.common.material import Material
 from utils.common.common_calculation import *
 from utils.common.is800_2007 import IS800_2007
+from utils.common import trace
+
+_trace = trace.channel('shear_connection')
 
 
 class ShearConnection(Connection):
@@ -577,8 +580,11 @@ class ShearConnection(Connection):
         self.supported_section.tension_yielding_capacity = IS800_2007.cl_6_2_tension_yielding_strength(A_g,
                                                                                                        self.supported_section.fy)
 
-        print(self.supported_section.shear_yielding_capacity, self.load.shear_force,
-              self.supported_section.tension_yielding_capacity, self.load.axial_force)
+        if _trace.on:
+            _trace('member_capacity', shear_yielding=self.supported_section.shear_yielding_capacity,
+                   shear_force=self.load.shear_force,
+                   tension_yielding=self.supported_section.tension_yielding_capacity,
+                   axial_force=self.load.axial_force)
 
         self.supporting_section.tension_yielding_capacity = IS800_2007.cl_6_2_tension_yielding_strength(self.supporting_section.area,
                                                                                                        self.supporting_section.fy)
\ No newline at end of file
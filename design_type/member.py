@@ -117,7 +117,6 @@ class Member(Main):
 
             else:
                 if section_profile == "Back to Back Angles":
-                    print(section_profile, "hjcxhf")
                     Angle_attributes = BBAngle_Properties()
                     Angle_attributes.data(designation, material_grade)
                     if l == "Long Leg":
@@ -644,7 +643,6 @@ class Member(Main):
         else:
             # Angle_attributes = Angle(designation, material_grade)
             if section_profile == "Back to Back Angles":
-                print(section_profile, "hjcxhf")
                 Angle_attributes = BBAngle_Properties()
                 Angle_attributes.data(designation, material_grade)
                 if l == "Long Leg":
@@ -0,0 +1,56 @@
+"""Registry of design modules, keyed by the module name stored in .osi files
+
+Design classes are imported only when first requested, so headless tools
+(sweeps, the design service, exporters) do not pay for importing every
+module up front.
+"""
+import importlib
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+
+DESIGN_MODULES = {
+    KEY_DISP_FINPLATE: ('design_type.connection.fin_plate_connection', 'FinPlateConnection'),
+    KEY_DISP_ENDPLATE: ('design_type.connection.end_plate_connection', 'EndPlateConnection'),
+    KEY_DISP_CLEATANGLE: ('design_type.connection.cleat_angle_connection', 'CleatAngleConnection'),
+    KEY_DISP_SEATED_ANGLE: ('design_type.connection.seated_angle_connection', 'SeatedAngleConnection'),
+    KEY_DISP_BEAMCOVERPLATE: ('design_type.connection.beam_cover_plate', 'BeamCoverPlate'),
+    KEY_DISP_BEAMCOVERPLATEWELD: ('design_type.connection.beam_cover_plate_weld', 'BeamCoverPlateWeld'),
+    KEY_DISP_COLUMNCOVERPLATE: ('design_type.connection.column_cover_plate', 'ColumnCoverPlate'),
+    KEY_DISP_COLUMNCOVERPLATEWELD: ('design_type.connection.column_cover_plate_weld', 'ColumnCoverPlateWeld'),
+    KEY_DISP_BB_EP_SPLICE: ('design_type.connection.beam_beam_end_plate_splice', 'BeamBeamEndPlateSplice'),
+    KEY_DISP_COLUMNENDPLATE: ('design_type.connection.column_end_plate', 'ColumnEndPlate'),
+    KEY_DISP_BCENDPLATE: ('design_type.connection.beam_column_end_plate', 'BeamColumnEndPlate'),
+    KEY_DISP_BASE_PLATE: ('design_type.connection.base_plate_connection', 'BasePlateConnection'),
+    KEY_DISP_TENSION_BOLTED: ('design_type.tension_member.tension_bolted', 'Tension_bolted'),
+    KEY_DISP_TENSION_WELDED: ('design_type.tension_member.tension_welded', 'Tension_welded'),
+    KEY_DISP_COMPRESSION: ('design_type.compression_member.compression', 'Compression'),
+}
+
+_loaded = {}
+
+
+def module_names():
+    """Return the module names that can be designed (list)."""
+    return list(DESIGN_MODULES.keys())
+
+
+def get_module_class(name):
+    """Import (once) and return the design class registered for a module name.
+
+    Args:
+        name: module name as stored under KEY_MODULE in the design dictionary (str)
+
+    Returns:
+        design class, e.g. FinPlateConnection
+
+    Raises:
+        KeyError: if no design module is registered under that name
+    """
+    if name not in _loaded:
+        if name not in DESIGN_MODULES:
+            raise KeyError("No design module registered for '{}'".format(name))
+        module_path, class_name = DESIGN_MODULES[name]
+        _loaded[name] = getattr(importlib.import_module(module_path), class_name)
+    return _loaded[name]
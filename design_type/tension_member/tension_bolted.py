@@ -22,8 +22,11 @@ from utils.common.load import Load
 from utils.common.Section_Properties_Calculator import *
 
 import logging
+from utils.common.logs import setup_logger
+from utils.common import trace
 from design_type.member import Member
 
+_trace = trace.channel('tension_bolted')
 
 
 class Tension_bolted(Member):
@@ -230,25 +233,7 @@ class Tension_bolted(Member):
 
         # @author Arsil Zunzunia
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def module_name(self):
 
@@ -818,7 +803,8 @@ class Tension_bolted(Member):
         # self.inter_status = False
         self.thk_count =0
 
-        print("The input values are set. Performing preliminary member check(s).")
+        if _trace.on:
+            _trace('inputs_set')
         # self.i = 0
 
         self.initial_member_capacity(self,design_dictionary)
@@ -878,7 +864,8 @@ class Tension_bolted(Member):
             sec_area[self.section.designation] = self.section.area
 
 
-        print(sec_gyr)
+        if _trace.on:
+            _trace('sections_by_radius_of_gyration', sec_gyr=sec_gyr)
         if len(sec_area)>=2:
             self.max_area = max(sec_area, key=sec_area.get)
         else:
@@ -1185,7 +1172,8 @@ class Tension_bolted(Member):
             # logger.info(" :=========End Of design===========")
 
         if self.member_design_status == True:
-            print("pass")
+            if _trace.on:
+                _trace('member_design_passed')
             self.design_status = True
             self.select_bolt_dia(self, design_dictionary)
         else:
@@ -1206,7 +1194,8 @@ class Tension_bolted(Member):
                 pass
 
 
-        print(self.section_size_1.designation)
+        if _trace.on:
+            _trace('section_selected', designation=self.section_size_1.designation)
         if design_dictionary[KEY_SEC_PROFILE] in ["Channels", 'Back to Back Channels']:
             self.min_plate_height = self.section_size_1.min_plate_height()
             self.max_plate_height = self.section_size_1.max_plate_height()
@@ -1379,7 +1368,8 @@ class Tension_bolted(Member):
 
         if self.bolt_design_status == True:
             self.design_status = True
-            print("bolt ok")
+            if _trace.on:
+                _trace('bolt_dia_passed', diameter=self.bolt.bolt_diameter_provided)
             self.get_bolt_grade(self, design_dictionary)
 
         else:
@@ -1446,9 +1436,9 @@ class Tension_bolted(Member):
                                                      'machine_flame_cut'), 2)
 
         self.bolt.min_edge_dist_round = round_up(self.bolt.min_edge_dist, 5)
-        print(self.bolt.min_edge_dist_round,self.bolt.max_end_dist,"hfhh")
-
-        print(self.bolt.min_edge_dist_round,self.bolt.min_edge_dist, "gbfhgfbdhhbdg")
+        if _trace.on:
+            _trace('edge_distances', min_edge_dist=self.bolt.min_edge_dist, min_edge_dist_round=self.bolt.min_edge_dist_round,
+                   max_end_dist=self.bolt.max_end_dist)
 
         self.bolt.calculate_bolt_capacity(bolt_diameter_provided=self.bolt.bolt_diameter_provided,
                                           bolt_grade_provided=self.bolt.bolt_grade_provided,
@@ -1495,7 +1485,8 @@ class Tension_bolted(Member):
                                                  shear_ecc=False, min_bolts_one_line=1, min_bolt_line=2,beta_lg=self.bolt.beta_lg,min_end_dist=self.bolt.min_end_dist_round)
 
         self.plate.edge_dist_provided = round(((self.max_plate_height - ((self.plate.bolts_one_line -1) * self.plate.gauge_provided))/2),2)
-        print(self.plate.bolt_line)
+        if _trace.on:
+            _trace('bolt_lines', bolt_line=self.plate.bolt_line)
 
         self.member_check(self, design_dictionary)
 
@@ -1661,7 +1652,8 @@ class Tension_bolted(Member):
             # self.initial_member_capacity(self, design_dictionary, previous_size)
             if len(self.sizelist)>=2:
                 size = self.section_size_1.designation
-                print("recheck",size )
+                if _trace.on:
+                    _trace('recheck_section', designation=size)
                 self.initial_member_capacity(self, design_dictionary, size)
             else:
                 self.design_status = False
@@ -1782,13 +1774,16 @@ class Tension_bolted(Member):
 
             self.plate.tension_blockshear_area_input(A_vg = A_vg, A_vn = A_vn, A_tg = A_tg, A_tn = A_tn, f_u = self.plate.fu, f_y = self.plate.fy)
             self.plate_tension_capacity = min(self.plate.tension_yielding_capacity,self.plate.tension_rupture_capacity,self.plate.block_shear_capacity)
-            print(self.plate.tension_yielding_capacity, self.plate.tension_rupture_capacity,self.plate.block_shear_capacity,"darshan")
+            if _trace.on:
+                _trace('plate_capacity', yielding=self.plate.tension_yielding_capacity,
+                       rupture=self.plate.tension_rupture_capacity, block_shear=self.plate.block_shear_capacity)
 
             if design_dictionary[KEY_SEC_PROFILE] == "Star Angles":
                 max_tension_yield = 2 * self.depth_max * self.plate.fy * max(self.plate.thickness)/ 1.1
             else:
                 max_tension_yield = self.depth_max * self.plate.fy * max(self.plate.thickness)/ 1.1
-            print(max_tension_yield)
+            if _trace.on:
+                _trace('max_plate_yield_capacity', capacity=max_tension_yield)
             if self.plate_tension_capacity > self.res_force:
                 # print(self.plate.tension_yielding_capacity, self.plate.tension_rupture_capacity,self.plate.block_shear_capacity,"darshan")
                 break
@@ -1860,7 +1855,8 @@ class Tension_bolted(Member):
                 logger.info(":=========End Of design===========")
 
             elif (8 * self.bolt.bolt_diameter_provided) > self.comb_thick:
-                print("bolt check")
+                if _trace.on:
+                    _trace('bolt_grip_exceeded', diameter=self.bolt.bolt_diameter_provided, grip=self.comb_thick)
                 status = False
                 while status == False:
                     self.plate.bolt_capacity_red = self.plate.get_bolt_red(self.plate.bolts_one_line,
@@ -1889,7 +1885,8 @@ class Tension_bolted(Member):
                 if len(self.sizelist) >= 2:
                     size = self.section_size_1.designation
                     # dia = self.bolt.bolt_diameter_provided
-                    print("recheck", size)
+                    if _trace.on:
+                        _trace('recheck_section', designation=size)
                     self.initial_member_capacity(self, design_dictionary, size)
 
                 else:
@@ -1900,13 +1897,14 @@ class Tension_bolted(Member):
             else:
                 pass
         else:
-            print(self.plate_tension_capacity, "hsdvdhsd")
+            if _trace.on:
+                _trace('plate_capacity_governs', capacity=self.plate_tension_capacity)
             if self.plate_tension_capacity < max_tension_yield and self.res_force < max_tension_yield:
-                print(self.section_size_1.designation, "hsdvdhsd")
                 # self.initial_member_capacity(self, design_dictionary, previous_size=self.section_size_1.designation)
                 if len(self.sizelist) >= 2:
                     size = self.section_size_1.designation
-                    print("recheck", size)
+                    if _trace.on:
+                        _trace('recheck_section', designation=size)
                     self.initial_member_capacity(self, design_dictionary, size)
                 else:
                     self.design_status = False
@@ -1922,7 +1920,6 @@ class Tension_bolted(Member):
                                .format(round(self.res_force / 1000, 2), round(self.plate_tension_capacity / 1000, 2), max(self.plate.thickness)))
                 logger.error(":Design is unsafe. \n ")
                 logger.info(":=========End Of design===========")
-                print(self.design_status)
 
     def status_pass(self,design_dictionary):
         if (2 * self.plate.length) > self.length:
@@ -1976,7 +1973,6 @@ class Tension_bolted(Member):
     def intermittent_bolt(self, design_dictionary):
         # print(self.bolt.min_edge_dist_round, "gbfhgf")
         # # print(round(self.plate.beta_lj, 2), "hcbvhg")
-        print(self.bolt.max_edge_dist,"ghxvjhshd")
         self.inter_length = self.length - 2 * (self.plate.end_dist_provided + (self.plate.bolt_line -1)*self.plate.pitch_provided)
         if design_dictionary[KEY_SEC_PROFILE] in ['Back to Back Angles', 'Star Angles']:
             # print (Angle)
@@ -2738,7 +2734,6 @@ class Tension_bolted(Member):
         Disp_3D_image = "/ResourceFiles/images/3d.png"
 
 
-        print(sys.path[0])
         rel_path = str(sys.path[0])
         rel_path = rel_path.replace("\\", "/")
 
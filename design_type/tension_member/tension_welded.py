@@ -18,8 +18,12 @@ from Common import *
 from utils.common.load import Load
 from design_type.member import Member
 import logging
+from utils.common.logs import setup_logger
 from utils.common.Section_Properties_Calculator import *
 from design_type.main import Main
+from utils.common import trace
+
+_trace = trace.channel('tension_welded')
 
 
 class Tension_welded(Member):
@@ -225,25 +229,7 @@ class Tension_welded(Member):
 
         # @author Arsil Zunzunia
         global logger
-        logger = logging.getLogger('Osdag')
-
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        handler = logging.FileHandler('logging_text.log')
-
-        formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        if key is not None:
-            handler = OurLog(key)
-            formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        logger = setup_logger(key)
 
     def module_name(self):
 
@@ -706,7 +692,8 @@ class Tension_welded(Member):
         "initialisation of components required to design a tension member along with connection"
 
         super(Tension_welded,self).set_input_values(self, design_dictionary)
-        print(design_dictionary,"input values are set. Doing preliminary member checks")
+        if _trace.on:
+            _trace('inputs', design_dictionary)
         self.module = design_dictionary[KEY_MODULE]
         self.sizelist = design_dictionary[KEY_SECSIZE]
         self.sec_profile = design_dictionary[KEY_SEC_PROFILE]
@@ -727,7 +714,8 @@ class Tension_welded(Member):
         self.weld = Weld(material_g_o=design_dictionary[KEY_DP_WELD_MATERIAL_G_O],
                          fabrication=design_dictionary[KEY_DP_WELD_FAB])
 
-        print("input values are set. Doing preliminary member checks")
+        if _trace.on:
+            _trace('inputs_set')
         # self.i = 0
 
         self.member_design_status = False
@@ -790,7 +778,8 @@ class Tension_welded(Member):
 
             sec_area[self.section.designation] = self.section.area
 
-        print(sec_gyr)
+        if _trace.on:
+            _trace('max_section', sec_gyr=sec_gyr)
         if len(sec_area) >= 2:
             self.max_area = max(sec_area, key=sec_area.get)
         else:
@@ -1048,7 +1037,6 @@ class Tension_welded(Member):
             # logger.info(" :=========End Of design===========")
 
         if self.member_design_status == True:
-            print("pass")
             self.design_status = True
             self.initial_plate_check(self, design_dictionary)
         else:
@@ -1111,7 +1099,8 @@ class Tension_welded(Member):
         "Increasing sectionsize to suffice the plate requirement"
 
         if tension_capacity >=self.res_force:
-            print(self.plate.thickness_provided)
+            if _trace.on:
+                _trace('initial_plate_check', thickness_provided=self.plate.thickness_provided)
             self.thick_design_status = True
             self.design_status = True
             self.select_weld(self, design_dictionary)
@@ -1121,7 +1110,8 @@ class Tension_welded(Member):
                 # self.initial_member_capacity(self, design_dictionary, previous_size=self.section_size_1.designation)
                 if len(self.sizelist) >= 2:
                     size = self.section_size_1.designation
-                    print("recheck", size)
+                    if _trace.on:
+                        _trace('initial_plate_check', recheck=size)
                     self.initial_member_capacity(self, design_dictionary, size)
                 else:
                     self.design_status = False
@@ -1152,7 +1142,8 @@ class Tension_welded(Member):
         self.weld.weld_size(plate_thickness = self.plate.thickness_provided, member_thickness= self.thick , edge_type= "Rolled")
 
         self.get_weld_strength(self,connecting_fu= [self.section_size_1.fu,self.plate.fu,self.weld.fu], weld_fabrication = self.weld.fabrication , t_weld = self.weld.size, force = (self.res_force))
-        print (self.weld.effective, "weld eff")
+        if _trace.on:
+            _trace('select_weld', effective=self.weld.effective)
         self.weld_plate_length(self, design_dictionary)
         self.weld.get_weld_stress(weld_shear=0,weld_axial=self.res_force, l_weld=self.weld.length)
         # print(self.plate.length, self.weld.throat, "xfsf")
@@ -1355,12 +1346,14 @@ class Tension_welded(Member):
             self.get_plate_thickness(self,design_dictionary)
 
         else:
-            print("recheck")
+            if _trace.on:
+                _trace('member_recheck')
             # previous_size = self.section_size_1.designation
             # self.initial_member_capacity(self, design_dictionary, previous_size)
             if len(self.sizelist) >= 2:
                 size = self.section_size_1.designation
-                print("recheck", size)
+                if _trace.on:
+                    _trace('member_recheck', recheck=size)
                 self.initial_member_capacity(self, design_dictionary, size)
             else:
                 self.design_status = False
@@ -1406,7 +1399,10 @@ class Tension_welded(Member):
 
             self.plate.tension_blockshear_area_input(A_vg = A_vg, A_vn = A_vn, A_tg = A_tg, A_tn = A_tn, f_u = self.plate.fu, f_y = self.plate.fy)
             self.plate_tension_capacity = min(self.plate.tension_yielding_capacity,self.plate.tension_rupture_capacity,self.plate.block_shear_capacity)
-            print (self.plate.tension_yielding_capacity, self.plate.tension_rupture_capacity,self.plate.block_shear_capacity)
+            if _trace.on:
+                _trace('get_plate_thickness', tension_yielding_capacity=self.plate.tension_yielding_capacity,
+                       tension_rupture_capacity=self.plate.tension_rupture_capacity,
+                       block_shear_capacity=self.plate.block_shear_capacity)
 
             if self.plate_tension_capacity > self.res_force:
                 self.design_status = True
@@ -2140,7 +2136,6 @@ class Tension_welded(Member):
         Disp_3D_image = "/ResourceFiles/images/3d.png"
 
 
-        print(sys.path[0])
         rel_path = str(sys.path[0])
         rel_path = rel_path.replace("\\", "/")
 
@@ -0,0 +1,210 @@
+"""Design of a module in a worker thread, with its progress shown over the module window
+
+DesignRun runs func_for_validation of a design class in a DesignThread and
+shows a DesignProgressDialog (progress bar, current stage, Cancel) while it
+runs. The progress comes from the checkpoints of utils.common.progress in the
+design's stages and clause checks; Cancel stops the design at its next
+checkpoint, between two candidates. The outcome is handed back on the GUI
+thread through the designed, cancelled and failed signals, where the window
+fills the output dock and builds the 3D model (OCC draws on the GUI thread).
+
+Each run measures the time from the Design button to the first paint of the
+progress dialog and, with a FrameMonitor, the frames the GUI thread missed
+until the window was updated. They are kept in DesignRun.timing and traced on
+the 'gui' channel (OSDAG_TRACE=gui).
+"""
+import sys
+from time import perf_counter
+
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QDialog, QHBoxLayout, QLabel, QProgressBar, QPushButton, QVBoxLayout
+
+from utils.common import trace
+from utils.common.progress import DesignCancelled, DesignProgress
+
+_trace = trace.channel('gui')
+FRAME_INTERVAL = 16     # ms, one frame at 60 Hz
+
+
+class DesignThread(QThread):
+    """Runs func_for_validation of a design class and emits its progress and outcome."""
+    progressed = pyqtSignal(int, str)       # percent done (-1 while unknown), stage
+    designed = pyqtSignal(object)           # what func_for_validation returned (error messages or None)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(object)             # sys.exc_info() of the exception the design raised
+
+    def __init__(self, main, design_inputs, parent=None):
+        super().__init__(parent)
+        self.main = main
+        self.design_inputs = design_inputs
+        self.progress = DesignProgress(main, callback=self._report)
+
+    def _report(self, fraction, stage):
+        self.progressed.emit(-1 if fraction is None else int(fraction * 100), stage or '')
+
+    def cancel(self):
+        self.progress.cancel()
+
+    def run(self):
+        try:
+            with self.progress:
+                error = self.main.func_for_validation(self.main, self.design_inputs)
+        except DesignCancelled:
+            self.cancelled.emit()
+        except Exception:
+            self.failed.emit(sys.exc_info())
+        else:
+            self.designed.emit(error)
+
+
+class DesignProgressDialog(QDialog):
+    """Progress bar, stage and Cancel button shown over the module window during a design."""
+    cancel_requested = pyqtSignal()
+    painted = pyqtSignal()                  # first paint only
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowFlag(Qt.FramelessWindowHint)
+        self.setWindowModality(Qt.WindowModal)
+        self.setMinimumWidth(360)
+        self._painted = False
+
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setRange(0, 0)
+        self.stage_label = QLabel("<p style='font-weight:500'>Please Wait...</p>", self)
+        self.stage_label.setAlignment(Qt.AlignCenter)
+        self.btn_cancel = QPushButton("Cancel", self)
+        self.btn_cancel.clicked.connect(self.reject)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(self.btn_cancel)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.stage_label)
+        layout.addLayout(buttons)
+
+    def set_progress(self, percent, stage):
+        if percent < 0:
+            self.progress_bar.setRange(0, 0)
+        else:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(percent)
+        if stage and self.btn_cancel.isEnabled():
+            self.stage_label.setText(stage.replace('_', ' ').capitalize() + "...")
+
+    def reject(self):
+        # Cancel and Esc stop the design; the dialog is closed once the design thread has returned
+        if self.btn_cancel.isEnabled():
+            self.btn_cancel.setEnabled(False)
+            self.stage_label.setText("Cancelling...")
+            self.cancel_requested.emit()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            self.painted.emit()
+
+
+class FrameMonitor(QObject):
+    """Counts the frames the GUI thread misses, from the delay of a timer ticking every frame."""
+
+    def __init__(self, interval=FRAME_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.interval = interval / 1000
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self._tick)
+        self.dropped_frames = 0
+        self.longest_stall = 0.0
+        self._last = None
+
+    def start(self):
+        self.dropped_frames = 0
+        self.longest_stall = 0.0
+        self._last = perf_counter()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        self._tick()
+
+    def _tick(self):
+        now = perf_counter()
+        gap = now - self._last
+        self._last = now
+        self.longest_stall = max(self.longest_stall, gap)
+        self.dropped_frames += max(int(gap / self.interval) - 1, 0)
+
+
+class DesignRun(QObject):
+    """One design of a module: its thread, progress dialog and timing."""
+    designed = pyqtSignal(object)           # error messages of func_for_validation, or None
+    cancelled = pyqtSignal()
+    stopped = pyqtSignal()                  # after designed, cancelled or a failure has been handled
+
+    def __init__(self, main, design_inputs, parent):
+        """
+        Args:
+            main: design class, e.g. FinPlateConnection
+            design_inputs: design dictionary (dict)
+            parent: module window the progress dialog is shown over (QWidget)
+        """
+        super().__init__(parent)
+        self.main = main
+        self.started = perf_counter()
+        self.timing = {'module': main.module_name(main), 'first_paint_ms': None}
+        self.thread = DesignThread(main, design_inputs)
+        self.dialog = DesignProgressDialog(parent)
+        self.frames = FrameMonitor(parent=self)
+
+        self.thread.progressed.connect(self.dialog.set_progress)
+        self.thread.designed.connect(self._designed)
+        self.thread.cancelled.connect(self._cancelled)
+        self.thread.failed.connect(self._failed)
+        self.dialog.cancel_requested.connect(self.thread.cancel)
+        self.dialog.painted.connect(self._painted)
+
+    def start(self):
+        self.frames.start()
+        self.thread.start()
+        self.dialog.show()
+
+    def is_running(self):
+        return self.thread.isRunning()
+
+    def cancel(self):
+        """Cancel the design and wait for its thread to return (the window is closing)."""
+        self.thread.cancel()
+        self.thread.wait()
+
+    def _painted(self):
+        self.timing['first_paint_ms'] = (perf_counter() - self.started) * 1000
+
+    def _designed(self, error):
+        self.dialog.close()
+        self.designed.emit(error)
+        # the 3D model is built in a single shot timer started by the window: stop after it
+        QTimer.singleShot(0, lambda: self._stop(False))
+
+    def _cancelled(self):
+        self.dialog.close()
+        self.cancelled.emit()
+        self._stop(True)
+
+    def _failed(self, exc_info):
+        self.dialog.close()
+        self._stop(False)
+        sys.excepthook(*exc_info)
+
+    def _stop(self, cancelled):
+        self.frames.stop()
+        self.thread.wait()
+        self.timing.update(seconds=perf_counter() - self.started, cancelled=cancelled,
+                           checkpoints=self.thread.progress.count, dropped_frames=self.frames.dropped_frames,
+                           longest_stall_ms=self.frames.longest_stall * 1000)
+        if _trace.on:
+            _trace('design', **self.timing)
+        self.stopped.emit()
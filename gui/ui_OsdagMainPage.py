@@ -115,7 +115,7 @@ class Ui_MainWindow(QMainWindow):
         self.lbl_fosseelogo.setMinimumSize(QtCore.QSize(0, 0))
         self.lbl_fosseelogo.setMaximumSize(QtCore.QSize(250, 92))
         self.lbl_fosseelogo.setText("")
-        self.lbl_fosseelogo.setPixmap(QtGui.QPixmap(":/newPrefix/images/Fossee_logo.png"))
+        self.lbl_fosseelogo.setPixmap(QtGui.QPixmap("ResourceFiles/images/Fossee_logo.png"))
         #self.lbl_fosseelogo.setScaledContents(True)
         self.lbl_fosseelogo.setObjectName("lbl_fosseelogo")
         self.gridLayout_2.addWidget(self.lbl_fosseelogo, 3, 3, 1, 1)
@@ -128,7 +128,7 @@ class Ui_MainWindow(QMainWindow):
         self.lbl_iitblogo.setMinimumSize(QtCore.QSize(0, 0))
         self.lbl_iitblogo.setMaximumSize(QtCore.QSize(100, 100))
         self.lbl_iitblogo.setText("")
-        self.lbl_iitblogo.setPixmap(QtGui.QPixmap(":/newPrefix/images/logoiitb.png"))
+        self.lbl_iitblogo.setPixmap(QtGui.QPixmap("ResourceFiles/images/logoiitb.png"))
         #self.lbl_iitblogo.setScaledContents(True)
         self.lbl_iitblogo.setAlignment(QtCore.Qt.AlignLeft|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
         self.lbl_iitblogo.setObjectName("lbl_iitblogo")
@@ -158,4 +158,3 @@ class Ui_MainWindow(QMainWindow):
         self.comboBox_help.setItemText(3, _translate("MainWindow", "Ask Us a Question"))
         self.comboBox_help.setItemText(4, _translate("MainWindow", "Check for Update"))
         self.comboBox_help.setItemText(5, _translate("MainWindow", "About Osdag"))
-import gui.osdagMainPageIcons_rc
@@ -34,9 +34,10 @@ class DummyThread(QtCore.QThread):
 
 class Ui_Dialog1(object):
 
-    def __init__(self, design_exist, loggermsg):
+    def __init__(self, design_exist, loggermsg, images_dir=None):
         self.design_exist = design_exist
         self.loggermsg = loggermsg
+        self.images_dir = images_dir
 
     def setupUi(self, Dialog, main, module_window):
         self.Dialog = Dialog
@@ -233,6 +234,7 @@ class Ui_Dialog1(object):
         input_summary['filename'] = fname_no_ext
         input_summary['does_design_exist'] = self.design_exist
         input_summary['logger_messages'] = self.loggermsg
+        input_summary['images_dir'] = self.images_dir
         # self.progress_bar.setValue(30)
         main.save_design(main, input_summary)
         # self.progress_bar.setValue(80)
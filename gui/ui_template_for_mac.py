@@ -17,9 +17,7 @@ from gui.ui_tutorial import Ui_Tutorial
 from gui.ui_aboutosdag import Ui_AboutOsdag
 from gui.ui_ask_question import Ui_AskQuestion
 
-from design_type.connection.column_cover_plate import ColumnCoverPlate
 # from PIL import Image
-from texlive.Design_wrapper import init_display as init_display_off_screen
 # from OCC.Display.backend import off
 import os
 import yaml
@@ -35,13 +33,14 @@ import configparser
 import pickle
 # import cairosvg
 
-from update_version_check import Update
-import pandas as pd
 
 
 
 from Common import *
 from utils.common.component import *
+from utils.common.logs import clear_log_file, DesignLogBuffer, log_entries
+from gui.design_worker import DesignRun
+from design_type.registry import get_module_class, module_names
 from utils.common.Section_Properties_Calculator import *
 from .customized_popup import Ui_Popup
 # from .ui_summary_popup import Ui_Dialog1
@@ -49,36 +48,13 @@ from .customized_popup import Ui_Popup
 
 from gui.ui_summary_popup import Ui_Dialog1
 from design_report.reportGenerator import save_html
+from design_report.html_report import AssetStore, IMAGES_DIR
 from .ui_OsdagSectionModeller import Ui_OsdagSectionModeller
 #from .ui_design_preferences import DesignPreferences
 from .UI_DESIGN_PREFERENCE import DesignPreferences
-from design_type.connection.shear_connection import ShearConnection
-from cad.common_logic import CommonDesignLogic
-from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
-from OCC.Core.Interface import Interface_Static_SetCVal
-from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.StlAPI import StlAPI_Writer
-from OCC.Core import BRepTools
-from OCC.Core import IGESControl
-from cad.cad3dconnection import cadconnection
-from design_type.connection.fin_plate_connection import FinPlateConnection
-from design_type.connection.column_cover_plate import ColumnCoverPlate
-from design_type.connection.cleat_angle_connection import CleatAngleConnection
-from design_type.connection.seated_angle_connection import SeatedAngleConnection
-from design_type.connection.end_plate_connection import EndPlateConnection
-from design_type.connection.end_plate_connection import EndPlateConnection
-from design_type.connection.beam_cover_plate import BeamCoverPlate
-from design_type.connection.beam_cover_plate_weld import BeamCoverPlateWeld
-from design_type.connection.beam_end_plate import BeamEndPlate
-from design_type.connection.column_end_plate import ColumnEndPlate
-from design_type.connection.column_cover_plate_weld import ColumnCoverPlateWeld
-from design_type.connection.base_plate_connection import BasePlateConnection
-from design_type.tension_member.tension_bolted import Tension_bolted
-from design_type.tension_member.tension_welded import Tension_welded
 import logging
 import subprocess
 from get_DPI_scale import scale
-from cad.cad3dconnection import cadconnection
 from OCC.Display.backend import load_backend, get_qt_modules
 from osdagMainSettings import backend_name
 used_backend = load_backend(backend_name())
@@ -172,6 +148,9 @@ class Ui_ModuleWindow(QtWidgets.QMainWindow):
                                      "Are you sure you want to quit?", QMessageBox.Yes, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
+            design_run = getattr(self.ui, 'design_run', None)
+            if design_run is not None and design_run.is_running():
+                design_run.cancel()
             logger = logging.getLogger('osdag')  # Remove all the previous handlers
             for handler in logger.handlers[:]:
                 logger.removeHandler(handler)
@@ -205,6 +184,12 @@ class Window(QMainWindow):
         self.window.exec()
         return self.ui.get_right_elements()
 
+    def design_log_entries(self):
+        """Log messages of the last design (list of LogEntry)."""
+        if getattr(self, 'design_log', None) is not None:
+            return self.design_log.entries()
+        return log_entries(self.textEdit.toPlainText())
+
     def open_summary_popup(self, main):
 
         if not main.design_button_status:
@@ -234,7 +219,7 @@ class Window(QMainWindow):
             # self.commLogicObj.display = self.display
 
         self.new_window = QtWidgets.QDialog(self)
-        self.new_ui = Ui_Dialog1(main.design_status,loggermsg=self.textEdit.toPlainText())
+        self.new_ui = Ui_Dialog1(main.design_status,loggermsg=self.design_log_entries())
         self.new_ui.setupUi(self.new_window, main)
         self.new_ui.btn_browse.clicked.connect(lambda: self.getLogoFilePath(self.new_window, self.new_ui.lbl_browse))
         self.new_ui.btn_saveProfile.clicked.connect(lambda: self.saveUserProfile(self.new_window))
@@ -1413,12 +1398,14 @@ class Window(QMainWindow):
         self.fuse_model = None
 
     def notification(self):
+        from update_version_check import Update
         update_class = Update()
         msg = update_class.notifi()
         QMessageBox.information(self, 'Info', msg)
 
     def save_output_to_csv(self, main):
         def save_fun():
+            import pandas as pd
             status = main.design_status
             out_list = main.output_values(main, status)
             in_list = main.input_values(main)
@@ -1799,33 +1786,11 @@ class Window(QMainWindow):
                                 "Cannot write file %s:\n%s" % (fileName, str(e)))
             return
 
-    def return_class(self,name):
-        if name == KEY_DISP_FINPLATE:
-            return FinPlateConnection
-        elif name == KEY_DISP_ENDPLATE:
-            return EndPlateConnection
-        elif name == KEY_DISP_CLEATANGLE:
-            return CleatAngleConnection
-        elif name == KEY_DISP_SEATED_ANGLE:
-            return SeatedAngleConnection
-        elif name == KEY_DISP_COLUMNCOVERPLATE:
-            return ColumnCoverPlate
-        elif name == KEY_DISP_COLUMNCOVERPLATEWELD:
-            return ColumnCoverPlateWeld
-        elif name == KEY_DISP_BEAMCOVERPLATE:
-            return BeamCoverPlate
-        elif name == KEY_DISP_BEAMCOVERPLATEWELD:
-            return BeamCoverPlateWeld
-        elif name == KEY_DISP_BEAMENDPLATE:
-            return BeamEndPlate
-        elif name == KEY_DISP_COLUMNENDPLATE:
-            return ColumnEndPlate
-        elif name == KEY_DISP_BASE_PLATE:
-            return BasePlateConnection
-        elif name == KEY_DISP_TENSION_BOLTED:
-            return Tension_bolted
-        elif name == KEY_DISP_TENSION_WELDED:
-            return Tension_welded
+    def return_class(self, name):
+        if name in module_names():
+            return get_module_class(name)
+        from gusset_connection import GussetConnection
+        return GussetConnection
 # Function for getting inputs from a file
     '''
     @author: Umair
@@ -1966,95 +1931,122 @@ class Window(QMainWindow):
                 elif type(input_field) == QtWidgets.QComboBox:
                     input_field.currentIndexChanged.connect(self.clear_output_fields)
             self.textEdit.clear()
-            with open("logging_text.log", 'w') as log_file:
-                pass
-            error = main.func_for_validation(main, self.design_inputs)
-            status = main.design_status
-            print(status)
+            clear_log_file()
+            if getattr(self, 'design_log', None) is not None:
+                self.design_log.detach()
+            # the messages of this design, handed to its report by open_summary_popup,
+            # logged from the design thread of run_design
+            self.design_log = DesignLogBuffer(all_threads=True).attach()
+            self.run_design(main)
+
+    def run_design(self, main):
+        """Design in a worker thread; design_finished updates the window once it is done."""
+        self.btn_Design.setEnabled(False)
+        self.design_run = DesignRun(main, self.design_inputs, self.btn_Design.window())
+        self.design_run.designed.connect(lambda error: self.design_finished(main, error))
+        self.design_run.cancelled.connect(lambda: self.design_cancelled(main))
+        self.design_run.stopped.connect(lambda: self.btn_Design.setEnabled(True))
+        self.design_run.start()
+
+    def design_cancelled(self, main):
+        main.design_status = False
+        main.design_button_status = False
+        logging.getLogger('Osdag').warning("Design cancelled.")
 
-            if error is not None:
-                self.show_error_msg(error)
-                return
+    def design_finished(self, main, error):
+        status = main.design_status
+        print(status)
 
-            out_list = main.output_values(main, status)
-            for option in out_list:
-                if option[2] == TYPE_TEXTBOX:
-                    txt = self.dockWidgetContents_out.findChild(QtWidgets.QWidget, option[0])
-                    txt.setText(str(option[3]))
-                    if status:
-                        txt.setVisible(True if option[3] != "" and txt.isVisible() else False)
-                        txt_label = self.dockWidgetContents_out.findChild(QtWidgets.QWidget, option[0]+"_label")
-                        txt_label.setVisible(True if option[3] != "" and txt_label.isVisible() else False)
+        if error is not None:
+            self.show_error_msg(error)
+            return
 
-                elif option[2] == TYPE_OUT_BUTTON:
-                    self.dockWidgetContents_out.findChild(QtWidgets.QWidget, option[0]).setEnabled(True)
+        out_list = main.output_values(main, status)
+        for option in out_list:
+            if option[2] == TYPE_TEXTBOX:
+                txt = self.dockWidgetContents_out.findChild(QtWidgets.QWidget, option[0])
+                txt.setText(str(option[3]))
+                if status:
+                    txt.setVisible(True if option[3] != "" and txt.isVisible() else False)
+                    txt_label = self.dockWidgetContents_out.findChild(QtWidgets.QWidget, option[0]+"_label")
+                    txt_label.setVisible(True if option[3] != "" and txt_label.isVisible() else False)
 
-            self.output_title_change(main)
+            elif option[2] == TYPE_OUT_BUTTON:
+                self.dockWidgetContents_out.findChild(QtWidgets.QWidget, option[0]).setEnabled(True)
 
-            last_design_folder = os.path.join('ResourceFiles', 'last_designs')
-            if not os.path.isdir(last_design_folder):
-                os.mkdir(last_design_folder)
-            last_design_file = str(main.module_name(main)).replace(' ', '') + ".osi"
-            last_design_file = os.path.join(last_design_folder, last_design_file)
-            out_titles_status = []
-            out_titles = []
-            title_repeat = 1
-            for option in out_list:
-                if option[2] == TYPE_TITLE:
-                    title_name = option[1]
-                    if title_name in out_titles:
-                        title_name += str(title_repeat)
-                        title_repeat += 1
-                    if self.output_title_fields[title_name][0].isVisible():
-                        out_titles_status.append(1)
-                    else:
-                        out_titles_status.append(0)
-                    out_titles.append(title_name)
-            self.design_inputs.update({"out_titles_status": out_titles_status})
-            with open(str(last_design_file), 'w') as last_design:
-                yaml.dump(self.design_inputs, last_design)
-            self.design_inputs.pop("out_titles_status")
-            if status is True and main.module in [KEY_DISP_FINPLATE, KEY_DISP_BEAMCOVERPLATE,
-                                                  KEY_DISP_BEAMCOVERPLATEWELD, KEY_DISP_CLEATANGLE,
-                                                  KEY_DISP_ENDPLATE, KEY_DISP_BASE_PLATE, KEY_DISP_SEATED_ANGLE,
-                                                  KEY_DISP_TENSION_BOLTED, KEY_DISP_TENSION_WELDED,KEY_DISP_COLUMNCOVERPLATE,
-                                                  KEY_DISP_COLUMNCOVERPLATEWELD, KEY_DISP_COLUMNENDPLATE]:
-
-                self.commLogicObj = CommonDesignLogic(self.display, self.folder, main.module, main.mainmodule)
-                status = main.design_status
-                module_class = self.return_class(main.module)
-                self.commLogicObj.call_3DModel(status, module_class)
-                self.display_x = 90
-                self.display_y = 90
-                for chkbox in main.get_3d_components(main):
-                    self.frame.findChild(QtWidgets.QCheckBox, chkbox[0]).setEnabled(True)
-                for action in self.menugraphics_component_list:
-                    action.setEnabled(True)
-                # fName = str('./ResourceFiles/images/3d.png')
-                # file_extension = fName.split(".")[-1]
-                #
-                # if file_extension == 'png':
-                #     self.display.ExportToImage(fName)
-                #     im = Image.open('./ResourceFiles/images/3d.png')
-                #     w,h=im.size
-                #     if(w< 640 or h < 360):
-                #         print('Re-taking Screenshot')
-                #         self.resize(700,500)
-                #         self.outputDock.hide()
-                #         self.inputDock.hide()
-                #         self.textEdit.hide()
-                #         QTimer.singleShot(0, lambda:self.retakeScreenshot(fName))
+        self.output_title_change(main)
+
+        last_design_folder = os.path.join('ResourceFiles', 'last_designs')
+        if not os.path.isdir(last_design_folder):
+            os.mkdir(last_design_folder)
+        last_design_file = str(main.module_name(main)).replace(' ', '') + ".osi"
+        last_design_file = os.path.join(last_design_folder, last_design_file)
+        out_titles_status = []
+        out_titles = []
+        title_repeat = 1
+        for option in out_list:
+            if option[2] == TYPE_TITLE:
+                title_name = option[1]
+                if title_name in out_titles:
+                    title_name += str(title_repeat)
+                    title_repeat += 1
+                if self.output_title_fields[title_name][0].isVisible():
+                    out_titles_status.append(1)
+                else:
+                    out_titles_status.append(0)
+                out_titles.append(title_name)
+        self.design_inputs.update({"out_titles_status": out_titles_status})
+        with open(str(last_design_file), 'w') as last_design:
+            yaml.dump(self.design_inputs, last_design)
+        self.design_inputs.pop("out_titles_status")
+        if status is True and main.module in [KEY_DISP_FINPLATE, KEY_DISP_BEAMCOVERPLATE,
+                                              KEY_DISP_BEAMCOVERPLATEWELD, KEY_DISP_CLEATANGLE,
+                                              KEY_DISP_ENDPLATE, KEY_DISP_BASE_PLATE, KEY_DISP_SEATED_ANGLE,
+                                              KEY_DISP_TENSION_BOLTED, KEY_DISP_TENSION_WELDED,KEY_DISP_COLUMNCOVERPLATE,
+                                              KEY_DISP_COLUMNCOVERPLATEWELD, KEY_DISP_COLUMNENDPLATE]:
+
+            # the CAD builders of every module, imported with the first 3D model
+            from cad.common_logic import CommonDesignLogic
+            self.commLogicObj = CommonDesignLogic(self.display, self.folder, main.module, main.mainmodule)
+            status = main.design_status
+            module_class = self.return_class(main.module)
+            # the model is built once per design, in its first display after the output dock has been updated,
+            # and shared by the component views and exports
+            self.commLogicObj.set_design(status, module_class)
+            commLogicObj = self.commLogicObj
+            QTimer.singleShot(0, lambda: commLogicObj.display_3DModel("Model", "gradient_bg"))
+            self.display_x = 90
+            self.display_y = 90
+            for chkbox in main.get_3d_components(main):
+                self.frame.findChild(QtWidgets.QCheckBox, chkbox[0]).setEnabled(True)
+            for action in self.menugraphics_component_list:
+                action.setEnabled(True)
+            # fName = str('./ResourceFiles/images/3d.png')
+            # file_extension = fName.split(".")[-1]
+            #
+            # if file_extension == 'png':
+            #     self.display.ExportToImage(fName)
+            #     im = Image.open('./ResourceFiles/images/3d.png')
+            #     w,h=im.size
+            #     if(w< 640 or h < 360):
+            #         print('Re-taking Screenshot')
+            #         self.resize(700,500)
+            #         self.outputDock.hide()
+            #         self.inputDock.hide()
+            #         self.textEdit.hide()
+            #         QTimer.singleShot(0, lambda:self.retakeScreenshot(fName))
+
+        else:
+            for fName in ['3d.png', 'top.png',
+                          'front.png', 'side.png']:
+                with open("./ResourceFiles/images/"+fName, 'w'):
+                    pass
+            self.display.EraseAll()
+            for chkbox in main.get_3d_components(main):
+                self.frame.findChild(QtWidgets.QCheckBox, chkbox[0]).setEnabled(False)
+            for action in self.menugraphics_component_list:
+                action.setEnabled(False)
 
-            else:
-                for fName in ['3d.png', 'top.png',
-                              'front.png', 'side.png']:
-                    with open("./ResourceFiles/images/"+fName, 'w'):
-                        pass
-                self.display.EraseAll()
-                for chkbox in main.get_3d_components(main):
-                    self.frame.findChild(QtWidgets.QCheckBox, chkbox[0]).setEnabled(False)
-                for action in self.menugraphics_component_list:
-                    action.setEnabled(False)
 
     def retakeScreenshot(self,fName):
         Ww=self.frameGeometry().width()
@@ -2078,11 +2070,11 @@ class Window(QMainWindow):
             output_field.setEnabled(False)
 
     def osdag_header(self):
-        image_path = os.path.abspath(os.path.join(os.getcwd(), os.path.join("ResourceFiles\images", "OsdagHeader.png")))
-        image_path2 = os.path.abspath(os.path.join(os.getcwd(), os.path.join("ResourceFiles\images", "ColumnsBeams.png")))
-
-        shutil.copyfile(image_path, os.path.join(str(self.folder), "images_html", "OsdagHeader.png"))
-        shutil.copyfile(image_path2, os.path.join(str(self.folder), "images_html", "ColumnsBeams.png"))
+        # stored once in the assets of the folder, under a hash of their content,
+        # and linked from every HTML report written there
+        assets = AssetStore(str(self.folder))
+        image_paths = [os.path.join(IMAGES_DIR, name) for name in ("OsdagHeader.png", "ColumnsBeams.png")]
+        return [assets.add(image_path) for image_path in image_paths if os.path.isfile(image_path)]
 
     def output_button_connect(self, main, button_list, b):
         b.clicked.connect(lambda: self.output_button_dialog(main, button_list, b))
@@ -2703,44 +2695,33 @@ class Window(QMainWindow):
             return
 
         if main.design_status:
-            if self.fuse_model is None:
-                self.fuse_model = self.commLogicObj.create2Dcad()
-            shape = self.fuse_model
-
             files_types = "IGS (*.igs);;STEP (*.stp);;STL (*.stl);;BREP(*.brep)"
 
             fileName, _ = QFileDialog.getSaveFileName(self, 'Export', os.path.join(str(self.folder), "untitled.igs"),
                                                       files_types)
             fName = str(fileName)
 
-            if fName and self.fuse_model:
-                file_extension = fName.split(".")[-1]
-
-                if file_extension == 'igs':
-                    IGESControl.IGESControl_Controller().Init()
-                    iges_writer = IGESControl.IGESControl_Writer()
-                    iges_writer.AddShape(shape)
-                    iges_writer.Write(fName)
-
-                elif file_extension == 'brep':
-
-                    BRepTools.breptools.Write(shape, fName)
-
-                elif file_extension == 'stp':
-                    # initialize the STEP exporter
-                    step_writer = STEPControl_Writer()
-                    Interface_Static_SetCVal("write.step.schema", "AP203")
-
-                    # transfer shapes and write file
-                    step_writer.Transfer(shape, STEPControl_AsIs)
-                    status = step_writer.Write(fName)
-
-                    assert (status == IFSelect_RetDone)
+            # the CAD exporters (and OCC), imported with the first export
+            from cad import export
+            if fName:
+                try:
+                    file_format = export.file_format(fName)
+                except ValueError as error:
+                    QMessageBox.about(self, 'Error', str(error))
+                    return
+            if fName and self.fuse_model is None:
+                # IGES and STEP get one fused solid, BREP and STL take the components as a compound
+                self.fuse_model = self.commLogicObj.create2Dcad(fuse=file_format in export.FUSED_FORMATS)
+            shape = self.fuse_model
 
-                else:
-                    stl_writer = StlAPI_Writer()
-                    stl_writer.SetASCIIMode(True)
-                    stl_writer.Write(shape, fName)
+            if fName and self.fuse_model:
+                # STL is written binary, from a mesh of the default deflection (see cad.export)
+                try:
+                    export.write_shape(shape, fName)
+                except IOError:
+                    self.fuse_model = None
+                    QMessageBox.about(self, 'Error', "File not saved")
+                    return
 
                 self.fuse_model = None
 
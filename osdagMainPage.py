@@ -84,8 +84,6 @@ import os
 from pathlib import Path
 import re
 from PyQt5.QtWidgets import QMessageBox,QApplication, QDialog, QMainWindow
-import urllib.request
-from update_version_check import Update
 #from Thread import timer
 from get_DPI_scale import scale
 
@@ -123,12 +121,8 @@ from PyQt5.QtCore import pyqtSlot,pyqtSignal, QObject, Qt,QSize, QFile, QTextStr
 from PyQt5.QtWidgets import QMainWindow, QDialog,QMessageBox, QFileDialog, QApplication, QWidget, QLabel, QGridLayout, QVBoxLayout, QTabWidget, QRadioButton, QButtonGroup, QSizePolicy
 from PyQt5.QtGui import QIcon
 from PyQt5 import QtWidgets, QtCore, QtGui
-from PyQt5 import uic
 import math
 import sys
-from gui.ui_tutorial import Ui_Tutorial
-from gui.ui_aboutosdag import Ui_AboutOsdag
-from gui.ui_ask_question import Ui_AskQuestion
 from gui.ui_design_summary import Ui_DesignReport
 from gui.LeftPanel_Button import Ui_LPButton
 from gui.Submodule_Page import Ui_Submodule_Page
@@ -136,43 +130,42 @@ from gui.ui_OsdagMainPage import Ui_MainWindow
 from gui.ExceptionDialog import CriticalExceptionDialog
 # from design_type.connection.fin_plate_connection import design_report_show
 # from design_type.connection.fin_plate_connection import DesignReportDialog
-from design_type.connection.fin_plate_connection import FinPlateConnection
-from design_type.connection.cleat_angle_connection import CleatAngleConnection
-from design_type.connection.seated_angle_connection import SeatedAngleConnection
-from design_type.connection.end_plate_connection import EndPlateConnection
-from design_type.connection.base_plate_connection import BasePlateConnection
-
-from design_type.connection.beam_cover_plate import BeamCoverPlate
-from design_type.connection.beam_cover_plate_weld import BeamCoverPlateWeld
-from design_type.connection.column_cover_plate_weld import ColumnCoverPlateWeld
-from design_type.connection.beam_column_end_plate import BeamColumnEndPlate
-from design_type.tension_member.tension_bolted import Tension_bolted
-from design_type.tension_member.tension_welded import Tension_welded
-
-from design_type.connection.beam_beam_end_plate_splice import BeamBeamEndPlateSplice
-
-from design_type.connection.column_cover_plate import ColumnCoverPlate
-from design_type.connection.column_end_plate import ColumnEndPlate
-from design_type.compression_member.compression import Compression
 #from design_type.tension_member.tension import Tension
 # from cad.cad_common import call_3DBeam
 import APP_CRASH.Appcrash.api as appcrash
 import configparser
 import os.path
 import subprocess
-if sys.platform == 'darwin':
-    print('its mac')
-    from gui.ui_template_for_mac import Ui_ModuleWindow
-else:
-    from gui.ui_template import Ui_ModuleWindow
-# from gui.ui_template import Ui_ModuleWindow
 import io
 import traceback
 import time
 
+# Design modules, their CAD builders and the module window (with the 3D viewer,
+# OCC and the icons of the input/output docks) are imported when a module is
+# first opened, not before the main window is shown; see
+# benchmarks/import_time.py for the import time of this page.
+
+
+def design_keys():
+    """Common, whose KEY_DISP_* names are the design modules of the registry (module)."""
+    from design_type import registry    # imports utils.common.component before Common
+    import Common
+    return Common
+
+
+def module_window_class():
+    """The module window of this platform (Ui_ModuleWindow)."""
+    if sys.platform == 'darwin':
+        from gui.ui_template_for_mac import Ui_ModuleWindow
+    else:
+        from gui.ui_template import Ui_ModuleWindow
+    return Ui_ModuleWindow
+
+
 class MyTutorials(QDialog):
     def __init__(self, parent=None):
         QDialog.__init__(self, parent)
+        from gui.ui_tutorial import Ui_Tutorial
         self.ui = Ui_Tutorial()
         self.ui.setupUi(self)
         self.osdagmainwindow = parent
@@ -181,6 +174,7 @@ class MyTutorials(QDialog):
 class MyAboutOsdag(QDialog):
     def __init__(self, parent=None):
         QDialog.__init__(self, parent)
+        from gui.ui_aboutosdag import Ui_AboutOsdag
         self.ui = Ui_AboutOsdag()
         self.ui.setupUi(self)
         self.osdagmainwindow = parent
@@ -188,6 +182,7 @@ class MyAboutOsdag(QDialog):
 class MyAskQuestion(QDialog):
     def __init__(self, parent=None):
         QDialog.__init__(self, parent)
+        from gui.ui_ask_question import Ui_AskQuestion
         self.ui = Ui_AskQuestion()
         self.ui.setupUi(self)
         self.osdagmainwindow = parent
@@ -460,6 +455,7 @@ class OsdagMainWindow(QMainWindow):
         elif loc == "Ask Us a Question":
             self.ask_question()
         elif loc == "Check for Update":
+            from update_version_check import Update
             update_class = Update()
             msg = update_class.notifi()
             QMessageBox.information(self, 'Info',msg)
@@ -489,84 +485,56 @@ class OsdagMainWindow(QMainWindow):
 
 #################################### Module Launchers ##########################################
 
+    def open_module(self, name):
+        """Hide the main window and open the module window of a design module, importing both on first use."""
+        from design_type.registry import get_module_class
+        self.hide()
+        self.ui2 = module_window_class()(get_module_class(name), ' ')
+        self.ui2.show()
+        self.ui2.closed.connect(self.show)
+
     @pyqtSlot()
     def show_shear_connection(self):
         if self.findChild(QRadioButton,'Fin_Plate').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(FinPlateConnection, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_FINPLATE)
         elif self.findChild(QRadioButton,'Cleat_Angle').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(CleatAngleConnection, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_CLEATANGLE)
         elif self.findChild(QRadioButton,'Seated_Angle').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow( SeatedAngleConnection, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_SEATED_ANGLE)
         elif self.findChild(QRadioButton,'End_Plate').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(EndPlateConnection, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_ENDPLATE)
         else:
             QMessageBox.about(self, "INFO", "Please select appropriate connection")
 
     def show_moment_connection(self):
         if self.findChild(QRadioButton,'B2B_Cover_Plate_Bolted').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(BeamCoverPlate, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_BEAMCOVERPLATE)
         elif self.findChild(QRadioButton,'B2B_Cover_Plate_Welded').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(BeamCoverPlateWeld, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_BEAMCOVERPLATEWELD)
         # elif self.findChild(QRadioButton,'B2B_End_Plate_Connection').isChecked():
         #     self.hide()
         #     self.ui2 = Ui_ModuleWindow(BeamBeamEndPlateSplice,' ')
         #     self.ui2.show()
         #     self.ui2.closed.connect(self.show)
         elif self.findChild(QRadioButton, 'B2B_End_Plate_Splice').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(BeamBeamEndPlateSplice, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_BB_EP_SPLICE)
 
     def show_moment_connection_bc(self):
         if self.findChild(QRadioButton,'BC_End_Plate').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(BeamColumnEndPlate, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_BCENDPLATE)
 
     def show_base_plate(self):
         if self.findChild(QRadioButton, 'Base_Plate').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(BasePlateConnection, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_BASE_PLATE)
 
     def show_moment_connection_cc(self):
         if self.findChild(QRadioButton,'C2C_Cover_Plate_Bolted').isChecked() :
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(ColumnCoverPlate, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_COLUMNCOVERPLATE)
         elif self.findChild(QRadioButton,'C2C_Cover_Plate_Welded').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(ColumnCoverPlateWeld, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_COLUMNCOVERPLATEWELD)
 
         elif self.findChild(QRadioButton,'C2C_End_Plate_Connection').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(ColumnEndPlate, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_COLUMNENDPLATE)
 
     def show_compression_module(self):
         # folder = self.select_workspace_folder()
@@ -591,16 +559,10 @@ class OsdagMainWindow(QMainWindow):
         #             shutil.rmtree(os.path.join(folder, create_folder))
         #             os.mkdir(os.path.join(root_path, create_folder))
         if self.findChild(QRadioButton,'Compression_Bolted').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(Compression, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_COMPRESSION)
 
         elif self.findChild(QRadioButton,'Compression_Welded').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(Compression, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_COMPRESSION)
 
     def show_tension_module(self):
         # folder = self.select_workspace_folder()
@@ -626,16 +588,10 @@ class OsdagMainWindow(QMainWindow):
         #             os.mkdir(os.path.join(root_path, create_folder))
 
         if self.findChild(QRadioButton,'Tension_Bolted').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(Tension_bolted, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_TENSION_BOLTED)
 
         elif self.findChild(QRadioButton,'Tension_Welded').isChecked():
-            self.hide()
-            self.ui2 = Ui_ModuleWindow(Tension_welded, ' ')
-            self.ui2.show()
-            self.ui2.closed.connect(self.show)
+            self.open_module(design_keys().KEY_DISP_TENSION_WELDED)
 
 ################################# Help Actions ############################################
 
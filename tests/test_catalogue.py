@@ -0,0 +1,66 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from utils.common import catalogue
+
+
+class TestCatalogue(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.database = tempfile.mkstemp(suffix='.sqlite')
+        os.close(handle)
+        conn = sqlite3.connect(self.database)
+        conn.execute('CREATE TABLE Bolt (Diameter INTEGER, Grade REAL)')
+        conn.executemany('INSERT INTO Bolt VALUES (?, ?)', [(16, 4.6), (20, 8.8)])
+        conn.commit()
+        conn.close()
+        catalogue.disable()
+
+    def tearDown(self):
+        catalogue.disable()
+        os.remove(self.database)
+
+    def _set_grade(self, diameter, grade):
+        conn = sqlite3.connect(self.database)
+        conn.execute('UPDATE Bolt SET Grade = ? WHERE Diameter = ?', (grade, diameter))
+        conn.commit()
+        conn.close()
+
+    def test_disabled_by_default_reads_the_database(self):
+        query = 'SELECT Grade FROM Bolt WHERE Diameter = ?'
+        self.assertEqual(catalogue.fetch_one(self.database, query, (16,)), (4.6,))
+        self._set_grade(16, 5.6)
+        self.assertEqual(catalogue.fetch_one(self.database, query, (16,)), (5.6,))
+        self.assertEqual(catalogue.stats(), {'enabled': False, 'hits': 0, 'misses': 0, 'entries': 0})
+
+    def test_rows_are_memoised_per_query_and_parameters(self):
+        catalogue.enable()
+        query = 'SELECT Grade FROM Bolt WHERE Diameter = ?'
+        self.assertEqual(catalogue.fetch_one(self.database, query, (16,)), (4.6,))
+        self._set_grade(16, 5.6)
+        self.assertEqual(catalogue.fetch_one(self.database, query, [16]), (4.6,))
+        self.assertEqual(catalogue.fetch_one(self.database, query, (20,)), (8.8,))
+        self.assertEqual(catalogue.stats(), {'enabled': True, 'hits': 1, 'misses': 2, 'entries': 2})
+
+    def test_fetch_all_is_kept_apart_from_fetch_one(self):
+        catalogue.enable()
+        query = 'SELECT Diameter FROM Bolt ORDER BY Diameter'
+        self.assertEqual(catalogue.fetch_one(self.database, query), (16,))
+        rows = catalogue.fetch_all(self.database, query)
+        self.assertEqual(rows, ((16,), (20,)))
+        self.assertIs(catalogue.fetch_all(self.database, query), rows)
+
+    def test_disable_drops_the_rows(self):
+        catalogue.enable()
+        query = 'SELECT Grade FROM Bolt WHERE Diameter = ?'
+        catalogue.fetch_one(self.database, query, (16,))
+        catalogue.disable()
+        self._set_grade(16, 5.6)
+        catalogue.enable()
+        self.assertEqual(catalogue.fetch_one(self.database, query, (16,)), (5.6,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from design_report import latex_compiler
+from design_report.latex_compiler import LatexError, log_excerpt, split_preamble
+
+PREAMBLE = ('\\documentclass[a4paper]{article}%\n'
+            '\\usepackage[T1]{fontenc}%\n'
+            '\\usepackage{longtable}%\n'
+            '%\n'
+            '\\definecolor{OsdagGreen}{RGB}{153,169,36}%\n')
+BODY = ('\\title{Design Report}%\n'
+        '\\begin{document}%\n'
+        'Fin Plate Connection\n'
+        '\\end{document}\n')
+
+
+class TestSplitPreamble(unittest.TestCase):
+
+    def test_fixed_preamble_is_split_off(self):
+        self.assertEqual(split_preamble(PREAMBLE + BODY), (PREAMBLE, BODY))
+
+    def test_split_stops_at_the_first_other_line(self):
+        tex = PREAMBLE + '\\newcommand{\\osdag}{Osdag}%\n\\usepackage{xcolor}%\n' + BODY
+        fixed, rest = split_preamble(tex)
+        self.assertEqual(fixed, PREAMBLE)
+        self.assertTrue(rest.startswith('\\newcommand'))
+
+    def test_documents_without_a_fixed_preamble_are_kept_whole(self):
+        for tex in (BODY, '\\input{preamble}\n' + BODY, PREAMBLE):
+            self.assertEqual(split_preamble(tex), ('', tex))
+
+
+class TestLogExcerpt(unittest.TestCase):
+
+    def test_excerpt_starts_at_the_first_error(self):
+        log = '\n'.join(['This is pdfTeX'] + ['(./file{}.sty)'.format(i) for i in range(5)] +
+                        ['! Undefined control sequence.', 'l.42 \\osdag', '', '! Emergency stop.'] +
+                        ['line {}'.format(i) for i in range(20)])
+        excerpt = log_excerpt(log, lines=3).split('\n')
+        self.assertEqual(excerpt, ['! Undefined control sequence.', 'l.42 \\osdag', ''])
+
+    def test_end_of_the_log_without_an_error(self):
+        log = '\n'.join('line {}'.format(i) for i in range(30))
+        self.assertEqual(log_excerpt(log).split('\n'),
+                         ['line {}'.format(i) for i in range(30 - latex_compiler.EXCERPT_LINES, 30)])
+
+    def test_error_message_carries_the_excerpt(self):
+        error = LatexError('pdflatex failed on report.tex', 'report.log', '! Emergency stop.')
+        self.assertEqual(str(error), 'pdflatex failed on report.tex\n! Emergency stop.')
+        self.assertEqual(str(LatexError('pdflatex timed out')), 'pdflatex timed out')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import logging
+import threading
+import unittest
+
+from utils.common import logs
+from utils.common.logs import DesignLogBuffer, LogEntry, log_entries
+
+LOGGER = 'osdag_test_logs'
+
+
+class TestDesignLogBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger(LOGGER)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+
+    def _log_from_thread(self, message):
+        thread = threading.Thread(target=self.logger.warning, args=(message,))
+        thread.start()
+        thread.join()
+
+    def test_keeps_messages_of_its_thread_only(self):
+        with DesignLogBuffer(LOGGER) as log_buffer:
+            self.logger.info('Cl. 10.2.2 satisfied')
+            self._log_from_thread('another design')
+        self.logger.info('after the design')
+        entries = log_buffer.entries()
+        self.assertEqual([(entry.level, entry.message, entry.clause) for entry in entries],
+                         [('INFO', 'Cl. 10.2.2 satisfied', '10.2.2')])
+        self.assertNotIn(log_buffer, self.logger.handlers)
+
+    def test_all_threads(self):
+        with DesignLogBuffer(LOGGER, all_threads=True) as log_buffer:
+            self.logger.info('design thread')
+            self._log_from_thread('worker thread')
+        self.assertEqual([entry.message for entry in log_buffer.entries()], ['design thread', 'worker thread'])
+
+    def test_detached_on_error(self):
+        with self.assertRaises(ZeroDivisionError):
+            with DesignLogBuffer(LOGGER) as log_buffer:
+                1 / 0
+        self.assertNotIn(log_buffer, self.logger.handlers)
+
+    def test_oldest_messages_are_dropped(self):
+        self.assertEqual(DesignLogBuffer(LOGGER)._entries.maxlen, logs.MAX_LOG_ENTRIES)
+        with DesignLogBuffer(LOGGER, max_entries=3) as log_buffer:
+            for i in range(5):
+                self.logger.info('message %d', i)
+        self.assertEqual([entry.message for entry in log_buffer.entries()], ['message 2', 'message 3', 'message 4'])
+        self.assertEqual(log_buffer.dropped, 2)
+
+    def test_text_is_in_the_log_file_format(self):
+        with DesignLogBuffer(LOGGER) as log_buffer:
+            self.logger.error('Bolt fails [Ref. IS 800:2007, Cl.10.3.3]')
+        entry, = log_buffer.entries()
+        parsed, = log_entries(log_buffer.text())
+        self.assertEqual(parsed[:3] + parsed[4:], ('ERROR', 'Bolt fails [Ref. IS 800:2007, Cl.10.3.3]', '10.3.3', LOGGER))
+        self.assertEqual(parsed.created, int(entry.created))
+
+
+class TestLogEntries(unittest.TestCase):
+
+    def test_entries_are_passed_through(self):
+        entries = [LogEntry('INFO', 'message', None, 0.0, 'Osdag')]
+        self.assertEqual(log_entries(entries), entries)
+        self.assertEqual(log_entries(None), [])
+
+    def test_text_is_parsed(self):
+        text = ('2020-06-01 10:00:00 - Osdag - WARNING - Load is less than the minimum [Ref. IS 800:2007, Cl.10.7]\n'
+                'a line without a level\n'
+                '2020-06-01 10:00:01 - Osdag - INFO - === End Of Design ===\n')
+        entries = log_entries(text)
+        self.assertEqual([(entry.level, entry.clause, entry.name) for entry in entries],
+                         [('WARNING', '10.7', 'Osdag'), ('INFO', None, 'Osdag')])
+        self.assertEqual(entries[1].message, '=== End Of Design ===')
+        self.assertEqual(entries[1].created - entries[0].created, 1.0)
+        self.assertEqual(entries[0].line(), text.split('\n')[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from utils.common import profiling
+
+
+def _snapshot(functions, stacks, hits, misses):
+    return {'functions': functions, 'stacks': stacks,
+            'catalogue': {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else None}}
+
+
+class TestMerge(unittest.TestCase):
+
+    def test_merge_into_empty_total(self):
+        data = _snapshot({'Bolt.calculate_bolt_capacity': {'calls': 3, 'cumulative': 0.3, 'self': 0.2}},
+                         {'func_for_validation;Bolt.calculate_bolt_capacity': 0.2}, 1, 3)
+        total = profiling.merge({}, data)
+        self.assertEqual(total['functions'], data['functions'])
+        self.assertEqual(total['stacks'], data['stacks'])
+        self.assertEqual(total['catalogue'], {'hits': 1, 'misses': 3, 'hit_rate': 0.25})
+        total['functions']['Bolt.calculate_bolt_capacity']['calls'] += 1
+        self.assertEqual(data['functions']['Bolt.calculate_bolt_capacity']['calls'], 3)
+
+    def test_merge_adds_calls_times_and_catalogue_counts(self):
+        first = _snapshot({'a': {'calls': 1, 'cumulative': 1.0, 'self': 0.5}}, {'a': 0.5}, 0, 0)
+        second = _snapshot({'a': {'calls': 2, 'cumulative': 2.0, 'self': 1.0},
+                            'b': {'calls': 1, 'cumulative': 0.25, 'self': 0.25}}, {'a': 1.0, 'a;b': 0.25}, 3, 1)
+        total = profiling.merge(profiling.merge({}, first), second)
+        self.assertEqual(total['functions'], {'a': {'calls': 3, 'cumulative': 3.0, 'self': 1.5},
+                                              'b': {'calls': 1, 'cumulative': 0.25, 'self': 0.25}})
+        self.assertEqual(total['stacks'], {'a': 1.5, 'a;b': 0.25})
+        self.assertEqual(total['catalogue'], {'hits': 3, 'misses': 1, 'hit_rate': 0.75})
+
+    def test_no_catalogue_queries_have_no_hit_rate(self):
+        total = profiling.merge({}, _snapshot({}, {}, 0, 0))
+        self.assertIsNone(total['catalogue']['hit_rate'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import threading
+import unittest
+
+from utils.common import progress
+from utils.common.progress import DesignCancelled, DesignProgress
+
+
+class _Design(object):
+    """Stands in for a design class: a loop over candidates, each checked in a stage."""
+    checked = 0
+
+    def func_for_validation(self, design_dictionary):
+        self.checked = 0
+        for _ in range(design_dictionary['candidates']):
+            self.member_capacity(self)
+
+    def member_capacity(self):
+        self.checked += 1
+
+
+def _design(design_progress, candidates=10):
+    with design_progress:
+        _Design.func_for_validation(_Design, {'candidates': candidates})
+
+
+class TestDesignProgress(unittest.TestCase):
+
+    def setUp(self):
+        progress._expected.pop(_Design, None)
+
+    def test_checkpoints_are_counted(self):
+        design_progress = DesignProgress(_Design)
+        _design(design_progress)
+        self.assertEqual(_Design.checked, 10)
+        self.assertEqual(design_progress.count, 11)
+        self.assertEqual(design_progress.stage, 'member_capacity')
+        self.assertEqual(getattr(_Design.member_capacity, '_checkpoint'), '_Design.member_capacity')
+
+    def test_fraction_is_known_after_a_complete_design(self):
+        reports = []
+        design_progress = DesignProgress(_Design, callback=lambda *report: reports.append(report), interval=0)
+        self.assertIsNone(design_progress.fraction())
+        _design(design_progress)
+        self.assertEqual(reports[0], (None, 'func_for_validation'))
+        self.assertEqual(len(reports), 11)
+
+        reports = []
+        design_progress = DesignProgress(_Design, callback=lambda *report: reports.append(report), interval=0)
+        _design(design_progress)
+        self.assertAlmostEqual(reports[0][0], 1 / 11)
+        self.assertEqual(reports[-1], (0.99, 'member_capacity'))
+
+    def test_cancel_stops_between_candidates(self):
+        design_progress = DesignProgress(_Design, interval=0)
+        design_progress.callback = lambda fraction, stage: design_progress.count == 4 and design_progress.cancel()
+        with self.assertRaises(DesignCancelled):
+            _design(design_progress)
+        self.assertTrue(design_progress.cancelled)
+        self.assertEqual(_Design.checked, 3)
+        self.assertNotIn(_Design, progress._expected)
+
+    def test_cancel_from_another_thread(self):
+        design_progress = DesignProgress(_Design)
+        thread = threading.Thread(target=design_progress.cancel)
+        thread.start()
+        thread.join()
+        with self.assertRaises(DesignCancelled):
+            _design(design_progress)
+        self.assertEqual(_Design.checked, 0)
+
+    def test_designs_without_progress_are_not_checked(self):
+        _design(DesignProgress(_Design))
+        design_progress = DesignProgress(_Design)
+        design_progress.cancel()
+        _Design.func_for_validation(_Design, {'candidates': 5})
+        self.assertEqual(_Design.checked, 5)
+        self.assertEqual(design_progress.count, 0)
+
+    def test_other_threads_are_not_counted(self):
+        design_progress = DesignProgress(_Design)
+        with design_progress:
+            thread = threading.Thread(target=_Design.func_for_validation, args=(_Design, {'candidates': 5}))
+            thread.start()
+            thread.join()
+        self.assertEqual(design_progress.count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+
+from batch import sweep
+
+
+class TestParseValues(unittest.TestCase):
+
+    def test_range_is_inclusive(self):
+        self.assertEqual(sweep.parse_values('10:30:10'), ['10', '20', '30'])
+
+    def test_fractional_step(self):
+        self.assertEqual(sweep.parse_values('0.5:1.5:0.5'), ['0.5', '1', '1.5'])
+
+    def test_list_and_single_value(self):
+        self.assertEqual(sweep.parse_values('MB 300, MB 350,,MB 400'), ['MB 300', 'MB 350', 'MB 400'])
+        self.assertEqual(sweep.parse_values('E 250 (Fe 410 W)A'), ['E 250 (Fe 410 W)A'])
+
+    def test_step_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            sweep.parse_values('10:30:0')
+
+
+class TestExpandGrid(unittest.TestCase):
+    base = {'Module': 'Fin Plate Connection', 'Load.Shear': '60', 'Bolt.Diameter': ['16', '20', '24']}
+
+    def test_one_design_per_combination(self):
+        grid = sweep.expand_grid(self.base, {'Load.Shear': ['10', '20'], 'Bolt.Diameter': ['16', '20']})
+        self.assertEqual([point for point, _ in grid],
+                         [{'Load.Shear': '10', 'Bolt.Diameter': '16'}, {'Load.Shear': '10', 'Bolt.Diameter': '20'},
+                          {'Load.Shear': '20', 'Bolt.Diameter': '16'}, {'Load.Shear': '20', 'Bolt.Diameter': '20'}])
+        point, design_dictionary = grid[1]
+        self.assertEqual(design_dictionary['Load.Shear'], '10')
+        self.assertEqual(design_dictionary['Module'], 'Fin Plate Connection')
+
+    def test_list_inputs_are_fixed_to_one_item(self):
+        grid = sweep.expand_grid(self.base, {'Bolt.Diameter': ['20']})
+        self.assertEqual(grid[0][1]['Bolt.Diameter'], ['20'])
+        self.assertEqual(self.base['Bolt.Diameter'], ['16', '20', '24'])
+
+
+class TestDesignKey(unittest.TestCase):
+    base = {'Module': 'Fin Plate Connection', 'Load.Shear': '60', 'Bolt.Diameter': ['16', '20']}
+
+    def test_equal_inputs_have_equal_keys(self):
+        same = dict(reversed(list(self.base.items())))
+        self.assertEqual(sweep._design_key(self.base), sweep._design_key(same))
+        other = dict(self.base, **{'Bolt.Diameter': ['20', '16']})
+        self.assertNotEqual(sweep._design_key(self.base), sweep._design_key(other))
+
+    def test_duplicate_points_are_designed_once(self):
+        result = {'module': 'Fin Plate Connection', 'design_status': True, 'errors': [], 'outputs': {'Out': 1}}
+        with mock.patch.object(sweep, '_design_point', return_value=result) as design_point, \
+                mock.patch.object(sweep.catalogue, 'enable'):
+            rows = sweep.run_sweep(self.base, {'Load.Shear': ['10', '10', '20']}, jobs=1)
+        self.assertEqual(design_point.call_count, 2)
+        self.assertEqual([row['Load.Shear'] for row in rows], ['10', '10', '20'])
+        self.assertTrue(all(row['design_status'] and row['Out'] == 1 for row in rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from utils.common import trace
+
+
+class TestTrace(unittest.TestCase):
+
+    def setUp(self):
+        self.saved_patterns = set(trace._patterns)
+        trace.disable()
+        self.events = []
+
+    def tearDown(self):
+        trace.disable()
+        trace.enable(*self.saved_patterns)
+
+    def test_channels_are_off_by_default(self):
+        channel = trace.channel('test_off')
+        self.assertIs(trace.channel('test_off'), channel)
+        self.assertFalse(channel.on)
+        trace.add_sink(self.events.append)
+        try:
+            channel('event', value=1)
+        finally:
+            trace.remove_sink(self.events.append)
+        self.assertEqual(self.events, [])
+
+    def test_enable_by_name_and_pattern(self):
+        fin_plate, end_plate = trace.channel('test_fin_plate'), trace.channel('test_end_plate')
+        trace.enable('test_fin_plate')
+        self.assertTrue(fin_plate.on)
+        self.assertFalse(end_plate.on)
+        trace.enable('test_*')
+        self.assertTrue(end_plate.on)
+        self.assertTrue(trace.channel('test_created_later').on)
+        trace.disable('test_*')
+        self.assertTrue(fin_plate.on)
+        self.assertFalse(end_plate.on)
+        trace.disable()
+        self.assertFalse(fin_plate.on)
+
+    def test_capture_collects_events_and_restores_channels(self):
+        channel = trace.channel('test_capture')
+        with trace.capture('test_capture') as events:
+            channel('bolt_grade', 8.8, capacity=45.2)
+            trace.channel('test_other')('ignored')
+        self.assertFalse(channel.on)
+        self.assertEqual(events, [{'channel': 'test_capture', 'event': 'bolt_grade', 'values': (8.8,),
+                                   'capacity': 45.2}])
+
+
+if __name__ == '__main__':
+    unittest.main()
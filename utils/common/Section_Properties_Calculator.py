@@ -2,6 +2,10 @@ import math
 from utils.common.component import Angle, Column,Beam,Channel
 from abc import ABC, abstractmethod
 
+from utils.common import trace
+
+_trace = trace.channel('section_properties')
+
 
 class Section_Properties(ABC):
 
@@ -157,7 +161,8 @@ class Single_Angle_Properties(Section_Properties):
         self.I_yz = a * b * (a / 2 - Cza) * (b / 2 - Cya) - (
                 (a - t) * (b - t) * (0.5 * (a + t) - Cza) * (0.5 * (b + t) - Cya))
         # self.I_yz = 1.000
-        print(self.I_yz)
+        if _trace.on:
+            _trace('moment_of_area_yz', I_yz=self.I_yz)
         return round(self.I_yz / 10000, 2)
 
     def calc_MomentOfAreaU(self, a, b, t, l):
@@ -231,7 +236,8 @@ class Single_Angle_Properties(Section_Properties):
             y_1 = (a - x) / 2
             y_2 = (x - t) / 2
             y_3 = (x - t) + (t / 2)
-            print("Leg A area is more than Leg B area")
+            if _trace.on:
+                _trace('leg_a_area_larger')
         else:
             x = (A_leg_a + A_leg_b) / (2 * t)
             A_1 = (a - t) * t
@@ -240,7 +246,8 @@ class Single_Angle_Properties(Section_Properties):
             y_1 = (t - x) + (a - t) / 2
             y_2 = (t - x) / 2
             y_3 = x / 2
-            print("Leg B area is more than Leg A area")
+            if _trace.on:
+                _trace('leg_b_area_larger')
 
         Z_pz = A_1 * y_1 + A_2 * y_2 + A_3 * y_3
         return round(Z_pz / 1000, 2)
@@ -256,7 +263,8 @@ class Single_Angle_Properties(Section_Properties):
             y_1 = x / 2
             y_2 = (t - x) / 2
             y_3 = (t - x) + (b - t) / 2
-            print("Leg A area is more than Leg B area")
+            if _trace.on:
+                _trace('leg_a_area_larger')
         else:
             x = b - (A_leg_a + A_leg_b) / (2 * t)
             A_1 = a * t
@@ -265,7 +273,8 @@ class Single_Angle_Properties(Section_Properties):
             y_1 = (x - t) + (t / 2)
             y_2 = (x - t) / 2
             y_3 = (b - x) / 2
-            print("Leg B area is more than Leg A area")
+            if _trace.on:
+                _trace('leg_b_area_larger')
 
         Z_py = A_1 * y_1 + A_2 * y_2 + A_3 * y_3
         return round(Z_py / 1000, 2)
@@ -862,7 +871,8 @@ class SAngle_Properties(Section_Properties):
 class Single_Channel_Properties(Section_Properties):
 
     def calc_Mass(self, f_w, f_t, w_h, w_t):
-        print(f_w, f_t, w_h, w_t)
+        if _trace.on:
+            _trace('calc_Mass', f_w=f_w, f_t=f_t, w_h=w_h, w_t=w_t)
         Ac = self.calc_Area(f_w, f_t, w_h, w_t)
         self.M = 7850 * Ac / 10000
         return round(self.M, 2)
@@ -879,7 +889,8 @@ class Single_Channel_Properties(Section_Properties):
 
     def calc_MomentOfAreaZ(self, f_w, f_t, w_h, w_t):
         self.I_zz = (f_w * w_h ** 3) / 12 - ((f_w - w_t) * (w_h - 2 * f_t) ** 3) / 12
-        print(self.I_zz, "duvbdf")
+        if _trace.on:
+            _trace('moment_of_area_z', I_zz=self.I_zz)
         return round(self.I_zz / 10000, 2)
 
     def calc_MomentOfAreaY(self, f_w, f_t, w_h, w_t):
@@ -930,7 +941,8 @@ class Single_Channel_Properties(Section_Properties):
             y_2 = (w_t - x) / 2
             y_3 = (w_t - x) + (f_w - w_t) / 2
 
-            print("Web area is more than flange area")
+            if _trace.on:
+                _trace('web_area_larger')
         else:
             x = f_w - (A_w + A_f) / (4 * f_t)
             A_1 = w_h * w_t
@@ -939,7 +951,8 @@ class Single_Channel_Properties(Section_Properties):
             y_1 = (x - w_t) + (w_t / 2)
             y_2 = (x - w_t) / 2
             y_3 = (f_w - x) / 2
-            print("Flange area is more than web area")
+            if _trace.on:
+                _trace('flange_area_larger')
 
         self.Z_py = A_1 * y_1 + A_2 * y_2 + A_3 * y_3
         return round(self.Z_py / 1000, 2)
@@ -0,0 +1,76 @@
+"""Memoised read access to the section/material catalogue (Intg_osdag.sqlite)
+
+Every design queries the catalogue many times over: material grades for each
+bolt grade tried, section rows for each member, whole designation lists for
+the input dock. Within one batch run (sweep, design service, benchmarks) the
+catalogue never changes, so these rows are shared between all designs of that
+run and can be fetched once per process.
+
+The cache is disabled by default, because the GUI adds custom materials and
+sections to the database at runtime. Batch entry points call enable() when
+they start.
+"""
+import sqlite3
+
+_rows = None
+_hits = 0
+_misses = 0
+
+
+def enable():
+    """Start memoising catalogue rows in this process."""
+    global _rows
+    if _rows is None:
+        _rows = {}
+
+
+def disable():
+    """Stop memoising and drop every cached row."""
+    global _rows, _hits, _misses
+    _rows = None
+    _hits = 0
+    _misses = 0
+
+
+def is_enabled():
+    return _rows is not None
+
+
+def stats():
+    """
+    Returns:
+        dictionary with the hit/miss counts and number of cached queries (dict)
+    """
+    return {'enabled': is_enabled(), 'hits': _hits, 'misses': _misses,
+            'entries': 0 if _rows is None else len(_rows)}
+
+
+def _query(database, db_query, params, fetch_all):
+    global _hits, _misses
+    key = (database, db_query, params, fetch_all)
+    if _rows is not None and key in _rows:
+        _hits += 1
+        return _rows[key]
+
+    conn = sqlite3.connect(database)
+    cur = conn.cursor()
+    cur.execute(db_query, params)
+    result = cur.fetchall() if fetch_all else cur.fetchone()
+    conn.close()
+
+    if _rows is not None:
+        _misses += 1
+        if fetch_all:
+            result = tuple(result)
+        _rows[key] = result
+    return result
+
+
+def fetch_one(database, db_query, params=()):
+    """Return the first row of a read-only catalogue query (tuple or None)."""
+    return _query(database, db_query, tuple(params), False)
+
+
+def fetch_all(database, db_query, params=()):
+    """Return all rows of a read-only catalogue query (sequence of tuples)."""
+    return _query(database, db_query, tuple(params), True)
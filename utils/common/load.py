@@ -1,3 +1,8 @@
+from utils.common import trace
+
+_trace = trace.channel('load')
+
+
 class Load(object):
 
     def __init__(self, axial_force=0.0, shear_force=0.0, moment=0.0, moment_minor=0.0, unit_kNm=False):
@@ -7,7 +12,6 @@ class Load(object):
         if unit_kNm is True:
             force_multiplier = 1e3
             moment_multiplier = 1e6
-        print(force_multiplier, "is force multiplier")
         if axial_force is not "":
             self.axial_force = force_multiplier * float(axial_force)
         else:
@@ -22,8 +26,9 @@ class Load(object):
         else:
             self.moment = 0.0
             self.moment_minor = 0.0
-        print("setting factored input loads as, axial force = {0} N, shear force = {1} N, moment = {2} Nmm".format(
-            self.axial_force, self.shear_force, self.moment))
+        if _trace.on:
+            _trace('factored_loads', force_multiplier=force_multiplier, axial_force=self.axial_force,
+                   shear_force=self.shear_force, moment=self.moment)
 
     def __repr__(self):
         repr = "Load\n"
@@ -0,0 +1,224 @@
+"""Logging setup shared by all design modules
+
+The 'Osdag' logger gets its handlers exactly once per process, however often
+set_osdaglogger is called:
+    * a QueueHandler on the logger, so a design only puts records on a queue,
+    * a QueueListener thread that formats them for the console and
+      logging_text.log, the file being opened once,
+    * the OurLog handler of the GUI log window (replaced, not added, when
+      the window changes), which stays synchronous as it writes to a widget.
+
+Messages of a single design are collected with DesignLogBuffer as LogEntry
+records (level, message, clause of IS 800 referred to) and handed to the
+report renderers as reportsummary['logger_messages'], instead of re-reading
+and re-parsing logging_text.log. A buffer only keeps the messages of the
+thread that attached it, so designs run side by side keep separate logs.
+"""
+import re
+import time
+import queue
+import atexit
+import logging
+import threading
+import collections
+import logging.handlers
+
+LOGGER_NAME = 'Osdag'
+LOG_FILE = 'logging_text.log'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+MAX_LOG_ENTRIES = 1000      # messages kept per design, the earliest dropped first
+# "Cl. 10.7", "cl.10.5.7", "Clause 10.2.4.2", "Cl.6.4.1(a)"
+CLAUSE_PATTERN = re.compile(r'\b(?:Cl|Clause)\.?\s*(\d+(?:\.\d+)*(?:\([a-z0-9]+\))?)', re.IGNORECASE)
+# a line of logging_text.log: time - logger - level - message
+LOG_LINE_PATTERN = re.compile(r'^(.*?) - (\S+) - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.*)$')
+
+_listener = None
+_listening = False
+_queue_handler = None
+_file_handler = None
+_window_handlers = {}
+
+
+def _formatter():
+    return logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT)
+
+
+def _start_listener(console, log_file):
+    global _listener, _queue_handler, _file_handler
+    handlers = []
+    if console:
+        handlers.append(logging.StreamHandler())
+    if log_file:
+        _file_handler = logging.FileHandler(log_file)
+        handlers.append(_file_handler)
+    for handler in handlers:
+        handler.setFormatter(_formatter())
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _start()
+    atexit.register(stop)
+
+
+def _start():
+    global _listening
+    _listener.start()
+    _listening = True
+
+
+def setup_logger(key=None, name=LOGGER_NAME, console=True, log_file=LOG_FILE):
+    """Return the module logger, adding its handlers only the first time.
+
+    Args:
+        key: GUI log window (QTextEdit) to show messages in, or None (object)
+        name: logger name (str)
+        console: also print messages; only used by the first call in a process (bool)
+        log_file: file messages are appended to, None for no file; only used
+            by the first call in a process (str)
+
+    Returns:
+        configured logger (logging.Logger)
+    """
+    from Common import OurLog
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    if _listener is None:
+        _start_listener(console, log_file)
+    if _queue_handler not in logger.handlers:
+        logger.addHandler(_queue_handler)
+
+    if key is not None:
+        window_handler = _window_handlers.get(name)
+        if window_handler is None or window_handler.key is not key:
+            if window_handler is not None:
+                logger.removeHandler(window_handler)
+            window_handler = OurLog(key)
+            window_handler.setFormatter(_formatter())
+            logger.addHandler(window_handler)
+            _window_handlers[name] = window_handler
+    return logger
+
+
+def clear_log_file():
+    """Empty logging_text.log before a new design, without reopening it."""
+    if _listener is None or _file_handler is None:
+        open(LOG_FILE, 'w').close()
+        return
+    # Let the listener write out what is queued before cutting the file.
+    stop()
+    _file_handler.acquire()
+    try:
+        _file_handler.stream.seek(0)
+        _file_handler.stream.truncate()
+    finally:
+        _file_handler.release()
+    _start()
+
+
+def stop():
+    """Flush queued messages and stop the listener thread (called at exit)."""
+    global _listening
+    if _listening:
+        _listener.stop()
+        _listening = False
+
+
+def clause_of(message):
+    """The clause a log message refers to, such as '10.7', or None (str)."""
+    match = CLAUSE_PATTERN.search(message)
+    return match.group(1) if match else None
+
+
+class LogEntry(collections.namedtuple('LogEntry', ('level', 'message', 'clause', 'created', 'name'))):
+    """A log message of a design: level name, message, clause referred to, time (epoch) and logger."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_record(cls, record):
+        message = record.getMessage()
+        return cls(record.levelname, message, clause_of(message), record.created, record.name)
+
+    def line(self):
+        """The message as a line of logging_text.log (str)."""
+        return '{} - {} - {} - {}'.format(time.strftime(DATE_FORMAT, time.localtime(self.created)), self.name,
+                                          self.level, self.message)
+
+
+def log_entries(logger_messages):
+    """
+    reportsummary['logger_messages'] as LogEntry records: given as they are by
+    DesignLogBuffer.entries(), or parsed from text in the format of
+    logging_text.log (lines without a level are left out).
+
+    Returns:
+        list of LogEntry
+    """
+    if not isinstance(logger_messages, str):
+        return list(logger_messages or ())
+    entries = []
+    for line in logger_messages.split('\n'):
+        match = LOG_LINE_PATTERN.match(line.strip())
+        if match:
+            asctime, name, level, message = match.groups()
+            try:
+                created = time.mktime(time.strptime(asctime, DATE_FORMAT))
+            except ValueError:
+                created = 0.0
+            entries.append(LogEntry(level, message, clause_of(message), created, name))
+    return entries
+
+
+class DesignLogBuffer(logging.Handler):
+    """In-memory log of one design: its last max_entries messages as LogEntry records.
+
+    Used as a context manager around the design:
+
+        with DesignLogBuffer() as log_buffer:
+            main.func_for_validation(main, design_dictionary)
+        reportsummary['logger_messages'] = log_buffer.entries()
+
+    Only the messages of the thread that attached the buffer are kept, unless
+    all_threads is True.
+    """
+
+    def __init__(self, name=LOGGER_NAME, level=logging.DEBUG, max_entries=MAX_LOG_ENTRIES, all_threads=False):
+        logging.Handler.__init__(self, level)
+        self.logger_name = name
+        self.all_threads = all_threads
+        self.thread = None
+        self.dropped = 0
+        self._entries = collections.deque(maxlen=max_entries)
+
+    def emit(self, record):
+        if not self.all_threads and record.thread != self.thread:
+            return
+        if len(self._entries) == self._entries.maxlen:
+            self.dropped += 1
+        self._entries.append(LogEntry.from_record(record))
+
+    def attach(self):
+        self.thread = threading.get_ident()
+        logging.getLogger(self.logger_name).addHandler(self)
+        return self
+
+    def detach(self):
+        logging.getLogger(self.logger_name).removeHandler(self)
+
+    def entries(self):
+        """The messages kept, oldest first (list of LogEntry)."""
+        return list(self._entries)
+
+    def text(self):
+        """Messages in the format of logging_text.log (str)."""
+        return '\n'.join(entry.line() for entry in self._entries)
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.detach()
+        return False
@@ -16,7 +16,10 @@ import sqlite3
 import math
 import os
 import sys
+from utils.common import catalogue
+from utils.common import trace
 PATH_TO_DATABASE = os.path.join(sys.path[0],'ResourceFiles','Database','Intg_osdag.sqlite')
+_trace = trace.channel('other_standards')
 
 
 
@@ -158,16 +161,14 @@ class IS1367_Part3_2002(object):
         except ValueError:
             return
 
-        conn = sqlite3.connect(PATH_TO_DATABASE)
         db_query = "SELECT * FROM Bolt_fy_fu WHERE Property_Class = ? AND Diameter_min < ? AND Diameter_max >= ?"
-        cur = conn.cursor()
-        cur.execute(db_query, (bolt_PC, bolt_diameter, bolt_diameter,))
-        row = cur.fetchone()
+        row = catalogue.fetch_one(PATH_TO_DATABASE, db_query, (bolt_PC, bolt_diameter, bolt_diameter,))
 
         bolt_fy = float(row[3])
         bolt_fu = float(row[4])
 
-        print(bolt_fu, bolt_fy)
+        if _trace.on:
+            _trace('bolt_fu_fy', bolt_PC=bolt_PC, bolt_diameter=bolt_diameter, bolt_fu=bolt_fu, bolt_fy=bolt_fy)
         # print(type(bolt_fu))
 
         # bolt_fu = float(int(bolt_grade) * 100)
@@ -0,0 +1,192 @@
+"""Opt-in profiling of the design code by clause and design stage
+
+instrument() wraps
+    * every clause of IS800_2007 and IS1367_Part3_2002,
+    * the methods of Bolt, Plate and Weld,
+    * the top level stages of the design modules (STAGES),
+with timers that record call counts, cumulative time (first entry only,
+so recursion is not counted twice) and self time, per function and per call
+stack. Nothing is wrapped until instrument() is called and uninstrument()
+puts the original functions back.
+
+    profiling.instrument([FinPlateConnection])
+    profiling.reset()
+    FinPlateConnection.func_for_validation(FinPlateConnection, design_dictionary)
+    data = profiling.snapshot()
+    print(profiling.format_hotspots(data))
+    open('fin.folded', 'w').write(profiling.collapsed_stacks(data))
+
+snapshot() also holds the catalogue cache hits/misses since reset(), and
+collapsed_stacks() gives the 'a;b;c count' text read by flamegraph.pl and
+speedscope.
+"""
+import json
+import inspect
+import functools
+from time import perf_counter
+
+from utils.common import catalogue
+
+STAGES = ('func_for_validation', 'set_input_values', 'member_capacity', 'initial_member_capacity',
+          'select_bolt_dia', 'get_bolt_grade', 'select_bolt_plate_arrangement', 'get_plate_details',
+          'get_fin_plate_details', 'design_weld', 'get_design_status', 'output_values')
+
+_originals = []
+_functions = {}
+_stacks = {}
+_call_stack = []
+_catalogue_start = (0, 0)
+
+
+def _clause_classes():
+    from utils.common.is800_2007 import IS800_2007
+    from utils.common.other_standards import IS1367_Part3_2002
+    from utils.common.component import Bolt, Plate, Weld
+    return [IS800_2007, IS1367_Part3_2002, Bolt, Plate, Weld]
+
+
+def _record(name, elapsed, child_time, recursive):
+    stats = _functions.get(name)
+    if stats is None:
+        stats = _functions[name] = {'calls': 0, 'cumulative': 0.0, 'self': 0.0}
+    stats['calls'] += 1
+    stats['self'] += elapsed - child_time
+    if not recursive:
+        stats['cumulative'] += elapsed
+    path = ';'.join(frame[0] for frame in _call_stack) + (';' if _call_stack else '') + name
+    _stacks[path] = _stacks.get(path, 0.0) + elapsed - child_time
+
+
+def _timed(name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        recursive = any(frame[0] == name for frame in _call_stack)
+        frame = [name, 0.0]
+        _call_stack.append(frame)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            _call_stack.pop()
+            _record(name, elapsed, frame[1], recursive)
+            if _call_stack:
+                _call_stack[-1][1] += elapsed
+    wrapper._profiled = True
+    return wrapper
+
+
+def _wrap(owner, attr_name, name):
+    static_attr = inspect.getattr_static(owner, attr_name)
+    if isinstance(static_attr, staticmethod):
+        func, rewrap = static_attr.__func__, staticmethod
+    elif isinstance(static_attr, classmethod):
+        func, rewrap = static_attr.__func__, classmethod
+    elif inspect.isfunction(static_attr):
+        func, rewrap = static_attr, None
+    else:
+        return
+    if getattr(func, '_profiled', False):
+        return
+    wrapper = _timed(name, func)
+    _originals.append((owner, attr_name, owner.__dict__.get(attr_name)))
+    setattr(owner, attr_name, rewrap(wrapper) if rewrap else wrapper)
+
+
+def instrument(module_classes=()):
+    """Wrap the clause classes and the stages of the given design classes with timers.
+
+    Args:
+        module_classes: design classes whose STAGES are timed, e.g. [FinPlateConnection] (list)
+    """
+    for cls in _clause_classes():
+        for attr_name in list(vars(cls)):
+            if not attr_name.startswith('__'):
+                _wrap(cls, attr_name, '{}.{}'.format(cls.__name__, attr_name))
+    for cls in module_classes:
+        for attr_name in STAGES:
+            if hasattr(cls, attr_name):
+                _wrap(cls, attr_name, '{}.{}'.format(cls.__name__, attr_name))
+
+
+def uninstrument():
+    """Put back every function replaced by instrument()."""
+    while _originals:
+        owner, attr_name, original = _originals.pop()
+        if original is None:
+            delattr(owner, attr_name)
+        else:
+            setattr(owner, attr_name, original)
+
+
+def is_instrumented():
+    return bool(_originals)
+
+
+def reset():
+    """Clear the recorded timings and start counting catalogue hits/misses afresh."""
+    global _catalogue_start
+    _functions.clear()
+    _stacks.clear()
+    stats = catalogue.stats()
+    _catalogue_start = (stats['hits'], stats['misses'])
+
+
+def snapshot():
+    """
+    Returns:
+        recorded data as plain dictionaries, with times in seconds:
+        {'functions': {name: {'calls', 'cumulative', 'self'}}, 'stacks': {path: self time},
+        'catalogue': {'hits', 'misses', 'hit_rate'}} (dict)
+    """
+    stats = catalogue.stats()
+    hits = stats['hits'] - _catalogue_start[0]
+    misses = stats['misses'] - _catalogue_start[1]
+    return {
+        'functions': {name: dict(values) for name, values in _functions.items()},
+        'stacks': dict(_stacks),
+        'catalogue': {'hits': hits, 'misses': misses,
+                      'hit_rate': hits / (hits + misses) if hits + misses else None},
+    }
+
+
+def merge(total, data):
+    """Add one snapshot to another (e.g. from several designs or processes) and return the total (dict)."""
+    if not total:
+        total.update({'functions': {}, 'stacks': {}, 'catalogue': {'hits': 0, 'misses': 0, 'hit_rate': None}})
+    for name, values in data['functions'].items():
+        stats = total['functions'].setdefault(name, {'calls': 0, 'cumulative': 0.0, 'self': 0.0})
+        for key in ('calls', 'cumulative', 'self'):
+            stats[key] += values[key]
+    for path, value in data['stacks'].items():
+        total['stacks'][path] = total['stacks'].get(path, 0.0) + value
+    hits = total['catalogue']['hits'] + data['catalogue']['hits']
+    misses = total['catalogue']['misses'] + data['catalogue']['misses']
+    total['catalogue'] = {'hits': hits, 'misses': misses,
+                          'hit_rate': hits / (hits + misses) if hits + misses else None}
+    return total
+
+
+def to_json(data, path):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def collapsed_stacks(data):
+    """Self time per call stack in the collapsed format of flame graph tools, in microseconds (str)."""
+    lines = ['{} {}'.format(path, int(round(value * 1e6))) for path, value in sorted(data['stacks'].items())]
+    return '\n'.join(line for line in lines if not line.endswith(' 0')) + '\n'
+
+
+def format_hotspots(data, top=15):
+    """Table of the functions with the largest self time (str)."""
+    rows = sorted(data['functions'].items(), key=lambda item: item[1]['self'], reverse=True)[:top]
+    lines = ['{:<60} {:>8} {:>12} {:>12}'.format('function', 'calls', 'self (ms)', 'cum. (ms)')]
+    for name, values in rows:
+        lines.append('{:<60} {:>8} {:>12.2f} {:>12.2f}'.format(
+            name, values['calls'], values['self'] * 1000, values['cumulative'] * 1000))
+    rate = data['catalogue']['hit_rate']
+    lines.append('catalogue cache: {} hits, {} misses{}'.format(
+        data['catalogue']['hits'], data['catalogue']['misses'],
+        '' if rate is None else ' ({:.0%} hit rate)'.format(rate)))
+    return '\n'.join(lines)
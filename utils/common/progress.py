@@ -0,0 +1,140 @@
+"""Progress and cancellation of a design run in a worker thread
+
+watch() puts a checkpoint in front of the top level stages of a design module
+(profiling.STAGES) and of the clause and component methods its optimisation
+loops call for every candidate (IS800_2007, IS1367_Part3_2002, Bolt, Plate,
+Weld). While a DesignProgress is active in a thread, every checkpoint that
+thread reaches is counted, reported to the progress callback (at most every
+interval seconds) and, once cancel() has been called from any thread, raises
+DesignCancelled: the design stops at the next clause it checks, between two
+candidates. Designs run without a DesignProgress, and other threads, pay one
+thread-local lookup per checkpoint.
+
+    progress = DesignProgress(FinPlateConnection, callback=print)
+    with progress:
+        FinPlateConnection.func_for_validation(FinPlateConnection, design_dictionary)
+
+The fraction done is estimated from the number of checkpoints the last
+complete design of the same module went through; it is None until a design
+of the module has completed.
+"""
+import inspect
+import functools
+import threading
+from time import perf_counter
+
+from utils.common.profiling import STAGES
+
+_local = threading.local()
+_watched = set()
+_expected = {}
+
+
+class DesignCancelled(Exception):
+    """Raised in the design thread at the first checkpoint after DesignProgress.cancel()."""
+
+
+def _checkpointed(name, stage, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        current = getattr(_local, 'progress', None)
+        if current is not None:
+            current.checkpoint(stage)
+        return func(*args, **kwargs)
+    wrapper._checkpoint = name
+    return wrapper
+
+
+def _wrap(owner, attr_name, stage=None):
+    static_attr = inspect.getattr_static(owner, attr_name)
+    if isinstance(static_attr, staticmethod):
+        func, rewrap = static_attr.__func__, staticmethod
+    elif isinstance(static_attr, classmethod):
+        func, rewrap = static_attr.__func__, classmethod
+    elif inspect.isfunction(static_attr):
+        func, rewrap = static_attr, None
+    else:
+        return
+    if getattr(func, '_checkpoint', None):
+        return
+    wrapper = _checkpointed('{}.{}'.format(owner.__name__, attr_name), stage, func)
+    setattr(owner, attr_name, rewrap(wrapper) if rewrap else wrapper)
+
+
+def _clause_classes():
+    # component first: is800_2007 imports it back
+    from utils.common.component import Bolt, Plate, Weld
+    from utils.common.is800_2007 import IS800_2007
+    from utils.common.other_standards import IS1367_Part3_2002
+    return [IS800_2007, IS1367_Part3_2002, Bolt, Plate, Weld]
+
+
+def watch(module_class):
+    """Put checkpoints in the clause classes and the stages of a design class (once per class)."""
+    if not _watched:
+        for cls in _clause_classes():
+            for attr_name in list(vars(cls)):
+                if not attr_name.startswith('__'):
+                    _wrap(cls, attr_name)
+        _watched.add(None)
+    if module_class not in _watched:
+        for attr_name in STAGES:
+            if attr_name in vars(module_class) or hasattr(module_class, attr_name):
+                _wrap(module_class, attr_name, attr_name)
+        _watched.add(module_class)
+
+
+class DesignProgress(object):
+    """Progress of one design, counted in checkpoints, and the request to cancel it."""
+
+    def __init__(self, module_class, callback=None, interval=0.05):
+        """
+        Args:
+            module_class: design class being designed, e.g. FinPlateConnection
+            callback: called from the design thread with the fraction done
+                (float, or None if unknown) and the current stage (str, or None)
+            interval: least time between two calls of the callback, in seconds (float)
+        """
+        self.module_class = module_class
+        self.callback = callback
+        self.interval = interval
+        self.count = 0
+        self.stage = None
+        self._cancel = threading.Event()
+        self._next_report = 0.0
+
+    def cancel(self):
+        """Stop the design at its next checkpoint (may be called from any thread)."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def fraction(self):
+        """Estimated fraction of the design done (float), None for the first design of a module."""
+        expected = _expected.get(self.module_class)
+        return min(self.count / expected, 0.99) if expected else None
+
+    def checkpoint(self, stage=None):
+        if self._cancel.is_set():
+            raise DesignCancelled('Design cancelled')
+        self.count += 1
+        if stage is not None:
+            self.stage = stage
+        if self.callback is not None:
+            now = perf_counter()
+            if now >= self._next_report:
+                self._next_report = now + self.interval
+                self.callback(self.fraction(), self.stage)
+
+    def __enter__(self):
+        watch(self.module_class)
+        _local.progress = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _local.progress = None
+        if exc_type is None:
+            _expected[self.module_class] = self.count
+        return False
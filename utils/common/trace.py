@@ -0,0 +1,127 @@
+"""Trace output for the internals of the design algorithms
+
+Replaces the print() calls that followed the optimisation loops (bolt
+diameter/grade selection, plate detailing, bolt force checks). Each module
+traces on its own named channel and every channel is off by default, so a
+design pays one attribute check per trace point:
+
+    _trace = trace.channel('fin_plate')
+    ...
+    if _trace.on:
+        _trace('bolt_grade', grade=grade, capacity=capacity, force=force)
+
+Switch channels on with trace.enable('fin_plate', 'component'), with shell
+patterns (trace.enable('*')) or with the OSDAG_TRACE environment variable
+(OSDAG_TRACE=fin_plate,component). Events go to stderr unless a sink is
+added; trace.capture() collects them as dictionaries.
+"""
+import os
+import sys
+import fnmatch
+import contextlib
+
+_channels = {}
+_patterns = set()
+_sinks = []
+
+
+class Channel(object):
+    """Named trace channel; calling it emits an event when the channel is on."""
+
+    def __init__(self, name):
+        self.name = name
+        self.on = _is_enabled(name)
+
+    def __call__(self, event, *values, **fields):
+        """Emit an event.
+
+        Args:
+            event: short event name (str)
+            values: unnamed values, kept in the order given
+            fields: named values
+        """
+        if not self.on:
+            return
+        record = {'channel': self.name, 'event': event}
+        if values:
+            record['values'] = values
+        record.update(fields)
+        for sink in (_sinks or [_stderr_sink]):
+            sink(record)
+
+
+def _is_enabled(name):
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in _patterns)
+
+
+def _refresh():
+    for name, trace_channel in _channels.items():
+        trace_channel.on = _is_enabled(name)
+
+
+def _stderr_sink(record):
+    text = ' '.join('{}={}'.format(k, v) for k, v in record.items()
+                    if k not in ('channel', 'event', 'values'))
+    values = ' '.join(str(v) for v in record.get('values', ()))
+    sys.stderr.write('[{}] {} {}\n'.format(record['channel'], record['event'], ' '.join(filter(None, (values, text)))))
+
+
+def channel(name):
+    """Return the trace channel of a module, creating it on first use (Channel)."""
+    if name not in _channels:
+        _channels[name] = Channel(name)
+    return _channels[name]
+
+
+def enable(*names):
+    """Switch on channels by name or shell pattern ('*' for all)."""
+    _patterns.update(names)
+    _refresh()
+
+
+def disable(*names):
+    """Switch off the given channel names/patterns, or every channel if none is given."""
+    if names:
+        _patterns.difference_update(names)
+    else:
+        _patterns.clear()
+    _refresh()
+
+
+def enabled_channels():
+    """Names of the channels that are currently on (list)."""
+    return sorted(name for name, trace_channel in _channels.items() if trace_channel.on)
+
+
+def add_sink(sink):
+    """Send events to sink(record) instead of stderr."""
+    _sinks.append(sink)
+
+
+def remove_sink(sink):
+    _sinks.remove(sink)
+
+
+@contextlib.contextmanager
+def capture(*names):
+    """Switch on channels (all if none given) and collect their events in a list.
+
+    Usage:
+        with trace.capture('fin_plate') as events:
+            FinPlateConnection.func_for_validation(FinPlateConnection, design_dictionary)
+    """
+    saved_patterns = set(_patterns)
+    events = []
+    enable(*(names or ('*',)))
+    add_sink(events.append)
+    try:
+        yield events
+    finally:
+        remove_sink(events.append)
+        _patterns.clear()
+        _patterns.update(saved_patterns)
+        _refresh()
+
+
+if os.environ.get('OSDAG_TRACE'):
+    enable(*(name.strip() for name in os.environ['OSDAG_TRACE'].split(',') if name.strip()))
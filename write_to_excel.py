@@ -1,142 +1,197 @@
-from design_type.connection.shear_connection import ShearConnection
-from design_type.connection.fin_plate_connection import FinPlateConnection
-from design_type.tension_member.tension_bolted import Tension_bolted
-from design_type.tension_member.tension_welded import Tension_welded
-from design_type.connection.beam_cover_plate import BeamCoverPlate
-from design_type.connection.beam_cover_plate_weld import BeamCoverPlateWeld
-from design_type.connection.column_cover_plate import ColumnCoverPlate
-from design_type.connection.column_cover_plate_weld import ColumnCoverPlateWeld
-from design_type.connection.column_end_plate import ColumnEndPlate
-import yaml
-from utils.common.component import Bolt, Plate, Weld
-from Common import *
+"""Write the inputs and outputs of many designs to one Excel workbook
+
+Every design (an .osi file) is designed by a pool of worker processes, and
+its inputs and outputs are written as a block of rows
+(design name, input key, input value, output key, output value) to the sheet
+of its module. The outputs are the check values of results_to_test for the
+modules that have it (the cover plate and column end plate connections), and
+the output dock values for the others. The workbook is opened once and written row by row: with
+xlsxwriter in constant_memory mode, or else openpyxl in write-only mode, so
+the time and memory taken do not grow with the size of the workbook.
+
+    python write_to_excel.py ResourceFiles/design_example -o osdag_results.xlsx -j 4
+"""
 import os
-import xlsxwriter
-# import pandas as pd
-from openpyxl import load_workbook, Workbook
-
-path = r'.\ResourceFiles\design_example'
-
-files = []
-# r=root, d=directories, f = files
-for r, d, f in os.walk(path):
-    for file in f:
-        if '.osi' in file:
-            files.append(os.path.join(r, file))
-
-
-for f in files:
-    print(f)
-    with open(f, 'r') as input_file:
-        d = yaml.load(input_file, Loader=yaml.FullLoader)
-
-    module = d['Module']
-
-
-    if module == KEY_DISP_COLUMNCOVERPLATEWELD:
-        main = ColumnCoverPlateWeld
-        main.set_osdaglogger(None)
-        main.set_input_values(main, d)
-        base = os.path.basename(f)
-        #TODO:comment below line for fin check
-        test_in_list = d
-        # filename = str(os.path.splitext(base)[0])+".txt"
-        # test_out_list = main.results_to_test(main)
-        # f = open(filename, "w")
-        # f.write(str(test_out_list))
-        # f.close()
-
-        workbook_name = 'CCWP.xlsx'
-
-        sheet_name = str(os.path.splitext(base)[0])
+import re
+import sys
+import time
+import argparse
+import itertools
+import contextlib
+
+# Common and component import each other; component has to be imported first.
+from utils.common.component import *
+from Common import *
+from batch.runner import load_design_file
+from batch.cad_export import find_design_files, unique_names
+from batch.results import design_result, design_results
+from design_type.registry import get_module_class
+
+HEADER = ('Design', 'Input', 'Input Value', 'Output', 'Output Value')
+SHEET_NAME_LENGTH = 31      # longest sheet name Excel accepts
+
+
+def sheet_name(module, used):
+    """A valid sheet name for a module, distinct from the used ones (str)."""
+    name = re.sub(r'[\[\]:*?/\\]', '', module)[:SHEET_NAME_LENGTH] or 'Sheet'
+    base, i = name, 1
+    while name.lower() in used:
+        i += 1
+        suffix = ' ({})'.format(i)
+        name = base[:SHEET_NAME_LENGTH - len(suffix)] + suffix
+    used.add(name.lower())
+    return name
+
+
+def _cell(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return str(value)
+
+
+def design_rows(name, inputs, outputs):
+    """
+    The rows of one design: inputs and outputs side by side, the shorter
+    list padded with empty cells, the design name on the first row only.
+    """
+    pairs = itertools.zip_longest(inputs.items(), outputs.items(), fillvalue=('', ''))
+    for i, ((input_key, input_value), (output_key, output_value)) in enumerate(pairs):
+        yield (name if i == 0 else '', input_key, str(input_value), output_key, _cell(output_value))
+
+
+def excel_result(design_dictionary, name):
+    """
+    design_result() of one design, its outputs replaced by the check values of
+    results_to_test when its module has them (dict).
+    """
+    result = design_result(design_dictionary, name)
+    if result['errors']:
+        return result
+    module_class = get_module_class(result['module'])
+    if hasattr(module_class, 'results_to_test'):
+        # the tension modules' results_to_test writes a file instead: keep their dock outputs
         try:
-            wb = load_workbook(workbook_name)
-            print('entered try')
-        except Exception as e:
-            print('creatingnew')
-            wb = Workbook()
-        # wb.create_sheet('test2')
-
-
-
-        # writer = ExcelWriter(workbook_name, engine='openpyxl')
-        # writer.book = wb
-        test_out_list = main.results_to_test(main)
-        # TODO:uncomment below line for fin check
-        # [test_in_list,test_out_list] = main.results_to_test(main)
-
-        # df = pd.DataFrame.from_records(list(test_out_list.items()), columns=['Check', 'Value'])
-
-        input_keys = list(test_in_list.keys())
-        input_values = list(map(str, list(test_in_list.values())))
-        output_keys = list(test_out_list.keys())
-        output_values = list(map(str, list(test_out_list.values())))
-
-        while len(input_keys) != len(output_keys):
-            if len(input_keys) < len(output_keys):
-                for i in range(0,len(output_keys)-len(input_keys)):
-                    input_keys.append('')
-                    input_values.append('')
+            with open(os.devnull, 'w') as out, contextlib.redirect_stdout(out):
+                check_values = module_class.results_to_test(module_class)
+        except Exception:
+            check_values = None
+        if isinstance(check_values, dict):
+            result['outputs'] = check_values
+    return result
+
+
+class ExcelWriter(object):
+    """A workbook written row by row, with one sheet per module."""
+
+    def __init__(self, path, engine=None):
+        """
+        Args:
+            path: .xlsx file to write (str)
+            engine: 'xlsxwriter' or 'openpyxl'; the first one installed by default (str)
+        """
+        self.path = path
+        self.engine = engine
+        self._sheets = {}
+        self._rows = {}
+        self._used_names = set()
+        if engine in (None, 'xlsxwriter'):
+            try:
+                import xlsxwriter
+                self._book = xlsxwriter.Workbook(path, {'constant_memory': True})
+                self.engine = 'xlsxwriter'
+                return
+            except ImportError:
+                if engine is not None:
+                    raise
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ImportError('Writing Excel files needs xlsxwriter or openpyxl (pip install xlsxwriter)')
+        self._book = Workbook(write_only=True)
+        self.engine = 'openpyxl'
+
+    def _sheet(self, module):
+        if module not in self._sheets:
+            name = sheet_name(module, self._used_names)
+            if self.engine == 'xlsxwriter':
+                sheet = self._book.add_worksheet(name)
             else:
-                for i in range(0,len(input_keys)-len(output_keys)):
-                    output_keys.append('')
-                    output_values.append('')
-
-        sheet_name_as_list = [sheet_name]
-        for i in range(0, len(input_keys)):
-            sheet_name_as_list.append('')
-
-        for row in zip(sheet_name_as_list,input_keys,input_values,output_keys,output_values):
-            wb.active.append(row)
-
-        # df.to_excel(writer, sheet_name=sheet_name, index=False)
-        wb.save(workbook_name)
-        wb.close()
-        # writer.save()
-        # writer.close()
-    #
-    # elif module == KEY_DISP_TENSION_BOLTED:
-    #     print('filenAME', f)
-    #     main = Tension_bolted
-    #     main.set_osdaglogger(None)
-    #     main.set_input_values(main, d)
-    #
-    # elif module == KEY_DISP_TENSION_WELDED:
-    #     print('filenAME', f)
-    #     main = Tension_welded
-    #     main.set_osdaglogger(None)
-    #     main.set_input_values(main, d)
-    #
-    # elif module == KEY_DISP_COLUMNCOVERPLATE:
-    #     print('filenAME', f)
-    #     main = ColumnCoverPlate
-    #     main.set_osdaglogger(None)
-    #     main.set_input_values(main, d)
-    #
-    # elif module == KEY_DISP_COLUMNCOVERPLATEWELD:
-    #     print('filenAME', f)
-    #     main = ColumnCoverPlateWeld
-    #     main.set_osdaglogger(None)
-    #     main.set_input_values(main, d)
-    #
-    # elif module == KEY_DISP_BEAMCOVERPLATE:
-    #     print('filenAME', f)
-    #     main = BeamCoverPlate
-    #     main.set_osdaglogger(None)
-    #     main.set_input_values(main, d)
-    #
-    # elif module == KEY_DISP_BEAMCOVERPLATEWELD:
-    #     print('filenAME', f)
-    #     main = BeamCoverPlateWeld
-    #     main.set_osdaglogger(None)
-    #     main.set_input_values(main, d)
-
-
-    # elif module == 'Column Coverplate Connection':
-    #     self = ColumnCoverPlate
-    #     self.set_osdaglogger()
-    #     self.set_input_values(self, d)
-
-
-
-
+                sheet = self._book.create_sheet(name)
+            self._sheets[module] = sheet
+            self._rows[module] = 0
+            self._append(module, HEADER)
+        return self._sheets[module]
+
+    def _append(self, module, row):
+        sheet = self._sheets[module]
+        if self.engine == 'xlsxwriter':
+            sheet.write_row(self._rows[module], 0, row)
+        else:
+            sheet.append(row)
+        self._rows[module] += 1
+
+    def write_design(self, name, module, inputs, outputs):
+        """Write the row block of one design to the sheet of its module."""
+        self._sheet(module)
+        for row in design_rows(name, inputs, outputs):
+            self._append(module, row)
+
+    def close(self):
+        if self.engine == 'xlsxwriter':
+            self._book.close()
+        else:
+            self._book.save(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_designs(designs, path, jobs=None, engine=None, progress=None):
+    """
+    Design every design and write its inputs and outputs to a workbook.
+
+    Args:
+        designs: (name, design dictionary) pairs (list)
+        path: .xlsx file to write (str)
+        jobs: worker processes, defaults to the CPU count (int)
+        engine: see ExcelWriter (str)
+        progress: called with each result as it is written
+
+    Returns:
+        number of designs written (int)
+    """
+    count = 0
+    with ExcelWriter(path, engine) as writer:
+        for (name, design_dictionary), result in zip(designs, design_results(designs, jobs, excel_result)):
+            outputs = result['outputs'] if not result['errors'] else {'Errors': '; '.join(result['errors'])}
+            writer.write_design(name, result['module'], design_dictionary, outputs)
+            count += 1
+            if progress is not None:
+                progress(result)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python write_to_excel.py', description=__doc__.split('\n')[0])
+    parser.add_argument('inputs', nargs='*', default=['ResourceFiles/design_example'],
+                        help='.osi design files or directories of them (default: the shipped examples)')
+    parser.add_argument('-o', '--output', default='osdag_results.xlsx', help='workbook to write')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--engine', choices=('xlsxwriter', 'openpyxl'), help='Excel writer (default: xlsxwriter)')
+    args = parser.parse_args(argv)
+
+    paths = find_design_files(args.inputs)
+    if not paths:
+        parser.error('no .osi design file found')
+    designs = list(zip(unique_names(paths), (load_design_file(path) for path in paths)))
+    start = time.perf_counter()
+    count = write_designs(designs, args.output, args.jobs, args.engine)
+    print('{} designs written to {} in {:.1f} s'.format(count, args.output, time.perf_counter() - start))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())